@@ -9,6 +9,8 @@ Provides:
 
 from fastapi import APIRouter, HTTPException, status
 from app.core.cache import cache_service, CacheNamespace
+from app.core.ephemeris import ephemeris
+from app.services.yoga_cache import yoga_result_cache
 from typing import Dict, Any
 
 router = APIRouter()
@@ -20,12 +22,15 @@ async def get_cache_stats():
     Get cache statistics.
 
     Returns:
-        Dictionary with hits, misses, hit rate, and mode (redis/fallback)
+        Dictionary with hits, misses, hit rate, and mode (redis/fallback),
+        plus the in-process ephemeris position and yoga result cache statistics
     """
     stats = await cache_service.get_stats()
     return {
         "status": "success",
-        "cache_stats": stats
+        "cache_stats": stats,
+        "ephemeris_stats": ephemeris.get_stats(),
+        "yoga_stats": yoga_result_cache.get_stats()
     }
 
 
@@ -47,6 +52,7 @@ async def clear_cache_namespace(namespace: str):
         CacheNamespace.VARSHAPHAL,
         CacheNamespace.COMPATIBILITY,
         CacheNamespace.CHARTS,
+        CacheNamespace.VARGAS,
         CacheNamespace.PROFILES,
     ]
 
@@ -83,6 +89,7 @@ async def clear_all_caches():
         CacheNamespace.VARSHAPHAL,
         CacheNamespace.COMPATIBILITY,
         CacheNamespace.CHARTS,
+        CacheNamespace.VARGAS,
         CacheNamespace.PROFILES,
     ]
 
@@ -1,31 +1,107 @@
 """Chart API Endpoints - Using Supabase REST API"""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from typing import Any, Dict, List
 
-from app.schemas.chart import ChartCalculateRequest, ChartResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+
+from app.schemas.chart import ChartBatchRequest, ChartCalculateRequest, ChartResponse
 from app.core.security import get_current_user
+from app.core.compute import compute_executor
 from app.services.astrology import astrology_service
+from app.services.chart_cache_service import chart_cache_service
+from app.services.vedic_astrology_accurate import accurate_vedic_astrology
 from app.services.supabase_service import supabase_service
+from app.services.dasha_enrichment_service import dasha_enrichment_service
 from app.services.divisional_charts_service import divisional_charts_service
+from app.services.varga_cache_service import varga_cache_service
 
 router = APIRouter()
 
 
+def _parse_birth_details(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a profile row into keyword arguments for the astrology service"""
+    # Handle different date/time formats from Supabase
+    if isinstance(profile['birth_date'], str):
+        birth_date = datetime.fromisoformat(profile['birth_date']).date()
+    else:
+        birth_date = profile['birth_date']
+
+    if isinstance(profile['birth_time'], str):
+        # Parse time string - could be HH:MM:SS or just HH:MM
+        birth_time = datetime.fromisoformat(f"2000-01-01T{profile['birth_time']}").time()
+    else:
+        birth_time = profile['birth_time']
+
+    return {
+        "name": str(profile['name']),
+        "birth_date": birth_date,
+        "birth_time": birth_time,
+        "latitude": float(str(profile['birth_lat'])),  # Convert to string first, then float
+        "longitude": float(str(profile['birth_lon'])),
+        "timezone_str": str(profile.get('birth_timezone') or 'UTC'),
+        "city": str(profile.get('birth_city') or 'Unknown')
+    }
+
+
+def _refresh_dasha(chart_data: Dict[str, Any], profile: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Recalculate dasha periods of a cached chart based on the current date
+    (planetary positions are cached, but dashas need to be current)
+    """
+    if 'dasha' in chart_data and 'planets' in chart_data and 'Moon' in chart_data['planets']:
+        birth = _parse_birth_details(profile)
+        birth_datetime = datetime.combine(birth["birth_date"], birth["birth_time"])
+
+        # Update chart data with fresh dasha calculation
+        chart_data['dasha'] = accurate_vedic_astrology._calculate_vimshottari_dasha(
+            chart_data['planets']['Moon'],
+            birth_datetime
+        )
+        dasha_enrichment_service.apply_to_chart(chart_data)
+
+    return chart_data
+
+
 @router.post("/calculate", response_model=dict, status_code=status.HTTP_201_CREATED)
 async def calculate_chart(
     request: ChartCalculateRequest,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(get_current_user)
 ):
     """
     Calculate and cache a birth chart (D1, D9, or Moon)
     If chart already exists, return cached version
+
+    Pass `chart_types` to get several charts in one call; they are derived
+    from a single D1 computation and returned as {"charts": {type: chart}}.
+
+    For D1, `include` selects the optional pipeline stages to run on top of
+    core positions (omit for the complete chart). A cached D1 missing any
+    requested stage is recalculated with the union of its stages and the
+    requested ones. Stored charts calculated by a different engine version
+    (ENGINE_VERSION) are recalculated.
+
+    AI personalization of the dasha ("dasha_ai") never delays the response:
+    it runs as a background job and is stored on the chart row, to be
+    fetched from /charts/{profile_id}/dasha/ai.
     """
     try:
         user_id = current_user["user_id"]
+        profile_id = str(request.profile_id)
+        chart_types = list(dict.fromkeys(request.chart_types or [request.chart_type]))
+
+        try:
+            requested_stages = accurate_vedic_astrology.resolve_stages(request.include)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
 
         # Verify profile belongs to user
         profile = await supabase_service.get_profile(
-            profile_id=request.profile_id,
+            profile_id=profile_id,
             user_id=user_id
         )
 
@@ -35,153 +111,234 @@ async def calculate_chart(
                 detail="Profile not found"
             )
 
-        # Check if chart already exists
-        existing_chart = await supabase_service.get_chart(
-            profile_id=request.profile_id,
-            chart_type=request.chart_type
-        )
+        charts: Dict[str, Any] = {}
+        existing_charts: Dict[str, Any] = {}
+        to_calculate: List[str] = []
+        include = request.include
+
+        for chart_type in chart_types:
+            # Check if chart already exists
+            existing_chart = await supabase_service.get_chart(
+                profile_id=profile_id,
+                chart_type=chart_type
+            )
 
-        if existing_chart:
-            # Recalculate dasha periods based on current date
-            # (planetary positions are cached, but dashas need to be current)
+            if not existing_chart:
+                to_calculate.append(chart_type)
+                continue
+
+            # Charts calculated by another engine version are recalculated
             chart_data = existing_chart.get('chart_data', {})
+            if chart_data.get('engine_version') != accurate_vedic_astrology.ENGINE_VERSION:
+                existing_charts[chart_type] = existing_chart
+                to_calculate.append(chart_type)
+                continue
+
+            # A cached D1 lacking a requested stage is recalculated with the
+            # union of stages. Charts cached before staging existed have no
+            # "stages" list and carry every stage.
+            cached_stages = chart_data.get('stages')
+            if chart_type == "D1" and cached_stages is not None and not requested_stages.issubset(cached_stages):
+                include = requested_stages.union(cached_stages)
+                existing_charts[chart_type] = existing_chart
+                to_calculate.append(chart_type)
+                continue
 
-            if 'planets' in chart_data and 'Moon' in chart_data['planets']:
-                from datetime import datetime, date, time
+            # Return chart with updated dasha
+            existing_chart['chart_data'] = _refresh_dasha(chart_data, profile)
+            charts[chart_type] = existing_chart
+
+            # Charts saved by other flows may still be waiting for enrichment
+            if dasha_enrichment_service.needs_enrichment(profile_id, chart_data):
+                background_tasks.add_task(dasha_enrichment_service.enrich_chart, profile_id, chart_type)
+
+        if to_calculate:
+            # Calculate all missing charts from a single D1 computation,
+            # reusing charts already calculated for the same birth data
+            try:
+                bundle = await chart_cache_service.calculate_chart_bundle(
+                    **_parse_birth_details(profile),
+                    chart_types=to_calculate,
+                    include=include
+                )
+            except HTTPException:
+                raise
+            except Exception as e:
+                import traceback
+                print(f"Error calculating chart: {str(e)}")
+                print("Full traceback:")
+                traceback.print_exc()
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Chart calculation failed: {str(e)}"
+                )
 
-                # Parse birth data from profile
-                if isinstance(profile['birth_date'], str):
-                    birth_date = datetime.fromisoformat(profile['birth_date']).date()
-                else:
-                    birth_date = profile['birth_date']
+            for chart_type in to_calculate:
+                chart_data = bundle[chart_type]
 
-                if isinstance(profile['birth_time'], str):
-                    birth_time = datetime.fromisoformat(f"2000-01-01T{profile['birth_time']}").time()
+                # Save chart to database (extend the cached row if stages were added)
+                if chart_type in existing_charts:
+                    saved_chart = await supabase_service.update_chart(
+                        profile_id=profile_id,
+                        chart_type=chart_type,
+                        chart_data=chart_data
+                    )
                 else:
-                    birth_time = profile['birth_time']
+                    saved_chart = await supabase_service.create_chart({
+                        "profile_id": profile_id,
+                        "chart_type": chart_type,
+                        "chart_data": chart_data,
+                        "chart_svg": None  # Will be generated by frontend for MVP
+                    })
 
-                birth_datetime = datetime.combine(birth_date, birth_time)
+                if not saved_chart:
+                    raise HTTPException(
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        detail=f"Failed to save {chart_type} chart"
+                    )
 
-                # Recalculate dasha with current date
-                from app.services.vedic_astrology_accurate import accurate_vedic_astrology
-                updated_dasha = accurate_vedic_astrology._calculate_vimshottari_dasha(
-                    chart_data['planets']['Moon'],
-                    birth_datetime
-                )
+                # Personalize the dasha with AI after the response has been sent
+                if dasha_enrichment_service.needs_enrichment(profile_id, chart_data):
+                    background_tasks.add_task(dasha_enrichment_service.enrich_chart, profile_id, chart_type)
 
-                # Update chart data with fresh dasha calculation
-                chart_data['dasha'] = updated_dasha
-                existing_chart['chart_data'] = chart_data
+                charts[chart_type] = saved_chart
 
-            # Return chart with updated dasha
-            return existing_chart
+        if not request.chart_types:
+            return charts[request.chart_type]
 
-        # Calculate new chart
-        try:
-            # Parse date/time strings from database
-            from datetime import date, time, datetime
+        return {
+            "profile_id": profile_id,
+            "charts": {chart_type: charts[chart_type] for chart_type in chart_types}
+        }
 
-            # Debug: print what we're getting
-            print(f"Profile data - birth_date: {profile['birth_date']} (type: {type(profile['birth_date'])})")
-            print(f"Profile data - birth_time: {profile['birth_time']} (type: {type(profile['birth_time'])})")
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"Error in calculate_chart: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process chart calculation: {str(e)}"
+        )
 
-            # Handle different date/time formats from Supabase
-            if isinstance(profile['birth_date'], str):
-                birth_date = datetime.fromisoformat(profile['birth_date']).date()
-            else:
-                birth_date = profile['birth_date']
 
-            if isinstance(profile['birth_time'], str):
-                # Parse time string - could be HH:MM:SS or just HH:MM
-                birth_time = datetime.fromisoformat(f"2000-01-01T{profile['birth_time']}").time()
-            else:
-                birth_time = profile['birth_time']
-
-            print(f"Parsed - birth_date: {birth_date} (type: {type(birth_date)})")
-            print(f"Parsed - birth_time: {birth_time} (type: {type(birth_time)})")
-
-            # Ensure all parameters are in the correct format
-            name = str(profile['name'])  # Ensure name is a string
-            latitude = float(str(profile['birth_lat']))  # Convert to string first, then float
-            longitude = float(str(profile['birth_lon']))
-            timezone_str = str(profile.get('birth_timezone') or 'UTC')  # Ensure it's a string
-            city = str(profile.get('birth_city') or 'Unknown')
-
-            print(f"Parameters for Kerykeion:")
-            print(f"  name: {name} (type: {type(name)})")
-            print(f"  latitude: {latitude} (type: {type(latitude)})")
-            print(f"  longitude: {longitude} (type: {type(longitude)})")
-            print(f"  timezone_str: {timezone_str} (type: {type(timezone_str)})")
-            print(f"  city: {city} (type: {type(city)})")
-
-            if request.chart_type == "D1":
-                chart_data = astrology_service.calculate_birth_chart(
-                    name=name,
-                    birth_date=birth_date,
-                    birth_time=birth_time,
-                    latitude=latitude,
-                    longitude=longitude,
-                    timezone_str=timezone_str,
-                    city=city
-                )
-            elif request.chart_type == "D9":
-                chart_data = astrology_service.calculate_navamsa_chart(
-                    name=name,
-                    birth_date=birth_date,
-                    birth_time=birth_time,
-                    latitude=latitude,
-                    longitude=longitude,
-                    timezone_str=timezone_str,
-                    city=city
-                )
-            elif request.chart_type == "Moon":
-                chart_data = astrology_service.calculate_moon_chart(
-                    name=name,
-                    birth_date=birth_date,
-                    birth_time=birth_time,
-                    latitude=latitude,
-                    longitude=longitude,
-                    timezone_str=timezone_str,
-                    city=city
-                )
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid chart type. Use 'D1', 'D9', or 'Moon'"
-                )
-        except Exception as e:
-            import traceback
-            print(f"Error calculating chart: {str(e)}")
-            print("Full traceback:")
-            traceback.print_exc()
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Chart calculation failed: {str(e)}"
-            )
+@router.post("/batch", response_model=dict, status_code=status.HTTP_201_CREATED)
+async def calculate_charts_batch(
+    request: ChartBatchRequest,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Calculate (or recalculate) charts for many profiles in one call
 
-        # Save chart to database
-        new_chart = await supabase_service.create_chart({
-            "profile_id": str(request.profile_id),  # Convert UUID to string
-            "chart_type": request.chart_type,
-            "chart_data": chart_data,
-            "chart_svg": None  # Will be generated by frontend for MVP
-        })
+    Profiles are loaded with one query, charts not already in the content
+    cache are computed in parallel across the compute workers, and all are
+    saved with one bulk upsert. A profile that is missing, or whose charts
+    fail to calculate or save, is reported under "errors" without failing
+    the rest of the batch.
 
-        if not new_chart:
+    Dasha AI personalization is not run for batches; charts requested with
+    "dasha_ai" stay pending until fetched from /charts/{profile_id}/dasha/ai.
+    """
+    try:
+        user_id = current_user["user_id"]
+        profile_ids = list(dict.fromkeys(str(profile_id) for profile_id in request.profile_ids))
+        chart_types = list(dict.fromkeys(request.chart_types))
+
+        try:
+            accurate_vedic_astrology.resolve_stages(request.include)
+        except ValueError as e:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to save chart"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
             )
 
-        return new_chart
+        # Load all profiles owned by the user in one query
+        profiles = await supabase_service.get_profiles_by_ids(profile_ids, user_id=user_id)
+        profiles_by_id = {str(profile['id']): profile for profile in profiles}
+
+        errors = [
+            {"profile_id": profile_id, "error": "Profile not found"}
+            for profile_id in profile_ids if profile_id not in profiles_by_id
+        ]
+
+        batch_ids = []
+        records = []
+        for profile_id in profile_ids:
+            if profile_id not in profiles_by_id:
+                continue
+            try:
+                records.append(_parse_birth_details(profiles_by_id[profile_id]))
+                batch_ids.append(profile_id)
+            except (KeyError, TypeError, ValueError) as e:
+                errors.append({"profile_id": profile_id, "error": f"Invalid birth details: {str(e)}"})
+
+        # Serve birth data already in the content cache, calculate the rest
+        outcomes: List[Dict[str, Any]] = []
+        uncached = []
+        for index, record in enumerate(records):
+            cached = await chart_cache_service.lookup(record, chart_types, request.include)
+            if len(cached) == len(chart_types):
+                outcomes.append({"charts": cached})
+            else:
+                outcomes.append({})
+                uncached.append(index)
+
+        calculated = await compute_executor.run_batch(
+            astrology_service.calculate_birth_charts_batch,
+            [records[index] for index in uncached],
+            chart_types=chart_types,
+            include=request.include
+        )
+        for index, outcome in zip(uncached, calculated):
+            if isinstance(outcome, BaseException):
+                outcome = {"error": getattr(outcome, "detail", None) or str(outcome) or type(outcome).__name__}
+            outcomes[index] = outcome
+            if "charts" in outcome:
+                await chart_cache_service.store(records[index], outcome["charts"], request.include)
+
+        rows = []
+        for profile_id, outcome in zip(batch_ids, outcomes):
+            if "error" in outcome:
+                errors.append({"profile_id": profile_id, "error": outcome["error"]})
+                continue
+            for chart_type, chart_data in outcome["charts"].items():
+                rows.append({
+                    "profile_id": profile_id,
+                    "chart_type": chart_type,
+                    "chart_data": chart_data,
+                    "chart_svg": None
+                })
+
+        # Save every calculated chart in one request
+        saved_charts = await supabase_service.upsert_charts(rows)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for chart in saved_charts:
+            results.setdefault(str(chart['profile_id']), {})[chart['chart_type']] = chart
+
+        failed_ids = {error["profile_id"] for error in errors}
+        errors.extend(
+            {"profile_id": profile_id, "error": "Failed to save charts"}
+            for profile_id in batch_ids
+            if profile_id not in results and profile_id not in failed_ids
+        )
+
+        return {
+            "results": [
+                {"profile_id": profile_id, "charts": results[profile_id]}
+                for profile_id in batch_ids if profile_id in results
+            ],
+            "errors": errors,
+            "calculated": len(results),
+            "failed": len(errors)
+        }
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error in calculate_chart: {str(e)}")
+        print(f"Error in calculate_charts_batch: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to process chart calculation: {str(e)}"
+            detail=f"Failed to process batch chart calculation: {str(e)}"
         )
 
 
@@ -220,44 +377,81 @@ async def get_chart(
             )
 
         # Recalculate dasha periods based on current date
-        chart_data = chart.get('chart_data', {})
+        chart['chart_data'] = _refresh_dasha(chart.get('chart_data', {}), profile)
 
-        if 'planets' in chart_data and 'Moon' in chart_data['planets']:
-            from datetime import datetime
+        return chart
 
-            # Parse birth data from profile
-            if isinstance(profile['birth_date'], str):
-                birth_date = datetime.fromisoformat(profile['birth_date']).date()
-            else:
-                birth_date = profile['birth_date']
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"Error getting chart: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get chart: {str(e)}"
+        )
 
-            if isinstance(profile['birth_time'], str):
-                birth_time = datetime.fromisoformat(f"2000-01-01T{profile['birth_time']}").time()
-            else:
-                birth_time = profile['birth_time']
 
-            birth_datetime = datetime.combine(birth_date, birth_time)
+@router.get("/{profile_id}/dasha/ai", response_model=dict)
+async def get_dasha_ai_personalization(
+    profile_id: str,
+    background_tasks: BackgroundTasks,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Get the deferred AI personalization of the current Mahadasha
 
-            # Recalculate dasha with current date
-            from app.services.vedic_astrology_accurate import accurate_vedic_astrology
-            updated_dasha = accurate_vedic_astrology._calculate_vimshottari_dasha(
-                chart_data['planets']['Moon'],
-                birth_datetime
+    Status values:
+    - pending: enrichment is queued or running - poll again later
+    - ready: personalization is available
+    - unavailable: AI is not configured or the call failed
+    - not_requested: the D1 chart was calculated without the dasha_ai stage
+    """
+    try:
+        user_id = current_user["user_id"]
+
+        # Verify profile belongs to user
+        profile = await supabase_service.get_profile(
+            profile_id=profile_id,
+            user_id=user_id
+        )
+
+        if not profile:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Profile not found"
             )
 
-            # Update chart data with fresh dasha calculation
-            chart_data['dasha'] = updated_dasha
-            chart['chart_data'] = chart_data
+        d1_chart = await supabase_service.get_chart(
+            profile_id=profile_id,
+            chart_type="D1"
+        )
 
-        return chart
+        if not d1_chart:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="D1 chart not found. Please calculate it first."
+            )
+
+        chart_data = d1_chart.get('chart_data', {})
+        enrichment = chart_data.get('dasha_ai') or {}
+
+        # Pick up charts whose enrichment job never ran (e.g. after a restart)
+        if dasha_enrichment_service.needs_enrichment(profile_id, chart_data):
+            background_tasks.add_task(dasha_enrichment_service.enrich_chart, profile_id, "D1")
+
+        return {
+            "profile_id": profile_id,
+            "status": enrichment.get("status", "not_requested"),
+            "personalization": enrichment if enrichment.get("planet") else None
+        }
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error getting chart: {str(e)}")
+        print(f"Error getting dasha AI personalization: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get chart: {str(e)}"
+            detail=f"Failed to get dasha AI personalization: {str(e)}"
         )
 
 
@@ -336,7 +530,7 @@ async def get_all_divisional_charts(
                 detail="Profile not found"
             )
 
-        # Get D1 chart (divisional charts are embedded in it)
+        # Divisional charts are calculated from the D1 chart on demand
         d1_chart = await supabase_service.get_chart(
             profile_id=profile_id,
             chart_type="D1"
@@ -349,27 +543,16 @@ async def get_all_divisional_charts(
             )
 
         chart_data = d1_chart.get('chart_data', {})
-        divisional_charts = chart_data.get('divisional_charts', {})
-
-        if not divisional_charts:
+        if not chart_data.get('planets'):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail="No divisional charts found. Chart may be old - please regenerate."
+                detail="D1 chart has no planet positions. Chart may be old - please regenerate."
             )
 
-        # Filter by priority if needed
-        if priority == "high":
-            priority_charts = ["D2", "D4", "D7", "D10", "D24"]
-            divisional_charts = {
-                k: v for k, v in divisional_charts.items()
-                if k in priority_charts
-            }
-        elif priority == "medium":
-            priority_charts = ["D2", "D3", "D4", "D7", "D10", "D12", "D16", "D20", "D24"]
-            divisional_charts = {
-                k: v for k, v in divisional_charts.items()
-                if k in priority_charts
-            }
+        # Filter by priority (D9 is served by /charts/{profile_id}/D9)
+        priorities = divisional_charts_service.DIVISIONAL_CHART_PRIORITIES
+        selected = [chart for chart in priorities.get(priority, priorities["all"]) if chart != "D9"]
+        divisional_charts = await varga_cache_service.get_vargas(chart_data, selected)
 
         return {
             "profile_id": profile_id,
@@ -421,7 +604,7 @@ async def get_specific_divisional_chart(
                 detail=f"Invalid division. Must be one of: {', '.join(valid_divisions)}"
             )
 
-        # Get D1 chart (divisional charts are embedded in it)
+        # The varga is calculated from the D1 chart the first time it is requested
         d1_chart = await supabase_service.get_chart(
             profile_id=profile_id,
             chart_type="D1"
@@ -434,9 +617,7 @@ async def get_specific_divisional_chart(
             )
 
         chart_data = d1_chart.get('chart_data', {})
-        divisional_charts = chart_data.get('divisional_charts', {})
-
-        if division not in divisional_charts:
+        if not chart_data.get('planets'):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"{division} chart not found. Chart may be old - please regenerate D1 chart."
@@ -445,7 +626,7 @@ async def get_specific_divisional_chart(
         return {
             "profile_id": profile_id,
             "division": division,
-            "chart_data": divisional_charts[division]
+            "chart_data": await varga_cache_service.get_varga(chart_data, division)
         }
 
     except HTTPException:
@@ -585,19 +766,14 @@ async def get_divisional_chart_yogas(
             )
 
         chart_data = d1_chart.get('chart_data', {})
-        divisional_charts = chart_data.get('divisional_charts', {})
-
-        if division not in divisional_charts:
+        if not chart_data.get('planets'):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"{division} chart not found. Chart may be old - please regenerate D1 chart."
             )
 
-        # Detect yogas in the divisional chart
-        yogas = divisional_charts_service.detect_divisional_yogas(
-            division,
-            divisional_charts[division]
-        )
+        # Detect yogas in the divisional chart (only this varga is calculated)
+        yogas = await varga_cache_service.detect_yogas(chart_data, division)
 
         return {
             "profile_id": profile_id,
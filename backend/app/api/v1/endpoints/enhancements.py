@@ -6,18 +6,24 @@ Remedies, Rectification, Transits, and Shadbala
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime, date, time, timedelta
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Body
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Body, Request, Response
+from fastapi.responses import JSONResponse
 
 logger = logging.getLogger(__name__)
 
 from app.core.security import get_current_user
+from app.core.compute import compute_executor
 from app.services.remedy_service import remedy_service
 from app.services.rectification_service import rectification_service
 from app.services.transit_service import transit_service
+from app.services.transit_events import BODIES as TRANSIT_BODIES
 from app.services.shadbala_service import shadbala_service
 from app.services.astrology import astrology_service
 from app.services.supabase_service import supabase_service
 from app.services.extended_yoga_service import extended_yoga_service
+from app.services.yoga_population import population_yoga_statistics
+from app.services.yoga_catalog import get_yoga_catalog
+from app.services.dosha_remedies import get_dosha_remedy_catalog
 
 # Import the new schemas
 from app.schemas.enhancements import (
@@ -178,7 +184,8 @@ async def rectify_birth_time(
         ]
 
         # Run rectification
-        result = rectification_service.rectify_birth_time(
+        result = await compute_executor.run(
+            rectification_service.rectify_birth_time,
             name=request.name,
             birth_date=birth_date,
             approximate_time=approx_time,
@@ -195,6 +202,8 @@ async def rectify_birth_time(
             "rectification": result
         }
 
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -270,7 +279,8 @@ async def get_current_transits(
         reference_date = transit_dt.date() if isinstance(transit_dt, datetime) else transit_dt
 
         # Calculate transits
-        transits_result = transit_service.get_current_transits(
+        transits_result = await compute_executor.run(
+            transit_service.get_current_transits,
             natal_moon_sign=natal_moon_sign,
             natal_ascendant_sign=natal_ascendant_sign,
             reference_date=reference_date
@@ -323,13 +333,32 @@ async def get_current_transits(
                 if 'Spirituality' not in focus_areas:
                     focus_areas.append('Spirituality')
 
+        # Exact sign changes and transit events of the next 30 days
+        focus_grahas = [p for p in request.focus_planets if p in TRANSIT_BODIES] if request.focus_planets else None
+        upcoming_sign_changes = await compute_executor.run(
+            transit_service.get_upcoming_sign_changes,
+            transit_dt,
+            days=30,
+            planets=[p for p in focus_grahas if p != "Moon"] if focus_grahas is not None else None
+        )
+        timeline_events = None
+        if request.include_timeline:
+            timeline = await compute_executor.run(
+                transit_service.calculate_transit_timeline,
+                birth_chart=chart_data,
+                start_date=transit_dt,
+                end_date=transit_dt + timedelta(days=30),
+                planets=focus_grahas
+            )
+            timeline_events = timeline["events"]
+
         # Build response matching TransitResponse schema
         response_data = {
             'transit_date': transit_dt,
             'current_positions': current_positions,
             'significant_aspects': [],  # TODO: Implement aspect calculations
-            'upcoming_sign_changes': [],  # TODO: Implement sign change predictions
-            'timeline_events': [] if request.include_timeline else None,
+            'upcoming_sign_changes': upcoming_sign_changes,
+            'timeline_events': timeline_events,
             'summary': summary,
             'focus_areas': focus_areas if focus_areas else ['General Life Matters']
         }
@@ -442,9 +471,23 @@ async def get_transit_timeline_from_chart(
     current_user: dict = Depends(get_current_user)
 ):
     """
-    Calculate transit timeline directly from chart data (for testing/demo)
+    Calculate transit timeline directly from chart data
+
+    Returns the exact transit events of the range (default: 30 days from
+    now) in time order: sign ingresses, nakshatra changes, retrograde and
+    direct stations, and conjunctions with the natal planets and ascendant.
+    Dates and the timezone may also be sent in the body with chart_data.
+    The range is limited to TransitService.MAX_TIMELINE_DAYS.
     """
     try:
+        # The whole body arrives as chart_data: {"chart_data": {...}, "start_date": ...}
+        if isinstance(chart_data.get("chart_data"), dict):
+            body = chart_data
+            chart_data = body["chart_data"]
+            start_date = start_date or body.get("start_date")
+            end_date = end_date or body.get("end_date")
+            timezone_str = body.get("timezone_str") or timezone_str
+
         # Parse dates
         if start_date:
             start_dt = datetime.fromisoformat(start_date)
@@ -454,11 +497,11 @@ async def get_transit_timeline_from_chart(
         if end_date:
             end_dt = datetime.fromisoformat(end_date)
         else:
-            from datetime import timedelta
             end_dt = start_dt + timedelta(days=30)
 
         # Calculate timeline
-        timeline = transit_service.calculate_transit_timeline(
+        timeline = await compute_executor.run(
+            transit_service.calculate_transit_timeline,
             birth_chart=chart_data,
             start_date=start_dt,
             end_date=end_dt,
@@ -472,6 +515,13 @@ async def get_transit_timeline_from_chart(
             "timeline": timeline
         }
 
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -709,11 +759,13 @@ async def analyze_yogas(
             chart_data = json.loads(chart_data)
         planets = chart_data.get('planets', {})
 
-        # Detect yogas
-        yogas = extended_yoga_service.detect_extended_yogas(planets)
-
-        # Enrich with classification metadata
-        yogas = extended_yoga_service.enrich_yogas(yogas)
+        # Detect yogas and enrich with classification metadata (only the requested families)
+        yogas = await compute_executor.run(
+            extended_yoga_service.detect_enriched_yogas,
+            planets,
+            categories=request.categories,
+            min_importance=request.min_importance.value if request.min_importance else None
+        )
 
         # Filter if needed
         if not request.include_all:
@@ -747,8 +799,15 @@ async def analyze_yogas(
             chart_quality = "Exceptional"
             summary += f" Notably, the chart features {', '.join(strongest_yogas[:3])}."
 
+        yoga_refs = catalog_version = None
+        if request.compact:
+            catalog = get_yoga_catalog()
+            yoga_refs, catalog_version = catalog.compact_yogas(yogas), catalog.version
+
         return YogaResponse(
-            yogas=yogas,
+            yogas=[] if request.compact else yogas,
+            yoga_refs=yoga_refs,
+            catalog_version=catalog_version,
             total_yogas=total,
             categories=categories,
             strongest_yogas=strongest_yogas,
@@ -758,6 +817,11 @@ async def analyze_yogas(
 
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         print(f"Error analyzing yogas: {str(e)}")
         raise HTTPException(
@@ -811,9 +875,8 @@ async def get_yoga_timing(
         chart_data = chart['chart_data']
         planets = chart_data.get('planets', {})
 
-        # Detect yogas to find the requested yoga
-        yogas = extended_yoga_service.detect_extended_yogas(planets)
-        yoga = next((y for y in yogas if y['name'] == yoga_name), None)
+        # Detect yogas until the requested one is found
+        yoga = await compute_executor.run(extended_yoga_service.find_extended_yoga, planets, yoga_name)
 
         if not yoga:
             raise HTTPException(
@@ -841,6 +904,8 @@ async def get_yoga_timing(
 
 @router.get("/yogas/statistics")
 async def get_yoga_statistics(
+    sample_size: int = Query(0, ge=0, le=100000, description="Synthetic charts for yoga frequencies (0 = skip)"),
+    seed: int = Query(0, ge=0, description="Random seed of the synthetic charts"),
     current_user: dict = Depends(get_current_user)
 ):
     """
@@ -852,6 +917,8 @@ async def get_yoga_statistics(
     - Category breakdown
     - Section coverage
     - System capabilities
+    - Population frequencies (with sample_size > 0): share of synthetic
+      charts with each yoga, from vectorized batch detection
     """
     try:
         # Get statistics from extended_yoga_service
@@ -912,12 +979,17 @@ async def get_yoga_statistics(
             "documentation_available": True
         }
 
+        if sample_size:
+            stats["population"] = await compute_executor.run(population_yoga_statistics, sample_size, seed)
+
         return {
             "success": True,
             "statistics": stats,
             "message": "JioAstro yoga detection system - 379 yogas with 92.9% BPHS coverage"
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error getting yoga statistics: {str(e)}")
         raise HTTPException(
@@ -1033,6 +1105,72 @@ async def get_bphs_coverage_report(
         )
 
 
+@router.get("/yogas/catalog")
+async def get_yoga_catalog_entries(
+    request: Request,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Static yoga metadata by yoga id, to resolve compact yogas
+    (POST /yogas/analyze with compact=true)
+
+    The catalog only changes with deployments, so responses carry the
+    catalog version as ETag: a matching If-None-Match gets 304 Not Modified.
+
+    Returns:
+    - version: Catalog version (also the catalog_version of compact responses)
+    - yogas: Yoga id -> static fields (name, category, BPHS reference, ...)
+    """
+    catalog = get_yoga_catalog()
+    headers = {"ETag": f'"{catalog.version}"', "Cache-Control": "private, max-age=86400"}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return JSONResponse(content=catalog.to_dict(), headers=headers)
+
+
+@router.get("/doshas/remedies")
+async def get_dosha_remedy_catalog_entries(
+    request: Request,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Dosha remedies by remedy id, to resolve the remedy_id of stored doshas
+
+    The catalog only changes with deployments, so responses carry the
+    catalog version as ETag: a matching If-None-Match gets 304 Not Modified.
+
+    Returns:
+    - version: Catalog version
+    - remedies: Remedy id -> dosha, tier, variant and remedies
+    """
+    catalog = get_dosha_remedy_catalog()
+    headers = {"ETag": f'"{catalog.version}"', "Cache-Control": "private, max-age=86400"}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return JSONResponse(content=catalog.to_dict(), headers=headers)
+
+
+@router.get("/doshas/remedies/{remedy_id}")
+async def get_dosha_remedy(
+    remedy_id: str,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Remedies of one remedy id (e.g. "manglik-dosha:medium")
+
+    Returns:
+    - dosha, tier, variant: What the remedy set applies to
+    - remedies: Remedies (categorized for most doshas)
+    """
+    entry = get_dosha_remedy_catalog().get(remedy_id)
+    if entry is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown remedy id: {remedy_id}"
+        )
+    return {"remedy_id": remedy_id, **entry}
+
+
 @router.get("/yogas/lookup/{yoga_name}")
 async def lookup_yoga_by_name(
     yoga_name: str,
@@ -1284,8 +1422,7 @@ async def compare_yogas_between_profiles(
             planets = chart_data.get('planets', {})
 
             # Detect yogas
-            yogas = extended_yoga_service.detect_extended_yogas(planets)
-            yogas = extended_yoga_service.enrich_yogas(yogas)
+            yogas = await compute_executor.run(extended_yoga_service.detect_enriched_yogas, planets)
 
             # Calculate statistics
             bphs_stats = {}
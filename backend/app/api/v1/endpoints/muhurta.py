@@ -13,6 +13,7 @@ from datetime import datetime, timedelta
 import os
 
 from app.core.security import get_current_user
+from app.core.compute import compute_executor
 from app.schemas import muhurta as schemas
 from app.services.muhurta_service import muhurta_service
 
@@ -35,12 +36,15 @@ async def get_panchang(
     - Vara (Weekday)
     """
     try:
-        panchang = muhurta_service.calculate_panchang(
+        panchang = await compute_executor.run(
+            muhurta_service.calculate_panchang,
             dt=request.datetime,
             latitude=request.latitude,
             longitude=request.longitude
         )
         return panchang
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -59,7 +63,8 @@ async def get_hora(
     Each day/night divided into 12 horas, each ruled by a planet.
     """
     try:
-        hora = muhurta_service.calculate_hora(
+        hora = await compute_executor.run(
+            muhurta_service.calculate_hora,
             dt=request.datetime,
             latitude=request.latitude,
             longitude=request.longitude
@@ -95,7 +100,8 @@ async def get_daily_hora_table(
         # Convert date to datetime
         dt = datetime.combine(request.date, datetime.min.time())
 
-        horas = muhurta_service.get_daily_hora_table(
+        horas = await compute_executor.run(
+            muhurta_service.get_daily_hora_table,
             date=dt,
             latitude=request.latitude,
             longitude=request.longitude
@@ -106,6 +112,8 @@ async def get_daily_hora_table(
             "horas": horas,
             "total_horas": len(horas)
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -151,23 +159,28 @@ async def find_muhurta(
 
         # Find muhurtas based on activity type
         if request.activity_type == "marriage":
-            results = muhurta_service.find_marriage_muhurta(
+            results = await compute_executor.run(
+                muhurta_service.find_marriage_muhurta,
                 start_dt, end_dt, request.latitude, request.longitude, request.max_results
             )
         elif request.activity_type == "business":
-            results = muhurta_service.find_business_start_muhurta(
+            results = await compute_executor.run(
+                muhurta_service.find_business_start_muhurta,
                 start_dt, end_dt, request.latitude, request.longitude, request.max_results
             )
         elif request.activity_type == "travel":
-            results = muhurta_service.find_travel_muhurta(
+            results = await compute_executor.run(
+                muhurta_service.find_travel_muhurta,
                 start_dt, end_dt, request.latitude, request.longitude, request.max_results
             )
         elif request.activity_type == "property":
-            results = muhurta_service.find_property_purchase_muhurta(
+            results = await compute_executor.run(
+                muhurta_service.find_property_purchase_muhurta,
                 start_dt, end_dt, request.latitude, request.longitude, request.max_results
             )
         elif request.activity_type == "surgery":
-            results = muhurta_service.find_surgery_muhurta(
+            results = await compute_executor.run(
+                muhurta_service.find_surgery_muhurta,
                 start_dt, end_dt, request.latitude, request.longitude, request.max_results
             )
         else:
@@ -212,7 +225,8 @@ async def get_best_time_today(
     Returns top 3 times if available.
     """
     try:
-        result = muhurta_service.find_best_time_today(
+        result = await compute_executor.run(
+            muhurta_service.find_best_time_today,
             activity_type=request.activity_type,
             latitude=request.latitude,
             longitude=request.longitude
@@ -366,7 +380,8 @@ async def get_panchang_public(request: schemas.PanchangRequest):
                 detail="Public access limited to current date only. Please sign in for full access."
             )
 
-        panchang = muhurta_service.calculate_panchang(
+        panchang = await compute_executor.run(
+            muhurta_service.calculate_panchang,
             dt=request.datetime,
             latitude=request.latitude,
             longitude=request.longitude
@@ -397,7 +412,8 @@ async def get_hora_public(request: schemas.HoraRequest):
                 detail="Public access limited to current date only. Please sign in for full access."
             )
 
-        hora = muhurta_service.calculate_hora(
+        hora = await compute_executor.run(
+            muhurta_service.calculate_hora,
             dt=request.datetime,
             latitude=request.latitude,
             longitude=request.longitude
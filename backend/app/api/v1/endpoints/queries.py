@@ -7,6 +7,7 @@ from datetime import datetime, timedelta, date, time, timezone
 from app.schemas.query import QueryCreate, QueryResponse
 from app.schemas.response import ResponseResponse
 from app.core.security import get_current_user
+from app.core.compute import compute_executor
 from app.core.config import settings
 from app.services.astrology import astrology_service
 from app.services.ai_service import ai_service
@@ -77,7 +78,8 @@ async def create_query(
                 timezone_str = str(profile.get('birth_timezone') or 'UTC')
                 city = str(profile.get('birth_city') or 'Unknown')
 
-                chart_data = astrology_service.calculate_birth_chart(
+                chart_data = await compute_executor.run(
+                    astrology_service.calculate_birth_chart,
                     name=profile['name'],
                     birth_date=birth_date,
                     birth_time=birth_time,
@@ -92,6 +94,8 @@ async def create_query(
                     "chart_type": "D1",
                     "chart_data": chart_data
                 })
+            except HTTPException:
+                raise
             except Exception as e:
                 print(f"Error calculating chart: {str(e)}")
                 raise HTTPException(
@@ -126,6 +130,18 @@ async def create_query(
             print(f"⚠️  Could not fetch numerology data: {str(e)}")
             # Continue without numerology data
 
+        # Fetch the D9 chart for divisional context (D2-D60 are calculated on demand)
+        navamsa_data = None
+        try:
+            navamsa_chart = await supabase_service.get_chart(
+                profile_id=query_data.profile_id,
+                chart_type="D9"
+            )
+            if navamsa_chart:
+                navamsa_data = navamsa_chart.get("chart_data")
+        except Exception as e:
+            print(f"⚠️  Could not fetch D9 chart: {str(e)}")
+
         # Generate AI interpretation with all available data
         try:
             print(f"🤖 Generating AI interpretation for question: {query_data.question[:50]}...")
@@ -136,7 +152,8 @@ async def create_query(
                 chart_data=chart.get("chart_data", {}),
                 question=query_data.question,
                 category=query_data.category or "general",
-                numerology_data=numerology_data
+                numerology_data=numerology_data,
+                navamsa_data=navamsa_data
             )
 
             print(f"✅ AI interpretation generated: {len(ai_result.get('interpretation', ''))} characters")
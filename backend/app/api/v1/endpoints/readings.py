@@ -22,6 +22,7 @@ from app.schemas.conversation import (
     GenerateSpeechResponse
 )
 from app.core.security import get_current_user
+from app.core.compute import compute_executor
 from app.services.mvp_bridge import mvp_bridge
 from app.services.query_matching_service import query_matching_service
 
@@ -312,7 +313,8 @@ async def generate_ai_reading(
             else:
                 birth_time = profile['birth_time']
 
-            chart_data = astrology_service.calculate_birth_chart(
+            chart_data = await compute_executor.run(
+                astrology_service.calculate_birth_chart,
                 name=profile['name'],
                 birth_date=birth_date,
                 birth_time=birth_time,
@@ -529,7 +531,8 @@ async def ask_question(
             else:
                 birth_time = profile['birth_time']
 
-            chart_data = astrology_service.calculate_birth_chart(
+            chart_data = await compute_executor.run(
+                astrology_service.calculate_birth_chart,
                 name=profile['name'],
                 birth_date=birth_date,
                 birth_time=birth_time,
@@ -705,7 +708,8 @@ async def ask_conversational_question(
             birth_time = datetime.fromisoformat(f"2000-01-01T{profile['birth_time']}").time() \
                 if isinstance(profile['birth_time'], str) else profile['birth_time']
 
-            chart_data = astrology_service.calculate_birth_chart(
+            chart_data = await compute_executor.run(
+                astrology_service.calculate_birth_chart,
                 name=profile['name'],
                 birth_date=birth_date,
                 birth_time=birth_time,
@@ -5,7 +5,7 @@ Provides:
 - Result caching for expensive calculations
 - TTL-based expiration
 - Namespace-based key management
-- Fallback to in-memory cache if Redis unavailable
+- Fallback to in-memory LRU cache if Redis unavailable
 
 Usage:
     from app.core.cache import cache_service
@@ -22,6 +22,7 @@ Usage:
 
 import json
 import hashlib
+from collections import OrderedDict
 from typing import Any, Optional, Dict
 from datetime import timedelta
 import redis.asyncio as redis
@@ -39,20 +40,23 @@ class CacheService:
     - Automatic JSON serialization/deserialization
     - Key namespacing for different systems
     - TTL support
-    - In-memory fallback when Redis unavailable
+    - In-memory LRU fallback when Redis unavailable
     - Cache hit/miss metrics
     """
 
-    def __init__(self, redis_url: Optional[str] = None):
+    def __init__(self, redis_url: Optional[str] = None, fallback_maxsize: int = 5000):
         """
         Initialize cache service.
 
         Args:
             redis_url: Redis connection URL (optional)
+            fallback_maxsize: Maximum entries kept by the in-memory fallback
         """
         self.redis_url = redis_url or "redis://localhost:6379/0"
         self.redis_client: Optional[redis.Redis] = None
-        self.fallback_cache: Dict[str, Any] = {}  # In-memory fallback
+        # In-memory fallback (LRU, values stored serialized like in Redis)
+        self.fallback_cache: "OrderedDict[str, str]" = OrderedDict()
+        self.fallback_maxsize = fallback_maxsize
         self.use_fallback = False
 
         # Metrics
@@ -129,8 +133,9 @@ class CacheService:
                 # Use in-memory cache
                 value = self.fallback_cache.get(key)
                 if value is not None:
+                    self.fallback_cache.move_to_end(key)
                     self.hits += 1
-                    return value
+                    return json.loads(value)
                 self.misses += 1
                 return None
 
@@ -171,8 +176,11 @@ class CacheService:
             serialized = json.dumps(value)
 
             if self.use_fallback:
-                # Use in-memory cache (no TTL support in fallback)
-                self.fallback_cache[key] = value
+                # Use in-memory cache (no TTL support in fallback, LRU bounded)
+                self.fallback_cache[key] = serialized
+                self.fallback_cache.move_to_end(key)
+                while len(self.fallback_cache) > self.fallback_maxsize:
+                    self.fallback_cache.popitem(last=False)
                 return True
 
             # Use Redis
@@ -340,6 +348,7 @@ class CacheNamespace:
     VARSHAPHAL = "varshaphal"
     COMPATIBILITY = "compatibility"
     CHARTS = "charts"
+    VARGAS = "vargas"
     PROFILES = "profiles"
 
 
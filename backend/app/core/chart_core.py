@@ -0,0 +1,283 @@
+"""
+Compact in-memory chart model.
+
+Charts travel through the services as nested dicts
+(`{"Moon": {"sign_num": 5, "house": 4, ...}}`): every lookup hashes a
+string key, and every cached chart carries a dict per planet plus a dict per
+nakshatra. ChartCore keeps the same data in `__slots__` objects with integer
+sign, house and nakshatra indices:
+
+- PlanetPosition: one slotted object per body (no per-instance __dict__)
+- ChartCore: bodies in a tuple plus name -> index lookup, with precomputed
+  sign / house occupancy for the common "who is in house N" questions
+- Exact converters from and to the dict format, so dicts are only built at
+  API edges
+- The shared chart constants (sign and nakshatra names and lords, planet
+  groups, ascendant keys)
+
+ChartFacts (app.services.chart_facts) builds its house and sign occupancy
+from a ChartCore.
+
+Indices follow the dict format: sign_num and house are 1-12, nakshatra is
+1-27, pada 1-4. Fields missing from the source dict are None.
+
+Usage:
+    from app.core.chart_core import ChartCore
+
+    core = ChartCore.from_chart(chart_data)
+    core["Moon"].house                  # 4
+    core.planets_in_house(10)           # ("Sun", "Mercury")
+    chart_data["planets"] == core.to_planets()
+"""
+
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+SIGN_NAMES = (
+    "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+    "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
+)
+
+# Sign lordships (1-indexed: 1=Aries, 12=Pisces)
+SIGN_LORDS = (
+    None, "Mars", "Venus", "Mercury", "Moon", "Sun", "Mercury",
+    "Venus", "Mars", "Jupiter", "Saturn", "Saturn", "Jupiter"
+)
+
+NAKSHATRA_NAMES = (
+    "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra",
+    "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni",
+    "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha",
+    "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha",
+    "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
+)
+
+# Vimshottari lords, repeating every 9 nakshatras
+NAKSHATRA_LORDS = ("Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury")
+
+GRAHAS = ("Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu")
+
+SEVEN_PLANETS = GRAHAS[:7]
+
+# Keys used for the ascendant when it is stored among the planets
+ASCENDANT_KEYS = ("Ascendant", "Lagna", "ASC")
+
+_SIGN_NUMBERS = frozenset(range(1, 13))
+
+# Dict fields held in slots, in the order the chart engine writes them
+_FIELDS = (
+    "sign_num", "degree", "longitude", "speed", "retrograde", "house",
+    "exalted", "debilitated", "own_sign", "combust", "combustion_distance", "vargottama"
+)
+
+
+def _is_engine_nakshatra(nakshatra: Any) -> bool:
+    """
+    Whether a nakshatra value has the engine's {"name", "number", "lord",
+    "pada"} shape and can be rebuilt from its number. Anything else is kept
+    verbatim.
+    """
+    if not isinstance(nakshatra, dict) or set(nakshatra) != {"name", "number", "lord", "pada"}:
+        return False
+    number = nakshatra["number"]
+    if not isinstance(number, int) or not 1 <= number <= 27:
+        return False
+    return nakshatra["name"] == NAKSHATRA_NAMES[number - 1] and nakshatra["lord"] == NAKSHATRA_LORDS[(number - 1) % 9]
+
+
+class PlanetPosition:
+    """Position and dignity of one body (fields absent from the source are None)"""
+
+    __slots__ = ("name", "nakshatra", "pada", "extra", *_FIELDS)
+
+    def __init__(
+        self,
+        name: str,
+        sign_num: Optional[int],
+        longitude: Optional[float] = None,
+        degree: Optional[float] = None,
+        house: Optional[int] = None,
+        speed: Optional[float] = None,
+        retrograde: Optional[bool] = None,
+        exalted: Optional[bool] = None,
+        debilitated: Optional[bool] = None,
+        own_sign: Optional[bool] = None,
+        combust: Optional[bool] = None,
+        combustion_distance: Optional[float] = None,
+        vargottama: Optional[bool] = None,
+        nakshatra: Optional[int] = None,
+        pada: Optional[int] = None,
+        extra: Optional[Dict[str, Any]] = None
+    ):
+        self.name = name
+        self.sign_num = sign_num
+        self.longitude = longitude
+        self.degree = degree
+        self.house = house
+        self.speed = speed
+        self.retrograde = retrograde
+        self.exalted = exalted
+        self.debilitated = debilitated
+        self.own_sign = own_sign
+        self.combust = combust
+        self.combustion_distance = combustion_distance
+        self.vargottama = vargottama
+        self.nakshatra = nakshatra
+        self.pada = pada
+        self.extra = extra
+
+    @property
+    def sign(self) -> Optional[str]:
+        """Sign name"""
+        return SIGN_NAMES[self.sign_num - 1] if self.sign_num in _SIGN_NUMBERS else None
+
+    @property
+    def nakshatra_name(self) -> Optional[str]:
+        return NAKSHATRA_NAMES[self.nakshatra - 1] if self.nakshatra else None
+
+    @property
+    def nakshatra_lord(self) -> Optional[str]:
+        return NAKSHATRA_LORDS[(self.nakshatra - 1) % 9] if self.nakshatra else None
+
+    @classmethod
+    def from_dict(cls, name: str, data: Dict[str, Any]) -> "PlanetPosition":
+        """Build from the chart engine's planet dict"""
+        data = dict(data)
+        sign_name = data.pop("sign", None)
+        sign_num = data.pop("sign_num", None)
+        if sign_num is None and sign_name in SIGN_NAMES:
+            sign_num = SIGN_NAMES.index(sign_name) + 1
+
+        position = cls(name, int(sign_num) if sign_num is not None else None)
+        for field in _FIELDS[1:]:
+            if field in data:
+                setattr(position, field, data.pop(field))
+
+        nakshatra = data.get("nakshatra")
+        if _is_engine_nakshatra(nakshatra):
+            del data["nakshatra"]
+            position.nakshatra = nakshatra["number"]
+            position.pada = nakshatra["pada"]
+
+        if sign_name is not None and sign_name != position.sign:
+            data["sign"] = sign_name
+        position.extra = data or None
+        return position
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert back to the chart engine's planet dict"""
+        data: Dict[str, Any] = {"sign": self.sign} if self.sign is not None else {}
+        for field in _FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                data[field] = value
+        if self.nakshatra is not None:
+            data["nakshatra"] = {
+                "name": self.nakshatra_name,
+                "number": self.nakshatra,
+                "lord": self.nakshatra_lord,
+                "pada": self.pada
+            }
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __repr__(self) -> str:
+        return f"PlanetPosition({self.name}, {self.sign}, house={self.house})"
+
+
+class ChartCore:
+    """
+    Slotted chart: bodies, ascendant and sign / house occupancy.
+
+    Bodies keep the order of the source dict, including non-graha entries
+    such as an "Ascendant" stored among the planets.
+    """
+
+    __slots__ = ("planets", "ascendant_sign_num", "ascendant_longitude", "_index", "_by_house", "_by_sign")
+
+    def __init__(
+        self,
+        planets: Tuple[PlanetPosition, ...],
+        ascendant_sign_num: Optional[int] = None,
+        ascendant_longitude: Optional[float] = None
+    ):
+        self.planets = tuple(planets)
+        self.ascendant_sign_num = ascendant_sign_num
+        self.ascendant_longitude = ascendant_longitude
+        self._index = {planet.name: index for index, planet in enumerate(self.planets)}
+
+        by_house = [[] for _ in range(13)]
+        by_sign = [[] for _ in range(13)]
+        for planet in self.planets:
+            if planet.name in ASCENDANT_KEYS:
+                continue
+            if planet.house and 1 <= planet.house <= 12:
+                by_house[planet.house].append(planet.name)
+            if planet.sign_num in _SIGN_NUMBERS:
+                by_sign[planet.sign_num].append(planet.name)
+        self._by_house = tuple(tuple(names) for names in by_house)
+        self._by_sign = tuple(tuple(names) for names in by_sign)
+
+    @classmethod
+    def from_planets(cls, planets: Dict[str, Dict[str, Any]], ascendant: Optional[Dict[str, Any]] = None) -> "ChartCore":
+        """
+        Build from a planets dict (and the chart's ascendant dict, if separate)
+
+        When no ascendant is given, an "Ascendant"/"Lagna"/"ASC" entry of the
+        planets dict is used.
+        """
+        positions = tuple(PlanetPosition.from_dict(name, data) for name, data in planets.items())
+
+        if ascendant is None:
+            ascendant = next((planets[key] for key in ASCENDANT_KEYS if key in planets), None)
+
+        ascendant_sign_num = ascendant_longitude = None
+        if ascendant:
+            ascendant_sign_num = ascendant.get("sign_num")
+            if ascendant_sign_num is None and ascendant.get("sign") in SIGN_NAMES:
+                ascendant_sign_num = SIGN_NAMES.index(ascendant["sign"]) + 1
+            ascendant_longitude = ascendant.get("longitude")
+
+        return cls(positions, ascendant_sign_num, ascendant_longitude)
+
+    @classmethod
+    def from_chart(cls, chart: Dict[str, Any]) -> "ChartCore":
+        """Build from a full chart dict ("planets" and "ascendant")"""
+        return cls.from_planets(chart.get("planets", {}), chart.get("ascendant"))
+
+    def to_planets(self) -> Dict[str, Dict[str, Any]]:
+        """Convert back to the planets dict format"""
+        return {planet.name: planet.to_dict() for planet in self.planets}
+
+    def __getitem__(self, name: str) -> PlanetPosition:
+        return self.planets[self._index[name]]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def __iter__(self) -> Iterator[PlanetPosition]:
+        return iter(self.planets)
+
+    def __len__(self) -> int:
+        return len(self.planets)
+
+    def get(self, name: str) -> Optional[PlanetPosition]:
+        index = self._index.get(name)
+        return self.planets[index] if index is not None else None
+
+    def planets_in_house(self, house: int) -> Tuple[str, ...]:
+        """Bodies occupying a house (1-12)"""
+        return self._by_house[house]
+
+    def planets_in_sign(self, sign_num: int) -> Tuple[str, ...]:
+        """Bodies occupying a sign (1-12)"""
+        return self._by_sign[sign_num]
+
+    def house_sign(self, house: int) -> Optional[int]:
+        """Sign of a whole-sign house, counted from the ascendant"""
+        if self.ascendant_sign_num is None:
+            return None
+        return (self.ascendant_sign_num + house - 2) % 12 + 1
+
+    def __repr__(self) -> str:
+        return f"ChartCore({len(self.planets)} bodies, ascendant={self.ascendant_sign_num})"
@@ -0,0 +1,377 @@
+"""
+Process-pool compute executor for CPU-bound astrology work.
+
+Swiss Ephemeris calculations, yoga detection, muhurta searches and birth time
+rectification are synchronous and CPU heavy. Called directly from async
+endpoints they block the event loop, so one heavy chart stalls every other
+request on that worker. This executor runs them in worker processes instead.
+
+Provides:
+- Process pool with Swiss Ephemeris (Lahiri) initialized once per worker
+- Bounded queue: at most `max_pending` tasks queued or running at once
+- Backpressure: callers wait up to `queue_timeout` for a slot, then get 503
+- Per-task timeouts (504)
+- Thread fallback when workers=0 (development, tests)
+- Metrics recorded in workers (app.core.metrics) are merged into the main
+  process, so /metrics covers work done in the pool
+
+Usage:
+    from app.core.compute import compute_executor
+
+    chart = await compute_executor.run(
+        astrology_service.calculate_birth_chart,
+        name=name, birth_date=birth_date, ...
+    )
+
+Callables must be module-level functions or methods of module-level
+singletons (e.g. muhurta_service.calculate_panchang). They are sent to the
+worker by name and resolved there, so service state is never pickled.
+Arguments and return values must be picklable.
+"""
+
+import asyncio
+import importlib
+import inspect
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Imported when a worker starts so the first task does not pay for it
+WARM_MODULES = (
+    "app.services.vedic_astrology_accurate",
+)
+
+# How often a caller re-checks for a free slot while the queue is full
+_SLOT_POLL_INTERVAL = 0.05
+
+
+class ComputeOverloadedError(HTTPException):
+    """All compute slots are busy - the caller should retry later (503)"""
+
+    def __init__(self, detail: str = "Server is busy with other calculations, please retry shortly"):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers={"Retry-After": "2"}
+        )
+
+
+class ComputeTimeoutError(HTTPException):
+    """A compute task exceeded its time budget (504)"""
+
+    def __init__(self, detail: str = "Calculation took too long"):
+        super().__init__(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail=detail)
+
+
+def _init_worker() -> None:
+    """Process pool initializer: configure Swiss Ephemeris once per worker"""
+    import swisseph as swe
+
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+
+    for module_name in WARM_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except Exception as e:
+            logger.warning(f"⚠️  Compute worker could not preload {module_name}: {e}")
+
+
+def _callable_ref(func: Callable) -> Tuple[str, ...]:
+    """
+    Build a picklable reference to a function or singleton method.
+
+    Returns:
+        (module, attribute, ...) path resolvable with importlib in any process
+
+    Raises:
+        ValueError: If func is a method of an object that is not a
+            module-level singleton
+    """
+    owner = getattr(func, "__self__", None)
+    if owner is None or inspect.ismodule(owner):
+        return (func.__module__, *func.__qualname__.split("."))
+
+    module = importlib.import_module(type(owner).__module__)
+    for name, value in vars(module).items():
+        if value is owner:
+            return (module.__name__, name, func.__name__)
+
+    raise ValueError(
+        f"{type(owner).__name__}.{func.__name__} is not bound to a module-level singleton "
+        "and cannot be sent to a compute worker"
+    )
+
+
+def _invoke(ref: Tuple[str, ...], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Worker entry point: resolve the callable by name and run it
+
+    Returns:
+        (result, metrics recorded in the worker since its last task), merged
+        into the main process registry by ComputeExecutor.run
+    """
+    target: Any = importlib.import_module(ref[0])
+    for attr in ref[1:]:
+        target = getattr(target, attr)
+    return target(*args, **kwargs), metrics.drain()
+
+
+class ComputeExecutor:
+    """
+    Bounded executor for CPU-bound calculations.
+
+    Settings default to COMPUTE_* values from app.core.config and are read
+    when the first task is submitted.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        queue_timeout: Optional[float] = None,
+        task_timeout: Optional[float] = None,
+        start_method: Optional[str] = None
+    ):
+        """
+        Initialize compute executor.
+
+        Args:
+            workers: Worker processes (0 = run tasks in threads)
+            max_pending: Maximum tasks queued or running at once
+            queue_timeout: Seconds to wait for a free slot before rejecting
+            task_timeout: Default seconds allowed per task
+            start_method: multiprocessing start method ("spawn", "fork", ...)
+        """
+        self.workers = workers
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self.task_timeout = task_timeout
+        self.start_method = start_method
+
+        self._pool = None
+        self._lock = threading.Lock()
+        self._pending = 0
+
+        # Metrics
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.timeouts = 0
+
+    def _configure(self) -> None:
+        """Fill unset options from application settings"""
+        if None not in (self.workers, self.max_pending, self.queue_timeout, self.task_timeout, self.start_method):
+            return
+
+        from app.core.config import settings
+
+        if self.workers is None:
+            self.workers = settings.COMPUTE_WORKERS
+        if self.max_pending is None:
+            self.max_pending = settings.COMPUTE_MAX_PENDING
+        if self.queue_timeout is None:
+            self.queue_timeout = settings.COMPUTE_QUEUE_TIMEOUT
+        if self.task_timeout is None:
+            self.task_timeout = settings.COMPUTE_TASK_TIMEOUT
+        if self.start_method is None:
+            self.start_method = settings.COMPUTE_START_METHOD
+
+    def _get_pool(self):
+        """Create the worker pool on first use"""
+        with self._lock:
+            if self._pool is None:
+                if self.workers > 0:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context(self.start_method),
+                        initializer=_init_worker
+                    )
+                    logger.info(f"✅ Compute process pool started ({self.workers} workers)")
+                else:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=max(1, self.max_pending),
+                        thread_name_prefix="compute"
+                    )
+            return self._pool
+
+    def _try_acquire_slot(self) -> bool:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                return False
+            self._pending += 1
+            return True
+
+    def _release_slot(self, _future: Optional[Future] = None) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    async def _acquire_slot(self) -> bool:
+        """Wait up to queue_timeout for a free slot"""
+        deadline = time.monotonic() + self.queue_timeout
+        while not self._try_acquire_slot():
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(_SLOT_POLL_INTERVAL)
+        return True
+
+    def _submit(self, func: Callable, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Future:
+        pool = self._get_pool()
+
+        if isinstance(pool, ThreadPoolExecutor):
+            return pool.submit(func, *args, **kwargs)
+
+        ref = _callable_ref(func)
+        try:
+            return pool.submit(_invoke, ref, args, kwargs)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM) - start a fresh pool and retry once
+            logger.warning("⚠️  Compute pool was broken, restarting workers")
+            with self._lock:
+                self._pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+            return self._get_pool().submit(_invoke, ref, args, kwargs)
+
+    async def run(
+        self,
+        func: Callable,
+        *args: Any,
+        task_timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Run a CPU-bound callable off the event loop and await its result.
+
+        Args:
+            func: Module-level function or method of a module-level singleton
+            *args: Positional arguments for func
+            task_timeout: Seconds allowed for this task (default: task_timeout)
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The callable's return value
+
+        Raises:
+            ComputeOverloadedError: No slot became free within queue_timeout
+            ComputeTimeoutError: The task did not finish in time. The task
+                keeps its slot until the worker actually finishes it, so
+                runaway work still counts against capacity.
+        """
+        self._configure()
+
+        if not await self._acquire_slot():
+            self.rejected += 1
+            raise ComputeOverloadedError()
+
+        try:
+            future = self._submit(func, args, kwargs)
+        except BaseException:
+            self._release_slot()
+            raise
+
+        future.add_done_callback(self._release_slot)
+        self.submitted += 1
+
+        timeout = task_timeout if task_timeout is not None else self.task_timeout
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise ComputeTimeoutError(
+                f"{getattr(func, '__name__', 'Calculation')} did not finish within {timeout:g}s"
+            )
+        except Exception:
+            self.failed += 1
+            raise
+
+        if self.workers > 0:
+            result, task_metrics = result
+            metrics.merge(task_metrics)
+
+        self.completed += 1
+        return result
+
+    async def run_batch(
+        self,
+        func: Callable,
+        items: List[Any],
+        *args: Any,
+        task_timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> List[Any]:
+        """
+        Split items into one chunk per worker and process the chunks in parallel.
+
+        Args:
+            func: Callable taking a list of items (plus *args/**kwargs) and
+                returning one result per item, in order
+            items: Items to process
+            task_timeout: Seconds allowed per chunk (default: task_timeout)
+
+        Returns:
+            Concatenated results in the order of items. Every item of a chunk
+            that failed (error, timeout or rejection) gets the chunk's
+            exception instead of a result, so one bad chunk does not fail
+            the others.
+        """
+        if not items:
+            return []
+
+        self._configure()
+        chunk_count = min(len(items), max(1, self.workers))
+        chunk_size = -(-len(items) // chunk_count)
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+        chunk_results = await asyncio.gather(*[
+            self.run(func, chunk, *args, task_timeout=task_timeout, **kwargs)
+            for chunk in chunks
+        ], return_exceptions=True)
+
+        results = []
+        for chunk, chunk_result in zip(chunks, chunk_results):
+            if isinstance(chunk_result, BaseException):
+                results.extend([chunk_result] * len(chunk))
+            else:
+                results.extend(chunk_result)
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get executor statistics.
+
+        Returns:
+            Dictionary with pool mode, current load and task counters
+        """
+        self._configure()
+        return {
+            "mode": "process" if self.workers > 0 else "thread",
+            "workers": self.workers,
+            "pending": self._pending,
+            "max_pending": self.max_pending,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts
+        }
+
+    def shutdown(self) -> None:
+        """Stop worker processes (called on application shutdown)"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Global compute executor instance
+compute_executor = ComputeExecutor()
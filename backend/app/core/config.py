@@ -42,6 +42,16 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
 
+    # Compute executor (CPU-bound chart, yoga, muhurta and rectification work)
+    COMPUTE_WORKERS: int = 2  # Process pool size; 0 runs tasks in a thread instead
+    COMPUTE_MAX_PENDING: int = 32  # Queued + running tasks before callers are turned away
+    COMPUTE_QUEUE_TIMEOUT: float = 2.0  # Seconds to wait for a free slot before 503
+    COMPUTE_TASK_TIMEOUT: float = 60.0  # Seconds per task before 504
+    COMPUTE_START_METHOD: str = "spawn"  # multiprocessing start method for workers
+
+    # Precomputed daily ephemeris table (scripts/generate_ephemeris_table.py)
+    EPHEMERIS_TABLE_PATH: str = ""  # Empty = data/ephemeris/lahiri_daily.npy
+
     # CORS
     ALLOWED_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:3001"]
 
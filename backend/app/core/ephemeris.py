@@ -0,0 +1,165 @@
+"""
+Shared Swiss Ephemeris position cache.
+
+Services used to call swe.calc_ut independently for the same instant and
+body: transits and Sade Sati both compute Saturn for "today", and every
+Panchang element (tithi, yoga, karana, ...) recomputes the Sun and Moon.
+All ephemeris lookups go through this module instead.
+
+Provides:
+- LRU cache keyed on (quantized Julian day, body, flags)
+- Cached ayanamsa lookups
+- Hit/miss metrics
+
+Julian days are quantized to `quantum_seconds` (default 1 second) and the
+position is always computed at the quantized instant, so results do not
+depend on what was cached before. One second moves the Moon by about half
+an arc-second.
+
+Usage:
+    import swisseph as swe
+    from app.core.ephemeris import ephemeris
+
+    (lon, lat, dist, lon_speed, lat_speed, dist_speed), ret = ephemeris.calc_ut(jd, swe.SUN)
+    ayanamsa = ephemeris.get_ayanamsa_ut(jd)
+
+The cache lives in process memory: each compute worker process keeps its
+own cache and its own counters.
+
+Sidereal results (FLG_SIDEREAL, ayanamsa) assume the process-wide Lahiri
+mode set by every service at import time.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Tuple
+
+import swisseph as swe
+
+SECONDS_PER_DAY = 86400.0
+
+# Same default as swe.calc_ut
+DEFAULT_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+
+class EphemerisCache:
+    """
+    Thread-safe LRU cache in front of Swiss Ephemeris.
+
+    Features:
+    - Drop-in replacements for swe.calc_ut and swe.get_ayanamsa_ut
+    - Bounded size with least-recently-used eviction
+    - Hit/miss metrics
+    """
+
+    def __init__(self, maxsize: int = 20000, quantum_seconds: float = 1.0):
+        """
+        Initialize ephemeris cache.
+
+        Args:
+            maxsize: Maximum cached entries (0 disables caching)
+            quantum_seconds: Julian day resolution of cache keys
+        """
+        self.maxsize = maxsize
+        self.quantum_seconds = quantum_seconds
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+
+    def quantize(self, jd: float) -> float:
+        """Round a Julian day to the cache resolution"""
+        quantum = self.quantum_seconds / SECONDS_PER_DAY
+        return round(jd / quantum) * quantum
+
+    def _lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def calc_ut(self, jd: float, body: int, flags: int = DEFAULT_FLAGS) -> Tuple[Tuple[float, ...], int]:
+        """
+        Cached swe.calc_ut.
+
+        Args:
+            jd: Julian day (UT)
+            body: Swiss Ephemeris body number (swe.SUN, swe.MOON, ...)
+            flags: Calculation flags (default FLG_SWIEPH | FLG_SPEED)
+
+        Returns:
+            (positions, retflags) exactly as swe.calc_ut
+
+        Raises:
+            swe.Error: Propagated from Swiss Ephemeris (errors are not cached)
+        """
+        jd = self.quantize(jd)
+        key = (jd, body, flags)
+
+        found, value = self._lookup(key)
+        if found:
+            return value
+
+        value = swe.calc_ut(jd, body, flags)
+        self._store(key, value)
+        return value
+
+    def longitude(self, jd: float, body: int, flags: int = DEFAULT_FLAGS) -> float:
+        """Cached ecliptic longitude of a body in degrees"""
+        return self.calc_ut(jd, body, flags)[0][0]
+
+    def get_ayanamsa_ut(self, jd: float) -> float:
+        """Cached swe.get_ayanamsa_ut (current sidereal mode)"""
+        jd = self.quantize(jd)
+        key = ("ayanamsa", jd)
+
+        found, value = self._lookup(key)
+        if found:
+            return value
+
+        value = swe.get_ayanamsa_ut(jd)
+        self._store(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop all cached positions (e.g. after changing the sidereal mode)"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counts, hit rate and current size
+        """
+        total_requests = self.hits + self.misses
+        hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(hit_rate, 2),
+            "total_requests": total_requests,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "quantum_seconds": self.quantum_seconds
+        }
+
+
+# Global ephemeris cache instance
+ephemeris = EphemerisCache()
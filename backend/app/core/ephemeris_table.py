@@ -0,0 +1,286 @@
+"""
+Precomputed daily ephemeris table (memory-mapped).
+
+Transit, Sade Sati, cosmic-energy and calendar-year questions mostly need
+daily positions of the grahas over months or years. Instead of thousands of
+swe.calc_ut calls, they can read a precomputed table:
+
+- float32 array of shape (days, bodies, 2): sidereal (Lahiri) longitude in
+  degrees and speed in degrees/day, sampled every day at 0h UT
+- bodies: Sun, Moon, Mars, Mercury, Jupiter, Venus, Saturn, Rahu (mean
+  node) and the Lahiri ayanamsa itself (to convert back to tropical).
+  Ketu is derived as Rahu + 180°.
+- served with np.load(mmap_mode="r"), so every worker process shares the
+  same page-cache pages and nothing is read until it is used
+
+Generate it with:
+    python scripts/generate_ephemeris_table.py            # 1900-2100
+    python scripts/generate_ephemeris_table.py --start-year 1950 --end-year 2050
+
+Error bounds (measured by the generator against swe.calc_ut at random
+instants and stored in the metadata file as max_error_deg):
+- Whole days (day slices): float32 rounding only, below 0.00005°
+- Arbitrary instants (cubic Hermite between days using the stored speeds):
+  below 0.001° for every body over 1900-2100 (Saturn ~0.0007°, Venus
+  ~0.0003°, Moon and Mercury ~0.0002°, Sun, Mars, Jupiter, Rahu and the
+  ayanamsa below 0.0001°). For comparison the Moon moves 0.001° in under
+  10 seconds.
+
+Usage:
+    from app.core.ephemeris_table import ephemeris_table
+
+    if ephemeris_table.available:
+        moon = ephemeris_table.longitude("Moon", jd)
+        saturn = ephemeris_table.longitudes("Saturn", jd_array)
+        jupiter_daily = ephemeris_table.daily("Jupiter", date(2025, 1, 1), date(2026, 1, 1))
+
+Callers fall back to swe.calc_ut (via app.core.ephemeris) when the table
+has not been generated or does not cover the requested dates.
+"""
+
+import json
+import logging
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+DEFAULT_TABLE_PATH = BACKEND_DIR / "data" / "ephemeris" / "lahiri_daily.npy"
+
+# Body order of the table's second axis
+TABLE_BODIES = ("Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ayanamsa")
+
+LONGITUDE, SPEED = 0, 1
+
+# Julian day of 1970-01-01 0h UT, used to convert dates without swisseph
+_JD_UNIX_EPOCH = 2440587.5
+_ORDINAL_UNIX_EPOCH = date(1970, 1, 1).toordinal()
+
+
+def date_to_jd(day: date) -> float:
+    """Julian day at 0h UT of a calendar date"""
+    return _JD_UNIX_EPOCH + (day.toordinal() - _ORDINAL_UNIX_EPOCH)
+
+
+def metadata_path(table_path: Union[str, Path]) -> Path:
+    """Path of the JSON metadata written next to a table"""
+    return Path(table_path).with_suffix(".json")
+
+
+class EphemerisTable:
+    """
+    Read-only access to the memory-mapped daily ephemeris table.
+
+    The table is opened on first use; `available` is False when the file
+    does not exist, so callers can fall back to Swiss Ephemeris.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Initialize ephemeris table.
+
+        Args:
+            path: Table file (.npy). Defaults to EPHEMERIS_TABLE_PATH from
+                settings, or data/ephemeris/lahiri_daily.npy
+        """
+        self.path = Path(path) if path else None
+        self._data: Optional[np.ndarray] = None
+        self._metadata: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._load_failed = False
+
+    def _resolve_path(self) -> Path:
+        if self.path is None:
+            try:
+                from app.core.config import settings
+                configured = settings.EPHEMERIS_TABLE_PATH
+            except Exception:
+                configured = ""
+            path = Path(configured) if configured else DEFAULT_TABLE_PATH
+            self.path = path if path.is_absolute() else BACKEND_DIR / path
+        return self.path
+
+    def _load(self) -> Optional[np.ndarray]:
+        if self._data is not None or self._load_failed:
+            return self._data
+
+        with self._lock:
+            if self._data is None and not self._load_failed:
+                path = self._resolve_path()
+                try:
+                    self._metadata = json.loads(metadata_path(path).read_text())
+                    self._data = np.load(path, mmap_mode="r")
+                    logger.info(f"✅ Ephemeris table loaded: {path} ({self._data.shape[0]} days)")
+                except FileNotFoundError:
+                    self._load_failed = True
+                    logger.info(f"ℹ️  Ephemeris table not found at {path}, using Swiss Ephemeris directly")
+                except Exception as e:
+                    self._load_failed = True
+                    logger.warning(f"⚠️  Could not load ephemeris table {path}: {e}")
+        return self._data
+
+    @property
+    def available(self) -> bool:
+        """Whether the table file exists and could be opened"""
+        return self._load() is not None
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Generator metadata (range, bodies, measured max_error_deg, ...)"""
+        self._load()
+        return self._metadata
+
+    @property
+    def start_jd(self) -> float:
+        return float(self.metadata["start_jd"])
+
+    @property
+    def end_jd(self) -> float:
+        """Julian day of the last sample"""
+        return self.start_jd + self._require().shape[0] - 1
+
+    def covers(self, start_jd: float, end_jd: Optional[float] = None) -> bool:
+        """Whether [start_jd, end_jd] lies inside the table"""
+        if not self.available:
+            return False
+        end_jd = start_jd if end_jd is None else end_jd
+        return self.start_jd <= start_jd and end_jd <= self.end_jd
+
+    def _require(self) -> np.ndarray:
+        data = self._load()
+        if data is None:
+            raise FileNotFoundError(
+                f"Ephemeris table not found at {self._resolve_path()}. "
+                "Run scripts/generate_ephemeris_table.py"
+            )
+        return data
+
+    def _body_index(self, body: str) -> int:
+        try:
+            return TABLE_BODIES.index("Rahu" if body == "Ketu" else body)
+        except ValueError:
+            raise ValueError(f"Unknown body: {body}. Valid bodies: {', '.join(TABLE_BODIES)}, Ketu")
+
+    def _adjust(self, values: np.ndarray, ayanamsa: Any, body: str, sidereal: bool) -> np.ndarray:
+        """Derive Ketu from Rahu and convert to tropical when requested"""
+        if body == "Ketu":
+            values = values + 180.0
+        if not sidereal and body != "Ayanamsa":
+            values = values + ayanamsa
+        return np.mod(values, 360.0) if body != "Ayanamsa" else values
+
+    def longitudes(self, body: str, jds: Any, sidereal: bool = True) -> np.ndarray:
+        """
+        Longitudes at arbitrary instants (cubic Hermite interpolation).
+
+        Args:
+            body: Sun, Moon, Mars, Mercury, Jupiter, Venus, Saturn, Rahu,
+                Ketu or Ayanamsa
+            jds: Julian day(s) in UT (scalar or array)
+            sidereal: Lahiri sidereal (default) or tropical longitudes
+
+        Returns:
+            float64 array of longitudes in degrees (0-360)
+
+        Raises:
+            ValueError: Unknown body or instants outside the table
+        """
+        data = self._require()
+        jds = np.asarray(jds, dtype=np.float64)
+        index = self._body_index(body)
+
+        offset = jds - self.start_jd
+        if np.any(offset < 0) or np.any(offset > data.shape[0] - 1):
+            raise ValueError(
+                f"Julian day outside ephemeris table range {self.start_jd}-{self.end_jd}"
+            )
+
+        i0 = np.minimum(np.floor(offset).astype(np.int64), data.shape[0] - 2)
+        t = offset - i0
+
+        p0 = data[i0, index, LONGITUDE].astype(np.float64)
+        p1 = data[i0 + 1, index, LONGITUDE].astype(np.float64)
+        m0 = data[i0, index, SPEED].astype(np.float64)
+        m1 = data[i0 + 1, index, SPEED].astype(np.float64)
+
+        # Unwrap across 360° -> 0° (no body moves 180° in a day)
+        p1 = p0 + (np.mod(p1 - p0 + 180.0, 360.0) - 180.0)
+
+        t2 = t * t
+        t3 = t2 * t
+        values = (
+            (2 * t3 - 3 * t2 + 1) * p0
+            + (t3 - 2 * t2 + t) * m0
+            + (-2 * t3 + 3 * t2) * p1
+            + (t3 - t2) * m1
+        )
+
+        ayanamsa = 0.0
+        if not sidereal:
+            ayanamsa = self.longitudes("Ayanamsa", jds)
+        return self._adjust(values, ayanamsa, body, sidereal)
+
+    def longitude(self, body: str, jd: float, sidereal: bool = True) -> float:
+        """Longitude of one body at one instant (see longitudes())"""
+        return float(self.longitudes(body, jd, sidereal))
+
+    def speed(self, body: str, jd: float) -> float:
+        """Speed in degrees/day (linear interpolation; negative = retrograde)"""
+        data = self._require()
+        index = self._body_index(body)
+        offset = jd - self.start_jd
+        if offset < 0 or offset > data.shape[0] - 1:
+            raise ValueError(
+                f"Julian day outside ephemeris table range {self.start_jd}-{self.end_jd}"
+            )
+        i0 = min(int(offset), data.shape[0] - 2)
+        t = offset - i0
+        return float((1 - t) * data[i0, index, SPEED] + t * data[i0 + 1, index, SPEED])
+
+    def daily(
+        self,
+        body: str,
+        start: date,
+        end: date,
+        sidereal: bool = True,
+        column: int = LONGITUDE
+    ) -> np.ndarray:
+        """
+        Daily values at 0h UT for start <= day < end (array slicing, no interpolation).
+
+        Args:
+            body: Body name (see longitudes())
+            start: First day
+            end: Day after the last day
+            sidereal: Lahiri sidereal (default) or tropical longitudes
+            column: LONGITUDE or SPEED
+
+        Returns:
+            float64 array with one value per day
+        """
+        data = self._require()
+        index = self._body_index(body)
+        first = int(date_to_jd(start) - self.start_jd)
+        last = int(date_to_jd(end) - self.start_jd)
+        if first < 0 or last > data.shape[0]:
+            raise ValueError(f"Dates outside ephemeris table range ({self.metadata.get('start_date')} - {self.metadata.get('end_date')})")
+
+        values = data[first:last, index, column].astype(np.float64)
+        if column == SPEED:
+            return values
+
+        ayanamsa = data[first:last, TABLE_BODIES.index("Ayanamsa"), LONGITUDE] if not sidereal else 0.0
+        return self._adjust(values, ayanamsa, body, sidereal)
+
+    def bodies(self) -> List[str]:
+        """Bodies available from the table (Ketu is derived from Rahu)"""
+        return [*TABLE_BODIES[:-1], "Ketu"]
+
+
+# Global ephemeris table instance
+ephemeris_table = EphemerisTable()
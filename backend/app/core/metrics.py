@@ -0,0 +1,201 @@
+"""
+Lightweight in-process metrics with Prometheus text export.
+
+Provides:
+- Histograms with fixed buckets and labels
+- `timer()` context manager for timing code blocks
+- Prometheus text exposition (served on /metrics)
+- Collection from compute worker processes: each task's observations are
+  drained in the worker and merged into the main process registry
+
+Usage:
+    from app.core.metrics import metrics, CHART_STAGE_SECONDS
+
+    with metrics.timer(CHART_STAGE_SECONDS, stage="yogas"):
+        yogas = detect_yogas(...)
+
+    text = metrics.render()
+"""
+
+import math
+import threading
+from bisect import bisect_left
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Seconds, from sub-millisecond stages up to AI calls
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == math.inf else repr(float(bound))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Histogram:
+    """Cumulative histogram per label combination"""
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = (), buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Initialize histogram.
+
+        Args:
+            name: Metric name (Prometheus naming, e.g. jioastro_..._seconds)
+            documentation: HELP text
+            labels: Label names
+            buckets: Upper bounds of the buckets (+Inf is added)
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [bucket counts..., +Inf count], sum
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: Dict[str, Any]) -> LabelValues:
+        if set(labels) != set(self.labels):
+            raise ValueError(f"{self.name} expects labels {self.labels}, got {tuple(labels)}")
+        return tuple(str(labels[label]) for label in self.labels)
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record one observation"""
+        key = self._label_values(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._series.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    def drain(self) -> Dict[LabelValues, Tuple[List[int], float]]:
+        """Return and reset all observations (used by compute workers)"""
+        with self._lock:
+            series, self._series = self._series, {}
+        return {key: (counts, total[0]) for key, (counts, total) in series.items()}
+
+    def merge(self, series: Dict[LabelValues, Tuple[List[int], float]]) -> None:
+        """Add observations drained from another process"""
+        with self._lock:
+            for key, (counts, total) in series.items():
+                own_counts, own_total = self._series.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+                for index, count in enumerate(counts):
+                    own_counts[index] += count
+                own_total[0] += total
+
+    def count(self, **labels: Any) -> int:
+        """Number of observations for a label combination"""
+        with self._lock:
+            series = self._series.get(self._label_values(labels))
+            return sum(series[0]) if series else 0
+
+    def render(self) -> List[str]:
+        """Prometheus text exposition lines"""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted((key, list(counts), total[0]) for key, (counts, total) in self._series.items())
+
+        for key, counts, total in series:
+            label_pairs = [f'{label}="{_escape(value)}"' for label, value in zip(self.labels, key)]
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                bucket_labels = ",".join([*label_pairs, f'le="{_format_bound(bound)}"'])
+                lines.append(f"{self.name}_bucket{{{bucket_labels}}} {cumulative}")
+            suffix = "{" + ",".join(label_pairs) + "}" if label_pairs else ""
+            lines.append(f"{self.name}_sum{suffix} {total!r}")
+            lines.append(f"{self.name}_count{suffix} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Process-wide registry of histograms and gauge callbacks"""
+
+    def __init__(self):
+        """Initialize metrics registry"""
+        self._histograms: Dict[str, Histogram] = {}
+        self._gauges: Dict[str, Tuple[str, Callable[[], Dict[str, float]]]] = {}
+        self._lock = threading.Lock()
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Get or create a histogram"""
+        with self._lock:
+            if name not in self._histograms:
+                self._histograms[name] = Histogram(name, documentation, labels, buckets)
+            return self._histograms[name]
+
+    def gauge_callback(self, name: str, documentation: str, collect: Callable[[], Dict[str, float]]) -> None:
+        """
+        Register gauges read at scrape time.
+
+        Args:
+            name: Metric name
+            documentation: HELP text
+            collect: Returns {label value: gauge value}, exported with a
+                "name" label
+        """
+        self._gauges[name] = (documentation, collect)
+
+    @contextmanager
+    def timer(self, histogram: Histogram, **labels: Any) -> Iterator[None]:
+        """Observe the wall-clock duration of a block (also when it raises)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            histogram.observe(time.perf_counter() - started, **labels)
+
+    def drain(self) -> Dict[str, Dict[LabelValues, Tuple[List[int], float]]]:
+        """Return and reset all histogram observations"""
+        with self._lock:
+            histograms = list(self._histograms.values())
+        drained = {histogram.name: histogram.drain() for histogram in histograms}
+        return {name: series for name, series in drained.items() if series}
+
+    def merge(self, snapshot: Optional[Dict[str, Dict[LabelValues, Tuple[List[int], float]]]]) -> None:
+        """Merge observations drained in another process"""
+        for name, series in (snapshot or {}).items():
+            histogram = self._histograms.get(name)
+            if histogram is not None:
+                histogram.merge(series)
+
+    def render(self) -> str:
+        """Prometheus text exposition of every metric"""
+        lines: List[str] = []
+        with self._lock:
+            histograms = sorted(self._histograms.values(), key=lambda histogram: histogram.name)
+        for histogram in histograms:
+            lines.extend(histogram.render())
+
+        for name, (documentation, collect) in sorted(self._gauges.items()):
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} gauge")
+            try:
+                values = collect()
+            except Exception:
+                continue
+            for label, value in sorted(values.items()):
+                lines.append(f'{name}{{name="{_escape(label)}"}} {float(value)!r}')
+
+        return "\n".join(lines) + "\n"
+
+
+# Global metrics registry
+metrics = MetricsRegistry()
+
+CHART_STAGE_SECONDS = metrics.histogram(
+    "jioastro_chart_stage_seconds",
+    "Time spent in each stage of the D1 chart pipeline",
+    labels=("stage",)
+)
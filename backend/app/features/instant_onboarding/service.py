@@ -269,7 +269,9 @@ class InstantOnboardingService:
                 latitude=data["latitude"],
                 longitude=data["longitude"],
                 timezone_str=data.get("timezone", "UTC"),
-                city=data.get("birth_place", "Unknown")
+                city=data.get("birth_place", "Unknown"),
+                # Quick chart only shows positions, yogas and the dasha timeline
+                include=["dasha", "yogas"]
             )
         except Exception as e:
             logger.error(f"Chart calculation failed: {type(e).__name__}: {str(e)}")
@@ -1,7 +1,7 @@
 """Chart Schemas"""
 
 from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Literal, Optional
 from datetime import datetime
 from uuid import UUID
 
@@ -10,7 +10,30 @@ class ChartCalculateRequest(BaseModel):
     """Schema for chart calculation request"""
 
     profile_id: UUID
-    chart_type: str = Field(..., pattern="^(D1|D9|Moon)$")
+    chart_type: str = Field("D1", pattern="^(D1|D9|Moon)$")
+    chart_types: Optional[List[Literal["D1", "D9", "Moon"]]] = Field(
+        None,
+        description="Calculate several charts from one D1 computation; "
+                    "the response is then {\"charts\": {chart_type: chart}}"
+    )
+    include: Optional[List[str]] = Field(
+        None,
+        description="Optional D1 pipeline stages to run on top of core positions "
+                    "(dasha, dasha_ai, yogas, divisional_charts, vimshopaka_bala, vargottama, "
+                    "doshas, transits, sade_sati). Omit to run every stage except divisional_charts, "
+                    "which are served per varga from /charts/{profile_id}/divisional/{division}."
+    )
+
+
+class ChartBatchRequest(BaseModel):
+    """Schema for batch chart calculation request"""
+
+    profile_ids: List[UUID] = Field(..., min_length=1, max_length=200)
+    chart_types: List[Literal["D1", "D9", "Moon"]] = Field(["D1"], min_length=1)
+    include: Optional[List[str]] = Field(
+        None,
+        description="D1 pipeline stages for every profile (see ChartCalculateRequest.include)"
+    )
 
 
 class ChartResponse(BaseModel):
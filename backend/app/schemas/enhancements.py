@@ -278,10 +278,26 @@ class ShadbalaResponse(BaseModel):
 
 # ==================== YOGA DETECTION SCHEMAS ====================
 
+class YogaImportance(str, Enum):
+    """Yoga importance classification"""
+    MAJOR = "major"
+    MODERATE = "moderate"
+    MINOR = "minor"
+
+
 class YogaCalculateRequest(BaseModel):
     """Request for yoga detection"""
     profile_id: str = Field(..., description="Profile ID to analyze yogas")
     include_all: bool = Field(True, description="Include all detected yogas or only strong ones")
+    categories: Optional[List[str]] = Field(
+        None,
+        description="Only detect these yoga families (e.g. wealth, raj, nabhasa, moon, bhava, nitya)"
+    )
+    min_importance: Optional[YogaImportance] = Field(None, description="Only yogas at least this important")
+    compact: bool = Field(
+        False,
+        description="Return yogas as catalog ids plus chart-specific fields (yoga_refs, see GET /yogas/catalog)"
+    )
 
     class Config:
         json_schema_extra = {
@@ -302,7 +318,12 @@ class YogaItem(BaseModel):
 
 class YogaResponse(BaseModel):
     """Response with detected yogas"""
-    yogas: List[YogaItem] = Field(..., description="All detected yogas")
+    yogas: List[YogaItem] = Field(..., description="All detected yogas (empty with compact=true)")
+    yoga_refs: Optional[List[Dict[str, Any]]] = Field(
+        None,
+        description="Compact yogas with compact=true: catalog id plus the fields that differ from the catalog entry"
+    )
+    catalog_version: Optional[str] = Field(None, description="Version of the yoga catalog the refs resolve against")
     total_yogas: int = Field(..., description="Total number of yogas detected")
     categories: Dict[str, int] = Field(default_factory=dict, description="Count by category")
     strongest_yogas: List[str] = Field(default_factory=list, description="Names of very strong yogas")
@@ -10,6 +10,7 @@ import os
 
 from app.core.config import settings
 from app.services.rule_retrieval import rule_retrieval_service
+from app.services.varga_cache_service import varga_cache_service
 
 
 class AIInterpretationService:
@@ -39,7 +40,8 @@ class AIInterpretationService:
         category: str = "general",
         use_knowledge_base: bool = True,
         numerology_data: Optional[Dict[str, Any]] = None,
-        palmistry_data: Optional[Dict[str, Any]] = None
+        palmistry_data: Optional[Dict[str, Any]] = None,
+        navamsa_data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Generate AI interpretation based on birth chart and user question
@@ -53,6 +55,7 @@ class AIInterpretationService:
             use_knowledge_base: Whether to retrieve and use BPHS rules (default: True)
             numerology_data: Optional numerology profile data
             palmistry_data: Optional palmistry analysis data
+            navamsa_data: Optional D9 chart data (the stored D9 chart)
 
         Returns:
             Dictionary containing interpretation, metadata, and rule citations
@@ -77,7 +80,8 @@ class AIInterpretationService:
                 rules_context = ""
 
         # Prepare context from chart data
-        context = self._prepare_chart_context(chart_data)
+        divisional_charts = await self._get_key_divisional_charts(chart_data, navamsa_data)
+        context = self._prepare_chart_context(chart_data, divisional_charts)
 
         # Add numerology context if available
         numerology_context = ""
@@ -204,7 +208,36 @@ Do NOT skip the numerology section if data is available above.
                 "error": str(e)
             }
 
-    def _prepare_chart_context(self, chart_data: Dict[str, Any]) -> str:
+    async def _get_key_divisional_charts(
+        self,
+        chart_data: Dict[str, Any],
+        navamsa_data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the divisional charts used for interpretation
+
+        D9 comes from the stored D9 chart; the others are calculated on demand
+        (and cached) from the D1 chart.
+        """
+        divisional_charts = {}
+        if navamsa_data:
+            divisional_charts["D9"] = navamsa_data
+
+        if chart_data.get("planets"):
+            try:
+                divisional_charts.update(
+                    await varga_cache_service.get_vargas(chart_data, ["D10", "D7", "D12"])
+                )
+            except Exception as e:
+                print(f"⚠️  Divisional charts unavailable: {e}. Proceeding without them.")
+
+        return divisional_charts
+
+    def _prepare_chart_context(
+        self,
+        chart_data: Dict[str, Any],
+        divisional_charts: Optional[Dict[str, Any]] = None
+    ) -> str:
         """Prepare chart context for AI prompt - includes Phase 2 enhancements"""
 
         context_parts = []
@@ -251,9 +284,9 @@ Do NOT skip the numerology section if data is available above.
                 )
 
         # Phase 2: Divisional Charts (if available)
-        if "divisional_charts" in chart_data and chart_data["divisional_charts"]:
+        if divisional_charts:
             context_parts.append("\n=== DIVISIONAL CHARTS (Varga Analysis) ===")
-            div_charts = chart_data["divisional_charts"]
+            div_charts = divisional_charts
 
             # Focus on key divisional charts for interpretation
             key_charts = {
@@ -3,7 +3,7 @@ Vedic Astrology Calculation Service
 Using accurate Swiss Ephemeris implementation for professional-grade Vedic calculations
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Iterable
 from datetime import datetime, date, time
 from app.services.vedic_astrology_accurate import accurate_vedic_astrology
 
@@ -23,7 +23,8 @@ class VedicAstrologyService:
         latitude: float,
         longitude: float,
         timezone_str: str = "UTC",
-        city: str = "Unknown"
+        city: str = "Unknown",
+        include: Optional[Iterable[str]] = None
     ) -> Dict[str, Any]:
         """
         Calculate Vedic birth chart (D1 - Rashi chart) using accurate Swiss Ephemeris
@@ -36,6 +37,8 @@ class VedicAstrologyService:
             longitude: Birth location longitude
             timezone_str: Timezone string (e.g., 'Asia/Kolkata')
             city: Birth city name
+            include: Optional pipeline stages to run on top of core positions
+                (None = all but the on-demand stages, see AccurateVedicAstrology.CHART_STAGES)
 
         Returns:
             Complete birth chart data including planets, houses, yogas, and dashas
@@ -49,7 +52,8 @@ class VedicAstrologyService:
             latitude=latitude,
             longitude=longitude,
             timezone_str=timezone_str,
-            city=city
+            city=city,
+            include=include
         )
 
     def calculate_navamsa_chart(
@@ -104,6 +108,67 @@ class VedicAstrologyService:
             city=city
         )
 
+    def calculate_chart_bundle(
+        self,
+        name: str,
+        birth_date: date,
+        birth_time: time,
+        latitude: float,
+        longitude: float,
+        timezone_str: str = "UTC",
+        city: str = "Unknown",
+        chart_types: Optional[Iterable[str]] = None,
+        include: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Calculate several chart types (D1, D9, Moon) from one D1 computation
+
+        Args:
+            chart_types: Chart types to return (default: D1, D9 and Moon)
+            include: D1 pipeline stages when D1 is requested (None = all stages)
+
+        Returns:
+            Dict mapping each chart type to its chart data
+        """
+
+        # Delegate to accurate Swiss Ephemeris implementation
+        return accurate_vedic_astrology.calculate_chart_bundle(
+            name=name,
+            birth_date=birth_date,
+            birth_time=birth_time,
+            latitude=latitude,
+            longitude=longitude,
+            timezone_str=timezone_str,
+            city=city,
+            chart_types=accurate_vedic_astrology.BUNDLE_CHART_TYPES if chart_types is None else chart_types,
+            include=include
+        )
+
+    def calculate_birth_charts_batch(
+        self,
+        records: List[Dict[str, Any]],
+        chart_types: Optional[Iterable[str]] = None,
+        include: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Calculate charts for many birth records in one call
+
+        Args:
+            records: Birth details (calculate_birth_chart arguments) per record
+            chart_types: Chart types per record (default: D1)
+            include: D1 pipeline stages (None = all stages)
+
+        Returns:
+            One entry per record, in order: {"charts": {...}} or {"error": ...}
+        """
+
+        # Delegate to accurate Swiss Ephemeris implementation
+        return accurate_vedic_astrology.calculate_birth_charts_batch(
+            records,
+            chart_types=("D1",) if chart_types is None else chart_types,
+            include=include
+        )
+
 
 # Singleton instance
 astrology_service = VedicAstrologyService()
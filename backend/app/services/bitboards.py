@@ -0,0 +1,137 @@
+"""
+Bitboards: houses and signs as bit masks.
+
+Most yoga and dosha conditions are set membership over the 12 houses or
+signs ("all benefics in kendras", "all seven grahas in movable signs").
+With the houses of a planet group packed into one int, such a condition is
+one or two bitwise operations instead of a Python loop:
+
+- Bit n stands for house (or sign) n, 1-12, so a planet's bit is `1 << house`
+- Bit 0 stands for "not placed" (house 0); house_mask() leaves it out
+- Masks are plain ints, so they hash, compare and combine freely
+
+Usage:
+    occupied = house_mask(planets, SEVEN_PLANETS)
+    within(occupied, KENDRA)            # every occupied house is a kendra
+    occupied & KENDRA                   # any planet in a kendra
+    occupied == mask((1, 7))            # exactly the 1st and 7th houses
+    has_run(occupied, 6)                # six consecutive houses occupied
+"""
+
+from typing import Any, Dict, Iterable, Tuple
+
+HOUSE_COUNT = 12
+
+_BITS = {number: 1 << number for number in range(HOUSE_COUNT + 1)}
+
+
+def bit(number: Any) -> int:
+    """Bit of one house / sign (0 = not placed); other values (None, 13) have no bit"""
+    return _BITS.get(number, 0)
+
+
+def mask(numbers: Iterable[int]) -> int:
+    """Mask of houses / signs"""
+    bits = 0
+    for number in numbers:
+        bits |= bit(number)
+    return bits
+
+
+def _arc(start: int, length: int) -> int:
+    return mask((start + offset - 1) % HOUSE_COUNT + 1 for offset in range(length))
+
+
+# (start house, length) -> mask, for every arc
+_ARCS = {
+    (start, length): _arc(start, length)
+    for start in range(1, HOUSE_COUNT + 1) for length in range(HOUSE_COUNT + 1)
+}
+
+
+def arc(start: int, length: int) -> int:
+    """Mask of `length` (0-12) consecutive houses from `start`, wrapping after the 12th"""
+    return _ARCS[(start - 1) % HOUSE_COUNT + 1, length]
+
+
+ALL_HOUSES = mask(range(1, HOUSE_COUNT + 1))
+
+# House groups
+KENDRA = mask((1, 4, 7, 10))
+TRIKONA = mask((1, 5, 9))
+PANAPHARA = mask((2, 5, 8, 11))
+APOKLIMA = mask((3, 6, 9, 12))
+UPACHAYA = mask((3, 6, 10, 11))
+DUSTHANA = mask((6, 8, 12))
+ODD = mask(range(1, HOUSE_COUNT + 1, 2))
+EVEN = mask(range(2, HOUSE_COUNT + 1, 2))
+
+# Sign qualities (same bit layout, numbered by sign: 1 = Aries)
+MOVABLE_SIGNS = mask((1, 4, 7, 10))
+FIXED_SIGNS = mask((2, 5, 8, 11))
+DUAL_SIGNS = mask((3, 6, 9, 12))
+
+
+def house_mask(planets: Dict[str, Any], names: Iterable[str]) -> int:
+    """Houses occupied by some of the named planets (unplaced planets add nothing)"""
+    bits = 0
+    for name in names:
+        house = planets.get(name, {}).get("house", 0)
+        if house:
+            bits |= bit(house)
+    return bits
+
+
+def sign_mask(planets: Dict[str, Any], names: Iterable[str]) -> int:
+    """Signs occupied by some of the named planets"""
+    bits = 0
+    for name in names:
+        sign = planets.get(name, {}).get("sign_num", 0)
+        if sign:
+            bits |= bit(sign)
+    return bits
+
+
+def within(bits: int, allowed: int) -> bool:
+    """Every house of `bits` is in `allowed` (true for an empty mask)"""
+    return not bits & ~allowed
+
+
+def count(bits: int) -> int:
+    """Number of houses in a mask"""
+    return bits.bit_count()
+
+
+def members(bits: int) -> Tuple[int, ...]:
+    """Houses of a mask, ascending"""
+    return tuple(number for number in range(HOUSE_COUNT + 1) if bits >> number & 1)
+
+
+def lowest(bits: int) -> int:
+    """Lowest house of a mask (0 for an empty mask or only "not placed")"""
+    return (bits & -bits).bit_length() - 1 if bits else 0
+
+
+def has_run(bits: int, length: int) -> bool:
+    """Whether `length` consecutive houses are all in the mask (not wrapping past the 12th)"""
+    run = bits
+    for shift in range(1, length):
+        run &= bits >> shift
+    return bool(run)
+
+
+def is_contiguous(bits: int) -> bool:
+    """Whether the houses of a non-empty mask form one run (not wrapping)"""
+    return bool(bits) and not (bits + (bits & -bits)) & bits
+
+
+def offsets_from(bits: int, start: int) -> int:
+    """Mask of distances (bit d = d houses after `start`, 0-11) of the houses in `bits`"""
+    houses = (bits & ALL_HOUSES) >> 1
+    shift = (start - 1) % HOUSE_COUNT
+    return ((houses >> shift) | (houses << (HOUSE_COUNT - shift))) & ((1 << HOUSE_COUNT) - 1)
+
+
+def span(bits: int) -> int:
+    """Distance between the lowest and highest bit of a non-empty mask"""
+    return bits.bit_length() - (bits & -bits).bit_length()
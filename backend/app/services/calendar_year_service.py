@@ -17,6 +17,11 @@ from typing import Dict, List, Optional, Tuple, Any
 import calendar
 import logging
 
+import numpy as np
+
+from app.core.ephemeris import ephemeris
+from app.core.ephemeris_table import ephemeris_table
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,8 +38,10 @@ class CalendarYearService:
         if swisseph is None:
             import swisseph as swe
             self.swe = swe
+            self.ephemeris = ephemeris
         else:
             self.swe = swisseph
+            self.ephemeris = swisseph
 
         # Planet constants
         self.PLANETS = {
@@ -457,7 +464,7 @@ class CalendarYearService:
         """Get planet's longitude at specific datetime."""
         jd = self._datetime_to_julian(dt)
         planet_id = self.PLANETS[planet_name]
-        pos, _ = self.swe.calc_ut(jd, planet_id)
+        pos, _ = self.ephemeris.calc_ut(jd, planet_id)
         return pos[0] % 360
 
     def _calculate_transit_house(self, planet_longitude: float, moon_sign: int) -> int:
@@ -567,6 +574,13 @@ class CalendarYearService:
         start_jd = self._datetime_to_julian(start_date)
         end_jd = self._datetime_to_julian(end_date)
 
+        # Scan the precomputed daily table in one array operation when possible
+        if self.ephemeris is ephemeris and end_jd > start_jd and ephemeris_table.covers(start_jd, end_jd):
+            jds = np.arange(start_jd, end_jd, 1.0)
+            signs = (ephemeris_table.longitudes(planet_name, jds, sidereal=False) // 30).astype(int)
+            changes = np.flatnonzero(signs != signs[0])
+            return self._julian_to_datetime(float(jds[changes[0]])) if changes.size else None
+
         start_pos = self._get_planet_position(planet_name, start_date)
         start_sign = int(start_pos / 30)
 
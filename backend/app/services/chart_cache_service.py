@@ -0,0 +1,205 @@
+"""
+Chart Cache Service
+Content-addressed cache for computed charts. Entries are keyed by a hash of
+the UTC birth moment, rounded location, ayanamsa, house system, chart type,
+pipeline stages and engine version - not by profile - so identical birth data
+is calculated once across profiles, and bumping ENGINE_VERSION invalidates
+every entry without manual cache clearing.
+
+Backed by cache_service (Redis, or the in-memory LRU fallback).
+"""
+
+from datetime import date, datetime, time
+from typing import Any, Dict, Iterable, List, Optional
+
+import pytz
+
+from app.core.cache import CacheNamespace, CacheTTL, cache_service
+from app.core.compute import compute_executor
+from app.services.astrology import astrology_service
+from app.services.vedic_astrology_accurate import accurate_vedic_astrology
+
+
+class ChartCacheService:
+    """Content-addressed cache of D1, D9 and Moon charts"""
+
+    AYANAMSA = "Lahiri"
+    HOUSE_SYSTEM = "Whole Sign"
+
+    # Decimal places kept from birth coordinates (4 = ~11 m)
+    COORDINATE_PRECISION = 4
+
+    # Stages whose output depends on today's date (current dasha, transits)
+    TIME_DEPENDENT_STAGES = frozenset({"dasha", "dasha_ai", "transits", "sade_sati"})
+
+    def __init__(self):
+        """Initialize chart cache service"""
+        self.cache = cache_service
+        self.astrology = accurate_vedic_astrology
+        self.ttl = CacheTTL.DAY
+
+    def _utc_instant(self, birth_date: date, birth_time: time, timezone_str: str) -> datetime:
+        """UTC birth moment, converted the same way as the chart engine"""
+        birth_datetime = datetime.combine(birth_date, birth_time)
+        if timezone_str == "UTC":
+            return birth_datetime
+        try:
+            local_dt = pytz.timezone(timezone_str).localize(birth_datetime)
+            return local_dt.astimezone(pytz.UTC).replace(tzinfo=None)
+        except Exception:
+            return birth_datetime
+
+    def _chart_stages(self, chart_type: str, include: Optional[Iterable[str]]) -> List[str]:
+        """Pipeline stages that determine the content of a chart type"""
+        if chart_type == "D1":
+            stages = self.astrology.resolve_stages(include)
+        else:
+            stages = self.astrology.DERIVED_CHART_STAGES
+        return sorted(stages)
+
+    def make_key(
+        self,
+        birth_date: date,
+        birth_time: time,
+        latitude: float,
+        longitude: float,
+        timezone_str: str,
+        chart_type: str,
+        include: Optional[Iterable[str]] = None
+    ) -> str:
+        """
+        Build the content-addressed cache key of a chart
+
+        Charts with time-dependent stages (current dasha, transits) are also
+        keyed by the current UTC date so they never outlive the day.
+        """
+        stages = self._chart_stages(chart_type, include)
+        key_data = {
+            "utc": self._utc_instant(birth_date, birth_time, timezone_str).isoformat(),
+            "lat": round(float(latitude), self.COORDINATE_PRECISION),
+            "lon": round(float(longitude), self.COORDINATE_PRECISION),
+            "ayanamsa": self.AYANAMSA,
+            "house_system": self.HOUSE_SYSTEM,
+            "chart_type": chart_type,
+            "stages": stages,
+            "engine_version": self.astrology.ENGINE_VERSION
+        }
+        if self.TIME_DEPENDENT_STAGES.intersection(stages):
+            key_data["day"] = datetime.utcnow().date().isoformat()
+
+        digest = self.cache._hash_key(key_data)
+        return self.cache._make_key(CacheNamespace.CHARTS, f"v{self.astrology.ENGINE_VERSION}:{digest}")
+
+    def _personalize(self, chart: Dict[str, Any], birth: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace the shared chart's birth details with the requester's own"""
+        basic_info = chart.get("basic_info")
+        if basic_info is not None:
+            basic_info["name"] = birth["name"]
+            basic_info["birth_datetime"] = datetime.combine(birth["birth_date"], birth["birth_time"]).isoformat()
+            basic_info.setdefault("location", {}).update({
+                "city": birth.get("city", "Unknown"),
+                "latitude": birth["latitude"],
+                "longitude": birth["longitude"],
+                "timezone": birth.get("timezone_str", "UTC")
+            })
+        return chart
+
+    def _key_for(self, birth: Dict[str, Any], chart_type: str, include: Optional[Iterable[str]]) -> str:
+        return self.make_key(
+            birth["birth_date"],
+            birth["birth_time"],
+            birth["latitude"],
+            birth["longitude"],
+            birth.get("timezone_str", "UTC"),
+            chart_type,
+            include
+        )
+
+    async def lookup(
+        self,
+        birth: Dict[str, Any],
+        chart_types: Iterable[str],
+        include: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get cached charts for a birth record
+
+        Args:
+            birth: calculate_birth_chart keyword arguments
+            chart_types: Chart types to look up
+            include: D1 pipeline stages (None = all)
+
+        Returns:
+            Dict of the chart types found in the cache (possibly empty)
+        """
+        charts = {}
+        for chart_type in chart_types:
+            cached = await self.cache.get(self._key_for(birth, chart_type, include))
+            if cached is not None:
+                charts[chart_type] = self._personalize(cached, birth)
+        return charts
+
+    async def store(
+        self,
+        birth: Dict[str, Any],
+        charts: Dict[str, Dict[str, Any]],
+        include: Optional[Iterable[str]] = None
+    ) -> None:
+        """Cache freshly calculated charts of a birth record"""
+        for chart_type, chart in charts.items():
+            await self.cache.set(self._key_for(birth, chart_type, include), chart, ttl=self.ttl)
+
+    async def calculate_chart_bundle(
+        self,
+        name: str,
+        birth_date: date,
+        birth_time: time,
+        latitude: float,
+        longitude: float,
+        timezone_str: str = "UTC",
+        city: str = "Unknown",
+        chart_types: Optional[Iterable[str]] = None,
+        include: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Cached equivalent of astrology_service.calculate_chart_bundle
+
+        Cached chart types are served from the content cache; the rest are
+        calculated together in a compute worker and cached.
+
+        Raises:
+            ValueError: If an unknown chart type or stage is requested
+        """
+        chart_types = list(dict.fromkeys(
+            self.astrology.BUNDLE_CHART_TYPES if chart_types is None else chart_types
+        ))
+        self.astrology._resolve_bundle(chart_types, include)
+
+        birth = {
+            "name": name,
+            "birth_date": birth_date,
+            "birth_time": birth_time,
+            "latitude": latitude,
+            "longitude": longitude,
+            "timezone_str": timezone_str,
+            "city": city
+        }
+
+        charts = await self.lookup(birth, chart_types, include)
+        missing = [chart_type for chart_type in chart_types if chart_type not in charts]
+
+        if missing:
+            calculated = await compute_executor.run(
+                astrology_service.calculate_chart_bundle,
+                **birth,
+                chart_types=missing,
+                include=include
+            )
+            await self.store(birth, calculated, include)
+            charts.update(calculated)
+
+        return {chart_type: charts[chart_type] for chart_type in chart_types}
+
+
+# Singleton instance
+chart_cache_service = ChartCacheService()
@@ -7,6 +7,7 @@ Includes composite chart generation and progressed chart calculations
 from typing import Dict, List, Any, Tuple
 from datetime import datetime, timedelta
 import swisseph as swe
+from app.core.ephemeris import ephemeris
 
 
 class ChartComparisonService:
@@ -864,7 +865,7 @@ class ChartComparisonService:
             )
 
             # Get ayanamsa
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ephemeris.get_ayanamsa_ut(jd)
 
             # Calculate progressed planets
             progressed_planets = {}
@@ -879,7 +880,7 @@ class ChartComparisonService:
             }
 
             for planet_name, planet_id in planet_ids.items():
-                planet_data, _ = swe.calc_ut(jd, planet_id)
+                planet_data, _ = ephemeris.calc_ut(jd, planet_id)
                 tropical_long = planet_data[0]
                 sidereal_long = (tropical_long - ayanamsa) % 360
 
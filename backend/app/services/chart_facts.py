@@ -0,0 +1,157 @@
+"""
+Chart facts shared by the yoga detectors.
+
+ExtendedYogaService runs 100+ `_detect_*` methods per chart, and each of
+them used to re-derive the same facts from the raw planets dict: the
+ascendant sign, house lords, occupants of each house, aspects, dignities,
+benefic / malefic status and the Jaimini karakas (computed three times per
+chart). ChartFacts computes them once per chart:
+
+- ChartFacts is a dict of the planet positions, so detectors keep reading
+  `planets["Moon"]["house"]` unchanged
+- Houses, signs and occupants come from a ChartCore (app.core.chart_core)
+  built once per chart, also available as `facts.core`
+- Derived facts are plain attributes (tuples, dicts, frozensets), read-only
+  after construction, so a ChartFacts can be shared between threads
+- Dignities, benefic / malefic sets and Jaimini karakas are classified by
+  the yoga service's own rules, on first access (a detector that never asks
+  for them costs nothing)
+
+Usage:
+    facts = extended_yoga_service.build_chart_facts(planets)
+    facts.ascendant_index           # 0 = Aries ... 11 = Pisces
+    facts.house_lords[10]           # "Saturn"
+    facts.occupants[4]              # ("Moon", "Jupiter")
+    facts.aspects("Mars", 8)        # True when Mars aspects the 8th house
+    facts.occupied_mask             # houses of the seven planets (app.services.bitboards)
+"""
+
+from functools import cached_property
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+from app.core.chart_core import ASCENDANT_KEYS, SEVEN_PLANETS, SIGN_LORDS, ChartCore
+from app.services import bitboards
+
+PlanetTest = Callable[[str], bool]
+
+# Houses aspected, counted from the planet's own house (1 = same house)
+ASPECT_DISTANCES = {
+    "Mars": frozenset((4, 7, 8)),
+    "Jupiter": frozenset((5, 7, 9)),
+    "Saturn": frozenset((3, 7, 10)),
+}
+DEFAULT_ASPECT_DISTANCES = frozenset((7,))
+
+
+def aspect_distances(planet: str) -> FrozenSet[int]:
+    """House distances (1-12) a planet aspects: 7th for all, plus special aspects"""
+    return ASPECT_DISTANCES.get(planet, DEFAULT_ASPECT_DISTANCES)
+
+
+_HOUSE_NUMBERS = frozenset(range(1, 13))
+
+# (aspecting planet, its house) -> houses aspected, for every house
+_ASPECTED_HOUSES = {
+    (planet, house): frozenset((house + distance - 2) % 12 + 1 for distance in distances)
+    for planet, distances in (*ASPECT_DISTANCES.items(), (None, DEFAULT_ASPECT_DISTANCES))
+    for house in _HOUSE_NUMBERS
+}
+
+
+def house_lords_from(ascendant_index: Optional[int]) -> Tuple[Optional[str], ...]:
+    """Lords of houses 1-12 (index 0 unused) for a 0-indexed ascendant sign"""
+    if ascendant_index is None:
+        return (None,) * 13
+    return (None, *(SIGN_LORDS[(ascendant_index + house - 1) % 12 + 1] for house in range(1, 13)))
+
+
+class ChartFacts(dict):
+    """Planet positions plus facts derived once per chart"""
+
+    def __init__(
+        self,
+        planets: Dict[str, Any],
+        ascendant_index: Optional[int] = None,
+        ascendant_sign_num: Optional[int] = None,
+        dignity_of: Optional[Callable[[str], str]] = None,
+        is_benefic: Optional[PlanetTest] = None,
+        is_malefic: Optional[PlanetTest] = None,
+        karakas: Optional[Callable[[], Dict[str, str]]] = None
+    ):
+        """
+        Initialize chart facts.
+
+        Args:
+            planets: Planet positions (copied shallowly, entries are shared)
+            ascendant_index: Ascendant sign, 0-indexed (0=Aries, 11=Pisces)
+            ascendant_sign_num: Ascendant sign of an "Ascendant" entry, 1-indexed
+            dignity_of: Classifies a planet's dignity ("exaltation", "own", ...)
+            is_benefic: Whether a planet is benefic in this chart
+            is_malefic: Whether a planet is malefic in this chart
+            karakas: Computes the Jaimini karakas
+
+            The classifiers are called once per planet, on first access.
+        """
+        super().__init__(planets)
+        self.ascendant_index = ascendant_index
+        self.ascendant_sign_num = ascendant_sign_num
+        self._dignity_of = dignity_of
+        self._is_benefic = is_benefic
+        self._is_malefic = is_malefic
+        self._karakas = karakas
+
+        # Per-chart results of computations built on these facts (e.g. rule matches)
+        self.memo: Dict[str, Any] = {}
+
+        self.core = ChartCore.from_planets(planets)
+        self.houses: Dict[str, int] = {planet.name: planet.house or 0 for planet in self.core}
+        self.signs: Dict[str, int] = {planet.name: planet.sign_num or 0 for planet in self.core}
+        self.occupants: Tuple[Tuple[str, ...], ...] = (
+            (), *(self.core.planets_in_house(house) for house in range(1, 13))
+        )
+
+        # Houses of the seven visible planets (bitboard), as the Nabhasa yogas count them
+        self.occupied_mask = bitboards.house_mask(self, SEVEN_PLANETS)
+
+        self.house_lords = house_lords_from(ascendant_index)
+
+        # Aspect matrix: planet -> houses (1-12) it aspects from its position
+        self.aspected_houses: Dict[str, FrozenSet[int]] = {}
+        for name, house in self.houses.items():
+            if name not in ASCENDANT_KEYS and house in _HOUSE_NUMBERS:
+                self.aspected_houses[name] = _ASPECTED_HOUSES[name if name in ASPECT_DISTANCES else None, house]
+
+    def aspects(self, planet: str, house: int) -> bool:
+        """Whether a planet aspects a house (Vedic graha drishti)"""
+        return house in self.aspected_houses.get(planet, ())
+
+    @property
+    def grahas(self) -> Tuple[str, ...]:
+        """Bodies other than the ascendant, in chart order"""
+        return tuple(name for name in self.houses if name not in ASCENDANT_KEYS)
+
+    @cached_property
+    def dignity(self) -> Dict[str, str]:
+        """Planet -> dignity classification"""
+        if not self._dignity_of:
+            return {}
+        return {name: self._dignity_of(name) for name in self.grahas}
+
+    @cached_property
+    def benefics(self) -> FrozenSet[str]:
+        """Benefic planets of this chart"""
+        if not self._is_benefic:
+            return frozenset()
+        return frozenset(name for name in self.grahas if self._is_benefic(name))
+
+    @cached_property
+    def malefics(self) -> FrozenSet[str]:
+        """Malefic planets of this chart"""
+        if not self._is_malefic:
+            return frozenset()
+        return frozenset(name for name in self.grahas if self._is_malefic(name))
+
+    @cached_property
+    def karakas(self) -> Dict[str, str]:
+        """Jaimini chara karakas ({"AK": planet, ...}); treat as read-only"""
+        return self._karakas() if self._karakas else {}
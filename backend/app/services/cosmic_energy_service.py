@@ -18,6 +18,7 @@ Score Ranges:
 from typing import Dict, Any, List, Optional
 from datetime import datetime, date, timedelta
 import swisseph as swe
+from app.core.ephemeris import ephemeris
 from app.services.astrology import astrology_service
 
 
@@ -188,9 +189,9 @@ class CosmicEnergyService:
 
             # Calculate Jupiter's current position
             jd = swe.julday(target_date.year, target_date.month, target_date.day, 12.0)
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ephemeris.get_ayanamsa_ut(jd)
 
-            result = swe.calc_ut(jd, swe.JUPITER, swe.FLG_SWIEPH)
+            result = ephemeris.calc_ut(jd, swe.JUPITER, swe.FLG_SWIEPH)
             tropical_long = result[0][0]
             sidereal_long = (tropical_long - ayanamsa) % 360
             jupiter_sign = int(sidereal_long / 30)
@@ -246,9 +247,9 @@ class CosmicEnergyService:
 
             # Calculate Saturn's current position
             jd = swe.julday(target_date.year, target_date.month, target_date.day, 12.0)
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ephemeris.get_ayanamsa_ut(jd)
 
-            result = swe.calc_ut(jd, swe.SATURN, swe.FLG_SWIEPH)
+            result = ephemeris.calc_ut(jd, swe.SATURN, swe.FLG_SWIEPH)
             tropical_long = result[0][0]
             sidereal_long = (tropical_long - ayanamsa) % 360
             saturn_sign = int(sidereal_long / 30)
@@ -308,9 +309,9 @@ class CosmicEnergyService:
 
             # Calculate today's Moon nakshatra
             jd = swe.julday(target_date.year, target_date.month, target_date.day, 12.0)
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ephemeris.get_ayanamsa_ut(jd)
 
-            result = swe.calc_ut(jd, swe.MOON, swe.FLG_SWIEPH)
+            result = ephemeris.calc_ut(jd, swe.MOON, swe.FLG_SWIEPH)
             tropical_long = result[0][0]
             sidereal_long = (tropical_long - ayanamsa) % 360
 
@@ -0,0 +1,305 @@
+"""
+Interval-indexed Vimshottari Dasha engine.
+
+Builds the dasha periods of one chart once, as sorted numeric arrays per
+level, and answers "which periods are active at this moment" by bisection
+instead of formatting and re-parsing date strings:
+
+- Levels 1-3 (mahadasha, antardasha, pratyantardasha) are precomputed:
+  9 + 81 + 729 periods as start/end day numbers, lord indices and parent
+  indices (NumPy arrays)
+- Levels 4-5 (sookshma, prana) are generated lazily, only for the periods
+  that are actually queried
+- Vectorized lookup for many moments at once (np.searchsorted)
+
+Moments are "day numbers": proleptic Gregorian ordinal days with the time
+of day as fraction (date(1, 1, 1) 00:00 = 1.0), in the same (local) time
+as the birth datetime.
+
+Sub-periods follow the chart engine's rules: each period is divided among
+the nine lords starting with its own, in proportion to their Vimshottari
+years, starting at the period's nominal start. The mahadasha running at
+birth nominally started before birth (by the part of the nakshatra the Moon
+has traversed), so its sub-periods are laid out from that moment and the
+ones that ended before birth are dropped; the one running at birth is
+clipped to start at birth.
+
+Usage:
+    from app.services.dasha_engine import get_timeline
+
+    timeline = get_timeline(moon_longitude, birth_datetime)
+    maha, antar, pratyantar = timeline.periods_at(datetime.now())
+    lords = timeline.lords_at(event_dates, level=2)
+"""
+
+import math
+from bisect import bisect_right
+from functools import lru_cache
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+LORDS = ("Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury")
+
+DASHA_YEARS = {
+    "Sun": 6, "Moon": 10, "Mars": 7, "Rahu": 18, "Jupiter": 16,
+    "Saturn": 19, "Mercury": 17, "Ketu": 7, "Venus": 20
+}
+
+LEVELS = ("mahadasha", "antardasha", "pratyantardasha", "sookshma", "prana")
+
+# Levels kept as precomputed arrays; deeper levels are generated on demand
+PRECOMPUTED_LEVELS = 3
+
+TOTAL_YEARS = 120
+DAYS_PER_YEAR = 365.25
+NAKSHATRA_SPAN = 13.333333
+
+_LORD_YEARS = np.array([DASHA_YEARS[lord] for lord in LORDS], dtype=np.float64)
+
+Moment = Union[date, datetime, float]
+
+
+def to_day_number(moment: Moment) -> float:
+    """Day number of a date, datetime or day number"""
+    if isinstance(moment, datetime):
+        seconds = moment.hour * 3600 + moment.minute * 60 + moment.second + moment.microsecond / 1e6
+        return moment.toordinal() + seconds / 86400.0
+    if isinstance(moment, date):
+        return float(moment.toordinal())
+    return float(moment)
+
+
+def from_day_number(day_number: float) -> datetime:
+    """Datetime of a day number (to the microsecond)"""
+    day = math.floor(day_number)
+    return datetime.fromordinal(day) + timedelta(days=day_number - day)
+
+
+def day_number_date(day_number: float) -> date:
+    """Calendar date containing a day number"""
+    return date.fromordinal(math.floor(day_number))
+
+
+class _Level:
+    """Periods of one level, sorted by start"""
+
+    __slots__ = ("lords", "origins", "starts", "ends", "years", "parents")
+
+    def __init__(
+        self,
+        lords: np.ndarray,
+        origins: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        years: np.ndarray,
+        parents: np.ndarray
+    ):
+        self.lords = lords
+        self.origins = origins  # Nominal start (before clipping at birth)
+        self.starts = starts
+        self.ends = ends
+        self.years = years  # Nominal length, used to divide into sub-periods
+        self.parents = parents
+
+
+def _subdivide(
+    lords: np.ndarray,
+    origins: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    years: np.ndarray
+) -> _Level:
+    """Divide every period among the nine lords from its nominal start, clipped to the period"""
+    offsets = np.arange(9)
+    child_lords = (lords[:, None] + offsets) % 9
+    child_years = years[:, None] * _LORD_YEARS[child_lords] / TOTAL_YEARS
+
+    durations = child_years * DAYS_PER_YEAR
+    child_origins = origins[:, None] + np.cumsum(durations, axis=1) - durations
+    child_starts = np.maximum(child_origins, starts[:, None])
+    child_ends = np.minimum(child_origins + durations, ends[:, None])
+    parents = np.broadcast_to(np.arange(len(lords))[:, None], child_lords.shape)
+
+    # Periods that ended before birth (only within the birth mahadasha)
+    keep = child_starts < child_ends
+    return _Level(
+        child_lords[keep].astype(np.int8),
+        child_origins[keep],
+        child_starts[keep],
+        child_ends[keep],
+        child_years[keep],
+        parents[keep]
+    )
+
+
+class VimshottariTimeline:
+    """Vimshottari periods of one chart, indexed by start moment"""
+
+    def __init__(self, moon_longitude: float, birth_datetime: datetime):
+        """
+        Build the 120-year timeline from birth.
+
+        Args:
+            moon_longitude: Sidereal longitude of the Moon at birth
+            birth_datetime: Birth datetime (naive, local time)
+        """
+        self.birth_datetime = birth_datetime
+        self.birth_day = to_day_number(birth_datetime)
+
+        nakshatra_num = int(moon_longitude / NAKSHATRA_SPAN)
+        first_lord = nakshatra_num % 9
+        traversed = (moon_longitude % NAKSHATRA_SPAN) / NAKSHATRA_SPAN
+
+        lords = (first_lord + np.arange(9)) % 9
+        full_years = _LORD_YEARS[lords]
+        spans = full_years.copy()
+        spans[0] = full_years[0] - traversed * full_years[0]  # Balance of the birth mahadasha
+
+        durations = spans * DAYS_PER_YEAR
+        starts = self.birth_day + np.cumsum(durations) - durations
+        origins = starts.copy()
+        origins[0] = self.birth_day - (full_years[0] - spans[0]) * DAYS_PER_YEAR
+        maha = _Level(
+            lords.astype(np.int8),
+            origins,
+            starts,
+            starts + durations,
+            full_years,
+            np.full(9, -1)
+        )
+        self.balance_years = float(spans[0])
+
+        self._levels: List[_Level] = [maha]
+        for _ in range(1, PRECOMPUTED_LEVELS):
+            parent = self._levels[-1]
+            self._levels.append(_subdivide(parent.lords, parent.origins, parent.starts, parent.ends, parent.years))
+
+    @property
+    def start(self) -> float:
+        return float(self._levels[0].starts[0])
+
+    @property
+    def end(self) -> float:
+        return float(self._levels[0].ends[-1])
+
+    def _period(self, level: _Level, depth: int, index: int) -> Dict[str, Any]:
+        start = level.starts.item(index)
+        end = level.ends.item(index)
+        return {
+            "level": LEVELS[depth - 1],
+            "planet": LORDS[level.lords.item(index)],
+            "start": start,
+            "end": end,
+            "start_date": day_number_date(start).isoformat(),
+            "end_date": day_number_date(end).isoformat(),
+            "years": round((end - start) / DAYS_PER_YEAR, 3),
+            "index": int(index)
+        }
+
+    def _index_at(self, level: _Level, day_number: float) -> int:
+        index = int(level.starts.searchsorted(day_number, side="right")) - 1
+        if index < 0 or day_number >= level.ends.item(index):
+            return -1
+        return index
+
+    def period_at(self, moment: Moment, level: int = 1) -> Optional[Dict[str, Any]]:
+        """
+        Active period of one level (1 = mahadasha ... 5 = prana)
+
+        Returns:
+            Period dict (planet, start/end day numbers and dates, years), or
+            None outside the 120-year timeline
+        """
+        periods = self.periods_at(moment, level)
+        return periods[-1] if len(periods) == level else None
+
+    def periods_at(self, moment: Moment, depth: int = PRECOMPUTED_LEVELS) -> List[Dict[str, Any]]:
+        """
+        Active periods from mahadasha down to `depth` (max 5)
+
+        Returns:
+            One period dict per level (empty outside the timeline)
+        """
+        if not 1 <= depth <= len(LEVELS):
+            raise ValueError(f"depth must be between 1 and {len(LEVELS)}")
+
+        day_number = to_day_number(moment)
+        periods = []
+        for level_num, level in enumerate(self._levels[:depth], start=1):
+            index = self._index_at(level, day_number)
+            if index < 0:
+                return periods
+            periods.append(self._period(level, level_num, index))
+
+        # Sookshma and prana: subdivide only the active period
+        level = self._levels[-1]
+        index = periods[-1]["index"] if periods else -1
+        for level_num in range(len(self._levels) + 1, depth + 1):
+            level = _subdivide(
+                level.lords[index:index + 1],
+                level.origins[index:index + 1],
+                level.starts[index:index + 1],
+                level.ends[index:index + 1],
+                level.years[index:index + 1]
+            )
+            index = self._index_at(level, day_number)
+            if index < 0:
+                return periods
+            periods.append(self._period(level, level_num, index))
+
+        return periods
+
+    def indices_at(self, moments: Iterable[Moment], level: int = 1) -> np.ndarray:
+        """
+        Vectorized lookup: index of the active period of a precomputed level
+        for every moment (-1 outside the timeline)
+        """
+        if not 1 <= level <= PRECOMPUTED_LEVELS:
+            raise ValueError(f"Vectorized lookup supports levels 1-{PRECOMPUTED_LEVELS}")
+
+        periods = self._levels[level - 1]
+        day_numbers = np.asarray([to_day_number(moment) for moment in moments], dtype=np.float64)
+        indices = np.searchsorted(periods.starts, day_numbers, side="right") - 1
+        valid = indices >= 0
+        valid[valid] = day_numbers[valid] < periods.ends[indices[valid]]
+        return np.where(valid, indices, -1)
+
+    def lords_at(self, moments: Iterable[Moment], level: int = 1) -> List[Optional[str]]:
+        """Vectorized lookup of the active lord for every moment"""
+        lords = self._levels[level - 1].lords
+        return [LORDS[lords[index]] if index >= 0 else None for index in self.indices_at(moments, level)]
+
+    def periods(self, level: int = 1, parent_index: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        All periods of a precomputed level, optionally only the children of
+        one period of the level above
+        """
+        if not 1 <= level <= PRECOMPUTED_LEVELS:
+            raise ValueError(f"Period listing supports levels 1-{PRECOMPUTED_LEVELS}")
+
+        periods = self._levels[level - 1]
+        indices = range(len(periods.lords))
+        if parent_index is not None:
+            indices = np.flatnonzero(periods.parents == parent_index).tolist()
+        return [self._period(periods, level, index) for index in indices]
+
+
+@lru_cache(maxsize=2048)
+def get_timeline(moon_longitude: float, birth_datetime: datetime) -> VimshottariTimeline:
+    """
+    Timeline of a chart, built once and reused (e.g. on every cached-chart
+    hit). Timelines are read-only, so instances are shared.
+    """
+    return VimshottariTimeline(moon_longitude, birth_datetime)
+
+
+def mahadasha_index_at(start_dates: List[str], moment: date) -> int:
+    """
+    Bisect a sorted list of ISO period start dates (e.g. a stored timeline)
+
+    Returns:
+        Index of the last period starting on or before moment (-1 if none)
+    """
+    return bisect_right(start_dates, moment.isoformat()) - 1
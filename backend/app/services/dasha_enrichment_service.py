@@ -0,0 +1,122 @@
+"""
+Dasha AI Enrichment Service
+Runs AI personalization of the current Mahadasha as a deferred job so chart
+calculation never waits on the LLM. Results are stored on the chart row under
+chart_data["dasha_ai"] and merged into the dasha when the chart is served.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Dict, Any, Optional, Set, Tuple
+
+from app.core.metrics import CHART_STAGE_SECONDS, metrics
+from app.services.dasha_interpretation_service import dasha_interpretation_service
+from app.services.supabase_service import supabase_service
+
+
+class DashaEnrichmentService:
+    """Deferred AI personalization of stored chart dashas"""
+
+    def __init__(self):
+        """Initialize enrichment service"""
+        self.interpretation = dasha_interpretation_service
+        self.db = supabase_service
+        # (profile_id, chart_type) pairs with a job currently running
+        self._in_flight: Set[Tuple[str, str]] = set()
+
+    def get_status(self, chart_data: Dict[str, Any]) -> Optional[str]:
+        """Return the AI enrichment status of a chart (None if never requested)"""
+        return (chart_data.get("dasha_ai") or {}).get("status")
+
+    def needs_enrichment(self, profile_id: str, chart_data: Dict[str, Any]) -> bool:
+        """
+        Check whether an enrichment job should be scheduled for a chart
+
+        True when the chart is still pending and no job for it is running
+        in this process.
+        """
+        if self.get_status(chart_data) != self.interpretation.AI_STATUS_PENDING:
+            return False
+        return (str(profile_id), chart_data.get("chart_type", "D1")) not in self._in_flight
+
+    def apply_to_chart(self, chart_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge a stored AI personalization into chart_data["dasha"]"""
+        enrichment = chart_data.get("dasha_ai") or {}
+        if enrichment.get("status") == self.interpretation.AI_STATUS_READY and chart_data.get("dasha"):
+            chart_data["dasha"] = self.interpretation.apply_ai_personalization(
+                chart_data["dasha"],
+                enrichment
+            )
+        return chart_data
+
+    async def enrich_chart(self, profile_id: str, chart_type: str = "D1") -> Optional[Dict[str, Any]]:
+        """
+        Generate and store AI personalization for a cached chart
+
+        Meant to run as a background task after the chart response has been
+        sent. The OpenAI call runs in a worker thread so the event loop is
+        never blocked.
+
+        Args:
+            profile_id: Profile whose chart should be enriched
+            chart_type: Chart type of the cached row (default D1)
+
+        Returns:
+            The stored enrichment record, or None if nothing was done
+        """
+        key = (str(profile_id), chart_type)
+        if key in self._in_flight:
+            return None
+
+        self._in_flight.add(key)
+        try:
+            chart = await self.db.get_chart(profile_id=str(profile_id), chart_type=chart_type)
+            if not chart:
+                return None
+
+            chart_data = chart.get("chart_data") or {}
+            dasha = chart_data.get("dasha")
+            if not dasha:
+                return None
+
+            chart_context = {
+                "planets": chart_data.get("planets", {}),
+                "ascendant": chart_data.get("ascendant", {})
+            }
+
+            with metrics.timer(CHART_STAGE_SECONDS, stage="dasha_ai"):
+                personalization = await asyncio.to_thread(
+                    self.interpretation.generate_ai_personalization,
+                    dasha,
+                    chart_context
+                )
+
+            if personalization:
+                enrichment = {"status": self.interpretation.AI_STATUS_READY, **personalization}
+            else:
+                enrichment = {"status": self.interpretation.AI_STATUS_UNAVAILABLE}
+            enrichment["generated_at"] = datetime.utcnow().isoformat()
+
+            # Re-read the row so changes made while the AI call ran are kept
+            latest = await self.db.get_chart(profile_id=str(profile_id), chart_type=chart_type)
+            latest_data = (latest or chart).get("chart_data") or chart_data
+            latest_data["dasha_ai"] = enrichment
+
+            await self.db.update_chart(
+                profile_id=str(profile_id),
+                chart_type=chart_type,
+                chart_data=latest_data
+            )
+
+            return enrichment
+
+        except Exception as e:
+            print(f"Dasha AI enrichment failed for profile {profile_id}: {e}")
+            return None
+
+        finally:
+            self._in_flight.discard(key)
+
+
+# Singleton instance
+dasha_enrichment_service = DashaEnrichmentService()
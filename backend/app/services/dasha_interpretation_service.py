@@ -12,6 +12,11 @@ from openai import OpenAI
 class DashaInterpretationService:
     """Generate interpretations for Mahadasha, Antardasha, and Pratyantardasha periods"""
 
+    # Status of deferred AI personalization stored under chart_data["dasha_ai"]
+    AI_STATUS_PENDING = "pending"
+    AI_STATUS_READY = "ready"
+    AI_STATUS_UNAVAILABLE = "unavailable"
+
     def __init__(self):
         """Initialize with OpenAI client for AI personalization"""
         api_key = os.getenv("OPENAI_API_KEY")
@@ -360,30 +365,35 @@ class DashaInterpretationService:
 
         return antardashas
 
-    def personalize_dasha_with_ai(
+    def generate_ai_personalization(
         self,
         dasha_data: Dict[str, Any],
         chart_data: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+    ) -> Optional[Dict[str, Any]]:
         """
-        Use AI to personalize Dasha interpretations based on actual chart placements
+        Ask the AI for a personalized interpretation of the current Mahadasha
+
+        This is a blocking network call - run it off the request path
+        (see dasha_enrichment_service) rather than inside chart calculation.
 
         Args:
-            dasha_data: Enhanced dasha data
-            chart_data: Complete birth chart data for context
+            dasha_data: Dasha data with current_mahadasha
+            chart_data: Chart data with planets for context
 
         Returns:
-            Dasha data with AI-personalized interpretations
+            Personalization dict (planet, personalized_summary,
+            personalized_focus_areas, key_opportunity) or None if AI is
+            unavailable or the call failed
         """
         if not self.openai_client or not chart_data:
-            return dasha_data
+            return None
 
         try:
             current_maha = dasha_data.get("current_mahadasha", {})
             current_planet = current_maha.get("planet")
 
             if not current_planet:
-                return dasha_data
+                return None
 
             # Get planet's position in the chart
             planets = chart_data.get("planets", {})
@@ -427,21 +437,60 @@ Format your response as JSON with keys: personalized_summary, focus_areas (array
             ai_content = response.choices[0].message.content
             ai_interpretation = json.loads(ai_content)
 
-            # Add AI personalization to current mahadasha
-            current_maha["ai_personalized"] = True
-            current_maha["personalized_summary"] = ai_interpretation.get("personalized_summary")
-            current_maha["personalized_focus_areas"] = ai_interpretation.get("focus_areas", [])
-            current_maha["key_opportunity"] = ai_interpretation.get("key_opportunity")
-
-            dasha_data["current_mahadasha"] = current_maha
-            dasha_data["ai_enhanced"] = True
+            return {
+                "planet": current_planet,
+                "personalized_summary": ai_interpretation.get("personalized_summary"),
+                "personalized_focus_areas": ai_interpretation.get("focus_areas", []),
+                "key_opportunity": ai_interpretation.get("key_opportunity")
+            }
 
         except Exception as e:
             print(f"AI personalization failed: {e}")
-            # Continue with standard interpretations if AI fails
+            return None
+
+    def apply_ai_personalization(
+        self,
+        dasha_data: Dict[str, Any],
+        personalization: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Merge a stored AI personalization into the current Mahadasha
+
+        Skipped when the personalization was generated for a different
+        Mahadasha lord (the active period has changed since).
+        """
+        current_maha = dasha_data.get("current_mahadasha") or {}
+        if not personalization or personalization.get("planet") != current_maha.get("planet"):
+            return dasha_data
+
+        current_maha["ai_personalized"] = True
+        current_maha["personalized_summary"] = personalization.get("personalized_summary")
+        current_maha["personalized_focus_areas"] = personalization.get("personalized_focus_areas", [])
+        current_maha["key_opportunity"] = personalization.get("key_opportunity")
+
+        dasha_data["current_mahadasha"] = current_maha
+        dasha_data["ai_enhanced"] = True
 
         return dasha_data
 
+    def personalize_dasha_with_ai(
+        self,
+        dasha_data: Dict[str, Any],
+        chart_data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Use AI to personalize Dasha interpretations based on actual chart placements
+
+        Args:
+            dasha_data: Enhanced dasha data
+            chart_data: Complete birth chart data for context
+
+        Returns:
+            Dasha data with AI-personalized interpretations
+        """
+        personalization = self.generate_ai_personalization(dasha_data, chart_data)
+        return self.apply_ai_personalization(dasha_data, personalization)
+
     def enhance_dasha_with_interpretations(
         self,
         dasha_data: Dict[str, Any],
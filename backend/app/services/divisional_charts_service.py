@@ -3,9 +3,64 @@ Divisional Charts (Shodashvarga) Calculation Service
 Implements D2-D60 divisional charts as per classical Vedic astrology
 """
 
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from datetime import datetime, date, time
 
+import numpy as np
+
+
+class VargaMatrix:
+    """
+    Shodashvarga signs of a set of bodies, computed in one array pass
+
+    Rows are bodies (the grahas and usually the ascendant), columns are
+    DivisionalChartsService.VARGAS. signs holds 1-indexed varga signs;
+    parts (0-indexed division within the rashi) and degrees (degree within
+    the varga sign) are kept so chart dicts can be built on demand.
+    """
+
+    __slots__ = ("bodies", "signs", "parts", "degrees", "_rows")
+
+    def __init__(self, bodies: Tuple[str, ...], signs: np.ndarray, parts: np.ndarray, degrees: np.ndarray):
+        self.bodies = bodies
+        self.signs = signs
+        self.parts = parts
+        self.degrees = degrees
+        self._rows = {body: row for row, body in enumerate(bodies)}
+
+    def __contains__(self, body: str) -> bool:
+        return body in self._rows
+
+    def sign(self, body: str, varga: str) -> int:
+        """1-indexed sign of a body in a varga"""
+        return int(self.signs[self._rows[body], _VARGA_COLUMNS[varga]])
+
+    def column(self, varga: str) -> np.ndarray:
+        """1-indexed signs of every body in a varga, in row order"""
+        return self.signs[:, _VARGA_COLUMNS[varga]]
+
+    def position(self, body: str, varga: str) -> Dict[str, Any]:
+        """Varga position of a body, as returned by calculate_divisional_position"""
+        row, column = self._rows[body], _VARGA_COLUMNS[varga]
+        div_sign = int(self.signs[row, column]) - 1
+        div_degree = float(self.degrees[row, column])
+
+        return {
+            "sign": DivisionalChartsService.SIGNS[div_sign],
+            "sign_num": div_sign + 1,
+            "degree": round(div_degree, 6),
+            "longitude": round(div_sign * 30 + div_degree, 6),
+            "division_number": int(self.parts[row, column]) + 1
+        }
+
+    def to_dict(self) -> Dict[str, Dict[str, int]]:
+        """{body: {varga: sign}} with 1-indexed signs"""
+        return {
+            body: dict(zip(DivisionalChartsService.VARGAS, self.signs[row].tolist()))
+            for row, body in enumerate(self.bodies)
+        }
+
 
 class DivisionalChartsService:
     """Calculate all 16 divisional charts (Shodashvarga)"""
@@ -78,6 +133,81 @@ class DivisionalChartsService:
         12: "Jupiter"   # Pisces
     }
 
+    # Divisional charts: name -> (division, chart name, purpose)
+    DIVISIONAL_CHARTS = {
+        # High Priority (Shodashvarga - most important)
+        "D2": (2, "Hora", "Wealth and prosperity"),
+        "D4": (4, "Chaturthamsa", "Property, assets, and fortune"),
+        "D7": (7, "Saptamsa", "Children and progeny"),
+        "D9": (9, "Navamsa", "Marriage, dharma, and spiritual strength"),
+        "D10": (10, "Dashamsa", "Career, profession, and honors"),
+        "D24": (24, "Chaturvimshamsa", "Education and learning"),
+
+        # Medium Priority
+        "D3": (3, "Drekkana", "Siblings, courage, and initiatives"),
+        "D12": (12, "Dwadashamsa", "Parents and ancestry"),
+        "D16": (16, "Shodashamsa", "Vehicles, comforts, and happiness"),
+        "D20": (20, "Vimshamsa", "Spiritual pursuits and worship"),
+
+        # Lower Priority (Advanced analysis)
+        "D27": (27, "Nakshatramsa", "Strengths and weaknesses"),
+        "D30": (30, "Trimshamsa", "Evils, misfortunes, and obstacles"),
+        "D40": (40, "Khavedamsa", "Auspicious and inauspicious effects"),
+        "D45": (45, "Akshavedamsa", "Character and general well-being"),
+        "D60": (60, "Shashtiamsa", "Past life karma and overall effects")
+    }
+
+    # Charts selected by calculate_all_divisional_charts priority
+    DIVISIONAL_CHART_PRIORITIES = {
+        "high": ("D2", "D4", "D7", "D9", "D10", "D24"),
+        "medium": ("D2", "D3", "D4", "D7", "D9", "D10", "D12", "D16", "D20", "D24"),
+        "all": tuple(DIVISIONAL_CHARTS)
+    }
+
+    # Shodashvarga divisions in VargaMatrix column order
+    VARGAS = ("D1", "D2", "D3", "D4", "D7", "D9", "D10", "D12", "D16", "D20", "D24", "D27", "D30", "D40", "D45", "D60")
+
+    # Varga sign rules of calculate_divisional_position as coefficients, with rashi,
+    # part (division number) and varga sign 0-indexed:
+    #   sign = (offset + sign_step * rashi + part_step * (part // part_group)) % 12
+    # name -> (offset odd, offset even, sign_step, part_step odd, part_step even, part_group)
+    VARGA_SIGN_RULES = {
+        "D1": (0, 0, 1, 0, 0, 1),
+        "D2": (4, 3, 0, -1, 1, 1),   # Odd: Leo then Cancer, even: Cancer then Leo
+        "D3": (0, 0, 1, 4, 4, 1),
+        "D4": (0, 0, 1, 3, 3, 1),
+        "D7": (0, 6, 1, 1, 1, 1),
+        "D9": (0, 0, 9, 1, 1, 1),
+        "D10": (0, 8, 1, 1, 1, 1),
+        "D12": (0, 0, 1, 1, 1, 1),
+        "D16": (0, 6, 0, 1, 1, 1),
+        "D20": (0, 8, 0, 1, 1, 1),
+        "D24": (4, 3, 0, 1, 1, 1),
+        "D27": (0, 0, 9, 1, 1, 3),
+        "D30": (0, 0, 1, 0, 0, 1),   # Replaced by the Trimshamsa ranges below
+        "D40": (0, 6, 0, 1, 1, 1),
+        "D45": (0, 6, 0, 1, 1, 1),
+        "D60": (0, 0, 5, 1, 1, 12)
+    }
+
+    # Trimshamsa (D30): upper degree bounds of the ranges and their sign offsets from the rashi
+    TRIMSHAMSA_BOUNDS = {"odd": (5, 10, 18, 25), "even": (5, 12, 20, 25)}
+    TRIMSHAMSA_OFFSETS = {"odd": (0, 10, 5, 8, 6), "even": (5, 4, 3, 2, 1)}
+
+    # Vimshopaka Bala classification: minimum score -> (classification, quality), highest first
+    VIMSHOPAKA_CLASSES = (
+        (18, "Parijatamsa", "Excellent"),         # 18-20
+        (16, "Uttamamsa", "Very Good"),           # 16-18
+        (13, "Gopuramsa", "Good"),                # 13-16
+        (10, "Simhasanamsa", "Above Average"),    # 10-13
+        (6, "Parvatamsa", "Average"),             # 6-10
+        (3, "Devalokamsa", "Below Average"),      # 3-6
+        (0, "Brahmalokamsa", "Weak")              # 0-3
+    )
+
+    # Planets scored by Vimshopaka Bala
+    VIMSHOPAKA_PLANETS = ("Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu")
+
     def get_planet_dignity(self, planet_name: str, sign_num: int) -> tuple[str, float]:
         """
         Determine planet's dignity in a sign
@@ -193,28 +323,7 @@ class DivisionalChartsService:
                     "contribution": round(varga_contribution, 4)
                 }
 
-            # Classify strength (out of 20 Shashtiamsa units)
-            if total_score >= 18:
-                classification = "Parijatamsa"  # Excellent (18-20)
-                quality = "Excellent"
-            elif total_score >= 16:
-                classification = "Uttamamsa"  # Very Good (16-18)
-                quality = "Very Good"
-            elif total_score >= 13:
-                classification = "Gopuramsa"  # Good (13-16)
-                quality = "Good"
-            elif total_score >= 10:
-                classification = "Simhasanamsa"  # Above Average (10-13)
-                quality = "Above Average"
-            elif total_score >= 6:
-                classification = "Parvatamsa"  # Average (6-10)
-                quality = "Average"
-            elif total_score >= 3:
-                classification = "Devalokamsa"  # Below Average (3-6)
-                quality = "Below Average"
-            else:
-                classification = "Brahmalokamsa"  # Weak (0-3)
-                quality = "Weak"
+            classification, quality = self._classify_vimshopaka(total_score)
 
             planet_strengths[planet_name] = {
                 "total_score": round(total_score, 4),
@@ -225,7 +334,65 @@ class DivisionalChartsService:
                 "varga_scores": varga_scores
             }
 
-        # Summary statistics
+        return self._vimshopaka_result(planet_strengths)
+
+    def calculate_vimshopaka_bala_from_matrix(self, matrix: VargaMatrix) -> Dict[str, Any]:
+        """
+        Calculate Vimshopaka Bala from a VargaMatrix
+
+        Same result shape as calculate_vimshopaka_bala, scored over all 16
+        vargas (D1 and D9 included) with one table lookup per planet and varga.
+
+        Args:
+            matrix: Varga signs from calculate_varga_matrix
+
+        Returns:
+            Dictionary with planet strengths and classifications
+        """
+        planets = [planet for planet in self.VIMSHOPAKA_PLANETS if planet in matrix]
+        names, scores_by_sign = _dignity_table()
+        weights = np.array([self.VIMSHOPAKA_WEIGHTS[varga] for varga in self.VARGAS])
+
+        signs = matrix.signs[[matrix.bodies.index(planet) for planet in planets]]
+        table_rows = np.array([self.VIMSHOPAKA_PLANETS.index(planet) for planet in planets], dtype=np.intp)
+        dignity_scores = scores_by_sign[table_rows[:, None], signs]
+        contributions = dignity_scores / 20.0 * weights
+        totals = np.cumsum(contributions, axis=1)[:, -1]  # Summed in varga order, like calculate_vimshopaka_bala
+
+        planet_strengths = {}
+        for row, planet_name in enumerate(planets):
+            total_score = float(totals[row])
+            classification, quality = self._classify_vimshopaka(total_score)
+            table_row = table_rows[row]
+
+            planet_strengths[planet_name] = {
+                "total_score": round(total_score, 4),
+                "max_score": 20.0,
+                "percentage": round((total_score / 20.0) * 100, 2),
+                "classification": classification,
+                "quality": quality,
+                "varga_scores": {
+                    varga: {
+                        "dignity": names[table_row][signs[row, column]],
+                        "dignity_score": float(dignity_scores[row, column]),
+                        "weight": self.VIMSHOPAKA_WEIGHTS[varga],
+                        "contribution": round(float(contributions[row, column]), 4)
+                    }
+                    for column, varga in enumerate(self.VARGAS)
+                }
+            }
+
+        return self._vimshopaka_result(planet_strengths)
+
+    def _classify_vimshopaka(self, total_score: float) -> Tuple[str, str]:
+        """(classification, quality) of a Vimshopaka score out of 20"""
+        for minimum, classification, quality in self.VIMSHOPAKA_CLASSES:
+            if total_score >= minimum:
+                return classification, quality
+        return self.VIMSHOPAKA_CLASSES[-1][1:]
+
+    def _vimshopaka_result(self, planet_strengths: Dict[str, Any]) -> Dict[str, Any]:
+        """Vimshopaka Bala result with summary statistics"""
         avg_strength = sum(p["total_score"] for p in planet_strengths.values()) / len(planet_strengths)
         strongest_planet = max(planet_strengths.items(), key=lambda x: x[1]["total_score"])
         weakest_planet = min(planet_strengths.items(), key=lambda x: x[1]["total_score"])
@@ -420,13 +587,30 @@ class DivisionalChartsService:
         )
 
         # Calculate divisional positions for all planets
-        div_planets = {}
-        for planet_name, planet_data in d1_planets.items():
-            div_pos = self.calculate_divisional_position(
+        div_positions = {
+            planet_name: self.calculate_divisional_position(
                 planet_data["longitude"],
                 division,
                 planet_data["sign_num"]
             )
+            for planet_name, planet_data in d1_planets.items()
+        }
+
+        return self._build_divisional_chart(d1_planets, asc_div_pos, div_positions, division, chart_name, purpose)
+
+    def _build_divisional_chart(
+        self,
+        d1_planets: Dict[str, Any],
+        asc_div_pos: Dict[str, Any],
+        div_positions: Dict[str, Dict[str, Any]],
+        division: int,
+        chart_name: str,
+        purpose: str
+    ) -> Dict[str, Any]:
+        """Assemble a divisional chart dict from ascendant and planet varga positions"""
+        div_planets = {}
+        for planet_name, div_pos in div_positions.items():
+            planet_data = d1_planets[planet_name]
 
             # Calculate house in divisional chart
             div_house = ((div_pos["sign_num"] - asc_div_pos["sign_num"]) % 12) + 1
@@ -464,6 +648,99 @@ class DivisionalChartsService:
             "calculation_method": f"Standard Vedic {chart_name} formula"
         }
 
+    def calculate_varga_matrix(
+        self,
+        d1_planets: Dict[str, Any],
+        d1_ascendant: Optional[Dict[str, Any]] = None
+    ) -> VargaMatrix:
+        """
+        Calculate the signs of every body in all 16 vargas in one array pass
+
+        Each varga rule of calculate_divisional_position is applied to a whole
+        column at once (see VARGA_SIGN_RULES); the Trimshamsa (D30) ranges are
+        looked up with searchsorted. The rashi is taken from each longitude.
+
+        Args:
+            d1_planets: Planets from D1 chart (may include "Ascendant")
+            d1_ascendant: Ascendant from D1 chart, added as row "Ascendant"
+                unless d1_planets already has one
+
+        Returns:
+            VargaMatrix with one row per body and one column per varga
+        """
+        longitudes = {name: data["longitude"] for name, data in d1_planets.items()}
+        if d1_ascendant is not None:
+            longitudes.setdefault("Ascendant", d1_ascendant["longitude"])
+
+        return self.calculate_varga_matrix_from_longitudes(longitudes)
+
+    def calculate_varga_matrix_from_longitudes(self, longitudes: Dict[str, float]) -> VargaMatrix:
+        """VargaMatrix of bodies given as {name: sidereal longitude}"""
+        bodies = tuple(longitudes)
+        longitude = np.fromiter(longitudes.values(), dtype=np.float64, count=len(bodies))
+
+        rules = _varga_rule_arrays()
+        rashi = (longitude // 30).astype(np.int64) % 12
+        degree_in_sign = longitude % 30
+        is_odd_sign = (rashi % 2 == 0)[:, None]  # Aries (0), Gemini (2), ... in 0-indexed
+
+        # Division within the rashi and degree within the varga sign, per column
+        div_size = 30 / rules["divisions"]
+        parts = np.floor(degree_in_sign[:, None] / div_size).astype(np.int64)
+        degrees = (degree_in_sign[:, None] % div_size) * (30 / div_size)
+
+        offset = np.where(is_odd_sign, rules["offset_odd"], rules["offset_even"])
+        part_step = np.where(is_odd_sign, rules["part_step_odd"], rules["part_step_even"])
+        signs = (offset + rules["sign_step"] * rashi[:, None] + part_step * (parts // rules["part_group"])) % 12
+
+        # Trimshamsa (D30): unequal ranges, ruled by Mars, Saturn, Jupiter, Mercury, Venus
+        odd_range = np.searchsorted(self.TRIMSHAMSA_BOUNDS["odd"], degree_in_sign, side="right")
+        even_range = np.searchsorted(self.TRIMSHAMSA_BOUNDS["even"], degree_in_sign, side="right")
+        trimshamsa_offset = np.where(
+            is_odd_sign[:, 0],
+            rules["trimshamsa_odd"][odd_range],
+            rules["trimshamsa_even"][even_range]
+        )
+        signs[:, rules["d30"]] = (rashi + trimshamsa_offset) % 12
+
+        return VargaMatrix(bodies, (signs + 1).astype(np.int8), parts, degrees)
+
+    def materialize_divisional_charts(
+        self,
+        matrix: VargaMatrix,
+        d1_planets: Dict[str, Any],
+        chart_names: Iterable[str]
+    ) -> Dict[str, Any]:
+        """
+        Build divisional chart dicts from a VargaMatrix
+
+        Args:
+            matrix: Varga signs from calculate_varga_matrix (with an "Ascendant" row)
+            d1_planets: Planets from D1 chart, for retrograde and D1 sign / house
+            chart_names: Charts to build (keys of DIVISIONAL_CHARTS)
+
+        Returns:
+            Dictionary of divisional charts, same shape as calculate_divisional_chart
+        """
+        divisional_charts = {}
+
+        for chart_name in chart_names:
+            division, _, purpose = self.DIVISIONAL_CHARTS[chart_name]
+            div_positions = {
+                planet_name: matrix.position(planet_name, chart_name)
+                for planet_name in d1_planets
+            }
+            divisional_charts[chart_name] = self._build_divisional_chart(
+                d1_planets,
+                matrix.position("Ascendant", chart_name),
+                div_positions,
+                division,
+                chart_name,
+                purpose
+            )
+
+        return divisional_charts
+
     def calculate_all_divisional_charts(
         self,
         d1_planets: Dict[str, Any],
@@ -481,57 +758,13 @@ class DivisionalChartsService:
         Returns:
             Dictionary of all calculated divisional charts
         """
-        # Define divisions with their purposes
-        all_divisions = {
-            # High Priority (Shodashvarga - most important)
-            "D2": (2, "Hora", "Wealth and prosperity"),
-            "D4": (4, "Chaturthamsa", "Property, assets, and fortune"),
-            "D7": (7, "Saptamsa", "Children and progeny"),
-            "D9": (9, "Navamsa", "Marriage, dharma, and spiritual strength"),
-            "D10": (10, "Dashamsa", "Career, profession, and honors"),
-            "D24": (24, "Chaturvimshamsa", "Education and learning"),
-
-            # Medium Priority
-            "D3": (3, "Drekkana", "Siblings, courage, and initiatives"),
-            "D12": (12, "Dwadashamsa", "Parents and ancestry"),
-            "D16": (16, "Shodashamsa", "Vehicles, comforts, and happiness"),
-            "D20": (20, "Vimshamsa", "Spiritual pursuits and worship"),
-
-            # Lower Priority (Advanced analysis)
-            "D27": (27, "Nakshatramsa", "Strengths and weaknesses"),
-            "D30": (30, "Trimshamsa", "Evils, misfortunes, and obstacles"),
-            "D40": (40, "Khavedamsa", "Auspicious and inauspicious effects"),
-            "D45": (45, "Akshavedamsa", "Character and general well-being"),
-            "D60": (60, "Shashtiamsa", "Past life karma and overall effects")
-        }
-
-        # Select divisions based on priority
-        if priority == "high":
-            selected = ["D2", "D4", "D7", "D9", "D10", "D24"]
-        elif priority == "medium":
-            selected = ["D2", "D3", "D4", "D7", "D9", "D10", "D12", "D16", "D20", "D24"]
-        else:  # "all"
-            selected = list(all_divisions.keys())
-
-        divisional_charts = {}
-
-        for chart_name in selected:
-            if chart_name in all_divisions:
-                division, name, purpose = all_divisions[chart_name]
+        selected = self.DIVISIONAL_CHART_PRIORITIES.get(priority, self.DIVISIONAL_CHART_PRIORITIES["all"])
 
-                # Skip D9 as it's calculated separately with more detail
-                if chart_name == "D9":
-                    continue
-
-                divisional_charts[chart_name] = self.calculate_divisional_chart(
-                    d1_planets,
-                    d1_ascendant,
-                    division,
-                    chart_name,
-                    purpose
-                )
+        # Skip D9 as it's calculated separately with more detail
+        selected = [chart_name for chart_name in selected if chart_name != "D9"]
 
-        return divisional_charts
+        matrix = self.calculate_varga_matrix(d1_planets, d1_ascendant)
+        return self.materialize_divisional_charts(matrix, d1_planets, selected)
 
     def detect_divisional_yogas(
         self,
@@ -700,5 +933,47 @@ class DivisionalChartsService:
         return effects.get(chart_name, "General benefic effects")
 
 
+_VARGA_COLUMNS = {varga: column for column, varga in enumerate(DivisionalChartsService.VARGAS)}
+
+
+@lru_cache(maxsize=None)
+def _varga_rule_arrays() -> Dict[str, Any]:
+    """VARGA_SIGN_RULES and Trimshamsa offsets as arrays aligned with VARGAS"""
+    service = DivisionalChartsService
+    rules = np.array([service.VARGA_SIGN_RULES[varga] for varga in service.VARGAS], dtype=np.int64)
+
+    return {
+        "divisions": np.array([int(varga[1:]) for varga in service.VARGAS], dtype=np.float64),
+        "offset_odd": rules[:, 0],
+        "offset_even": rules[:, 1],
+        "sign_step": rules[:, 2],
+        "part_step_odd": rules[:, 3],
+        "part_step_even": rules[:, 4],
+        "part_group": rules[:, 5],
+        "trimshamsa_odd": np.array(service.TRIMSHAMSA_OFFSETS["odd"], dtype=np.int64),
+        "trimshamsa_even": np.array(service.TRIMSHAMSA_OFFSETS["even"], dtype=np.int64),
+        "d30": _VARGA_COLUMNS["D30"]
+    }
+
+
+@lru_cache(maxsize=None)
+def _dignity_table() -> Tuple[Tuple[Tuple[str, ...], ...], np.ndarray]:
+    """
+    get_planet_dignity for every VIMSHOPAKA_PLANETS planet and sign
+
+    Returns (names, scores): names[planet][sign] and scores[planet, sign]
+    with 1-indexed signs (index 0 unused).
+    """
+    service = divisional_charts_service
+    names, scores = [], np.zeros((len(service.VIMSHOPAKA_PLANETS), 13))
+
+    for row, planet in enumerate(service.VIMSHOPAKA_PLANETS):
+        dignities = [service.get_planet_dignity(planet, sign) for sign in range(13)]
+        names.append(tuple(name for name, _ in dignities))
+        scores[row] = [score for _, score in dignities]
+
+    return tuple(names), scores
+
+
 # Singleton instance
 divisional_charts_service = DivisionalChartsService()
@@ -3,17 +3,63 @@ Dosha Detection Service
 Detects major doshas (afflictions) in Vedic astrology charts
 """
 
-from typing import Dict, Any, List
+import copy
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+from app.core.chart_core import SEVEN_PLANETS
+from app.services import bitboards
+
+
+@lru_cache(maxsize=None)
+def _between_axis_mask(rahu_house: int, ketu_house: int) -> int:
+    """Bitboard of houses (0-12) counted as between Rahu and Ketu for Kaal Sarpa"""
+    between = 0
+    for house in range(bitboards.HOUSE_COUNT + 1):
+        if rahu_house < ketu_house:
+            # Rahu in earlier house, Ketu in later house
+            inside = rahu_house < house < ketu_house
+        else:
+            # Rahu in later house, Ketu in earlier house (axis wraps around)
+            inside = house > rahu_house or house < ketu_house
+        if inside:
+            between |= bitboards.bit(house)
+    return between
 
 
 class DoshaDetectionService:
     """Detect classical Vedic astrology doshas"""
 
+    # Output modes of detect_all_doshas:
+    # - full: complete analysis with remedies inline
+    # - reference: complete analysis, remedies only as remedy_id
+    # - summary: SUMMARY_FIELDS only
+    DOSHA_MODES = ("full", "reference", "summary")
+    SUMMARY_FIELDS = ("name", "present", "severity", "intensity_score", "remedy_id")
+
+    # Remedy set ("tier") of each severity by dosha. A remedy id is
+    # "<dosha-slug>:<tier>", plus ":<variant>" where the remedies also depend
+    # on the chart (Kaal Sarpa type, bodies in a Grahan affliction).
+    # Severity "none" has no remedies. See app.services.dosha_remedies
+    REMEDY_TIERS = MappingProxyType({
+        "Manglik Dosha": {"very_low": "low", "low": "low", "medium": "medium", "high": "high", "very_high": "high"},
+        "Kaal Sarpa Dosha": {"low": "low", "medium": "low", "high": "high", "very_high": "high"},
+        "Pitra Dosha": {"low": "low", "medium": "low", "high": "high", "very_high": "high"},
+        "Grahan Dosha": {"low": "low", "medium": "low", "high": "high", "very_high": "high"},
+        "Gandanta Dosha": {"medium": "any", "high": "any"},
+        "Kemdrum Dosha": {"medium": "any"}
+    })
+
+    # Bodies whose involvement in a Grahan affliction selects its remedies
+    GRAHAN_BODIES = ("Sun", "Moon", "Rahu", "Ketu")
+
     def detect_all_doshas(
         self,
         d1_planets: Dict[str, Any],
         d1_ascendant: Dict[str, Any],
-        d9_planets: Dict[str, Any] = None
+        d9_planets: Dict[str, Any] = None,
+        mode: str = "full"
     ) -> List[Dict[str, Any]]:
         """
         Detect all major doshas in the birth chart
@@ -22,55 +68,159 @@ class DoshaDetectionService:
             d1_planets: Planets from D1 (Rashi) chart
             d1_ascendant: Ascendant from D1 chart
             d9_planets: Planets from D9 (Navamsa) chart (optional for Manglik)
+            mode: One of DOSHA_MODES. Outside "full" no remedy text is built;
+                it is resolved from remedy_id via the dosha remedy catalog.
 
         Returns:
             List of detected doshas with details
+
+        Raises:
+            ValueError: If mode is unknown
         """
+        if mode not in self.DOSHA_MODES:
+            raise ValueError(f"Unknown dosha mode: {mode}. Valid modes: {', '.join(self.DOSHA_MODES)}")
+
+        with_remedies = mode == "full"
         doshas = []
 
         # 1. Manglik Dosha (Mars affliction)
-        manglik = self.detect_manglik_dosha(d1_planets, d9_planets)
+        manglik = self.detect_manglik_dosha(d1_planets, d9_planets, with_remedies=with_remedies)
         if manglik["present"]:
             doshas.append(manglik)
 
         # 2. Kaal Sarpa Dosha (All planets between Rahu-Ketu axis)
-        kaal_sarpa = self.detect_kaal_sarpa_dosha(d1_planets)
+        kaal_sarpa = self.detect_kaal_sarpa_dosha(d1_planets, with_remedies=with_remedies)
         if kaal_sarpa["present"]:
             doshas.append(kaal_sarpa)
 
         # 3. Pitra Dosha (Ancestral affliction)
-        pitra = self.detect_pitra_dosha(d1_planets)
+        pitra = self.detect_pitra_dosha(d1_planets, with_remedies=with_remedies)
         if pitra["present"]:
             doshas.append(pitra)
 
         # 4. Gandanta Dosha (Junction points between signs/nakshatras)
-        gandanta = self.detect_gandanta_dosha(d1_planets, d1_ascendant)
+        gandanta = self.detect_gandanta_dosha(d1_planets, d1_ascendant, with_remedies=with_remedies)
         if gandanta["present"]:
             doshas.append(gandanta)
 
         # 5. Grahan Dosha (Eclipse dosha - Sun/Moon with Rahu/Ketu)
-        grahan = self.detect_grahan_dosha(d1_planets)
+        grahan = self.detect_grahan_dosha(d1_planets, with_remedies=with_remedies)
         if grahan["present"]:
             doshas.append(grahan)
 
         # 6. Kemdrum Dosha (Moon isolated)
-        kemdrum = self.detect_kemdrum_dosha(d1_planets)
+        kemdrum = self.detect_kemdrum_dosha(d1_planets, with_remedies=with_remedies)
         if kemdrum["present"]:
             doshas.append(kemdrum)
 
-        return doshas if doshas else [{
-            "name": "No Major Dosha",
-            "present": False,
-            "severity": "none",
-            "description": "No major doshas detected in the chart",
-            "effects": "Chart is relatively free from major afflictions",
-            "remedies": []
-        }]
+        if not doshas:
+            doshas = [{
+                "name": "No Major Dosha",
+                "present": False,
+                "severity": "none",
+                "description": "No major doshas detected in the chart",
+                "effects": "Chart is relatively free from major afflictions",
+                **self._remedies(None, with_remedies, list)
+            }]
+
+        if mode == "summary":
+            return [{field: dosha.get(field) for field in self.SUMMARY_FIELDS} for dosha in doshas]
+
+        return doshas
+
+    def remedy_id(self, dosha_name: str, severity: str, variant: Optional[str] = None) -> Optional[str]:
+        """
+        Remedy catalog id of a dosha at a severity (None if it has no remedies)
+        """
+        tier = self.REMEDY_TIERS.get(dosha_name, {}).get(severity)
+        if tier is None:
+            return None
+        remedy_id = f"{dosha_name.lower().replace(' ', '-')}:{tier}"
+        return f"{remedy_id}:{variant}" if variant else remedy_id
+
+    def remedy_sets(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Every remedy set the detectors can produce, as (remedy_id, entry)
+
+        Entries hold the dosha name, tier, variant (or None) and remedies,
+        built by the same code as inline remedies.
+        """
+        def tiers(dosha_name: str) -> Dict[str, str]:
+            # Tier -> first severity of the tier
+            return {tier: severity for severity, tier in reversed(list(self.REMEDY_TIERS[dosha_name].items()))}
+
+        def entry(dosha_name: str, severity: str, variant: Optional[str], remedies: Any):
+            return self.remedy_id(dosha_name, severity, variant), {
+                "dosha": dosha_name,
+                "tier": self.REMEDY_TIERS[dosha_name][severity],
+                "variant": variant,
+                "remedies": remedies
+            }
+
+        for severity in tiers("Manglik Dosha").values():
+            yield entry("Manglik Dosha", severity, None, self._get_manglik_remedies(severity))
+
+        yoga_types = [details["name"] for details in self.KAAL_SARPA_TYPE_DETAILS.values()]
+        yoga_types.append(self.KAAL_SARPA_DEFAULT_TYPE_DETAILS["name"])
+        for severity in tiers("Kaal Sarpa Dosha").values():
+            variants = {self._kaal_sarpa_remedy_variant(severity, yoga_type): yoga_type for yoga_type in yoga_types}
+            for variant, yoga_type in variants.items():
+                yield entry("Kaal Sarpa Dosha", severity, variant, self._get_kaal_sarpa_remedies(severity, yoga_type))
+
+        for severity in tiers("Pitra Dosha").values():
+            yield entry("Pitra Dosha", severity, None, self._get_pitra_dosha_remedies(severity, 0))
+
+        for severity in tiers("Grahan Dosha").values():
+            for mask in range(1 << len(self.GRAHAN_BODIES)):
+                bodies = tuple(body for i, body in enumerate(self.GRAHAN_BODIES) if mask >> i & 1)
+                variant = "-".join(body.lower() for body in bodies) or "none"
+                yield entry("Grahan Dosha", severity, variant, self._get_grahan_dosha_remedies(severity, bodies))
+
+        for severity in tiers("Gandanta Dosha").values():
+            yield entry("Gandanta Dosha", severity, None, list(self.GANDANTA_REMEDIES))
+
+        for severity in tiers("Kemdrum Dosha").values():
+            yield entry("Kemdrum Dosha", severity, None, list(self.KEMDRUM_REMEDIES))
+
+    def _remedies(self, remedy_id: Optional[str], with_remedies: bool, build) -> Dict[str, Any]:
+        """remedy_id field, plus the remedies from build() when requested"""
+        fields = {"remedy_id": remedy_id}
+        if with_remedies:
+            fields["remedies"] = build()
+        return fields
+
+    # Intensity of Mars by house (from Lagna; x0.8 from Moon, x0.5 from Venus)
+    MANGLIK_HOUSE_WEIGHTS = MappingProxyType({
+        1: 4,   # Self, personality, aggression
+        2: 3,   # Family, wealth conflicts
+        4: 2,   # Domestic peace
+        7: 3,   # Spouse, partnership
+        8: 5,   # Longevity, accidents, major transformations
+        12: 4   # Separation, losses
+    })
+
+    # Manglik effects and age of manifestation by severity
+    MANGLIK_EFFECTS = MappingProxyType({
+        "none": "No Manglik affliction present",
+        "very_low": "Minimal impact. May experience minor delays in marriage (1-2 years) or occasional disagreements. Effects naturally reduce after age 28.",
+        "low": "Mild impact. Possible delays in finding suitable match (2-3 years). Minor conflicts in early marriage that resolve with maturity. Consider simple remedies.",
+        "medium": "Moderate impact. Marriage delays (3-5 years) or challenges in married life such as frequent disagreements, ego clashes. Remedies recommended before marriage.",
+        "high": "Significant impact. Substantial delays (5-7 years), major conflicts with spouse, possible separation if not addressed. Strong remedial measures essential.",
+        "very_high": "Severe impact. Very long delays (7+ years), serious marital discord, risk of separation or spouse's health issues. Comprehensive remedial measures and compatibility matching crucial."
+    })
+    MANGLIK_MANIFESTATION_PERIODS = MappingProxyType({
+        "very_low": "18-28 years (reduces significantly after 28)",
+        "low": "20-30 years (reduces after 28-30)",
+        "medium": "22-35 years (partial reduction after 32)",
+        "high": "24-40 years (gradual reduction after 35)",
+        "very_high": "25-45 years (remedies essential throughout)"
+    })
 
     def detect_manglik_dosha(
         self,
         d1_planets: Dict[str, Any],
-        d9_planets: Dict[str, Any] = None
+        d9_planets: Dict[str, Any] = None,
+        with_remedies: bool = True
     ) -> Dict[str, Any]:
         """
         Enhanced Manglik Dosha Detection with 5-level intensity classification
@@ -98,38 +248,25 @@ class DoshaDetectionService:
         mars_house_from_moon = ((mars_sign_num - moon_sign) % 12) + 1
         mars_house_from_venus = ((mars_sign_num - venus_sign) % 12) + 1
 
-        # Manglik houses with intensity weights
-        # Very high intensity: 1st (aggression), 8th (accidents/death), 12th (separation)
-        # High intensity: 2nd (family discord), 7th (spouse conflicts)
-        # Medium intensity: 4th (domestic peace issues)
-        house_intensity_weights = {
-            1: 4,   # Self, personality, aggression
-            2: 3,   # Family, wealth conflicts
-            4: 2,   # Domestic peace
-            7: 3,   # Spouse, partnership
-            8: 5,   # Longevity, accidents, major transformations
-            12: 4   # Separation, losses
-        }
-
         # Calculate base intensity score
         intensity_score = 0
         affected_houses = []
 
         # Check from Lagna
-        if mars_house_lagna in house_intensity_weights:
-            weight = house_intensity_weights[mars_house_lagna]
+        if mars_house_lagna in self.MANGLIK_HOUSE_WEIGHTS:
+            weight = self.MANGLIK_HOUSE_WEIGHTS[mars_house_lagna]
             intensity_score += weight
             affected_houses.append(f"{mars_house_lagna}th from Lagna (weight: {weight})")
 
         # Check from Moon (slightly less weight)
-        if mars_house_from_moon in house_intensity_weights:
-            weight = house_intensity_weights[mars_house_from_moon] * 0.8
+        if mars_house_from_moon in self.MANGLIK_HOUSE_WEIGHTS:
+            weight = self.MANGLIK_HOUSE_WEIGHTS[mars_house_from_moon] * 0.8
             intensity_score += weight
             affected_houses.append(f"{mars_house_from_moon}th from Moon (weight: {weight:.1f})")
 
         # Check from Venus (least weight, but still significant)
-        if mars_house_from_venus in house_intensity_weights:
-            weight = house_intensity_weights[mars_house_from_venus] * 0.5
+        if mars_house_from_venus in self.MANGLIK_HOUSE_WEIGHTS:
+            weight = self.MANGLIK_HOUSE_WEIGHTS[mars_house_from_venus] * 0.5
             intensity_score += weight
             affected_houses.append(f"{mars_house_from_venus}th from Venus (weight: {weight:.1f})")
 
@@ -240,28 +377,6 @@ class DoshaDetectionService:
             severity = "very_high"
             intensity_label = "Very High"
 
-        # Effects based on severity
-        effects_by_severity = {
-            "none": "No Manglik affliction present",
-            "very_low": "Minimal impact. May experience minor delays in marriage (1-2 years) or occasional disagreements. Effects naturally reduce after age 28.",
-            "low": "Mild impact. Possible delays in finding suitable match (2-3 years). Minor conflicts in early marriage that resolve with maturity. Consider simple remedies.",
-            "medium": "Moderate impact. Marriage delays (3-5 years) or challenges in married life such as frequent disagreements, ego clashes. Remedies recommended before marriage.",
-            "high": "Significant impact. Substantial delays (5-7 years), major conflicts with spouse, possible separation if not addressed. Strong remedial measures essential.",
-            "very_high": "Severe impact. Very long delays (7+ years), serious marital discord, risk of separation or spouse's health issues. Comprehensive remedial measures and compatibility matching crucial."
-        }
-
-        # Age-based manifestation
-        manifestation_periods = {
-            "very_low": "18-28 years (reduces significantly after 28)",
-            "low": "20-30 years (reduces after 28-30)",
-            "medium": "22-35 years (partial reduction after 32)",
-            "high": "24-40 years (gradual reduction after 35)",
-            "very_high": "25-45 years (remedies essential throughout)"
-        }
-
-        # Categorized remedies by type and severity
-        remedies = self._get_manglik_remedies(severity)
-
         return {
             "name": "Manglik Dosha",
             "present": is_manglik,
@@ -279,7 +394,7 @@ class DoshaDetectionService:
                 "affected_houses": affected_houses,
                 "strength_factors": strength_factors,
                 "cancellations": cancellations,
-                "manifestation_period": manifestation_periods.get(severity, "Not applicable")
+                "manifestation_period": self.MANGLIK_MANIFESTATION_PERIODS.get(severity, "Not applicable")
             },
             "description": (
                 f"Mars in {mars_house_lagna}th house from Lagna, "
@@ -287,8 +402,13 @@ class DoshaDetectionService:
                 f"{mars_house_from_venus}th from Venus. "
                 f"Intensity: {intensity_label} ({final_intensity:.1f}/10)"
             ),
-            "effects": effects_by_severity.get(severity, ""),
-            "remedies": remedies
+            "effects": self.MANGLIK_EFFECTS.get(severity, ""),
+            # Categorized remedies by type and severity
+            **self._remedies(
+                self.remedy_id("Manglik Dosha", severity),
+                with_remedies,
+                lambda: self._get_manglik_remedies(severity)
+            )
         }
 
     def _get_manglik_remedies(self, severity: str) -> Dict[str, List[str]]:
@@ -395,7 +515,7 @@ class DoshaDetectionService:
 
         return base_remedies
 
-    def detect_kaal_sarpa_dosha(self, d1_planets: Dict[str, Any]) -> Dict[str, Any]:
+    def detect_kaal_sarpa_dosha(self, d1_planets: Dict[str, Any], with_remedies: bool = True) -> Dict[str, Any]:
         """
         Enhanced Kaal Sarpa Dosha Detection with 12 variations and detailed effects
 
@@ -411,28 +531,19 @@ class DoshaDetectionService:
         ketu_house = ketu_data.get("house", 0)
 
         # Get all planets except Rahu and Ketu
-        planets_to_check = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
+        planets_to_check = SEVEN_PLANETS
 
         # Check if all planets are on one side of Rahu-Ketu axis
+        between = _between_axis_mask(rahu_house, ketu_house)
         planets_between_rahu_ketu = []
         planets_outside = []
 
         for planet in planets_to_check:
             planet_house = d1_planets.get(planet, {}).get("house", 0)
-
-            # Check if planet is between Rahu and Ketu
-            if rahu_house < ketu_house:
-                # Rahu in earlier house, Ketu in later house
-                if rahu_house < planet_house < ketu_house:
-                    planets_between_rahu_ketu.append(planet)
-                else:
-                    planets_outside.append(planet)
+            if bitboards.bit(planet_house) & between:
+                planets_between_rahu_ketu.append(planet)
             else:
-                # Rahu in later house, Ketu in earlier house (axis wraps around)
-                if planet_house > rahu_house or planet_house < ketu_house:
-                    planets_between_rahu_ketu.append(planet)
-                else:
-                    planets_outside.append(planet)
+                planets_outside.append(planet)
 
         # Determine Full vs Partial Kaal Sarpa
         num_planets_hemmed = max(len(planets_between_rahu_ketu), len(planets_outside))
@@ -540,11 +651,7 @@ class DoshaDetectionService:
             severity = "very_high"
             intensity_label = "Very High"
 
-        # Get type-specific remedies
-        remedies = self._get_kaal_sarpa_remedies(
-            severity,
-            kaal_sarpa_type_info.get("name", "Kaal Sarpa")
-        )
+        yoga_type = kaal_sarpa_type_info.get("name", "Kaal Sarpa")
 
         return {
             "name": "Kaal Sarpa Dosha",
@@ -577,167 +684,181 @@ class DoshaDetectionService:
             "effects": kaal_sarpa_type_info.get("effects", "No Kaal Sarpa affliction"),
             "positive_effects": kaal_sarpa_type_info.get("positive_effects", []) if has_kaal_sarpa else [],
             "manifestation_period": kaal_sarpa_type_info.get("manifestation_period", "") if has_kaal_sarpa else "",
-            "remedies": remedies
+            # Type-specific remedies
+            **self._remedies(
+                self.remedy_id("Kaal Sarpa Dosha", severity, self._kaal_sarpa_remedy_variant(severity, yoga_type)),
+                with_remedies,
+                lambda: self._get_kaal_sarpa_remedies(severity, yoga_type)
+            )
+        }
+
+    # The 12 Kaal Sarpa types by Rahu's house (copied before being returned)
+    KAAL_SARPA_TYPE_DETAILS = MappingProxyType({
+        1: {
+            "name": "Ananta Kaal Sarpa",
+            "deity": "Lord Ananta (Vishnu's serpent)",
+            "effects": "Challenges in self-confidence, health issues, obstacles in personal development. May face struggles in establishing identity and authority. Possible delays in achieving goals.",
+            "positive_effects": [
+                "Strong spiritual inclination after age 42",
+                "Ability to overcome obstacles through perseverance",
+                "Deep philosophical understanding"
+            ],
+            "life_areas": "Self, personality, health, vitality",
+            "manifestation_period": "Most active: 18-42 years, reduces after 42"
+        },
+        2: {
+            "name": "Kulika Kaal Sarpa",
+            "deity": "Kulika Naga",
+            "effects": "Family conflicts, wealth instability, speech-related problems. Challenges in accumulating and maintaining wealth. Strained family relationships. Possible food-related issues.",
+            "positive_effects": [
+                "Excellent communication skills after maturity",
+                "Ability to earn through speech/teaching",
+                "Strong family bonds after resolution"
+            ],
+            "life_areas": "Wealth, family, speech, food",
+            "manifestation_period": "Most active: 22-45 years, stabilizes after 45"
+        },
+        3: {
+            "name": "Vasuki Kaal Sarpa",
+            "deity": "Vasuki Naga (King of Serpents)",
+            "effects": "Sibling conflicts, courage challenges, communication issues. Problems with neighbors or close relatives. Obstacles in short travels. Lack of support from siblings.",
+            "positive_effects": [
+                "Exceptional writing and communication abilities",
+                "Success in media, journalism after struggles",
+                "Strong willpower and courage development"
+            ],
+            "life_areas": "Siblings, courage, communication, short journeys",
+            "manifestation_period": "Most active: 20-40 years"
+        },
+        4: {
+            "name": "Shankhapala Kaal Sarpa",
+            "deity": "Shankhapala Naga",
+            "effects": "Property disputes, mother's health issues, emotional instability. Challenges in domestic peace. Difficulty acquiring or maintaining property. Lack of mental peace at home.",
+            "positive_effects": [
+                "Strong emotional resilience after trials",
+                "Success in real estate after age 35",
+                "Deep maternal devotion"
+            ],
+            "life_areas": "Mother, property, emotions, domestic peace",
+            "manifestation_period": "Most active: 25-50 years"
+        },
+        5: {
+            "name": "Padma Kaal Sarpa",
+            "deity": "Padma Naga",
+            "effects": "Children-related concerns, intelligence blocks, speculative losses. Delays in having children or challenges with them. Obstacles in education. Losses in speculation/gambling.",
+            "positive_effects": [
+                "Exceptional intelligence and creativity after maturity",
+                "Success in research and innovation",
+                "Good relationship with children eventually"
+            ],
+            "life_areas": "Children, intelligence, education, speculation",
+            "manifestation_period": "Most active: 25-45 years"
+        },
+        6: {
+            "name": "Mahapadma Kaal Sarpa",
+            "deity": "Mahapadma Naga",
+            "effects": "Health problems, enemy troubles, debt issues, legal disputes. Chronic health conditions. Persistent enemies. Financial obligations. Service-related struggles.",
+            "positive_effects": [
+                "Excellent problem-solving abilities",
+                "Success in healing professions",
+                "Ability to overcome major obstacles"
+            ],
+            "life_areas": "Health, enemies, debts, litigation, service",
+            "manifestation_period": "Most active: Throughout life, peaks 30-50 years"
+        },
+        7: {
+            "name": "Takshaka Kaal Sarpa",
+            "deity": "Takshaka Naga",
+            "effects": "Marriage delays, partnership problems, spouse health issues. Serious challenges in married life. Business partnership conflicts. Delays in finding suitable partner.",
+            "positive_effects": [
+                "Strong partnership skills after trials",
+                "Deep understanding of relationships",
+                "Success in public relations"
+            ],
+            "life_areas": "Marriage, partnerships, spouse, contracts",
+            "manifestation_period": "Most active: 24-42 years"
+        },
+        8: {
+            "name": "Karkotak Kaal Sarpa",
+            "deity": "Karkotak Naga",
+            "effects": "Sudden accidents, longevity concerns, inheritance disputes. Unexpected setbacks. Chronic ailments. Challenges with in-laws. Occult interests but with obstacles.",
+            "positive_effects": [
+                "Strong interest and success in occult sciences",
+                "Transformational abilities",
+                "Research and investigation skills"
+            ],
+            "life_areas": "Longevity, accidents, inheritance, transformation",
+            "manifestation_period": "Critical periods: 21, 28, 35, 42, 56 years"
+        },
+        9: {
+            "name": "Shankhachud Kaal Sarpa",
+            "deity": "Shankhachud Naga",
+            "effects": "Father's health/relationship issues, spiritual obstacles, higher education delays. Problems with authority figures. Obstacles in religious pursuits. Foreign travel issues.",
+            "positive_effects": [
+                "Strong philosophical and spiritual wisdom",
+                "Success in higher education eventually",
+                "Teaching and mentoring abilities"
+            ],
+            "life_areas": "Father, religion, higher education, long journeys",
+            "manifestation_period": "Most active: 22-48 years"
+        },
+        10: {
+            "name": "Ghatak Kaal Sarpa",
+            "deity": "Ghatak Naga (The Destroyer)",
+            "effects": "Career instability, professional setbacks, authority conflicts. Frequent job changes. Delays in career success. Problems with superiors. Public image challenges.",
+            "positive_effects": [
+                "Exceptional career success after age 42",
+                "Leadership abilities through struggles",
+                "Recognition and fame eventually"
+            ],
+            "life_areas": "Career, profession, status, authority",
+            "manifestation_period": "Most active: 25-42 years, major success after 42"
+        },
+        11: {
+            "name": "Vishdhar Kaal Sarpa",
+            "deity": "Vishdhar Naga",
+            "effects": "Income fluctuations, unfulfilled desires, social network issues. Unstable income sources. Obstacles in achieving wishes. Elder sibling problems. Inconsistent gains.",
+            "positive_effects": [
+                "Multiple income sources after maturity",
+                "Large social network eventually",
+                "Fulfillment of major desires after struggles"
+            ],
+            "life_areas": "Income, gains, desires, friends, elder siblings",
+            "manifestation_period": "Most active: 28-50 years"
+        },
+        12: {
+            "name": "Sheshnag Kaal Sarpa",
+            "deity": "Sheshnag (Divine Serpent)",
+            "effects": "Expenditure problems, foreign settlement issues, sleep disorders. Excessive or wasteful expenses. Difficulties in foreign lands. Spiritual confusion. Hospitalization possibilities.",
+            "positive_effects": [
+                "Strong spiritual liberation potential",
+                "Success in foreign lands eventually",
+                "Charitable inclinations and moksha pursuit"
+            ],
+            "life_areas": "Losses, expenses, foreign lands, spirituality, moksha",
+            "manifestation_period": "Most active: Throughout life, spiritual peak after 48"
         }
+    })
+    KAAL_SARPA_DEFAULT_TYPE_DETAILS = MappingProxyType({
+        "name": "Kaal Sarpa Yoga",
+        "deity": "Serpent Deities",
+        "effects": "General obstacles and transformational challenges in life",
+        "positive_effects": ["Spiritual growth through adversity"],
+        "life_areas": "Various life areas",
+        "manifestation_period": "Throughout life"
+    })
 
     def _get_kaal_sarpa_type_details(self, rahu_house: int, ketu_house: int) -> Dict[str, Any]:
         """Get detailed information for each of the 12 Kaal Sarpa Yoga types"""
 
-        type_details = {
-            1: {
-                "name": "Ananta Kaal Sarpa",
-                "deity": "Lord Ananta (Vishnu's serpent)",
-                "effects": "Challenges in self-confidence, health issues, obstacles in personal development. May face struggles in establishing identity and authority. Possible delays in achieving goals.",
-                "positive_effects": [
-                    "Strong spiritual inclination after age 42",
-                    "Ability to overcome obstacles through perseverance",
-                    "Deep philosophical understanding"
-                ],
-                "life_areas": "Self, personality, health, vitality",
-                "manifestation_period": "Most active: 18-42 years, reduces after 42"
-            },
-            2: {
-                "name": "Kulika Kaal Sarpa",
-                "deity": "Kulika Naga",
-                "effects": "Family conflicts, wealth instability, speech-related problems. Challenges in accumulating and maintaining wealth. Strained family relationships. Possible food-related issues.",
-                "positive_effects": [
-                    "Excellent communication skills after maturity",
-                    "Ability to earn through speech/teaching",
-                    "Strong family bonds after resolution"
-                ],
-                "life_areas": "Wealth, family, speech, food",
-                "manifestation_period": "Most active: 22-45 years, stabilizes after 45"
-            },
-            3: {
-                "name": "Vasuki Kaal Sarpa",
-                "deity": "Vasuki Naga (King of Serpents)",
-                "effects": "Sibling conflicts, courage challenges, communication issues. Problems with neighbors or close relatives. Obstacles in short travels. Lack of support from siblings.",
-                "positive_effects": [
-                    "Exceptional writing and communication abilities",
-                    "Success in media, journalism after struggles",
-                    "Strong willpower and courage development"
-                ],
-                "life_areas": "Siblings, courage, communication, short journeys",
-                "manifestation_period": "Most active: 20-40 years"
-            },
-            4: {
-                "name": "Shankhapala Kaal Sarpa",
-                "deity": "Shankhapala Naga",
-                "effects": "Property disputes, mother's health issues, emotional instability. Challenges in domestic peace. Difficulty acquiring or maintaining property. Lack of mental peace at home.",
-                "positive_effects": [
-                    "Strong emotional resilience after trials",
-                    "Success in real estate after age 35",
-                    "Deep maternal devotion"
-                ],
-                "life_areas": "Mother, property, emotions, domestic peace",
-                "manifestation_period": "Most active: 25-50 years"
-            },
-            5: {
-                "name": "Padma Kaal Sarpa",
-                "deity": "Padma Naga",
-                "effects": "Children-related concerns, intelligence blocks, speculative losses. Delays in having children or challenges with them. Obstacles in education. Losses in speculation/gambling.",
-                "positive_effects": [
-                    "Exceptional intelligence and creativity after maturity",
-                    "Success in research and innovation",
-                    "Good relationship with children eventually"
-                ],
-                "life_areas": "Children, intelligence, education, speculation",
-                "manifestation_period": "Most active: 25-45 years"
-            },
-            6: {
-                "name": "Mahapadma Kaal Sarpa",
-                "deity": "Mahapadma Naga",
-                "effects": "Health problems, enemy troubles, debt issues, legal disputes. Chronic health conditions. Persistent enemies. Financial obligations. Service-related struggles.",
-                "positive_effects": [
-                    "Excellent problem-solving abilities",
-                    "Success in healing professions",
-                    "Ability to overcome major obstacles"
-                ],
-                "life_areas": "Health, enemies, debts, litigation, service",
-                "manifestation_period": "Most active: Throughout life, peaks 30-50 years"
-            },
-            7: {
-                "name": "Takshaka Kaal Sarpa",
-                "deity": "Takshaka Naga",
-                "effects": "Marriage delays, partnership problems, spouse health issues. Serious challenges in married life. Business partnership conflicts. Delays in finding suitable partner.",
-                "positive_effects": [
-                    "Strong partnership skills after trials",
-                    "Deep understanding of relationships",
-                    "Success in public relations"
-                ],
-                "life_areas": "Marriage, partnerships, spouse, contracts",
-                "manifestation_period": "Most active: 24-42 years"
-            },
-            8: {
-                "name": "Karkotak Kaal Sarpa",
-                "deity": "Karkotak Naga",
-                "effects": "Sudden accidents, longevity concerns, inheritance disputes. Unexpected setbacks. Chronic ailments. Challenges with in-laws. Occult interests but with obstacles.",
-                "positive_effects": [
-                    "Strong interest and success in occult sciences",
-                    "Transformational abilities",
-                    "Research and investigation skills"
-                ],
-                "life_areas": "Longevity, accidents, inheritance, transformation",
-                "manifestation_period": "Critical periods: 21, 28, 35, 42, 56 years"
-            },
-            9: {
-                "name": "Shankhachud Kaal Sarpa",
-                "deity": "Shankhachud Naga",
-                "effects": "Father's health/relationship issues, spiritual obstacles, higher education delays. Problems with authority figures. Obstacles in religious pursuits. Foreign travel issues.",
-                "positive_effects": [
-                    "Strong philosophical and spiritual wisdom",
-                    "Success in higher education eventually",
-                    "Teaching and mentoring abilities"
-                ],
-                "life_areas": "Father, religion, higher education, long journeys",
-                "manifestation_period": "Most active: 22-48 years"
-            },
-            10: {
-                "name": "Ghatak Kaal Sarpa",
-                "deity": "Ghatak Naga (The Destroyer)",
-                "effects": "Career instability, professional setbacks, authority conflicts. Frequent job changes. Delays in career success. Problems with superiors. Public image challenges.",
-                "positive_effects": [
-                    "Exceptional career success after age 42",
-                    "Leadership abilities through struggles",
-                    "Recognition and fame eventually"
-                ],
-                "life_areas": "Career, profession, status, authority",
-                "manifestation_period": "Most active: 25-42 years, major success after 42"
-            },
-            11: {
-                "name": "Vishdhar Kaal Sarpa",
-                "deity": "Vishdhar Naga",
-                "effects": "Income fluctuations, unfulfilled desires, social network issues. Unstable income sources. Obstacles in achieving wishes. Elder sibling problems. Inconsistent gains.",
-                "positive_effects": [
-                    "Multiple income sources after maturity",
-                    "Large social network eventually",
-                    "Fulfillment of major desires after struggles"
-                ],
-                "life_areas": "Income, gains, desires, friends, elder siblings",
-                "manifestation_period": "Most active: 28-50 years"
-            },
-            12: {
-                "name": "Sheshnag Kaal Sarpa",
-                "deity": "Sheshnag (Divine Serpent)",
-                "effects": "Expenditure problems, foreign settlement issues, sleep disorders. Excessive or wasteful expenses. Difficulties in foreign lands. Spiritual confusion. Hospitalization possibilities.",
-                "positive_effects": [
-                    "Strong spiritual liberation potential",
-                    "Success in foreign lands eventually",
-                    "Charitable inclinations and moksha pursuit"
-                ],
-                "life_areas": "Losses, expenses, foreign lands, spirituality, moksha",
-                "manifestation_period": "Most active: Throughout life, spiritual peak after 48"
-            }
-        }
+        details = self.KAAL_SARPA_TYPE_DETAILS.get(rahu_house, self.KAAL_SARPA_DEFAULT_TYPE_DETAILS)
+        return copy.deepcopy(dict(details))
 
-        return type_details.get(rahu_house, {
-            "name": "Kaal Sarpa Yoga",
-            "deity": "Serpent Deities",
-            "effects": "General obstacles and transformational challenges in life",
-            "positive_effects": ["Spiritual growth through adversity"],
-            "life_areas": "Various life areas",
-            "manifestation_period": "Throughout life"
-        })
+    def _kaal_sarpa_remedy_variant(self, severity: str, yoga_type: str) -> Optional[str]:
+        """Remedy id variant: only the high tier remedies name the Kaal Sarpa type"""
+        if self.REMEDY_TIERS["Kaal Sarpa Dosha"].get(severity) != "high":
+            return None
+        return yoga_type.lower().replace(" ", "-")
 
     def _get_kaal_sarpa_remedies(self, severity: str, yoga_type: str) -> Dict[str, List[str]]:
         """Get categorized remedies for Kaal Sarpa Yoga based on severity and type"""
@@ -841,7 +962,7 @@ class DoshaDetectionService:
 
         return base_remedies
 
-    def detect_pitra_dosha(self, d1_planets: Dict[str, Any]) -> Dict[str, Any]:
+    def detect_pitra_dosha(self, d1_planets: Dict[str, Any], with_remedies: bool = True) -> Dict[str, Any]:
         """
         Enhanced Pitra Dosha Detection (Ancestral Afflictions)
 
@@ -1086,9 +1207,6 @@ class DoshaDetectionService:
             for category in effects_detail:
                 effects_detail[category] = list(set(effects_detail[category]))
 
-        # Categorized remedies
-        remedies = self._get_pitra_dosha_remedies(severity, intensity_score)
-
         return {
             "name": "Pitra Dosha",
             "present": has_pitra_dosha,
@@ -1120,7 +1238,12 @@ class DoshaDetectionService:
                 "progeny_issues": any("5th" in i["indicator"] or "Jupiter" in i["indicator"] for i in indicators),
                 "karmic_debts": any("Saturn" in i["indicator"] or "Shrapit" in i["indicator"] for i in indicators)
             } if has_pitra_dosha else {},
-            "remedies": remedies
+            # Categorized remedies
+            **self._remedies(
+                self.remedy_id("Pitra Dosha", severity),
+                with_remedies,
+                lambda: self._get_pitra_dosha_remedies(severity, intensity_score)
+            )
         }
 
     def _get_pitra_dosha_remedies(self, severity: str, intensity_score: int) -> Dict[str, List[str]]:
@@ -1234,33 +1357,44 @@ class DoshaDetectionService:
 
         return base_remedies
 
+    GANDANTA_REMEDIES = (
+        "Perform Gandanta Dosha Shanti Puja",
+        "Recite Mahamrityunjaya Mantra 108 times daily",
+        "Donate white items on Mondays if Moon is afflicted",
+        "Wear Pearl gemstone after consultation",
+        "Worship Lord Shiva and Goddess Durga",
+        "Perform Rudrabhishek on Mondays",
+        "Chant Om Namah Shivaya regularly"
+    )
+
+    # Gandanta zones (sign_num, degree_start, degree_end)
+    GANDANTA_ZONES = (
+        (11, 26.666667, 30.0),  # Last 3°20' of Pisces (11)
+        (0, 0.0, 3.333333),      # First 3°20' of Aries (0)
+        (3, 26.666667, 30.0),    # Last 3°20' of Cancer (3)
+        (4, 0.0, 3.333333),      # First 3°20' of Leo (4)
+        (7, 26.666667, 30.0),    # Last 3°20' of Scorpio (7)
+        (8, 0.0, 3.333333),      # First 3°20' of Sagittarius (8)
+    )
+
     def detect_gandanta_dosha(
         self,
         d1_planets: Dict[str, Any],
-        d1_ascendant: Dict[str, Any]
+        d1_ascendant: Dict[str, Any],
+        with_remedies: bool = True
     ) -> Dict[str, Any]:
         """
         Detect Gandanta Dosha (Junction points between water and fire signs)
         Critical junctions: Pisces-Aries, Cancer-Leo, Scorpio-Sagittarius
         Last 3°20' of water sign to first 3°20' of fire sign
         """
-        # Gandanta zones (sign_num, degree_start, degree_end)
-        gandanta_zones = [
-            (11, 26.666667, 30.0),  # Last 3°20' of Pisces (11)
-            (0, 0.0, 3.333333),      # First 3°20' of Aries (0)
-            (3, 26.666667, 30.0),    # Last 3°20' of Cancer (3)
-            (4, 0.0, 3.333333),      # First 3°20' of Leo (4)
-            (7, 26.666667, 30.0),    # Last 3°20' of Scorpio (7)
-            (8, 0.0, 3.333333),      # First 3°20' of Sagittarius (8)
-        ]
-
         afflicted_points = []
 
         # Check Ascendant
         asc_sign = d1_ascendant.get("sign_num", 0)
         asc_degree = d1_ascendant.get("degree", 0)
 
-        for zone_sign, zone_start, zone_end in gandanta_zones:
+        for zone_sign, zone_start, zone_end in self.GANDANTA_ZONES:
             if asc_sign == zone_sign and zone_start <= asc_degree <= zone_end:
                 afflicted_points.append({
                     "point": "Ascendant",
@@ -1274,7 +1408,7 @@ class DoshaDetectionService:
         moon_sign = moon_data.get("sign_num", 0)
         moon_degree = moon_data.get("degree", 0)
 
-        for zone_sign, zone_start, zone_end in gandanta_zones:
+        for zone_sign, zone_start, zone_end in self.GANDANTA_ZONES:
             if moon_sign == zone_sign and zone_start <= moon_degree <= zone_end:
                 afflicted_points.append({
                     "point": "Moon",
@@ -1287,11 +1421,12 @@ class DoshaDetectionService:
 
         # Moon in Gandanta is most critical
         moon_in_gandanta = any(p["point"] == "Moon" for p in afflicted_points)
+        severity = "high" if moon_in_gandanta else "medium" if has_gandanta else "none"
 
         return {
             "name": "Gandanta Dosha",
             "present": has_gandanta,
-            "severity": "high" if moon_in_gandanta else "medium" if has_gandanta else "none",
+            "severity": severity,
             "details": {
                 "afflicted_points": afflicted_points,
                 "moon_in_gandanta": moon_in_gandanta
@@ -1308,18 +1443,14 @@ class DoshaDetectionService:
                 "Moon in Gandanta can cause emotional turmoil." if has_gandanta
                 else "No Gandanta affliction"
             ),
-            "remedies": [
-                "Perform Gandanta Dosha Shanti Puja",
-                "Recite Mahamrityunjaya Mantra 108 times daily",
-                "Donate white items on Mondays if Moon is afflicted",
-                "Wear Pearl gemstone after consultation",
-                "Worship Lord Shiva and Goddess Durga",
-                "Perform Rudrabhishek on Mondays",
-                "Chant Om Namah Shivaya regularly"
-            ] if has_gandanta else []
+            **self._remedies(
+                self.remedy_id("Gandanta Dosha", severity),
+                with_remedies,
+                lambda: list(self.GANDANTA_REMEDIES) if has_gandanta else []
+            )
         }
 
-    def detect_grahan_dosha(self, d1_planets: Dict[str, Any]) -> Dict[str, Any]:
+    def detect_grahan_dosha(self, d1_planets: Dict[str, Any], with_remedies: bool = True) -> Dict[str, Any]:
         """
         Enhanced Grahan Dosha Detection (Eclipse Afflictions)
 
@@ -1583,8 +1714,8 @@ class DoshaDetectionService:
             for category in effects_detail:
                 effects_detail[category] = list(set(effects_detail[category]))
 
-        # Get categorized remedies
-        remedies = self._get_grahan_dosha_remedies(severity, afflictions)
+        # Remedies depend on the luminaries and nodes involved
+        bodies = self._grahan_bodies(afflictions)
 
         return {
             "name": "Grahan Dosha",
@@ -1610,17 +1741,29 @@ class DoshaDetectionService:
                 if has_grahan else "No Grahan Dosha"
             ),
             "effects": effects_detail if has_grahan else "No Grahan Dosha affliction",
-            "remedies": remedies
+            # Categorized remedies
+            **self._remedies(
+                self.remedy_id("Grahan Dosha", severity, "-".join(body.lower() for body in bodies) or "none"),
+                with_remedies,
+                lambda: self._get_grahan_dosha_remedies(severity, bodies)
+            )
         }
 
-    def _get_grahan_dosha_remedies(self, severity: str, afflictions: List[Dict[str, Any]]) -> Dict[str, List[str]]:
-        """Get categorized remedies for Grahan Dosha based on severity and affliction types"""
+    def _grahan_bodies(self, afflictions: List[Dict[str, Any]]) -> Tuple[str, ...]:
+        """GRAHAN_BODIES named in the affliction types, in GRAHAN_BODIES order"""
+        return tuple(
+            body for body in self.GRAHAN_BODIES
+            if any(body in aff["type"] for aff in afflictions)
+        )
+
+    def _get_grahan_dosha_remedies(self, severity: str, bodies: Tuple[str, ...]) -> Dict[str, List[str]]:
+        """Get categorized remedies for Grahan Dosha based on severity and the bodies involved"""
 
         # Determine which luminaries are afflicted
-        sun_afflicted = any("Sun" in aff["type"] for aff in afflictions)
-        moon_afflicted = any("Moon" in aff["type"] for aff in afflictions)
-        rahu_involved = any("Rahu" in aff["type"] for aff in afflictions)
-        ketu_involved = any("Ketu" in aff["type"] for aff in afflictions)
+        sun_afflicted = "Sun" in bodies
+        moon_afflicted = "Moon" in bodies
+        rahu_involved = "Rahu" in bodies
+        ketu_involved = "Ketu" in bodies
 
         # Base remedies for all severities
         base_remedies = {
@@ -1659,7 +1802,7 @@ class DoshaDetectionService:
             return {}
 
         if severity in ["low", "medium"]:
-            return {
+            remedies = {
                 **base_remedies,
                 "pujas": [
                     "Grahan Dosha Nivaran Puja on eclipse days",
@@ -1686,6 +1829,12 @@ class DoshaDetectionService:
                 ]
             }
 
+            # Filter out None values (remedies of bodies not involved)
+            return {
+                key: [r for r in value if r is not None]
+                for key, value in remedies.items()
+            }
+
         else:  # high or very_high
             return {
                 **base_remedies,
@@ -1748,14 +1897,20 @@ class DoshaDetectionService:
                 ]
             }
 
-        # Filter out None values
-        for key in base_remedies:
-            if isinstance(base_remedies[key], list):
-                base_remedies[key] = [r for r in base_remedies[key] if r is not None]
+    # Planets (except Rahu/Ketu) whose placement around the Moon cancels Kemdrum
+    KEMDRUM_PLANETS = ("Sun", "Mars", "Mercury", "Jupiter", "Venus", "Saturn")
 
-        return base_remedies
+    KEMDRUM_REMEDIES = (
+        "Worship Lord Shiva and fast on Mondays",
+        "Wear Pearl gemstone after consultation",
+        "Donate white items on Mondays",
+        "Recite Chandra (Moon) mantra 108 times daily",
+        "Perform Chandra Graha Shanti Puja",
+        "Keep fast on Purnima (Full Moon)",
+        "Drink water from silver vessel"
+    )
 
-    def detect_kemdrum_dosha(self, d1_planets: Dict[str, Any]) -> Dict[str, Any]:
+    def detect_kemdrum_dosha(self, d1_planets: Dict[str, Any], with_remedies: bool = True) -> Dict[str, Any]:
         """
         Detect Kemdrum Dosha (Moon isolated - no planets in 2nd and 12th from Moon)
         """
@@ -1766,13 +1921,11 @@ class DoshaDetectionService:
         house_before_moon = (moon_house - 2) % 12 + 1
         house_after_moon = (moon_house % 12) + 1
 
-        # Check if any planet (except Rahu/Ketu) in these houses
-        planets_to_check = ["Sun", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
-
         planets_before = []
         planets_after = []
 
-        for planet in planets_to_check:
+        # Check if any planet (except Rahu/Ketu) in these houses
+        for planet in self.KEMDRUM_PLANETS:
             planet_house = d1_planets.get(planet, {}).get("house", 0)
             if planet_house == house_before_moon:
                 planets_before.append(planet)
@@ -1794,11 +1947,12 @@ class DoshaDetectionService:
             cancellations.append("Venus in Kendra from Lagna")
 
         effective_kemdrum = has_kemdrum and len(cancellations) == 0
+        severity = "medium" if effective_kemdrum else "none"
 
         return {
             "name": "Kemdrum Dosha",
             "present": effective_kemdrum,
-            "severity": "medium" if effective_kemdrum else "none",
+            "severity": severity,
             "details": {
                 "moon_house": moon_house,
                 "house_before_moon": house_before_moon,
@@ -1817,15 +1971,11 @@ class DoshaDetectionService:
                 "However, cancellations can reduce severity." if effective_kemdrum
                 else "No Kemdrum affliction"
             ),
-            "remedies": [
-                "Worship Lord Shiva and fast on Mondays",
-                "Wear Pearl gemstone after consultation",
-                "Donate white items on Mondays",
-                "Recite Chandra (Moon) mantra 108 times daily",
-                "Perform Chandra Graha Shanti Puja",
-                "Keep fast on Purnima (Full Moon)",
-                "Drink water from silver vessel"
-            ] if effective_kemdrum else []
+            **self._remedies(
+                self.remedy_id("Kemdrum Dosha", severity),
+                with_remedies,
+                lambda: list(self.KEMDRUM_REMEDIES) if effective_kemdrum else []
+            )
         }
 
 
@@ -0,0 +1,75 @@
+"""
+Dosha remedy catalog.
+
+Remedies are the bulk of a dosha analysis, and they depend only on the
+dosha, its severity tier and, for a few doshas, a variant (the Kaal Sarpa
+type, the bodies in a Grahan affliction). Every detected dosha carries a
+stable remedy_id naming its remedy set:
+
+    "manglik-dosha:medium", "kaal-sarpa-dosha:high:vasuki-kaal-sarpa",
+    "grahan-dosha:low:moon-ketu", "kemdrum-dosha:any"
+
+so the analysis can be returned and stored without the remedy text
+(DoshaDetectionService.detect_all_doshas with mode="reference" or
+"summary"), and the remedies resolved on demand from this catalog
+(GET /doshas/remedies, versioned by a content hash, or one id at a time).
+
+The catalog is built from DoshaDetectionService.remedy_sets(), the same
+code that builds inline remedies (mode="full"), so both always agree.
+
+Usage:
+    from app.services.dosha_remedies import get_dosha_remedy_catalog
+
+    catalog = get_dosha_remedy_catalog()
+    remedies = catalog.get(dosha["remedy_id"])["remedies"]
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from app.services.dosha_detection_service import dosha_detection_service
+
+
+class DoshaRemedyCatalog:
+    """Dosha remedy sets by remedy id"""
+
+    def __init__(self, entries: Iterable[Tuple[str, Mapping[str, Any]]]):
+        """
+        Initialize the catalog.
+
+        Args:
+            entries: (remedy id, entry) pairs; an entry holds dosha, tier,
+                variant and remedies (JSON values)
+        """
+        self.entries = MappingProxyType({
+            key: MappingProxyType(dict(entry)) for key, entry in sorted(entries)
+        })
+        canonical = json.dumps(self._remedies(), sort_keys=True, ensure_ascii=False)
+        self.version = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Entry of a remedy id (a fresh JSON-ready copy), or None"""
+        entry = self.entries.get(key)
+        return json.loads(json.dumps(dict(entry))) if entry is not None else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready catalog: version and remedy id -> entry"""
+        return {"version": self.version, "remedies": self._remedies()}
+
+    def _remedies(self) -> Dict[str, Dict[str, Any]]:
+        return {key: dict(entry) for key, entry in self.entries.items()}
+
+
+@lru_cache(maxsize=1)
+def get_dosha_remedy_catalog() -> DoshaRemedyCatalog:
+    """Catalog of every remedy set of the dosha detectors, built once per process"""
+    return DoshaRemedyCatalog(dosha_detection_service.remedy_sets())
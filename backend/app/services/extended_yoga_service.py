@@ -3,8 +3,42 @@ Extended Yoga Detection Service
 Detects 25+ classical Vedic yogas beyond the basic set
 """
 
-from typing import Dict, List, Any, Optional
+import json
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Any, Mapping, Optional, Tuple
+from app.core.chart_core import SEVEN_PLANETS, SIGN_LORDS
+from app.services import bitboards
+from app.services.chart_facts import ChartFacts, aspect_distances
 from app.services.jaimini_service import JaiminiService
+from app.services.yoga_cache import freeze_yogas, placement_signature, thaw_yogas, yoga_result_cache
+from app.services.yoga_incremental import ChartChanges, DetectorRun, TracedPlanets, YogaEvaluation
+from app.services.yoga_normalization import deduplicate_yogas
+from app.services.yoga_rules import BACKEND_DIR, get_yoga_rule_set
+
+BHAVA_YOGA_EFFECTS_PATH = BACKEND_DIR / "data" / "bhava_yoga_effects.json"
+
+
+def _load_bhava_yoga_effects(path: Path = BHAVA_YOGA_EFFECTS_PATH) -> Tuple[Tuple[Optional[Mapping[str, Any]], ...], ...]:
+    """
+    Load the Bhava yoga effects as a 13 x 13 table: [lord_house][placement].
+
+    Row and column 0 are unused (None). Entries are read-only mappings and
+    their life_areas are tuples, so the table can be shared by every call.
+    """
+    with open(path, encoding="utf-8") as f:
+        effects = json.load(f)["effects"]
+
+    def freeze(entry: Optional[Dict[str, Any]]) -> Optional[Mapping[str, Any]]:
+        if entry is None:
+            return None
+        return MappingProxyType({**entry, "life_areas": tuple(entry.get("life_areas", ()))})
+
+    return tuple(
+        tuple(freeze(effects.get(str(lord_house), {}).get(str(placement))) if lord_house and placement else None
+              for placement in range(13))
+        for lord_house in range(13)
+    )
 
 
 class ExtendedYogaService:
@@ -68,10 +102,202 @@ class ExtendedYogaService:
         "Saturn": 11,   # Aquarius 0-20°
     }
 
+    # Detector families of detect_extended_yogas, in detection order. "categories"
+    # are the filter names accepted by categories=; "max_importance" is the
+    # highest importance the family's yogas are classified as (families below
+    # a min_importance= filter are skipped). "live" families depend on exact
+    # degrees and are recomputed on every call (see app.services.yoga_cache).
+    YOGA_FAMILIES = {
+        # 1-5: Pancha Mahapurusha Yogas (5 Great Person yogas)
+        "pancha_mahapurusha": {"categories": ("mahapurusha",), "max_importance": "major",
+                               "detectors": ("_detect_pancha_mahapurusha",)},
+        # 6-12: Adhi, Chamara, Lakshmi & Saraswati, Amala, Parvata, Kahala
+        "named_classical": {"categories": ("named", "wealth", "moon"), "max_importance": "major",
+                            "detectors": ("_detect_adhi_yoga", "_detect_chamara_yoga", "_detect_lakshmi_saraswati_yoga",
+                                          "_detect_amala_yoga", "_detect_parvata_yoga", "_detect_kahala_yoga")},
+        # 13-14: Chandra-Mangala & Guru-Mangala Yogas
+        "conjunction": {"categories": ("conjunction", "wealth"), "max_importance": "major",
+                        "detectors": ("_detect_chandra_mangala_yoga", "_detect_guru_mangala_yoga")},
+        # 15-16: Viparita Raj, additional house lord yogas (Vaapi Dharma Lords, Lakshmi Classical, Parijata), Neecha Bhanga
+        "viparita_neecha_bhanga": {"categories": ("raj", "wealth"), "max_importance": "major",
+                                   "detectors": ("_detect_viparita_raj_yoga", "_detect_additional_house_lord_yogas",
+                                                 "_detect_neecha_bhanga")},
+        # 17-19: Vesi, Vosi, Ubhayachari (planets around the Sun)
+        "sun": {"categories": ("sun",), "max_importance": "major",
+                "detectors": ("_detect_vesi_yoga", "_detect_vosi_yoga", "_detect_ubhayachari_yoga")},
+        # 20-23a: Sunapha, Anapha, Durudhura, Kemadruma, Dhana from Moon (Ch.37.7-12)
+        "moon": {"categories": ("moon", "wealth", "challenge"), "max_importance": "major",
+                 "detectors": ("_detect_sunapha_yoga", "_detect_anapha_yoga", "_detect_durudhura_yoga",
+                               "_detect_kemadruma_yoga", "_detect_dhana_from_moon_yoga")},
+        # 24-25: Budhaditya, Ganesha, Nipuna
+        "intelligence": {"categories": ("conjunction", "learning"), "max_importance": "major",
+                         "detectors": ("_detect_budhaditya_yoga", "_detect_ganesha_yoga", "_detect_nipuna_yoga")},
+        # 26: Kala Sarpa Yoga (12 types based on Rahu position)
+        "kala_sarpa": {"categories": ("challenge",), "max_importance": "major",
+                       "detectors": ("_detect_kala_sarpa_yoga",)},
+        # 27-55: Nabhasa Ashraya, Dala, Akriti and Sankhya Yogas
+        "nabhasa": {"categories": ("nabhasa",), "max_importance": "major",
+                    "detectors": ("_detect_nabhasa_ashraya_yogas", "_detect_nabhasa_dala_yogas",
+                                  "_detect_nabhasa_akriti_yogas", "_detect_nabhasa_sankhya_yogas")},
+        # 56-60: Rare Yogas (Shakata, Shrinatha, Kusuma, Matsya, Kurma)
+        "rare": {"categories": ("rare", "wealth"), "max_importance": "major",
+                 "detectors": ("_detect_rare_yogas",)},
+        # 42-43f: Gajakesari, Raj Yogas (Kendra-Trikona, systematic house lord combinations) and Raj supports
+        "raj": {"categories": ("raj",), "max_importance": "major",
+                "detectors": ("_detect_gajakesari_yoga", "_detect_raj_yoga_kendra_trikona", "_detect_systematic_raj_yogas",
+                              "_detect_benefic_support_yogas", "_detect_valor_yogas", "_detect_exalted_benefic_2nd_yogas",
+                              "_detect_viparita_like_support_yogas", "_detect_karma_raj_yoga",
+                              "_detect_all_benefic_kendras_yoga", "_detect_moon_venus_mutual_yoga")},
+        # 44: Grahan Yoga
+        "grahan": {"categories": ("challenge",), "max_importance": "major",
+                   "detectors": ("_detect_grahan_yoga",)},
+        # 45: Dharma-Karmadhipati Yoga
+        "dharma_karmadhipati": {"categories": ("raj",), "max_importance": "major",
+                                "detectors": ("_detect_dharma_karmadhipati_yoga",)},
+        # 46-46b: Dhana, Lakshmi (5L-9L) and Ascendant-specific wealth yogas
+        "wealth": {"categories": ("wealth",), "max_importance": "major",
+                   "detectors": ("_detect_dhana_yoga", "_detect_lakshmi_wealth_yogas", "_detect_ascendant_wealth_yogas")},
+        # 47-49: Chandal, Kubera, Daridra
+        "chandal_kubera_daridra": {"categories": ("challenge", "wealth", "penury"), "max_importance": "major",
+                                   "detectors": ("_detect_chandal_yoga", "_detect_kubera_yoga", "_detect_daridra_yoga")},
+        # 49a: Penury Yogas (BPHS Ch.42), including the complex ones (Ch.42 continued)
+        "penury": {"categories": ("penury", "challenge"), "max_importance": "major",
+                   "detectors": ("_detect_penury_yogas", "_detect_moon_navamsa_maraka_yoga",
+                                 "_detect_rasi_navamsa_lagna_maraka_yoga", "_detect_benefic_malefic_misplacement_yoga")},
+        # 49b: Royal Association Yogas (Jaimini - BPHS Ch.40)
+        "royal_association": {"categories": ("jaimini", "raj"), "max_importance": "moderate",
+                              "detectors": ("_detect_royal_association_yogas",)},
+        # Jaimini Karakamsa Yogas (10) + AK Penury Yogas (2)
+        "jaimini": {"categories": ("jaimini", "penury"), "max_importance": "moderate",
+                    "detectors": ("_detect_jaimini_karakamsa_yogas", "_detect_ak_penury_yogas")},
+        # 49c-49e: BPHS classical Sun-based yogas, Vaapī Nabhasa, Kālanidhi
+        "bphs_classical": {"categories": ("sun", "nabhasa", "wealth"), "max_importance": "major",
+                           "detectors": ("_detect_sun_based_yogas", "_detect_vaapi_nabhasa_yoga", "_detect_kalanidhi_yoga")},
+        # 50-51: Balarishta, Kroora
+        "affliction": {"categories": ("challenge",), "max_importance": "major",
+                       "detectors": ("_detect_balarishta_yoga", "_detect_kroora_yoga")},
+        # 61-87: Nitya Yogas (Birth Yogas based on Sun-Moon distance)
+        "nitya": {"categories": ("nitya",), "max_importance": "moderate", "live": True,
+                  "detectors": ("_detect_nitya_yogas",)},
+        # 88-94: Sanyas Yogas (7 classical renunciation yogas)
+        "sanyas": {"categories": ("sanyas",), "max_importance": "major",
+                   "detectors": ("_detect_sanyas_yogas",)},
+        # 95-238: Bhava Yogas (144 house lord placements: all 12 lords × 12 positions)
+        "bhava": {"categories": ("bhava",), "max_importance": "moderate",
+                  "detectors": ("_detect_bhava_yogas",)},
+        # Named Yogas (Ch.36) and their BPHS variations
+        "named": {"categories": ("named",), "max_importance": "major",
+                  "detectors": ("_detect_shankha_yoga", "_detect_bheri_yoga", "_detect_mridanga_yoga",
+                                "_detect_sharada_yoga", "_detect_khadga_yoga", "_detect_trimurti_yoga",
+                                "_detect_lagna_adhi_yoga", "_detect_kalpadruma_yoga", "_detect_trimurti_variations_bphs",
+                                "_detect_srinatha_enhanced_yoga", "_detect_matsya_kurma_combined_yoga")},
+        # Subtle Raj Yogas (birth_moment_yoga needs birth data and is not run)
+        "subtle_raj": {"categories": ("raj",), "max_importance": "major",
+                       "detectors": ("_detect_strong_vargottama_moon", "_detect_exalted_aspects_on_lagna",
+                                     "_detect_benefic_in_single_kendra")},
+        # Specialized Timing Yogas (8 yogas)
+        "timing": {"categories": ("timing",), "max_importance": "minor",
+                   "detectors": ("_detect_timing_yogas",)},
+        # Divisional Amplifiers (Ch.41.18-25) - only detected when D9 fields are present
+        "divisional": {"categories": ("divisional",), "max_importance": "major",
+                       "detectors": ("_detect_parijata_yoga", "_detect_uttama_yoga", "_detect_gopura_yoga",
+                                     "_detect_simhasana_yoga", "_detect_parvata_divisional_yoga",
+                                     "_detect_devaloka_yoga", "_detect_brahmaloka_yoga", "_detect_iravatamsa_yoga")},
+    }
+
+    IMPORTANCE_RANK = {"minor": 0, "moderate": 1, "major": 2}
+
+    # Bhava yoga effects, [lord_house][placement] (see _get_bhava_yoga_effects)
+    BHAVA_YOGA_EFFECTS = _load_bhava_yoga_effects()
+
+    # Fallback strength of a house lord by the house it occupies (index 0 unused)
+    BHAVA_PLACEMENT_STRENGTH = (
+        None, "Very Strong", "Medium", "Medium", "Strong", "Strong", "Medium",
+        "Strong", "Weak", "Strong", "Strong", "Medium", "Weak"
+    )
+
+    # House patterns of the Nabhasa Akriti yogas as bitboards ("1-4" = houses 1 to 4, "1+7" = houses 1 and 7)
+    NABHASA_HOUSE_MASKS = {
+        "1-4": bitboards.arc(1, 4), "4-7": bitboards.arc(4, 4), "5-8": bitboards.arc(5, 4),
+        "7-10": bitboards.arc(7, 4), "10-1": bitboards.arc(10, 4),
+        "1-7": bitboards.arc(1, 7), "4-10": bitboards.arc(4, 7), "7-12": bitboards.arc(7, 6),
+        "10-4": bitboards.arc(10, 7),
+        "1+4": bitboards.mask((1, 4)), "1+7": bitboards.mask((1, 7)), "1+10": bitboards.mask((1, 10)),
+        "4+10": bitboards.mask((4, 10)), "4+7": bitboards.mask((4, 7)), "7+10": bitboards.mask((7, 10)),
+        "10+1": bitboards.mask((10, 1)),
+        "2+6+10": bitboards.mask((2, 6, 10)), "3+7+11": bitboards.mask((3, 7, 11)),
+        "4+8+12": bitboards.mask((4, 8, 12)),
+        "kendra+trikona": bitboards.KENDRA | bitboards.TRIKONA,
+    }
+
+    # House groups
+    KENDRA_HOUSES = (1, 4, 7, 10)
+    TRIKONA_HOUSES = (1, 5, 9)
+    KENDRA_TRIKONA_HOUSES = (1, 4, 5, 7, 9, 10)
+    UPACHAYA_HOUSES = (3, 6, 10, 11)
+    DUSTHANA_HOUSES = (6, 8, 12)
+
+    # Sign qualities
+    MOVABLE_SIGNS = (1, 4, 7, 10)  # Aries, Cancer, Libra, Capricorn
+    FIXED_SIGNS = (2, 5, 8, 11)    # Taurus, Leo, Scorpio, Aquarius
+    DUAL_SIGNS = (3, 6, 9, 12)     # Gemini, Virgo, Sagittarius, Pisces
+
+    # Planet groups (in the order yogas list them; SEVEN_PLANETS is in app.core.chart_core)
+    NATURAL_BENEFICS = ("Jupiter", "Venus", "Mercury")
+    NATURAL_BENEFICS_WITH_MOON = ("Jupiter", "Venus", "Mercury", "Moon")
+    NATURAL_MALEFICS = ("Mars", "Saturn", "Rahu", "Ketu")
+    KROORA_GRAHAS = ("Sun", "Mars", "Saturn")
+
     def __init__(self):
         """Initialize Extended Yoga Service with Jaimini integration"""
         self.jaimini = JaiminiService()
 
+    def build_chart_facts(self, planets: Dict, karakas: Optional[Dict[str, str]] = None) -> ChartFacts:
+        """
+        Derive the facts shared by all detectors once per chart
+
+        Args:
+            planets: Dictionary of planetary positions
+            karakas: Jaimini karakas when already calculated
+
+        Returns:
+            ChartFacts (a dict of the planet positions with precomputed
+            ascendant, house lords, occupants and aspects; dignities,
+            benefics/malefics and Jaimini karakas on first access).
+            An existing ChartFacts is returned as is.
+        """
+        if isinstance(planets, ChartFacts):
+            return planets
+
+        return ChartFacts(
+            planets,
+            ascendant_index=self._calculate_ascendant_sign(planets),
+            ascendant_sign_num=self._get_ascendant_sign(planets),
+            dignity_of=lambda name: self._get_planet_dignity(name, planets),
+            is_benefic=lambda name: self._is_benefic(name, planets),
+            is_malefic=lambda name: self._is_malefic(name, planets),
+            karakas=(lambda: karakas) if karakas is not None else lambda: self.jaimini.calculate_charakarakas(planets)
+        )
+
+    def _rule_yogas(self, group: str, planets: Dict) -> List[Dict]:
+        """
+        Yogas of one group of declarative rules (see app.services.yoga_rules)
+
+        All rules are evaluated together on the first call for a chart;
+        later groups read the stored matches.
+        """
+        facts = self.build_chart_facts(planets)
+        matches = facts.memo.get("yoga_rules")
+        if matches is None:
+            matches = facts.memo["yoga_rules"] = get_yoga_rule_set().evaluate(facts)
+        return [dict(yoga) for yoga in matches.get(group, [])]
+
+    def _get_karakas(self, planets: Dict) -> Dict[str, str]:
+        """Jaimini karakas, computed once per chart when planets is a ChartFacts"""
+        if isinstance(planets, ChartFacts):
+            return planets.karakas
+        return self.jaimini.calculate_charakarakas(planets)
+
     def _wrap_1_to_12(self, n: int) -> int:
         """
         Wrap number to 1-12 range (BPHS-compliant house distance calculation)
@@ -125,6 +351,9 @@ class ExtendedYogaService:
         5. Neutral: Neither benefic nor malefic placement
         6. Debilitation: Planet at weakest strength
         """
+        if isinstance(planets, ChartFacts) and planet_name in planets.dignity:
+            return planets.dignity[planet_name]
+
         planet_data = planets.get(planet_name, {})
         sign_num = planet_data.get("sign_num", 0)
         degrees = planet_data.get("degree", 0)
@@ -191,18 +420,15 @@ class ExtendedYogaService:
         if not planet_house:
             return False
 
-        # Natural malefics
-        natural_malefics = ["Mars", "Saturn", "Rahu", "Ketu"]
-
         # Check for conjunction with malefics
-        for malefic in natural_malefics:
+        for malefic in self.NATURAL_MALEFICS:
             if malefic in planets:
                 malefic_house = planets[malefic].get("house", 0)
                 if malefic_house == planet_house:
                     return True  # Tainted by conjunction
 
         # Check for aspects from malefics
-        for malefic in natural_malefics:
+        for malefic in self.NATURAL_MALEFICS:
             if malefic in planets:
                 malefic_house = planets[malefic].get("house", 0)
                 if malefic_house and self._planet_aspects_house_simple(malefic, malefic_house, planet_house):
@@ -215,28 +441,8 @@ class ExtendedYogaService:
         Simple aspect check (for tainting detection)
         Same logic as in _check_mutual_aspect but as standalone method
         """
-        distance = self._wrap_1_to_12(to_house - from_house + 1)
-
-        if distance == 1:
-            return False
-
-        # All planets aspect 7th house
-        if distance == 7:
-            return True
-
-        # Mars special aspects: 4th, 8th
-        if planet == "Mars" and distance in [4, 8]:
-            return True
-
-        # Jupiter special aspects: 5th, 9th
-        if planet == "Jupiter" and distance in [5, 9]:
-            return True
-
-        # Saturn special aspects: 3rd, 10th
-        if planet == "Saturn" and distance in [3, 10]:
-            return True
-
-        return False
+        # All planets aspect the 7th; Mars also 4th/8th, Jupiter 5th/9th, Saturn 3rd/10th
+        return self._wrap_1_to_12(to_house - from_house + 1) in aspect_distances(planet)
 
     def _is_benefic(self, planet: str, planets: Dict, options: Dict = None) -> bool:
         """
@@ -257,6 +463,9 @@ class ExtendedYogaService:
         Returns:
             bool: True if planet is benefic in this context
         """
+        if options is None and isinstance(planets, ChartFacts):
+            return planet in planets.benefics
+
         # Natural benefics (always benefic)
         if planet in ["Jupiter", "Venus"]:
             return True
@@ -306,6 +515,9 @@ class ExtendedYogaService:
         Returns:
             bool: True if planet is malefic in this context
         """
+        if options is None and isinstance(planets, ChartFacts):
+            return planet in planets.malefics
+
         # Natural malefics (always malefic)
         if planet in ["Sun", "Mars", "Saturn", "Rahu", "Ketu"]:
             return True
@@ -489,7 +701,13 @@ class ExtendedYogaService:
 
         return (is_cancelled, reasons)
 
-    def detect_extended_yogas(self, planets: Dict[str, Any], houses: Any = None) -> List[Dict[str, str]]:
+    def detect_extended_yogas(
+        self,
+        planets: Dict[str, Any],
+        houses: Any = None,
+        categories: Optional[Iterable[str]] = None,
+        min_importance: Optional[str] = None
+    ) -> List[Dict[str, str]]:
         """
         Detect 100+ comprehensive classical Vedic yogas (BPHS-compliant):
 
@@ -519,243 +737,237 @@ class ExtendedYogaService:
         **Eclipse Yogas (4)**: Grahan (Sun-Rahu, Sun-Ketu, Moon-Rahu, Moon-Ketu)
         **Other Classical (10)**: Gajakesari, Chamara, Nipuna, Chandal, Balarishta, Kroora, Rare (5)
 
+        Results are memoized by placement signature (app.services.yoga_cache):
+        charts that differ only in degrees the detectors do not look at share
+        one detection run. Each call returns fresh copies.
+
         Args:
             planets: Dictionary of planetary positions with sign_num and house
             houses: Houses data (optional, for advanced yogas)
+            categories: Only run detector families with one of these categories
+                (e.g. ["wealth", "raj", "nabhasa"], see YOGA_FAMILIES)
+            min_importance: Only return yogas at least this important
+                ("major", "moderate" or "minor"); families that cannot
+                reach it (e.g. the 144 Bhava yogas for "major") are skipped
 
         Returns:
             List of detected yogas with name, description, strength, and category
-        """
-        yogas = []
-
-        # 1-5: Pancha Mahapurusha Yogas (5 Great Person yogas)
-        yogas.extend(self._detect_pancha_mahapurusha(planets))
-
-        # 6: Adhi Yoga
-        yogas.extend(self._detect_adhi_yoga(planets))
-
-        # 7: Chamara Yoga
-        yogas.extend(self._detect_chamara_yoga(planets))
-
-        # 8-9: Lakshmi Yoga & Saraswati Yoga
-        yogas.extend(self._detect_lakshmi_saraswati_yoga(planets))
-
-        # 10: Amala Yoga
-        yogas.extend(self._detect_amala_yoga(planets))
-
-        # 11: Parvata Yoga
-        yogas.extend(self._detect_parvata_yoga(planets))
-
-        # 12: Kahala Yoga
-        yogas.extend(self._detect_kahala_yoga(planets))
-
-        # 13: Chandra-Mangala Yoga
-        yogas.extend(self._detect_chandra_mangala_yoga(planets))
-
-        # 14: Guru-Mangala Yoga
-        yogas.extend(self._detect_guru_mangala_yoga(planets))
-
-        # 15: Viparita Raj Yoga
-        yogas.extend(self._detect_viparita_raj_yoga(planets))
-
-        # 15a: Additional House Lord Yogas (Vaapi Dharma Lords, Lakshmi Classical, Parijata)
-        yogas.extend(self._detect_additional_house_lord_yogas(planets))
 
-        # 16: Neecha Bhanga Raj Yoga
-        yogas.extend(self._detect_neecha_bhanga(planets))
-
-        # 17: Vesi Yoga
-        yogas.extend(self._detect_vesi_yoga(planets))
-
-        # 18: Vosi Yoga
-        yogas.extend(self._detect_vosi_yoga(planets))
-
-        # 19: Ubhayachari Yoga
-        yogas.extend(self._detect_ubhayachari_yoga(planets))
-
-        # 20: Sunapha Yoga
-        yogas.extend(self._detect_sunapha_yoga(planets))
-
-        # 21: Anapha Yoga
-        yogas.extend(self._detect_anapha_yoga(planets))
-
-        # 22: Durudhura Yoga
-        yogas.extend(self._detect_durudhura_yoga(planets))
-
-        # 23: Kemadruma Yoga (inauspicious)
-        yogas.extend(self._detect_kemadruma_yoga(planets))
-
-        # 23a: Dhana from Moon Yoga (Ch.37.7-12)
-        yogas.extend(self._detect_dhana_from_moon_yoga(planets))
-
-        # 24: Budhaditya Yoga (already exists but enhanced)
-        yogas.extend(self._detect_budhaditya_yoga(planets))
-
-        # 24a: Ganesha Yoga (Jupiter-Ketu or Venus-Ketu conjunction - positive spiritual intelligence)
-        yogas.extend(self._detect_ganesha_yoga(planets))
-
-        # 25: Nipuna Yoga
-        yogas.extend(self._detect_nipuna_yoga(planets))
-
-        # 26: Kala Sarpa Yoga (12 types based on Rahu position)
-        yogas.extend(self._detect_kala_sarpa_yoga(planets))
-
-        # 27-30: Nabhasa Ashraya Yogas (4 types - based on sign types)
-        yogas.extend(self._detect_nabhasa_ashraya_yogas(planets))
-
-        # 31-32: Nabhasa Dala Yogas (2 types - based on benefic/malefic)
-        yogas.extend(self._detect_nabhasa_dala_yogas(planets))
-
-        # 33-52: Nabhasa Akriti Yogas (complete 20 pattern yogas)
-        yogas.extend(self._detect_nabhasa_akriti_yogas(planets))
-
-        # 53-55: Nabhasa Sankhya Yogas (numerical patterns)
-        yogas.extend(self._detect_nabhasa_sankhya_yogas(planets))
-
-        # 56-60: Rare Yogas (Shakata, Shrinatha, Kusuma, Matsya, Kurma)
-        yogas.extend(self._detect_rare_yogas(planets))
-
-        # NEW YOGAS - Phase 1: Critical
-        # 42: Gajakesari Yoga
-        yogas.extend(self._detect_gajakesari_yoga(planets))
-
-        # 43: Raj Yoga (Kendra-Trikona - simplified)
-        yogas.extend(self._detect_raj_yoga_kendra_trikona(planets))
-
-        # 43a: Systematic Raj Yogas (BPHS-compliant house lord combinations)
-        yogas.extend(self._detect_systematic_raj_yogas(planets))
-
-        # 43b: Benefic Support Yogas (Phase 1.3)
-        yogas.extend(self._detect_benefic_support_yogas(planets))
-
-        # 43c: Valor Yogas (Phase 1.4)
-        yogas.extend(self._detect_valor_yogas(planets))
-
-        # 43d: Exalted Benefic in 2nd (Phase 1.5)
-        yogas.extend(self._detect_exalted_benefic_2nd_yogas(planets))
-
-        # 43e: Viparita-like Support (Phase 1.6)
-        yogas.extend(self._detect_viparita_like_support_yogas(planets))
-
-        # 43f: Miscellaneous Raj Supports (Phase 1.7)
-        yogas.extend(self._detect_karma_raj_yoga(planets))
-        yogas.extend(self._detect_all_benefic_kendras_yoga(planets))
-        yogas.extend(self._detect_moon_venus_mutual_yoga(planets))
-
-        # 44: Grahan Yoga
-        yogas.extend(self._detect_grahan_yoga(planets))
-
-        # NEW YOGAS - Phase 2: High Priority
-        # 45: Dharma-Karmadhipati Yoga (simplified)
-        yogas.extend(self._detect_dharma_karmadhipati_yoga(planets))
+        Raises:
+            ValueError: On unknown categories or importance
+        """
+        categories = None if categories is None else list(categories)
+        families = self._select_yoga_families(categories, min_importance)
+        threshold = self.IMPORTANCE_RANK[min_importance] if min_importance else 0
 
-        # 46: Dhana Yoga (simplified)
-        yogas.extend(self._detect_dhana_yoga(planets))
+        try:
+            karakas = self.jaimini.calculate_charakarakas(planets)
+            wanted = None if categories is None else frozenset(category.lower() for category in categories)
+            key = (placement_signature(planets, karakas), wanted, min_importance)
+        except (AttributeError, TypeError, ValueError):
+            # No placement signature (unexpected field types): detect without the cache
+            return list(self.iter_extended_yogas(planets, houses, categories, min_importance))
+
+        # Per family: (None, cached yogas), or (live family, canonical names seen before it)
+        found, segments = yoga_result_cache.lookup(key)
+        if not found:
+            facts = self.build_chart_facts(planets, karakas)
+            seen = set()
+            segments = []
+            for family in families:
+                before = frozenset(seen)
+                yogas = self._run_yoga_family(family, facts, seen)
+                segments.append((family, before) if family.get("live") else (None, freeze_yogas(yogas)))
+            yoga_result_cache.store(key, tuple(segments))
 
-        # 46a: Lakshmi Wealth Yogas (5L-9L relationships)
-        yogas.extend(self._detect_lakshmi_wealth_yogas(planets))
+        yogas = []
+        for family, value in segments:
+            if family is None:
+                yogas.extend(thaw_yogas(value))
+            else:
+                yogas.extend(self._run_yoga_family(family, planets, set(value)))
+        return [yoga for yoga in yogas if self.IMPORTANCE_RANK.get(yoga["importance"], 0) >= threshold]
 
-        # 46b: Ascendant-Specific Wealth Yogas
-        yogas.extend(self._detect_ascendant_wealth_yogas(planets))
+    def iter_extended_yogas(
+        self,
+        planets: Dict[str, Any],
+        houses: Any = None,
+        categories: Optional[Iterable[str]] = None,
+        min_importance: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield yogas as they are found, one detector family at a time
 
-        # 47: Chandal Yoga
-        yogas.extend(self._detect_chandal_yoga(planets))
+        Yields the same deduplicated, enriched yogas in the same order as
+        detect_extended_yogas, so callers looking for one yoga (or the first
+        few) can stop early without running the remaining families.
 
-        # 48: Kubera Yoga
-        yogas.extend(self._detect_kubera_yoga(planets))
+        Args:
+            planets: Dictionary of planetary positions with sign_num and house
+            houses: Houses data (optional, for advanced yogas)
+            categories: Only run families with one of these categories (see YOGA_FAMILIES)
+            min_importance: Only yield yogas at least this important ("major", "moderate", "minor")
 
-        # 49: Daridra Yoga
-        yogas.extend(self._detect_daridra_yoga(planets))
+        Raises:
+            ValueError: On unknown categories or importance
+        """
+        families = self._select_yoga_families(categories, min_importance)
+        threshold = self.IMPORTANCE_RANK[min_importance] if min_importance else 0
 
-        # 49a: Comprehensive Penury Yogas (BPHS Ch.42)
-        yogas.extend(self._detect_penury_yogas(planets))
+        # Ascendant, lords, occupants, aspects, dignities and karakas, derived once for all detectors
+        facts = self.build_chart_facts(planets)
 
-        # ===== PHASE 4.2: Complex Penury Yogas (Ch.42 continued) - 3 yogas =====
-        # Note: AK-related penury yogas (Ch.42.14-15) will be in Jaimini phase
-        yogas.extend(self._detect_moon_navamsa_maraka_yoga(planets))
-        yogas.extend(self._detect_rasi_navamsa_lagna_maraka_yoga(planets))
-        yogas.extend(self._detect_benefic_malefic_misplacement_yoga(planets))
+        # Canonical names already yielded (duplicates across families keep the first)
+        seen = set()
+        for family in families:
+            for yoga in self._run_yoga_family(family, facts, seen):
+                if self.IMPORTANCE_RANK.get(yoga["importance"], 0) >= threshold:
+                    yield yoga
 
-        # 49b: Royal Association Yogas (Jaimini - BPHS Ch.40)
-        yogas.extend(self._detect_royal_association_yogas(planets))
+    def _run_yoga_family(self, family: Dict, planets: Dict, seen: set) -> List[Dict[str, Any]]:
+        """Deduplicated, enriched yogas of one detector family (seen: canonical names kept so far, updated)"""
+        yogas = []
+        for detector in family["detectors"]:
+            yogas.extend(getattr(self, detector)(planets))
+        return self._finish_yoga_family(yogas, seen)
+
+    def _finish_yoga_family(self, yogas: List[Dict], seen: set) -> List[Dict[str, Any]]:
+        """Deduplicate the detected yogas of one family (seen: updated) and enrich them"""
+        # Enrich with classification metadata (importance, impact, life_area)
+        return [self._enrich_yoga_with_metadata(yoga) for yoga in deduplicate_yogas(yogas, seen)]
+
+    def _select_yoga_families(self, categories: Optional[Iterable[str]], min_importance: Optional[str]) -> List[Dict]:
+        """Detector families to run for the category and importance filters"""
+        if min_importance is not None and min_importance not in self.IMPORTANCE_RANK:
+            raise ValueError(f"Unknown yoga importance: {min_importance} (expected one of {', '.join(self.IMPORTANCE_RANK)})")
+
+        families = list(self.YOGA_FAMILIES.values())
+        if categories is not None:
+            wanted = {category.lower() for category in categories}
+            unknown = wanted - {category for family in families for category in family["categories"]}
+            if unknown:
+                raise ValueError(f"Unknown yoga categories: {', '.join(sorted(unknown))}")
+            families = [family for family in families if wanted.intersection(family["categories"])]
+
+        if min_importance is not None:
+            threshold = self.IMPORTANCE_RANK[min_importance]
+            families = [family for family in families if self.IMPORTANCE_RANK[family["max_importance"]] >= threshold]
+
+        return families
+
+    def find_extended_yoga(self, planets: Dict[str, Any], name: str) -> Optional[Dict[str, Any]]:
+        """First detected yoga with this name, or None (stops at the family that finds it)"""
+        return next((yoga for yoga in self.iter_extended_yogas(planets) if yoga["name"] == name), None)
+
+    def evaluate_yogas(
+        self,
+        planets: Dict[str, Any],
+        categories: Optional[Iterable[str]] = None,
+        min_importance: Optional[str] = None
+    ) -> YogaEvaluation:
+        """
+        Detect yogas and record which chart facts each detector read
 
-        # ===== BATCH 2 & 3: Jaimini Karakamsa Yogas (10) + AK Penury Yogas (2) =====
-        yogas.extend(self._detect_jaimini_karakamsa_yogas(planets))
-        yogas.extend(self._detect_ak_penury_yogas(planets))
+        The result gives the same yogas as iter_extended_yogas and is the
+        base for reevaluate_yogas on nearby variants of the chart (see
+        app.services.yoga_incremental).
 
-        # PHASE 4 ENHANCEMENTS: BPHS-Compliant Classical Yogas
-        # 49c: Sun-based yogas (Vesi, Vasi, Ubhayachari) - BPHS Classical
-        yogas.extend(self._detect_sun_based_yogas(planets))
+        Args:
+            planets: Dictionary of planetary positions with sign_num and house
+            categories: Only run families with one of these categories (see YOGA_FAMILIES)
+            min_importance: Only keep yogas at least this important ("major", "moderate", "minor")
 
-        # 49d: Vaapī Nabhasa Yoga (Panaphara/Apoklima pattern) - BPHS Classical
-        yogas.extend(self._detect_vaapi_nabhasa_yoga(planets, options={}))
+        Raises:
+            ValueError: On unknown categories or importance
+        """
+        categories = None if categories is None else list(categories)
+        return self._evaluate_incrementally(planets, categories, min_importance, None, ChartChanges(()))
 
-        # 49e: Kālanidhi Wealth Yoga - BPHS Classical
-        yogas.extend(self._detect_kalanidhi_yoga(planets, options={}))
+    def reevaluate_yogas(
+        self,
+        previous: YogaEvaluation,
+        planets: Dict[str, Any],
+        changed: Optional[Iterable[str]] = None
+    ) -> YogaEvaluation:
+        """
+        Yogas of a variant of an evaluated chart, re-running only affected detectors
 
-        # NEW YOGAS - Phase 3: Medium Priority
-        # 50: Balarishta Yoga
-        yogas.extend(self._detect_balarishta_yoga(planets))
+        Detectors whose recorded facts did not change keep their previous
+        yogas; families none of whose detectors ran again keep their
+        deduplicated, enriched yogas too.
 
-        # 51: Kroora Yoga
-        yogas.extend(self._detect_kroora_yoga(planets))
+        Args:
+            previous: Evaluation of the earlier chart (evaluate_yogas or reevaluate_yogas)
+            planets: Planetary positions of the variant
+            changed: Bodies that moved (e.g. ["Moon", "Ascendant"]); by default
+                the changed facts are found by comparing the planets field by field
 
-        # NEW: 27 Nitya Yogas (Birth Yogas based on Sun-Moon distance)
-        # 61-87: Nitya Yogas
-        yogas.extend(self._detect_nitya_yogas(planets))
+        Returns:
+            YogaEvaluation with the filters of the previous one
+        """
+        changes = ChartChanges.between(previous.planets, planets) if changed is None else ChartChanges.of_bodies(changed)
+        return self._evaluate_incrementally(planets, previous.categories, previous.min_importance, previous, changes)
 
-        # NEW PHASE 3: Sanyas Yogas (Renunciation Yogas)
-        # 88-94: Sanyas Yogas (7 classical renunciation yogas)
-        yogas.extend(self._detect_sanyas_yogas(planets))
-
-        # NEW PHASE 4: Bhava Yogas (House Lord Placements)
-        # 95-238: Bhava Yogas (144 complete house lord placements: all 12 lords × 12 positions)
-        yogas.extend(self._detect_bhava_yogas(planets))
-
-        # ===== PHASE 2.1: Missing Named Yogas (Ch.36) - 7 yogas =====
-        yogas.extend(self._detect_shankha_yoga(planets))
-        yogas.extend(self._detect_bheri_yoga(planets))
-        yogas.extend(self._detect_mridanga_yoga(planets))
-        yogas.extend(self._detect_sharada_yoga(planets))
-        yogas.extend(self._detect_khadga_yoga(planets))
-        yogas.extend(self._detect_trimurti_yoga(planets))
-        yogas.extend(self._detect_lagna_adhi_yoga(planets))
-
-        # ===== PHASE 4.3: Additional Named Yogas (Ch.36) - 1 yoga =====
-        yogas.extend(self._detect_kalpadruma_yoga(planets))
-
-        # ===== BATCH 1: Named Yoga Variations (Ch.36) - 6 yogas =====
-        # Note: Using BPHS-compliant Trimurti variations (Hari/Hara/Brahma) below, not old combined version
-        yogas.extend(self._detect_trimurti_variations_bphs(planets))
-        yogas.extend(self._detect_srinatha_enhanced_yoga(planets))
-        yogas.extend(self._detect_matsya_kurma_combined_yoga(planets))
-
-        # ===== PHASE 2.2: Subtle Raj Yogas - 5 yogas =====
-        # Note: birth_moment_yoga requires birth_data parameter - skip for now
-        # yogas.extend(self._detect_birth_moment_yoga(planets, birth_data=None))
-        yogas.extend(self._detect_strong_vargottama_moon(planets))
-        yogas.extend(self._detect_exalted_aspects_on_lagna(planets))
-        yogas.extend(self._detect_benefic_in_single_kendra(planets))
-
-        # ===== BATCH 4: Specialized Timing Yogas (8 yogas) =====
-        yogas.extend(self._detect_timing_yogas(planets))
-
-        # ===== PHASE 2.3: Divisional Amplifiers (Ch.41.18-22) - 6 yogas =====
-        # Note: These require D9 data - will only detect if D9 fields present
-        yogas.extend(self._detect_parijata_yoga(planets))
-        yogas.extend(self._detect_uttama_yoga(planets))
-        yogas.extend(self._detect_gopura_yoga(planets))
-        yogas.extend(self._detect_simhasana_yoga(planets))
-        yogas.extend(self._detect_parvata_divisional_yoga(planets))
-
-        # ===== PHASE 4.1: Advanced Divisional Amplifiers (Ch.41.23-25) - 3 yogas =====
-        # Note: These require comprehensive D9 data integration
-        yogas.extend(self._detect_devaloka_yoga(planets))
-        yogas.extend(self._detect_brahmaloka_yoga(planets))
-        yogas.extend(self._detect_iravatamsa_yoga(planets))
-
-        # Enrich all yogas with classification metadata (importance, impact, life_area)
-        return self.enrich_yogas(yogas)
+    def _evaluate_incrementally(
+        self,
+        planets: Dict[str, Any],
+        categories: Optional[List[str]],
+        min_importance: Optional[str],
+        previous: Optional[YogaEvaluation],
+        changes: ChartChanges
+    ) -> YogaEvaluation:
+        """Run the detectors affected by the changes (all without a previous evaluation)"""
+        families = self._select_yoga_families(categories, min_importance)
+        threshold = self.IMPORTANCE_RANK[min_importance] if min_importance else 0
+
+        reads = set()
+        traced = TracedPlanets(planets, reads)
+        detectors = {}
+        family_results = {}
+        rerun = []
+        yogas = []
+        seen = set()
+        for family in families:
+            ran = False
+            for detector in family["detectors"]:
+                run = previous.detectors.get(detector) if previous is not None else None
+                if run is None or run.affected_by(changes):
+                    reads.clear()
+                    run = DetectorRun(freeze_yogas(getattr(self, detector)(traced)), reads)
+                    rerun.append(detector)
+                    ran = True
+                detectors[detector] = run
+
+            # Same detector yogas after the same earlier names: same deduplicated, enriched yogas
+            before = frozenset(seen)
+            result = previous.families.get(family["detectors"]) if previous is not None else None
+            if ran or result is None or result[0] != before:
+                detected = [yoga for detector in family["detectors"] for yoga in thaw_yogas(detectors[detector].yogas)]
+                result = (before, freeze_yogas(self._finish_yoga_family(detected, seen)), frozenset(seen - before))
+            seen.update(result[2])
+            family_results[family["detectors"]] = result
+            yogas.extend(thaw_yogas(result[1]))
+
+        yogas = [yoga for yoga in yogas if self.IMPORTANCE_RANK.get(yoga["importance"], 0) >= threshold]
+        return YogaEvaluation(planets, categories, min_importance, detectors, family_results, yogas, rerun)
+
+    # Pancha Mahapurusha yoga formed by each planet
+    MAHAPURUSHA_YOGA_NAMES = MappingProxyType({
+        "Mars": "Ruchaka Yoga",
+        "Mercury": "Bhadra Yoga",
+        "Jupiter": "Hamsa Yoga",
+        "Venus": "Malavya Yoga",
+        "Saturn": "Sasa Yoga"
+    })
+
+    # Effects of each Pancha Mahapurusha yoga
+    MAHAPURUSHA_YOGA_EFFECTS = MappingProxyType({
+        "Mars": "Courage, leadership, victory over enemies, commander qualities",
+        "Mercury": "Intelligence, eloquence, learning, business acumen",
+        "Jupiter": "Wisdom, righteousness, spiritual knowledge, prosperity",
+        "Venus": "Beauty, artistic talents, luxury, marital happiness",
+        "Saturn": "Authority, discipline, organizational skills, longevity"
+    })
 
     def _detect_pancha_mahapurusha(self, planets: Dict) -> List[Dict]:
         """
@@ -763,30 +975,13 @@ class ExtendedYogaService:
         Formed when these planets are in own sign or exalted in Kendra (1,4,7,10)
         """
         yogas = []
-        kendra_houses = [1, 4, 7, 10]
-
-        yoga_names = {
-            "Mars": "Ruchaka Yoga",
-            "Mercury": "Bhadra Yoga",
-            "Jupiter": "Hamsa Yoga",
-            "Venus": "Malavya Yoga",
-            "Saturn": "Sasa Yoga"
-        }
-
-        yoga_effects = {
-            "Mars": "Courage, leadership, victory over enemies, commander qualities",
-            "Mercury": "Intelligence, eloquence, learning, business acumen",
-            "Jupiter": "Wisdom, righteousness, spiritual knowledge, prosperity",
-            "Venus": "Beauty, artistic talents, luxury, marital happiness",
-            "Saturn": "Authority, discipline, organizational skills, longevity"
-        }
 
         for planet in ["Mars", "Mercury", "Jupiter", "Venus", "Saturn"]:
             planet_data = planets.get(planet, {})
             house = planet_data.get("house")
             sign_num = planet_data.get("sign_num")
 
-            if house in kendra_houses:
+            if house in self.KENDRA_HOUSES:
                 # Check if exalted or in own sign
                 is_exalted = sign_num == self.EXALTATION_SIGNS.get(planet)
                 is_own_sign = sign_num in self.OWN_SIGNS.get(planet, [])
@@ -799,7 +994,7 @@ class ExtendedYogaService:
                     is_cancelled, cancel_reasons = self._check_yoga_cancellation([planet], planets)
 
                     # Build description with cancellation note if applicable
-                    base_desc = f"{planet} in Kendra in {'exalted' if is_exalted else 'own'} sign - {yoga_effects[planet]}"
+                    base_desc = f"{planet} in Kendra in {'exalted' if is_exalted else 'own'} sign - {self.MAHAPURUSHA_YOGA_EFFECTS[planet]}"
                     if is_cancelled:
                         base_desc += f" [CANCELLED: {'; '.join(cancel_reasons)}]"
                         calculated_strength = "Weak"  # Downgrade strength if cancelled
@@ -807,7 +1002,7 @@ class ExtendedYogaService:
                         base_desc += f" [WEAKENED: {'; '.join(cancel_reasons)}]"
 
                     yogas.append({
-                        "name": yoga_names[planet],
+                        "name": self.MAHAPURUSHA_YOGA_NAMES[planet],
                         "description": base_desc,
                         "strength": calculated_strength,
                         "category": "Pancha Mahapurusha",
@@ -866,6 +1061,12 @@ class ExtendedYogaService:
             })
         return yogas
 
+    # Houses of Saraswati yoga: kendras, trikonas and the 2nd
+    SARASWATI_HOUSES = (1, 2, 4, 5, 7, 9, 10)
+
+    # Signs of Jupiter's friends (Aries, Cancer, Leo, Scorpio)
+    JUPITER_FRIENDLY_SIGNS = (1, 4, 5, 8)
+
     def _detect_lakshmi_saraswati_yoga(self, planets: Dict) -> List[Dict]:
         """
         Lakshmi Yoga: Venus strong in Kendra - wealth and prosperity
@@ -901,16 +1102,11 @@ class ExtendedYogaService:
         jup_house = jupiter.get("house", 0)
         ven_house = venus_data.get("house", 0)
 
-        # Kendra houses from Lagna: 1, 4, 7, 10
-        # Trikona houses from Lagna: 1, 5, 9
-        # Combined with 2nd house: 1, 2, 4, 5, 7, 9, 10
-        saraswati_houses = [1, 2, 4, 5, 7, 9, 10]
-
         if merc_house and jup_house and ven_house:
             # Check if ALL three planets are in these houses FROM LAGNA
-            if (merc_house in saraswati_houses and
-                jup_house in saraswati_houses and
-                ven_house in saraswati_houses):
+            if (merc_house in self.SARASWATI_HOUSES and
+                jup_house in self.SARASWATI_HOUSES and
+                ven_house in self.SARASWATI_HOUSES):
 
                 # Check Jupiter strength
                 jup_sign = jupiter.get("sign_num", 0)
@@ -918,8 +1114,7 @@ class ExtendedYogaService:
                 jup_own_sign = jup_sign in self.OWN_SIGNS.get("Jupiter", [])  # 9, 12 (Sagittarius, Pisces)
 
                 # Friendly signs for Jupiter: Sun (Leo=5), Moon (Cancer=4), Mars (Aries=1, Scorpio=8)
-                jup_friendly_signs = [1, 4, 5, 8]
-                jup_in_friendly = jup_sign in jup_friendly_signs
+                jup_in_friendly = jup_sign in self.JUPITER_FRIENDLY_SIGNS
 
                 jup_strong = jup_exalted or jup_own_sign or jup_in_friendly
 
@@ -1008,12 +1203,11 @@ class ExtendedYogaService:
         Brings wealth, learning, fame
         """
         yogas = []
-        kendra_houses = [1, 4, 7, 10]
 
         benefics_in_kendra = [p for p in ["Mercury", "Venus", "Jupiter"]
-                             if planets.get(p, {}).get("house") in kendra_houses]
+                             if planets.get(p, {}).get("house") in self.KENDRA_HOUSES]
         malefics_in_kendra = [p for p in ["Mars", "Saturn"]
-                             if planets.get(p, {}).get("house") in kendra_houses]
+                             if planets.get(p, {}).get("house") in self.KENDRA_HOUSES]
 
         if len(benefics_in_kendra) >= 2 and len(malefics_in_kendra) == 0:
             yogas.append({
@@ -1055,56 +1249,16 @@ class ExtendedYogaService:
         Chandra-Mangala Yoga: Moon and Mars together or in mutual aspect
         Brings wealth through property, courage
         """
-        yogas = []
-        moon_house = planets.get("Moon", {}).get("house", 0)
-        mars_house = planets.get("Mars", {}).get("house", 0)
-
-        # Same house (conjunction)
-        if moon_house == mars_house:
-            yogas.append({
-                "name": "Chandra-Mangala Yoga",
-                "description": "Moon-Mars conjunction - wealth through property, courage, practical nature",
-                "strength": "Medium",
-                "category": "Wealth",
-                        "bphs_category": "Non-BPHS (Practical)",
-                        "bphs_section": "Modern/Practical Addition",
-                        "bphs_ref": "Not in BPHS spec"
-            })
-        # 7th house aspect
-        elif abs(moon_house - mars_house) == 6 or abs(moon_house - mars_house) == 6:
-            yogas.append({
-                "name": "Chandra-Mangala Yoga (aspect)",
-                "description": "Moon-Mars in opposition - wealth, determination, property gains",
-                "strength": "Weak",
-                "category": "Wealth",
-                        "bphs_category": "Non-BPHS (Practical)",
-                        "bphs_section": "Modern/Practical Addition",
-                        "bphs_ref": "Not in BPHS spec"
-            })
-
-        return yogas
+        # Declarative rules (data/yoga_rules.json), evaluated once per chart
+        return self._rule_yogas("chandra_mangala", planets)
 
     def _detect_guru_mangala_yoga(self, planets: Dict) -> List[Dict]:
         """
         Guru-Mangala Yoga: Jupiter and Mars together
         Brings technical expertise, engineering skills, leadership
         """
-        yogas = []
-        jupiter_house = planets.get("Jupiter", {}).get("house", 0)
-        mars_house = planets.get("Mars", {}).get("house", 0)
-
-        if jupiter_house == mars_house:
-            yogas.append({
-                "name": "Guru-Mangala Yoga",
-                "description": "Jupiter-Mars conjunction - technical expertise, engineering skills, strategic thinking",
-                "strength": "Medium",
-                "category": "Skills & Leadership",
-                        "bphs_category": "Non-BPHS (Practical)",
-                        "bphs_section": "Modern/Practical Addition",
-                        "bphs_ref": "Not in BPHS spec"
-            })
-
-        return yogas
+        # Declarative rules (data/yoga_rules.json), evaluated once per chart
+        return self._rule_yogas("guru_mangala", planets)
 
     def _detect_viparita_raj_yoga(self, planets: Dict) -> List[Dict]:
         """
@@ -1124,7 +1278,6 @@ class ExtendedYogaService:
         they neutralize negative effects and create Raja Yoga.
         """
         yogas = []
-        dusthana_houses = [6, 8, 12]
 
         # Get ascendant sign (0-indexed: 0=Aries, 11=Pisces)
         asc_data = planets.get("Ascendant", {})
@@ -1133,7 +1286,7 @@ class ExtendedYogaService:
         if not asc_sign_num:
             # Fallback to simplified detection if no ascendant data
             malefics_in_dusthana = [p for p in ["Mars", "Saturn"]
-                                   if planets.get(p, {}).get("house") in dusthana_houses]
+                                   if planets.get(p, {}).get("house") in self.DUSTHANA_HOUSES]
             if len(malefics_in_dusthana) >= 2:
                 yogas.append({
                     "name": "Viparita Raj Yoga",
@@ -1155,7 +1308,7 @@ class ExtendedYogaService:
         lord_6th = self._get_house_lord(6, asc_sign)
         lord_6th_house = planets.get(lord_6th, {}).get("house", 0)
 
-        if lord_6th_house in dusthana_houses:
+        if lord_6th_house in self.DUSTHANA_HOUSES:
             yogas.append({
                 "name": "Harsha Viparita Raj Yoga",
                 "description": f"6th lord ({lord_6th}) in {lord_6th_house}th house - Victory over enemies, good health, courage and fighting spirit, happiness, success in competitive fields",
@@ -1173,7 +1326,7 @@ class ExtendedYogaService:
         lord_8th = self._get_house_lord(8, asc_sign)
         lord_8th_house = planets.get(lord_8th, {}).get("house", 0)
 
-        if lord_8th_house in dusthana_houses:
+        if lord_8th_house in self.DUSTHANA_HOUSES:
             yogas.append({
                 "name": "Sarala Viparita Raj Yoga",
                 "description": f"8th lord ({lord_8th}) in {lord_8th_house}th house - Long life despite obstacles, overcoming dangers and accidents, success in occult sciences, fearless nature, inheritance gains",
@@ -1191,7 +1344,7 @@ class ExtendedYogaService:
         lord_12th = self._get_house_lord(12, asc_sign)
         lord_12th_house = planets.get(lord_12th, {}).get("house", 0)
 
-        if lord_12th_house in dusthana_houses:
+        if lord_12th_house in self.DUSTHANA_HOUSES:
             yogas.append({
                 "name": "Vimal Viparita Raj Yoga",
                 "description": f"12th lord ({lord_12th}) in {lord_12th_house}th house - Success despite financial difficulties, spiritual wisdom and inclinations, charity and helping others, independent nature, gains from foreign lands or spirituality",
@@ -1239,10 +1392,6 @@ class ExtendedYogaService:
         lord_5th_house = lord_5th_data.get("house", 0)
         lord_9th_house = lord_9th_data.get("house", 0)
 
-        kendra_houses = [1, 4, 7, 10]
-        trikona_houses = [1, 5, 9]
-        kendra_trikona = list(set(kendra_houses + trikona_houses))
-
         # Helper: Check if planet is strong
         def is_planet_strong(planet_name: str) -> bool:
             planet_data = planets.get(planet_name, {})
@@ -1335,12 +1484,11 @@ class ExtendedYogaService:
 
         # 2. LAKSHMI YOGA (Classical BPHS)
         # Lagna lord in Kendra/Trikona AND strong benefic in 9th/5th house
-        if lagna_lord_house in kendra_trikona:
+        if lagna_lord_house in self.KENDRA_TRIKONA_HOUSES:
             # Check for strong benefics in 5th or 9th house
-            benefics = ["Jupiter", "Venus", "Mercury"]
             strong_benefics_in_dharma = []
 
-            for benefic in benefics:
+            for benefic in self.NATURAL_BENEFICS:
                 benefic_data = planets.get(benefic, {})
                 benefic_house = benefic_data.get("house", 0)
 
@@ -1365,7 +1513,7 @@ class ExtendedYogaService:
 
         # 3. PARIJATA YOGA
         # Lagna lord strong in Kendra/Trikona
-        if lagna_lord_house in kendra_trikona:
+        if lagna_lord_house in self.KENDRA_TRIKONA_HOUSES:
             lagna_lord_strong = is_planet_strong(lagna_lord)
 
             if lagna_lord_strong:
@@ -1654,11 +1802,10 @@ class ExtendedYogaService:
         second_from_moon = ((moon_house - 1) + 1) % 12 + 1  # 2nd house from Moon
         eleventh_from_moon = ((moon_house - 1) + 10) % 12 + 1  # 11th house from Moon
 
-        benefics = ["Jupiter", "Venus", "Mercury"]
         planets_in_2nd = []
         planets_in_11th = []
 
-        for benefic in benefics:
+        for benefic in self.NATURAL_BENEFICS:
             benefic_house = planets.get(benefic, {}).get("house", 0)
             benefic_sign = planets.get(benefic, {}).get("sign_num", 0)
 
@@ -1825,6 +1972,22 @@ class ExtendedYogaService:
 
         return yogas
 
+    # Kala Sarpa type by Rahu's house: (type, effects, strength)
+    KALA_SARPA_TYPES = MappingProxyType({
+        1: ("Anant Kala Sarpa", "Affects health, longevity - obstacles in self-development", "Medium"),
+        2: ("Kulik Kala Sarpa", "Affects wealth, family - financial ups and downs", "Medium"),
+        3: ("Vasuki Kala Sarpa", "Affects siblings, courage - relationship challenges with brothers/sisters", "Medium"),
+        4: ("Shankhpal Kala Sarpa", "Affects mother, property - emotional challenges, property disputes", "Strong"),
+        5: ("Padma Kala Sarpa", "Affects children, creativity - delays in childbirth, speculative losses", "Strong"),
+        6: ("Mahapadma Kala Sarpa", "Affects enemies, health - chronic health issues, hidden enemies", "Very Strong"),
+        7: ("Takshak Kala Sarpa", "Affects spouse, partnerships - marital discord, business partnership issues", "Very Strong"),
+        8: ("Karkotak Kala Sarpa", "Affects longevity, transformation - sudden changes, accidents, inheritance issues", "Very Strong"),
+        9: ("Shankhachud Kala Sarpa", "Affects father, dharma - obstacles in spiritual growth, father's health", "Strong"),
+        10: ("Ghatak Kala Sarpa", "Affects career, status - professional setbacks, authority conflicts", "Very Strong"),
+        11: ("Vishdhar Kala Sarpa", "Affects gains, social circle - financial losses, unreliable friends", "Strong"),
+        12: ("Sheshnag Kala Sarpa", "Affects expenses, liberation - excessive spending, foreign troubles, spiritual seeking", "Strong")
+    })
+
     def _detect_kala_sarpa_yoga(self, planets: Dict) -> List[Dict]:
         """
         Kala Sarpa Yoga (Kaal Sarp Dosha): All 7 planets hemmed between Rahu-Ketu axis
@@ -1845,23 +2008,23 @@ class ExtendedYogaService:
             return yogas
 
         # Check if all 7 planets are between Rahu and Ketu
-        # Planets should be in houses from Rahu to Ketu (clockwise)
-        main_planets = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
-        all_between_rahu_ketu = True
-        partial_between = 0
+        # Planets should be in houses from Rahu to Ketu (clockwise), strictly between them
+        main_planets = SEVEN_PLANETS
+        hemmed = bitboards.arc(rahu_house + 1, 5)
+        if isinstance(planets, ChartFacts):
+            occupied = planets.occupied_mask
+        else:
+            occupied = bitboards.house_mask(planets, main_planets)
 
-        for planet_name in main_planets:
-            planet_house = planets.get(planet_name, {}).get("house", 0)
-            if not planet_house:
-                continue
+        # Three or more occupied houses outside the axis leave at most 4 planets between
+        if bitboards.count(occupied & ~hemmed) >= 3:
+            return yogas
 
-            # Calculate if planet is between Rahu and Ketu (clockwise from Rahu)
-            distance_from_rahu = (planet_house - rahu_house) % 12
-            if distance_from_rahu == 0 or distance_from_rahu >= 6:
-                # Planet is not strictly between Rahu and Ketu
-                all_between_rahu_ketu = False
-            else:
-                partial_between += 1
+        all_between_rahu_ketu = bitboards.within(occupied, hemmed)
+        partial_between = sum(
+            1 for planet_name in main_planets
+            if bitboards.bit(planets.get(planet_name, {}).get("house", 0)) & hemmed
+        )
 
         # Kala Sarpa Yoga: All planets between Rahu-Ketu
         # Partial Kala Sarpa: 5-6 planets between
@@ -1869,22 +2032,7 @@ class ExtendedYogaService:
             return yogas
 
         # Determine the type based on Rahu's house
-        types = {
-            1: ("Anant Kala Sarpa", "Affects health, longevity - obstacles in self-development", "Medium"),
-            2: ("Kulik Kala Sarpa", "Affects wealth, family - financial ups and downs", "Medium"),
-            3: ("Vasuki Kala Sarpa", "Affects siblings, courage - relationship challenges with brothers/sisters", "Medium"),
-            4: ("Shankhpal Kala Sarpa", "Affects mother, property - emotional challenges, property disputes", "Strong"),
-            5: ("Padma Kala Sarpa", "Affects children, creativity - delays in childbirth, speculative losses", "Strong"),
-            6: ("Mahapadma Kala Sarpa", "Affects enemies, health - chronic health issues, hidden enemies", "Very Strong"),
-            7: ("Takshak Kala Sarpa", "Affects spouse, partnerships - marital discord, business partnership issues", "Very Strong"),
-            8: ("Karkotak Kala Sarpa", "Affects longevity, transformation - sudden changes, accidents, inheritance issues", "Very Strong"),
-            9: ("Shankhachud Kala Sarpa", "Affects father, dharma - obstacles in spiritual growth, father's health", "Strong"),
-            10: ("Ghatak Kala Sarpa", "Affects career, status - professional setbacks, authority conflicts", "Very Strong"),
-            11: ("Vishdhar Kala Sarpa", "Affects gains, social circle - financial losses, unreliable friends", "Strong"),
-            12: ("Sheshnag Kala Sarpa", "Affects expenses, liberation - excessive spending, foreign troubles, spiritual seeking", "Strong")
-        }
-
-        yoga_type, effects, strength = types.get(rahu_house, ("Unknown Type", "Effects vary", "Medium"))
+        yoga_type, effects, strength = self.KALA_SARPA_TYPES.get(rahu_house, ("Unknown Type", "Effects vary", "Medium"))
 
         if all_between_rahu_ketu:
             yogas.append({
@@ -1914,11 +2062,7 @@ class ExtendedYogaService:
         """
         yogas = []
 
-        movable_signs = [1, 4, 7, 10]  # Aries, Cancer, Libra, Capricorn
-        fixed_signs = [2, 5, 8, 11]    # Taurus, Leo, Scorpio, Aquarius
-        dual_signs = [3, 6, 9, 12]     # Gemini, Virgo, Sagittarius, Pisces
-
-        main_planets = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
+        main_planets = SEVEN_PLANETS
 
         in_movable = 0
         in_fixed = 0
@@ -1926,11 +2070,11 @@ class ExtendedYogaService:
 
         for planet in main_planets:
             sign_num = planets.get(planet, {}).get("sign_num", 0)
-            if sign_num in movable_signs:
+            if sign_num in self.MOVABLE_SIGNS:
                 in_movable += 1
-            elif sign_num in fixed_signs:
+            elif sign_num in self.FIXED_SIGNS:
                 in_fixed += 1
-            elif sign_num in dual_signs:
+            elif sign_num in self.DUAL_SIGNS:
                 in_dual += 1
 
         # Rajju Yoga - All in movable
@@ -1983,6 +2127,9 @@ class ExtendedYogaService:
 
         return yogas
 
+    # Malefics of the Nabhasa Dala yogas
+    DALA_MALEFICS = ("Sun", "Mars", "Saturn", "Rahu", "Ketu")
+
     def _detect_nabhasa_dala_yogas(self, planets: Dict) -> List[Dict]:
         """
         Nabhasa Dala Yogas (2 types) - Based on benefic/malefic distribution
@@ -1991,12 +2138,9 @@ class ExtendedYogaService:
         """
         yogas = []
 
-        benefics = ["Jupiter", "Venus", "Mercury"]  # Mercury is considered benefic when alone
-        malefics = ["Sun", "Mars", "Saturn", "Rahu", "Ketu"]
-        kendras = [1, 4, 7, 10]
-
-        benefics_in_kendra = sum(1 for p in benefics if planets.get(p, {}).get("house", 0) in kendras)
-        malefics_in_kendra = sum(1 for p in malefics if planets.get(p, {}).get("house", 0) in kendras)
+        # Mercury is considered benefic when alone
+        benefics_in_kendra = sum(1 for p in self.NATURAL_BENEFICS if planets.get(p, {}).get("house", 0) in self.KENDRA_HOUSES)
+        malefics_in_kendra = sum(1 for p in self.DALA_MALEFICS if planets.get(p, {}).get("house", 0) in self.KENDRA_HOUSES)
 
         # Mala Yoga - All benefics in kendras
         if benefics_in_kendra == 3:
@@ -2024,6 +2168,9 @@ class ExtendedYogaService:
 
         return yogas
 
+    # Successive kendras of Gada yoga
+    SUCCESSIVE_KENDRA_PAIRS = ((1, 4), (4, 7), (7, 10), (10, 1))
+
     def _detect_nabhasa_akriti_yogas(self, planets: Dict) -> List[Dict]:
         """
         Complete 20 Nabhasa Akriti Yogas - Based on planetary patterns/shapes
@@ -2031,20 +2178,26 @@ class ExtendedYogaService:
         """
         yogas = []
 
-        main_planets = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
-        occupied_houses = sorted(list(set([planets.get(p, {}).get("house", 0) for p in main_planets if planets.get(p, {}).get("house", 0) > 0])))
+        main_planets = SEVEN_PLANETS
+
+        # Houses occupied by the seven planets, as a bitboard (see app.services.bitboards)
+        if isinstance(planets, ChartFacts):
+            occupied = planets.occupied_mask
+        else:
+            occupied = bitboards.house_mask(planets, main_planets)
+        occupied_count = bitboards.count(occupied)
 
-        if len(occupied_houses) == 0:
+        if occupied_count == 0:
             return yogas
 
         # Get benefics and malefics
-        benefics = ["Jupiter", "Venus", "Mercury", "Moon"]
-        malefics = ["Sun", "Mars", "Saturn"]
-        benefic_houses = [planets.get(p, {}).get("house", 0) for p in benefics if planets.get(p, {}).get("house", 0)]
-        malefic_houses = [planets.get(p, {}).get("house", 0) for p in malefics if planets.get(p, {}).get("house", 0)]
+        benefic_count = sum(1 for p in self.NATURAL_BENEFICS_WITH_MOON if planets.get(p, {}).get("house", 0))
+        malefic_count = sum(1 for p in self.KROORA_GRAHAS if planets.get(p, {}).get("house", 0))
+        benefic_mask = bitboards.house_mask(planets, self.NATURAL_BENEFICS_WITH_MOON)
+        malefic_mask = bitboards.house_mask(planets, self.KROORA_GRAHAS)
 
         # 1. Gola Yoga - All planets in one house
-        if len(occupied_houses) == 1:
+        if occupied_count == 1:
             yogas.append({
                 "name": "Gola Yoga",
                 "description": "All planets in one house - Intense focus, specialized skills, poverty early then prosperity, concentrated energy",
@@ -2056,7 +2209,7 @@ class ExtendedYogaService:
             })
 
         # 2. Yuga Yoga - All planets in houses 1-4
-        if len(occupied_houses) >= 2 and occupied_houses[0] >= 1 and occupied_houses[-1] <= 4:
+        if occupied_count >= 2 and bitboards.within(occupied, self.NABHASA_HOUSE_MASKS["1-4"]):
             yogas.append({
                 "name": "Yuga Yoga",
                 "description": "All planets in first quadrant (H1-4) - Religious nature, charitable deeds, respected in society, spiritual tendencies",
@@ -2068,7 +2221,7 @@ class ExtendedYogaService:
             })
 
         # 3. Shola Yoga - All planets in houses 5-8
-        if len(occupied_houses) >= 2 and occupied_houses[0] >= 5 and occupied_houses[-1] <= 8:
+        if occupied_count >= 2 and bitboards.within(occupied, self.NABHASA_HOUSE_MASKS["5-8"]):
             yogas.append({
                 "name": "Shola Yoga",
                 "description": "All planets in second quadrant (H5-8) - Courageous, argumentative, wealthy through effort, leadership qualities",
@@ -2080,9 +2233,7 @@ class ExtendedYogaService:
             })
 
         # 4. Halaka/Hal Yoga - No planets in kendras (1,4,7,10)
-        kendra_houses = [1, 4, 7, 10]
-        trikona_houses = [1, 5, 9]  # Trinal houses for Chaapa Yoga
-        if not any(h in kendra_houses for h in occupied_houses):
+        if not occupied & bitboards.KENDRA:
             yogas.append({
                 "name": "Hal Yoga",
                 "description": "No planets in kendras - Agricultural pursuits, farming, land-related work, hardworking nature",
@@ -2094,7 +2245,7 @@ class ExtendedYogaService:
             })
 
         # 5. Vajra Yoga - All in 1st & 7th OR benefics in all kendras
-        if set(occupied_houses) == {1, 7} or (all(h in kendra_houses for h in benefic_houses) and len(benefic_houses) == 4):
+        if occupied == self.NABHASA_HOUSE_MASKS["1+7"] or (bitboards.within(benefic_mask, bitboards.KENDRA) and benefic_count == 4):
             yogas.append({
                 "name": "Vajra Yoga (Nabhasa)",
                 "description": "Planets in 1st & 7th or benefics in all kendras - Strong personality, success in early and late life, diamond-like strength",
@@ -2106,7 +2257,7 @@ class ExtendedYogaService:
             })
 
         # 6. Yava Yoga - All in 1st & 4th OR 1st & 10th
-        if set(occupied_houses) == {1, 4} or set(occupied_houses) == {1, 10}:
+        if occupied in (self.NABHASA_HOUSE_MASKS["1+4"], self.NABHASA_HOUSE_MASKS["1+10"]):
             yogas.append({
                 "name": "Yava Yoga",
                 "description": "Planets in angular houses from lagna - Middle life prosperity, charitable, religious observances",
@@ -2118,7 +2269,7 @@ class ExtendedYogaService:
             })
 
         # 7. Kamala/Padma Yoga - All planets in kendras
-        if len(occupied_houses) >= 2 and all(h in kendra_houses for h in occupied_houses):
+        if occupied_count >= 2 and bitboards.within(occupied, bitboards.KENDRA):
             yogas.append({
                 "name": "Kamala Yoga",
                 "description": "All planets in kendras (1,4,7,10) - Fame, wealth, long life, royal honors, lotus-like grace",
@@ -2131,15 +2282,13 @@ class ExtendedYogaService:
 
         # 8. Vaapi Yoga - All in Panaphar (2,5,8,11) OR Apoklima (3,6,9,12), NO Kendras
         # Classical BPHS: Well of wealth yoga
-        panaphar_houses = [2, 5, 8, 11]  # Succedent houses
-        apoklima_houses = [3, 6, 9, 12]  # Cadent houses
         # Check that NO planets are in Kendras (1,4,7,10)
-        no_kendras = not any(h in kendra_houses for h in occupied_houses)
+        no_kendras = not occupied & bitboards.KENDRA
 
-        if no_kendras and len(occupied_houses) >= 2:
-            # All in Panaphar OR all in Apoklima
-            if all(h in panaphar_houses for h in occupied_houses) or \
-               all(h in apoklima_houses for h in occupied_houses):
+        if no_kendras and occupied_count >= 2:
+            # All in Panaphar (2,5,8,11) OR all in Apoklima (3,6,9,12)
+            if bitboards.within(occupied, bitboards.PANAPHARA) or \
+               bitboards.within(occupied, bitboards.APOKLIMA):
                 yogas.append({
                     "name": "Vaapi Yoga",
                     "description": "All planets in Panaphar (2,5,8,11) or Apoklima (3,6,9,12), no Kendras - Well of wealth, accumulation, secretive nature, supportive relationships, high position through hard work",
@@ -2153,7 +2302,7 @@ class ExtendedYogaService:
                 })
 
         # 9. Yupa Yoga - All from lagna to 4th house
-        if len(occupied_houses) >= 2 and occupied_houses[0] == 1 and occupied_houses[-1] <= 4:
+        if occupied_count >= 2 and occupied & bitboards.bit(1) and bitboards.within(occupied, self.NABHASA_HOUSE_MASKS["1-4"]):
             yogas.append({
                 "name": "Yupa Yoga",
                 "description": "Planets from 1st to 4th house - Religious sacrifices, spiritual practices, revered for rituals",
@@ -2165,7 +2314,7 @@ class ExtendedYogaService:
             })
 
         # 10. Ishwara Yoga - All from lagna to 7th house
-        if len(occupied_houses) >= 2 and occupied_houses[0] == 1 and occupied_houses[-1] <= 7:
+        if occupied_count >= 2 and occupied & bitboards.bit(1) and bitboards.within(occupied, self.NABHASA_HOUSE_MASKS["1-7"]):
             yogas.append({
                 "name": "Ishwara Yoga",
                 "description": "Planets from 1st to 7th house - Lordship qualities, authority, ministerial positions, wealth",
@@ -2177,40 +2326,34 @@ class ExtendedYogaService:
             })
 
         # 11. Shakti Yoga - All in 7 consecutive signs/houses
-        if len(occupied_houses) >= 7:
-            for i in range(len(occupied_houses) - 6):
-                if occupied_houses[i+6] - occupied_houses[i] == 6:  # 7 consecutive
-                    yogas.append({
-                        "name": "Shakti Yoga",
-                        "description": "7 planets in consecutive houses - Cowardice in youth, courage in old age, lazy but successful",
-                        "strength": "Medium",
-                        "category": "Nabhasa - Akriti",
-                        "bphs_category": "Standard Yogas",
-                        "bphs_section": "F) Nabhasa (Ch.35)",
-                        "bphs_ref": "Ch.35.13"
-                    })
-                    break
+        if bitboards.has_run(occupied, 7):  # 7 consecutive
+            yogas.append({
+                "name": "Shakti Yoga",
+                "description": "7 planets in consecutive houses - Cowardice in youth, courage in old age, lazy but successful",
+                "strength": "Medium",
+                "category": "Nabhasa - Akriti",
+                "bphs_category": "Standard Yogas",
+                "bphs_section": "F) Nabhasa (Ch.35)",
+                "bphs_ref": "Ch.35.13"
+            })
 
         # 12. Danda Yoga - All in 6 consecutive houses
-        if len(occupied_houses) >= 6:
-            for i in range(len(occupied_houses) - 5):
-                if occupied_houses[i+5] - occupied_houses[i] == 5:  # 6 consecutive
-                    yogas.append({
-                        "name": "Danda Yoga",
-                        "description": "6 planets in consecutive houses - Staff/stick pattern, serving others, moderate income",
-                        "strength": "Medium",
-                        "category": "Nabhasa - Akriti",
-                        "bphs_category": "Standard Yogas",
-                        "bphs_section": "F) Nabhasa (Ch.35)",
-                        "bphs_ref": "Ch.35.13"
-                    })
-                    break
+        if bitboards.has_run(occupied, 6):  # 6 consecutive
+            yogas.append({
+                "name": "Danda Yoga",
+                "description": "6 planets in consecutive houses - Staff/stick pattern, serving others, moderate income",
+                "strength": "Medium",
+                "category": "Nabhasa - Akriti",
+                "bphs_category": "Standard Yogas",
+                "bphs_section": "F) Nabhasa (Ch.35)",
+                "bphs_ref": "Ch.35.13"
+            })
 
         # 13. Naukaa Yoga - All in 7 consecutive houses from a kendra
-        if len(occupied_houses) >= 7:
-            for kendra in kendra_houses:
-                houses_from_kendra = [(h - kendra) % 12 for h in occupied_houses]
-                if max(houses_from_kendra) - min(houses_from_kendra) <= 6:
+        if occupied_count >= 7:
+            for kendra in (1, 4, 7, 10):
+                # Distances from the kendra fit in 7 houses
+                if bitboards.span(bitboards.offsets_from(occupied, kendra)) <= 6:
                     yogas.append({
                         "name": "Naukaa Yoga",
                         "description": "7 planets in boat pattern from kendra - Water/ship related work, travel, trade voyages",
@@ -2223,8 +2366,8 @@ class ExtendedYogaService:
                     break
 
         # 14. Koota Yoga - All in 4th, 8th, and 12th houses (dusthanas)
-        dusthana_houses = [4, 8, 12]  # Note: 4th is also kendra but in some contexts considered dusthana
-        if len(occupied_houses) >= 2 and all(h in dusthana_houses for h in occupied_houses):
+        # Note: 4th is also kendra but in some contexts considered dusthana
+        if occupied_count >= 2 and bitboards.within(occupied, self.NABHASA_HOUSE_MASKS["4+8+12"]):
             yogas.append({
                 "name": "Koota Yoga",
                 "description": "Planets in dusthana houses (4,8,12) - Deceptive nature, imprisonment, confinement, secrecy",
@@ -2236,7 +2379,7 @@ class ExtendedYogaService:
             })
 
         # 15. Chatra/Chhatra Yoga - All planets from 10th house
-        if occupied_houses[0] == 10 and len(occupied_houses) >= 2:
+        if bitboards.lowest(occupied) == 10 and occupied_count >= 2:
             yogas.append({
                 "name": "Chatra Yoga",
                 "description": "Planets from 10th house onwards - Royal canopy, rulership, authority, happiness in early life",
@@ -2248,7 +2391,7 @@ class ExtendedYogaService:
             })
 
         # 16. Chaapa/Dhanu Yoga - All in trikona houses (1,5,9)
-        if len(occupied_houses) >= 2 and all(h in trikona_houses for h in occupied_houses):
+        if occupied_count >= 2 and bitboards.within(occupied, bitboards.TRIKONA):
             yogas.append({
                 "name": "Chaapa Yoga",
                 "description": "All in trikonas (1,5,9) - Bow/archer pattern, wandering, incarceration in middle age, final success",
@@ -2260,7 +2403,7 @@ class ExtendedYogaService:
             })
 
         # 17. Ardha Chandra Yoga - All in 7 houses from lagna
-        if len(occupied_houses) >= 4 and occupied_houses[0] == 1 and (occupied_houses[-1] - occupied_houses[0]) == len(occupied_houses) - 1 and len(occupied_houses) == 7:
+        if occupied == self.NABHASA_HOUSE_MASKS["1-7"]:
             yogas.append({
                 "name": "Ardha Chandra Yoga",
                 "description": "7 planets spread in half-moon pattern from lagna - Handsome, famous, commanding, head of army",
@@ -2272,8 +2415,7 @@ class ExtendedYogaService:
             })
 
         # 18. Chakra Yoga - All planets in kendra and trikona only
-        kendra_trikona = [1, 4, 5, 7, 9, 10]
-        if len(occupied_houses) >= 4 and all(h in kendra_trikona for h in occupied_houses):
+        if occupied_count >= 4 and bitboards.within(occupied, self.NABHASA_HOUSE_MASKS["kendra+trikona"]):
             yogas.append({
                 "name": "Chakra Yoga",
                 "description": "Planets in kendras and trikonas - Sovereign ruler, powerful leader, tremendous authority, wheel pattern",
@@ -2285,24 +2427,21 @@ class ExtendedYogaService:
             })
 
         # 19. Samudra Yoga - All in 6 consecutive signs
-        if len(occupied_houses) >= 6:
-            for i in range(len(occupied_houses) - 5):
-                if occupied_houses[i+5] - occupied_houses[i] == 5:
-                    yogas.append({
-                        "name": "Samudra Yoga",
-                        "description": "6 planets in consecutive houses - Ocean of wealth, treasure accumulation, generous",
-                        "strength": "Strong",
-                        "category": "Nabhasa - Akriti",
-                        "bphs_category": "Standard Yogas",
-                        "bphs_section": "F) Nabhasa (Ch.35)",
-                        "bphs_ref": "Ch.35.15"
-                    })
-                    break
+        if bitboards.has_run(occupied, 6):
+            yogas.append({
+                "name": "Samudra Yoga",
+                "description": "6 planets in consecutive houses - Ocean of wealth, treasure accumulation, generous",
+                "strength": "Strong",
+                "category": "Nabhasa - Akriti",
+                "bphs_category": "Standard Yogas",
+                "bphs_section": "F) Nabhasa (Ch.35)",
+                "bphs_ref": "Ch.35.15"
+            })
 
         # 20. Dama Yoga - Planets in consecutive houses (general)
-        if len(occupied_houses) >= 3:
-            consecutive = all(occupied_houses[i+1] - occupied_houses[i] == 1 for i in range(len(occupied_houses)-1))
-            if consecutive and len(occupied_houses) < 6:  # Not already covered by Danda or Shakti
+        if occupied_count >= 3:
+            consecutive = bitboards.is_contiguous(occupied)
+            if consecutive and occupied_count < 6:  # Not already covered by Danda or Shakti
                 yogas.append({
                     "name": "Dama Yoga",
                     "description": "Planets in consecutive houses - Charitable, helpful nature, gains through service, moderate wealth",
@@ -2316,23 +2455,23 @@ class ExtendedYogaService:
         # NEW NABHASA AKRITI YOGAS - BPHS IDs 6-31
 
         # ID 6: Gada Yoga - All planets in two successive kendras
-        successive_kendra_pairs = [(1,4), (4,7), (7,10), (10,1)]
-        for k1, k2 in successive_kendra_pairs:
-            if len(occupied_houses) >= 2 and set(occupied_houses).issubset({k1, k2}):
-                yogas.append({
-                    "name": "Gada Yoga",
-                    "description": f"All planets in two successive kendras ({k1}th & {k2}th) - Club-like strength, success through partnerships, gains through joint efforts",
-                    "strength": "Strong",
-                    "category": "Nabhasa - Akriti",
+        if occupied_count >= 2 and bitboards.within(occupied, bitboards.KENDRA):
+            for k1, k2 in self.SUCCESSIVE_KENDRA_PAIRS:
+                if bitboards.within(occupied, self.NABHASA_HOUSE_MASKS[f"{k1}+{k2}"]):
+                    yogas.append({
+                        "name": "Gada Yoga",
+                        "description": f"All planets in two successive kendras ({k1}th & {k2}th) - Club-like strength, success through partnerships, gains through joint efforts",
+                        "strength": "Strong",
+                        "category": "Nabhasa - Akriti",
                         "bphs_category": "Standard Yogas",
                         "bphs_section": "F) Nabhasa (Ch.35)",
                         "bphs_ref": "Ch.35.9"
-                })
-                break
+                    })
+                    break
 
         # ID 7: Sakata Yoga (Nabhasa) - All planets only in 1st and 7th
         # Note: Different from rare Shakata yoga (Moon-Jupiter)
-        if len(occupied_houses) >= 2 and set(occupied_houses) == {1, 7}:
+        if occupied == self.NABHASA_HOUSE_MASKS["1+7"]:
             # Check if not already added as Vajra
             if not any(y["name"] == "Vajra Yoga (Nabhasa)" for y in yogas):
                 yogas.append({
@@ -2346,7 +2485,7 @@ class ExtendedYogaService:
                 })
 
         # ID 8: Vihaga Yoga - All planets only in 4th and 10th
-        if len(occupied_houses) >= 2 and set(occupied_houses) == {4, 10}:
+        if occupied == self.NABHASA_HOUSE_MASKS["4+10"]:
             yogas.append({
                 "name": "Vihaga Yoga",
                 "description": "All planets only in 4th and 10th houses - Bird-like movement, travel, messenger, diplomatic success",
@@ -2358,7 +2497,7 @@ class ExtendedYogaService:
             })
 
         # ID 9: Śṛṅgāṭaka Yoga - All planets only in trikonas (1, 5, 9)
-        if len(occupied_houses) >= 2 and set(occupied_houses).issubset(trikona_houses):
+        if occupied_count >= 2 and bitboards.within(occupied, bitboards.TRIKONA):
             # Check if not already covered by Chaapa
             if not any(y["name"] == "Chaapa Yoga" for y in yogas):
                 yogas.append({
@@ -2374,13 +2513,13 @@ class ExtendedYogaService:
         # ID 10: Hala Yoga (Corrected BPHS version) - All in Trishadaya sets
         # Trishadaya: (2,6,10) or (3,7,11) or (4,8,12)
         trishadaya_sets = [
-            ([2, 6, 10], "2nd-6th-10th"),
-            ([3, 7, 11], "3rd-7th-11th"),
-            ([4, 8, 12], "4th-8th-12th")
+            (self.NABHASA_HOUSE_MASKS["2+6+10"], "2nd-6th-10th"),
+            (self.NABHASA_HOUSE_MASKS["3+7+11"], "3rd-7th-11th"),
+            (self.NABHASA_HOUSE_MASKS["4+8+12"], "4th-8th-12th")
         ]
 
         for tri_set, tri_desc in trishadaya_sets:
-            if len(occupied_houses) >= 2 and set(occupied_houses).issubset(tri_set):
+            if occupied_count >= 2 and bitboards.within(occupied, tri_set):
                 yogas.append({
                     "name": "Hala Yoga (Corrected)",
                     "description": f"All planets in {tri_desc} (Trishadaya) - Plough pattern, agricultural success, land-related wealth, hardworking nature",
@@ -2394,8 +2533,8 @@ class ExtendedYogaService:
 
         # IDs 11-12: Corrected Benefic/Malefic Kendra patterns
         # ID 11: Vajra (Corrected) - All benefics in 1&7 OR all malefics in 4&10
-        benefic_in_17 = all(h in [1, 7] for h in benefic_houses) and len(benefic_houses) >= 3
-        malefic_in_410 = all(h in [4, 10] for h in malefic_houses) and len(malefic_houses) >= 2
+        benefic_in_17 = bitboards.within(benefic_mask, self.NABHASA_HOUSE_MASKS["1+7"]) and benefic_count >= 3
+        malefic_in_410 = bitboards.within(malefic_mask, self.NABHASA_HOUSE_MASKS["4+10"]) and malefic_count >= 2
 
         if benefic_in_17 or malefic_in_410:
             pattern = "benefics in 1&7" if benefic_in_17 else "malefics in 4&10"
@@ -2410,8 +2549,8 @@ class ExtendedYogaService:
             })
 
         # ID 12: Yava (Corrected) - All benefics in 4&10 OR all malefics in 1&7
-        benefic_in_410 = all(h in [4, 10] for h in benefic_houses) and len(benefic_houses) >= 3
-        malefic_in_17 = all(h in [1, 7] for h in malefic_houses) and len(malefic_houses) >= 2
+        benefic_in_410 = bitboards.within(benefic_mask, self.NABHASA_HOUSE_MASKS["4+10"]) and benefic_count >= 3
+        malefic_in_17 = bitboards.within(malefic_mask, self.NABHASA_HOUSE_MASKS["1+7"]) and malefic_count >= 2
 
         if benefic_in_410 or malefic_in_17:
             pattern = "benefics in 4&10" if benefic_in_410 else "malefics in 1&7"
@@ -2426,10 +2565,11 @@ class ExtendedYogaService:
             })
 
         # IDs 15-18: Spread Patterns (BPHS Corrected) - 7 planets spread over quadrants
-        if len([p for p in main_planets if planets.get(p, {}).get("house", 0) > 0]) == 7:
+        all_placed = all(planets.get(p, {}).get("house", 0) > 0 for p in main_planets)
+        if all_placed:
 
             # ID 15: Yupa (Corrected) - 7 planets spread over houses 1-4
-            if all(1 <= h <= 4 for h in occupied_houses):
+            if bitboards.within(occupied, self.NABHASA_HOUSE_MASKS["1-4"]):
                 yogas.append({
                     "name": "Yupa Yoga (BPHS)",
                     "description": "7 planets spread over 1st-4th houses - Sacrificial post, religious authority, ritualistic success",
@@ -2441,7 +2581,7 @@ class ExtendedYogaService:
                 })
 
             # ID 16: Śara - 7 planets spread over houses 4-7
-            elif all(4 <= h <= 7 for h in occupied_houses):
+            elif bitboards.within(occupied, self.NABHASA_HOUSE_MASKS["4-7"]):
                 yogas.append({
                     "name": "Śara Yoga",
                     "description": "7 planets spread over 4th-7th houses - Arrow pattern, goal-oriented, success through partnerships",
@@ -2453,7 +2593,7 @@ class ExtendedYogaService:
                 })
 
             # ID 17: Śakti (Corrected) - 7 planets spread over houses 7-10
-            elif all(7 <= h <= 10 for h in occupied_houses):
+            elif bitboards.within(occupied, self.NABHASA_HOUSE_MASKS["7-10"]):
                 yogas.append({
                     "name": "Śakti Yoga (BPHS)",
                     "description": "7 planets spread over 7th-10th houses - Spear pattern, powerful authority, career success, combative strength",
@@ -2465,7 +2605,7 @@ class ExtendedYogaService:
                 })
 
             # ID 18: Daṇḍa (Corrected) - 7 planets spread over houses 10-1 (wrapping)
-            elif all(h in [10, 11, 12, 1] for h in occupied_houses):
+            elif bitboards.within(occupied, self.NABHASA_HOUSE_MASKS["10-1"]):
                 yogas.append({
                     "name": "Daṇḍa Yoga (BPHS)",
                     "description": "7 planets spread over 10th-1st houses (wrapping) - Staff pattern, authority through discipline, administrative success",
@@ -2477,11 +2617,10 @@ class ExtendedYogaService:
                 })
 
         # IDs 19-22: Consecutive House Patterns (BPHS Corrected)
-        if len([p for p in main_planets if planets.get(p, {}).get("house", 0) > 0]) == 7:
+        if all_placed:
 
             # ID 19: Nauka (Corrected) - 7 consecutive from house 1
-            consecutive_from_1 = list(range(1, 8))
-            if all(h in consecutive_from_1 for h in occupied_houses):
+            if bitboards.within(occupied, self.NABHASA_HOUSE_MASKS["1-7"]):
                 yogas.append({
                     "name": "Nauka Yoga (BPHS)",
                     "description": "7 consecutive houses starting from 1st - Boat pattern, water-related success, trade voyages",
@@ -2493,8 +2632,7 @@ class ExtendedYogaService:
                 })
 
             # ID 20: Kūṭa (Corrected) - 7 consecutive from house 4
-            consecutive_from_4 = list(range(4, 11))
-            if all(h in consecutive_from_4 for h in occupied_houses):
+            if bitboards.within(occupied, self.NABHASA_HOUSE_MASKS["4-10"]):
                 yogas.append({
                     "name": "Kūṭa Yoga (BPHS)",
                     "description": "7 consecutive houses starting from 4th - Heap/pile pattern, accumulation of wealth, property success",
@@ -2506,9 +2644,8 @@ class ExtendedYogaService:
                 })
 
             # ID 21: Chatra (Corrected) - 7 consecutive from house 7
-            consecutive_from_7 = list(range(7, 14))  # Will be modulo 12
-            occupied_adjusted = [(h - 7) for h in occupied_houses]
-            if all(0 <= adj <= 6 for adj in occupied_adjusted):
+            # Houses 7-12 (not wrapping past the 12th)
+            if bitboards.within(occupied, self.NABHASA_HOUSE_MASKS["7-12"]):
                 yogas.append({
                     "name": "Chatra Yoga (BPHS)",
                     "description": "7 consecutive houses starting from 7th - Umbrella/canopy pattern, royal protection, success in partnerships",
@@ -2520,8 +2657,7 @@ class ExtendedYogaService:
                 })
 
             # ID 22: Dhanus/Chāpa (Corrected) - 7 consecutive from house 10
-            consecutive_from_10 = [10, 11, 12, 1, 2, 3, 4]
-            if all(h in consecutive_from_10 for h in occupied_houses):
+            if bitboards.within(occupied, self.NABHASA_HOUSE_MASKS["10-4"]):
                 yogas.append({
                     "name": "Dhanus Yoga (BPHS)",
                     "description": "7 consecutive houses starting from 10th - Bow pattern, career authority, leadership, focused ambition",
@@ -2537,10 +2673,10 @@ class ExtendedYogaService:
         # ID 23: Chakra (Corrected) - 6 alternate signs from Lagna
         # Alternate means: Lagna, Lagna+2, Lagna+4, Lagna+6, Lagna+8, Lagna+10
         # In houses: odd houses (1,3,5,7,9,11) OR even houses (2,4,6,8,10,12)
-        all_odd = all(h % 2 == 1 for h in occupied_houses)
-        all_even = all(h % 2 == 0 for h in occupied_houses)
+        all_odd = bitboards.within(occupied, bitboards.ODD)
+        all_even = bitboards.within(occupied, bitboards.EVEN)
 
-        if (all_odd or all_even) and len(occupied_houses) >= 6:
+        if (all_odd or all_even) and occupied_count >= 6:
             pattern = "odd houses (1,3,5,7,9,11)" if all_odd else "even houses (2,4,6,8,10,12)"
             yogas.append({
                 "name": "Chakra Yoga (BPHS)",
@@ -2555,7 +2691,7 @@ class ExtendedYogaService:
         # ID 24: Samudra (Corrected) - 6 alternate signs from 2nd house
         # Starting from 2nd: 2,4,6,8,10,12 (even) or shifted pattern
         # Simplified: Check if 6+ planets in specific alternate pattern
-        if all_even and len(occupied_houses) >= 6:
+        if all_even and occupied_count >= 6:
             yogas.append({
                 "name": "Samudra Yoga (BPHS)",
                 "description": "6+ planets in alternate even houses - Ocean pattern, vast wealth, treasure accumulation, generous nature",
@@ -2627,7 +2763,7 @@ class ExtendedYogaService:
             })
 
         # Matsya Yoga - All planets in 1st-7th houses
-        main_planets = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
+        main_planets = SEVEN_PLANETS
         all_in_first_half = all(1 <= planets.get(p, {}).get("house", 0) <= 7 for p in main_planets if planets.get(p, {}).get("house", 0) > 0)
 
         if all_in_first_half and sum(1 for p in main_planets if planets.get(p, {}).get("house", 0) > 0) >= 6:
@@ -2713,19 +2849,16 @@ class ExtendedYogaService:
         Simplified: Benefics in both Kendra and Trikona houses simultaneously
         """
         yogas = []
-        kendra_houses = [1, 4, 7, 10]
-        trikona_houses = [1, 5, 9]
-        benefics = ["Jupiter", "Venus", "Mercury"]
 
         # Check for benefics well-placed in both kendra and trikona
         benefics_in_kendra = []
         benefics_in_trikona = []
 
-        for planet in benefics:
+        for planet in self.NATURAL_BENEFICS:
             house = planets.get(planet, {}).get("house", 0)
-            if house in kendra_houses:
+            if house in self.KENDRA_HOUSES:
                 benefics_in_kendra.append(planet)
-            if house in trikona_houses:
+            if house in self.TRIKONA_HOUSES:
                 benefics_in_trikona.append(planet)
 
         # Raj Yoga forms when benefics occupy both kendra and trikona
@@ -2814,12 +2947,11 @@ class ExtendedYogaService:
         Simplified: Benefics in 9th and 10th houses (dharma and karma houses)
         """
         yogas = []
-        benefics = ["Jupiter", "Venus", "Mercury", "Moon"]
 
         benefic_in_9th = None
         benefic_in_10th = None
 
-        for planet in benefics:
+        for planet in self.NATURAL_BENEFICS_WITH_MOON:
             house = planets.get(planet, {}).get("house", 0)
             if house == 9:
                 benefic_in_9th = planet
@@ -2842,6 +2974,9 @@ class ExtendedYogaService:
 
         return yogas
 
+    # Wealth houses of Dhana yoga
+    DHANA_HOUSES = (2, 5, 9, 11)
+
     def _detect_dhana_yoga(self, planets: Dict) -> List[Dict]:
         """
         Dhana Yoga (Wealth Yoga): Simplified version
@@ -2849,13 +2984,11 @@ class ExtendedYogaService:
         Simplified: Benefics in wealth houses (2, 5, 9, 11)
         """
         yogas = []
-        wealth_houses = [2, 5, 9, 11]
-        benefics = ["Jupiter", "Venus", "Mercury"]
 
         benefics_in_wealth_houses = []
-        for planet in benefics:
+        for planet in self.NATURAL_BENEFICS:
             house = planets.get(planet, {}).get("house", 0)
-            if house in wealth_houses:
+            if house in self.DHANA_HOUSES:
                 benefics_in_wealth_houses.append((planet, house))
 
         # Dhana Yoga forms when 2+ benefics are in wealth houses
@@ -2928,18 +3061,16 @@ class ExtendedYogaService:
         venus_sign = planets.get("Venus", {}).get("sign_num", 0)
         mercury_sign = planets.get("Mercury", {}).get("sign_num", 0)
 
-        kendra_trikona = [1, 4, 5, 7, 9, 10]
-
         # Check if all three benefics are strong
-        jupiter_strong = (jupiter_house in kendra_trikona or
+        jupiter_strong = (jupiter_house in self.KENDRA_TRIKONA_HOUSES or
                          jupiter_sign == self.EXALTATION_SIGNS.get("Jupiter") or
                          jupiter_sign in self.OWN_SIGNS.get("Jupiter", []))
 
-        venus_strong = (venus_house in kendra_trikona or
+        venus_strong = (venus_house in self.KENDRA_TRIKONA_HOUSES or
                        venus_sign == self.EXALTATION_SIGNS.get("Venus") or
                        venus_sign in self.OWN_SIGNS.get("Venus", []))
 
-        mercury_strong = (mercury_house in kendra_trikona or
+        mercury_strong = (mercury_house in self.KENDRA_TRIKONA_HOUSES or
                          mercury_sign == self.EXALTATION_SIGNS.get("Mercury") or
                          mercury_sign in self.OWN_SIGNS.get("Mercury", []))
 
@@ -3341,12 +3472,6 @@ class ExtendedYogaService:
         # Dusthana lords (6, 8, 12 - houses of obstacles, losses, expenses)
         dusthana_lords = [lord_6, lord_8, lord_12]
 
-        # Malefic planets
-        malefics = ["Mars", "Saturn", "Rahu", "Ketu"]
-
-        # Benefic planets
-        benefics = ["Jupiter", "Venus", "Mercury", "Moon"]
-
         # Get planetary data
         lord_1_house = planets.get(lord_1, {}).get("house", 0)
         lord_1_sign = planets.get(lord_1, {}).get("sign_num", 0)
@@ -3435,7 +3560,7 @@ class ExtendedYogaService:
         if lord_1_house in [6, 8, 12]:
             # Check if 1L is with any malefic
             malefic_in_same_house = False
-            for malefic in malefics:
+            for malefic in self.NATURAL_MALEFICS:
                 if malefic != lord_1:  # Don't count if 1L itself is malefic
                     malefic_house = planets.get(malefic, {}).get("house", 0)
                     if malefic_house == lord_1_house:
@@ -3470,7 +3595,7 @@ class ExtendedYogaService:
             if with_dusthana_lord:
                 # Check for benefic aspect (simplified - check if any benefic in kendra from 1L)
                 has_benefic_aspect = False
-                for benefic in benefics:
+                for benefic in self.NATURAL_BENEFICS_WITH_MOON:
                     benefic_house = planets.get(benefic, {}).get("house", 0)
                     if benefic_house > 0:
                         house_diff = abs(benefic_house - lord_1_house)
@@ -3517,7 +3642,7 @@ class ExtendedYogaService:
         beneficial_lords = [lord_9, lord_10]
 
         malefics_in_lagna = []
-        for malefic in malefics:
+        for malefic in self.NATURAL_MALEFICS:
             malefic_house = planets.get(malefic, {}).get("house", 0)
             if malefic_house == 1 and malefic not in beneficial_lords:
                 malefics_in_lagna.append(malefic)
@@ -3569,12 +3694,12 @@ class ExtendedYogaService:
         benefics_in_bad = []
         malefics_in_good = []
 
-        for benefic in benefics:
+        for benefic in self.NATURAL_BENEFICS_WITH_MOON:
             benefic_house = planets.get(benefic, {}).get("house", 0)
             if benefic_house in [6, 8, 12]:
                 benefics_in_bad.append(benefic)
 
-        for malefic in malefics:
+        for malefic in self.NATURAL_MALEFICS:
             malefic_house = planets.get(malefic, {}).get("house", 0)
             if malefic_house in [1, 5, 9]:
                 malefics_in_good.append(malefic)
@@ -3735,6 +3860,10 @@ class ExtendedYogaService:
 
         return yogas
 
+    # Trikonas and kendras as named in the Royal Association yogas
+    ROYAL_TRIKONA_HOUSE_NAMES = MappingProxyType({1: "Lagna", 5: "5th (children/purva punya)", 9: "9th (dharma/fortune)"})
+    ROYAL_KENDRA_HOUSE_NAMES = MappingProxyType({1: "Lagna", 4: "4th (home)", 7: "7th (partnerships)", 10: "10th (career)"})
+
     def _detect_royal_association_yogas(self, planets: Dict) -> List[Dict]:
         """
         Royal Association Yogas (BPHS Ch.40 - IDs 208-223) - 16 variations
@@ -3751,7 +3880,7 @@ class ExtendedYogaService:
 
         # Calculate Charakarakas using Jaimini service
         try:
-            karakas = self.jaimini.calculate_charakarakas(planets)
+            karakas = self._get_karakas(planets)
         except Exception as e:
             # If karaka calculation fails, skip these yogas
             return yogas
@@ -3798,9 +3927,8 @@ class ExtendedYogaService:
             })
 
         # ID 209: Clean 10th & 11th houses (no malefics)
-        malefics = ["Mars", "Saturn", "Rahu", "Ketu"]
-        malefics_in_10 = [p for p in malefics if planets.get(p, {}).get("house", 0) == 10]
-        malefics_in_11 = [p for p in malefics if planets.get(p, {}).get("house", 0) == 11]
+        malefics_in_10 = [p for p in self.NATURAL_MALEFICS if planets.get(p, {}).get("house", 0) == 10]
+        malefics_in_11 = [p for p in self.NATURAL_MALEFICS if planets.get(p, {}).get("house", 0) == 11]
 
         if len(malefics_in_10) == 0 and len(malefics_in_11) == 0:
             yogas.append({
@@ -3830,11 +3958,10 @@ class ExtendedYogaService:
                 })
 
         # ID 211: AK with benefic planets
-        benefics = ["Jupiter", "Venus", "Mercury", "Moon"]
         benefics_with_ak = []
 
         if ak_house > 0:
-            for benefic in benefics:
+            for benefic in self.NATURAL_BENEFICS_WITH_MOON:
                 if benefic != ak_planet:
                     benefic_house = planets.get(benefic, {}).get("house", 0)
                     if benefic_house == ak_house:
@@ -3866,7 +3993,7 @@ class ExtendedYogaService:
 
         # ID 213: AK in trines (1, 5, 9)
         if ak_house in [1, 5, 9]:
-            house_names = {1: "Lagna", 5: "5th (children/purva punya)", 9: "9th (dharma/fortune)"}
+            house_names = self.ROYAL_TRIKONA_HOUSE_NAMES
             yogas.append({
                 "name": "Raja Yoga - Atmakaraka in Trikona",
                 "description": f"Atmakaraka ({ak_planet}) in {house_names[ak_house]} - soul in dharma houses, righteous path, spiritual growth leads to material success",
@@ -3879,7 +4006,7 @@ class ExtendedYogaService:
 
         # ID 214: AK in kendras (1, 4, 7, 10)
         if ak_house in [1, 4, 7, 10]:
-            house_names = {1: "Lagna", 4: "4th (home)", 7: "7th (partnerships)", 10: "10th (career)"}
+            house_names = self.ROYAL_KENDRA_HOUSE_NAMES
             yogas.append({
                 "name": "Raja Yoga - Atmakaraka in Kendra",
                 "description": f"Atmakaraka ({ak_planet}) in {house_names[ak_house]} - strong self-expression, angular power, ability to manifest soul's purpose in world",
@@ -3892,7 +4019,7 @@ class ExtendedYogaService:
 
         # ID 215: AmK in kendras
         if amk_house in [1, 4, 7, 10]:
-            house_names = {1: "Lagna", 4: "4th (home)", 7: "7th (partnerships)", 10: "10th (career)"}
+            house_names = self.ROYAL_KENDRA_HOUSE_NAMES
             yogas.append({
                 "name": "Raja Yoga - Amatyakaraka in Kendra",
                 "description": f"Amatyakaraka ({amk_planet}) in {house_names[amk_house]} - career success through angular strength, professional prominence, leadership positions",
@@ -4024,25 +4151,7 @@ class ExtendedYogaService:
         """
         # Calculate which sign rules the house
         # House 1 = Ascendant sign, House 2 = next sign, etc.
-        house_sign = (asc_sign + house_num - 1) % 12
-
-        # Sign lordships (0-indexed: 0=Aries, 11=Pisces)
-        sign_lords = {
-            0: "Mars",      # Aries
-            1: "Venus",     # Taurus
-            2: "Mercury",   # Gemini
-            3: "Moon",      # Cancer
-            4: "Sun",       # Leo
-            5: "Mercury",   # Virgo
-            6: "Venus",     # Libra
-            7: "Mars",      # Scorpio
-            8: "Jupiter",   # Sagittarius
-            9: "Saturn",    # Capricorn
-            10: "Saturn",   # Aquarius
-            11: "Jupiter"   # Pisces
-        }
-
-        return sign_lords.get(house_sign, "Unknown")
+        return SIGN_LORDS[(asc_sign + house_num - 1) % 12 + 1]
 
     def _get_sign_lord(self, sign_num: int) -> str:
         """
@@ -4054,22 +4163,9 @@ class ExtendedYogaService:
         Returns:
             Planet name that rules the sign
         """
-        sign_lords = {
-            0: "Mars",      # Aries
-            1: "Venus",     # Taurus
-            2: "Mercury",   # Gemini
-            3: "Moon",      # Cancer
-            4: "Sun",       # Leo
-            5: "Mercury",   # Virgo
-            6: "Venus",     # Libra
-            7: "Mars",      # Scorpio
-            8: "Jupiter",   # Sagittarius
-            9: "Saturn",    # Capricorn
-            10: "Saturn",   # Aquarius
-            11: "Jupiter"   # Pisces
-        }
-
-        return sign_lords.get(sign_num, "Unknown")
+        if 0 <= sign_num <= 11:
+            return SIGN_LORDS[sign_num + 1]
+        return "Unknown"
 
     def _calculate_ascendant_sign(self, planets: Dict) -> Optional[int]:
         """
@@ -4081,6 +4177,9 @@ class ExtendedYogaService:
         Returns:
             Ascendant sign number (0-indexed: 0=Aries, 11=Pisces) or None if cannot determine
         """
+        if isinstance(planets, ChartFacts):
+            return planets.ascendant_index
+
         # Strategy 1: Try to find ascendant directly in planet data
         # Some chart calculations include "Ascendant" as a key
         if "Ascendant" in planets:
@@ -4177,45 +4276,12 @@ class ExtendedYogaService:
         if lord1_house == 0 or lord2_house == 0:
             return False
 
-        # Helper function to check if planet aspects a house
-        def planet_aspects_house(planet: str, from_house: int, to_house: int) -> bool:
-            """
-            Check if planet aspects a house (BPHS-compliant Vedic aspects)
-
-            All planets: 7th house (opposition)
-            Mars: 4th, 7th, 8th houses
-            Jupiter: 5th, 7th, 9th houses
-            Saturn: 3rd, 7th, 10th houses
-
-            CRITICAL FIX: Uses _wrap_1_to_12 for proper zodiacal distance
-            """
-            # Calculate house distance using zodiacal wrapping (1-12 range)
-            distance = self._wrap_1_to_12(to_house - from_house + 1)
-
-            if distance == 1:  # Same house, not an aspect
-                return False
-
-            # All planets aspect 7th house (FIXED: was 6, now 7)
-            if distance == 7:
-                return True
-
-            # Mars special aspects: 4th, 8th (FIXED: was [3,7], now [4,8])
-            if planet == "Mars" and distance in [4, 8]:
-                return True
-
-            # Jupiter special aspects: 5th, 9th (CORRECT)
-            if planet == "Jupiter" and distance in [5, 9]:
-                return True
-
-            # Saturn special aspects: 3rd, 10th (FIXED: was [2,9], now [3,10])
-            if planet == "Saturn" and distance in [3, 10]:
-                return True
-
-            return False
-
         # Check if lord1 aspects lord2's house AND lord2 aspects lord1's house
-        lord1_aspects_lord2 = planet_aspects_house(lord1, lord1_house, lord2_house)
-        lord2_aspects_lord1 = planet_aspects_house(lord2, lord2_house, lord1_house)
+        if isinstance(planets, ChartFacts):
+            return planets.aspects(lord1, lord2_house) and planets.aspects(lord2, lord1_house)
+
+        lord1_aspects_lord2 = self._planet_aspects_house_simple(lord1, lord1_house, lord2_house)
+        lord2_aspects_lord1 = self._planet_aspects_house_simple(lord2, lord2_house, lord1_house)
 
         return lord1_aspects_lord2 and lord2_aspects_lord1
 
@@ -4275,6 +4341,24 @@ class ExtendedYogaService:
 
         return False
 
+    # The 9 house-lord pairs of the systematic Raj yogas: (house1, house2, description)
+    SYSTEMATIC_RAJ_HOUSE_PAIRS = (
+        # Lagna lord combinations
+        (1, 5, "Lagna Lord with 5th Lord"),
+        (1, 9, "Lagna Lord with 9th Lord"),
+
+        # Kendra lords with Trikona lords
+        (4, 5, "4th Lord with 5th Lord"),
+        (4, 9, "4th Lord with 9th Lord"),
+        (7, 5, "7th Lord with 5th Lord"),
+        (7, 9, "7th Lord with 9th Lord"),
+        (10, 5, "10th Lord with 5th Lord"),
+        (10, 9, "10th Lord with 9th Lord"),
+
+        # Two Trikona lords
+        (5, 9, "5th Lord with 9th Lord"),
+    )
+
     def _detect_systematic_raj_yogas(self, planets: Dict) -> List[Dict]:
         """
         Detect all 67 systematic Raj Yogas based on BPHS house lord combinations
@@ -4319,27 +4403,8 @@ class ExtendedYogaService:
         if asc_sign is None:
             return yogas
 
-        # Define the 9 house-lord pairs for Raj Yoga
-        # Format: (house1, house2, description)
-        house_pairs = [
-            # Lagna lord combinations
-            (1, 5, "Lagna Lord with 5th Lord"),
-            (1, 9, "Lagna Lord with 9th Lord"),
-
-            # Kendra lords with Trikona lords
-            (4, 5, "4th Lord with 5th Lord"),
-            (4, 9, "4th Lord with 9th Lord"),
-            (7, 5, "7th Lord with 5th Lord"),
-            (7, 9, "7th Lord with 9th Lord"),
-            (10, 5, "10th Lord with 5th Lord"),
-            (10, 9, "10th Lord with 9th Lord"),
-
-            # Two Trikona lords
-            (5, 9, "5th Lord with 9th Lord"),
-        ]
-
         # Check each house-lord pair
-        for house1, house2, pair_desc in house_pairs:
+        for house1, house2, pair_desc in self.SYSTEMATIC_RAJ_HOUSE_PAIRS:
             # Get the planetary lords of these houses
             lord1 = self._get_house_lord(house1, asc_sign)
             lord2 = self._get_house_lord(house2, asc_sign)
@@ -4463,6 +4528,13 @@ class ExtendedYogaService:
 
         return yogas
 
+    # Houses from the Lagna lord's sign that support it
+    BENEFIC_SUPPORT_POSITIONS = MappingProxyType({
+        2: "2nd from Lagna lord's sign",
+        4: "4th from Lagna lord's sign",
+        5: "5th from Lagna lord's sign"
+    })
+
     def _detect_benefic_support_yogas(self, planets: Dict) -> List[Dict]:
         """
         Phase 1.3: Benefic Support Yogas (24 variations)
@@ -4507,18 +4579,8 @@ class ExtendedYogaService:
         # Convert to 0-indexed
         lagna_lord_sign_idx = lagna_lord_sign - 1
 
-        # Define benefics
-        benefics = ["Jupiter", "Venus", "Mercury", "Moon"]
-
-        # Define support positions from Lagna lord's sign (2nd, 4th, 5th)
-        support_positions = {
-            2: "2nd from Lagna lord's sign",
-            4: "4th from Lagna lord's sign",
-            5: "5th from Lagna lord's sign"
-        }
-
         # Check each benefic
-        for benefic in benefics:
+        for benefic in self.NATURAL_BENEFICS_WITH_MOON:
             if benefic not in planets:
                 continue
 
@@ -4535,7 +4597,7 @@ class ExtendedYogaService:
             # Check if in support position (2nd, 4th, 5th from Lagna lord's sign)
             if sign_distance in [1, 3, 4]:  # 0-indexed: 1=2nd, 3=4th, 4=5th
                 position_num = sign_distance + 1
-                position_desc = support_positions.get(position_num, f"{position_num}th")
+                position_desc = self.BENEFIC_SUPPORT_POSITIONS.get(position_num, f"{position_num}th")
 
                 # Additional check for Moon - prefer waxing
                 if benefic == "Moon":
@@ -4559,15 +4621,23 @@ class ExtendedYogaService:
 
         return yogas
 
+    # What each benefic contributes
+    BENEFIC_QUALITIES = MappingProxyType({
+        "Jupiter": "wisdom, expansion, and fortune",
+        "Venus": "comfort, arts, and relationships",
+        "Mercury": "intelligence, communication, and skills",
+        "Moon": "emotional support and public favor"
+    })
+
     def _get_benefic_quality(self, planet: str) -> str:
         """Get the quality/domain each benefic supports"""
-        qualities = {
-            "Jupiter": "wisdom, expansion, and fortune",
-            "Venus": "comfort, arts, and relationships",
-            "Mercury": "intelligence, communication, and skills",
-            "Moon": "emotional support and public favor"
-        }
-        return qualities.get(planet, "positive influences")
+        return self.BENEFIC_QUALITIES.get(planet, "positive influences")
+
+    # Upachaya houses from the Lagna lord's sign
+    VALOR_POSITIONS = MappingProxyType({
+        3: "3rd from Lagna lord's sign (courage)",
+        6: "6th from Lagna lord's sign (victory over enemies)"
+    })
 
     def _detect_valor_yogas(self, planets: Dict) -> List[Dict]:
         """
@@ -4603,17 +4673,8 @@ class ExtendedYogaService:
         # Convert to 0-indexed
         lagna_lord_sign_idx = lagna_lord_sign - 1
 
-        # Define malefics
-        malefics = ["Sun", "Mars", "Saturn"]
-
-        # Define upachaya positions (3rd, 6th from Lagna lord's sign)
-        upachaya_positions = {
-            3: "3rd from Lagna lord's sign (courage)",
-            6: "6th from Lagna lord's sign (victory over enemies)"
-        }
-
         # Check each malefic
-        for malefic in malefics:
+        for malefic in self.KROORA_GRAHAS:
             if malefic not in planets:
                 continue
 
@@ -4630,7 +4691,7 @@ class ExtendedYogaService:
             # Check if in upachaya position (3rd, 6th from Lagna lord's sign)
             if sign_distance in [2, 5]:  # 0-indexed: 2=3rd, 5=6th
                 position_num = sign_distance + 1
-                position_desc = upachaya_positions.get(position_num, f"{position_num}th")
+                position_desc = self.VALOR_POSITIONS.get(position_num, f"{position_num}th")
 
                 # Check if malefic is strong
                 is_strong = self._check_lord_strength(malefic, planets, "strong")
@@ -4649,14 +4710,24 @@ class ExtendedYogaService:
 
         return yogas
 
+    # What each malefic contributes
+    MALEFIC_QUALITIES = MappingProxyType({
+        "Sun": "authority and leadership",
+        "Mars": "courage and competitive strength",
+        "Saturn": "discipline and perseverance"
+    })
+
     def _get_malefic_quality(self, planet: str) -> str:
         """Get the quality/domain each malefic provides"""
-        qualities = {
-            "Sun": "authority and leadership",
-            "Mars": "courage and competitive strength",
-            "Saturn": "discipline and perseverance"
-        }
-        return qualities.get(planet, "strength through challenges")
+        return self.MALEFIC_QUALITIES.get(planet, "strength through challenges")
+
+    # Benefic -> (exaltation sign, sign name, quality)
+    EXALTED_2ND_BENEFICS = MappingProxyType({
+        "Jupiter": (4, "Cancer", "wisdom in wealth, expansive financial growth"),
+        "Venus": (12, "Pisces", "luxurious lifestyle, artistic income"),
+        "Mercury": (6, "Virgo", "intellectual earnings, business acumen"),
+        "Moon": (2, "Taurus", "emotional security through wealth, stable finances")
+    })
 
     def _detect_exalted_benefic_2nd_yogas(self, planets: Dict) -> List[Dict]:
         """
@@ -4678,14 +4749,7 @@ class ExtendedYogaService:
         """
         yogas = []
 
-        benefics = {
-            "Jupiter": (4, "Cancer", "wisdom in wealth, expansive financial growth"),
-            "Venus": (12, "Pisces", "luxurious lifestyle, artistic income"),
-            "Mercury": (6, "Virgo", "intellectual earnings, business acumen"),
-            "Moon": (2, "Taurus", "emotional security through wealth, stable finances")
-        }
-
-        for benefic, (exalt_sign, exalt_sign_name, quality) in benefics.items():
+        for benefic, (exalt_sign, exalt_sign_name, quality) in self.EXALTED_2ND_BENEFICS.items():
             if benefic not in planets:
                 continue
 
@@ -4726,56 +4790,8 @@ class ExtendedYogaService:
 
         Condition: Lagna lord must be strong (own/exalted) for the yoga to manifest
         """
-        yogas = []
-
-        # Get ascendant sign
-        asc_sign = self._calculate_ascendant_sign(planets)
-        if asc_sign is None:
-            return yogas
-
-        # Get Lagna lord and check strength
-        lagna_lord = self._get_house_lord(1, asc_sign)
-        if lagna_lord not in planets:
-            return yogas
-
-        # Lagna lord must be strong for this yoga to work
-        if not self._check_lord_strength(lagna_lord, planets, "strong"):
-            return yogas  # Skip if Lagna lord is weak
-
-        # Define all 7 classical planets (excluding Rahu/Ketu)
-        classical_planets = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
-
-        # Dusthana/Upachaya houses where debilitation can be beneficial
-        beneficial_dusthana = {
-            3: "3rd house (courage through struggle)",
-            6: "6th house (victory over enemies)",
-            8: "8th house (transformation through crisis)",
-            12: "12th house (spiritual liberation)"
-        }
-
-        # Check each planet
-        for planet in classical_planets:
-            if planet not in planets:
-                continue
-
-            planet_data = planets[planet]
-            planet_house = planet_data.get("house", 0)
-            is_debilitated = planet_data.get("debilitated", False)
-
-            # Check if planet is debilitated AND in beneficial dusthana
-            if is_debilitated and planet_house in beneficial_dusthana:
-                house_desc = beneficial_dusthana[planet_house]
-
-                yogas.append({
-                    "name": f"Viparita-like Support: Debilitated {planet} in {planet_house}th",
-                    "description": f"{planet} debilitated in {house_desc} with strong Lagna lord ({lagna_lord}) - weakness transforms to strength, success through overcoming obstacles",
-                    "strength": "Medium",
-                    "category": "Raj Yoga Support",
-                    "yoga_forming_planets": [planet, lagna_lord],
-                    "formation": f"Debilitated {planet} in {planet_house}th, supported by strong {lagna_lord}"
-                })
-
-        return yogas
+        # Declarative rules (data/yoga_rules.json), evaluated once per chart
+        return self._rule_yogas("viparita_like_support", planets)
 
     def _detect_karma_raj_yoga(self, planets: Dict) -> List[Dict]:
         """
@@ -4836,14 +4852,10 @@ class ExtendedYogaService:
         """
         yogas = []
 
-        # Define benefics
-        benefics = {"Jupiter", "Venus", "Mercury", "Moon"}
-
         # Get planets in kendras
-        kendras = [1, 4, 7, 10]
         kendra_planets = {}
 
-        for house in kendras:
+        for house in self.KENDRA_HOUSES:
             kendra_planets[house] = []
 
         # Collect planets in kendras
@@ -4851,11 +4863,11 @@ class ExtendedYogaService:
             if planet_name in ["Rahu", "Ketu", "Ascendant"]:
                 continue
             house = planet_data.get("house", 0)
-            if house in kendras:
+            if house in self.KENDRA_HOUSES:
                 kendra_planets[house].append(planet_name)
 
         # Check if any kendra is occupied
-        occupied_kendras = [h for h in kendras if kendra_planets[h]]
+        occupied_kendras = [h for h in self.KENDRA_HOUSES if kendra_planets[h]]
         if not occupied_kendras:
             return yogas
 
@@ -4863,7 +4875,7 @@ class ExtendedYogaService:
         all_benefic = True
         for house in occupied_kendras:
             for planet in kendra_planets[house]:
-                if planet not in benefics:
+                if planet not in self.NATURAL_BENEFICS_WITH_MOON:
                     all_benefic = False
                     break
             if not all_benefic:
@@ -4945,6 +4957,13 @@ class ExtendedYogaService:
 
         return yogas
 
+    # Significations of the dusthanas
+    DUSTHANA_MEANINGS = MappingProxyType({
+        6: "debts, diseases, and enemies",
+        8: "sudden losses, obstacles, and transformations",
+        12: "expenses, losses, and foreign matters"
+    })
+
     def _detect_daridra_yoga(self, planets: Dict) -> List[Dict]:
         """
         Daridra Yoga (Poverty Yoga): According to BPHS
@@ -4973,18 +4992,10 @@ class ExtendedYogaService:
         eleventh_lord_data = planets.get(lord_of_11th, {})
         eleventh_lord_house = eleventh_lord_data.get("house", 0)
 
-        # Dusthana houses (6th, 8th, 12th)
-        dusthana_houses = [6, 8, 12]
-
         # Check if 11th lord is in dusthana
-        if eleventh_lord_house in dusthana_houses:
-            dusthana_meanings = {
-                6: "debts, diseases, and enemies",
-                8: "sudden losses, obstacles, and transformations",
-                12: "expenses, losses, and foreign matters"
-            }
+        if eleventh_lord_house in self.DUSTHANA_HOUSES:
 
-            meaning = dusthana_meanings.get(eleventh_lord_house, "difficulties")
+            meaning = self.DUSTHANA_MEANINGS.get(eleventh_lord_house, "difficulties")
 
             yogas.append({
                 "name": "Daridra Yoga",
@@ -5196,10 +5207,9 @@ class ExtendedYogaService:
 
         # Count malefics in good houses (kendra + trikona)
         malefics_in_good = []
-        good_houses = [1, 4, 5, 7, 9, 10]
         for planet in malefics:
             planet_house = planets.get(planet, {}).get("house", 0)
-            if planet_house in good_houses:
+            if planet_house in self.KENDRA_TRIKONA_HOUSES:
                 malefics_in_good.append((planet, planet_house))
 
         # Check if majority of benefics in dusthana AND majority of malefics in good houses
@@ -5255,7 +5265,7 @@ class ExtendedYogaService:
 
         # Get Jaimini Karakas (requires calculation)
         try:
-            karakas = self.jaimini.calculate_charakarakas(planets)
+            karakas = self._get_karakas(planets)
         except Exception:
             # If Jaimini calculation fails, skip these yogas
             return yogas
@@ -5451,7 +5461,7 @@ class ExtendedYogaService:
 
         # Get Jaimini Karakas
         try:
-            karakas = self.jaimini.calculate_charakarakas(planets)
+            karakas = self._get_karakas(planets)
         except Exception:
             return yogas
 
@@ -5486,8 +5496,7 @@ class ExtendedYogaService:
             })
 
         # Yoga 2: AK aspected by malefics in dusthana
-        dusthana = [6, 8, 12]
-        if ak_house in dusthana:
+        if ak_house in self.DUSTHANA_HOUSES:
             # Check for malefic aspects (simplified - Saturn, Mars, Rahu, Ketu aspects)
             malefics_aspecting = []
             for malefic in ["Mars", "Saturn", "Rahu", "Ketu"]:
@@ -5515,6 +5524,9 @@ class ExtendedYogaService:
 
         return yogas
 
+    # Houses critical for children's health
+    BALARISHTA_HOUSES = (1, 4, 8)
+
     def _detect_balarishta_yoga(self, planets: Dict) -> List[Dict]:
         """
         Balarishta Yoga: Indicators of childhood health challenges
@@ -5536,11 +5548,10 @@ class ExtendedYogaService:
                 malefics_with_moon.append(planet)
 
         # Check malefics in critical houses for children
-        critical_houses = [1, 4, 8]
         malefics_in_critical = []
         for planet in ["Mars", "Saturn"]:
             house = planets.get(planet, {}).get("house", 0)
-            if house in critical_houses:
+            if house in self.BALARISHTA_HOUSES:
                 malefics_in_critical.append(f"{planet} in {house}th")
 
         if (moon_debilitated and malefics_with_moon) or len(malefics_in_critical) >= 2:
@@ -5556,19 +5567,20 @@ class ExtendedYogaService:
 
         return yogas
 
+    # Malefics of Kroora yoga, in reporting order
+    KROORA_YOGA_MALEFICS = ("Mars", "Saturn", "Sun")
+
     def _detect_kroora_yoga(self, planets: Dict) -> List[Dict]:
         """
         Kroora Yoga (Cruel Yoga): Multiple malefics in kendras without benefic aspects
         Indicates harsh personality, aggressive nature, but also strength and courage
         """
         yogas = []
-        kendras = [1, 4, 7, 10]
-        malefics = ["Mars", "Saturn", "Sun"]
 
         malefics_in_kendra = []
-        for planet in malefics:
+        for planet in self.KROORA_YOGA_MALEFICS:
             house = planets.get(planet, {}).get("house", 0)
-            if house in kendras:
+            if house in self.KENDRA_HOUSES:
                 malefics_in_kendra.append((planet, house))
 
         # Kroora Yoga forms when 2+ malefics in kendras
@@ -5577,7 +5589,7 @@ class ExtendedYogaService:
 
             # Check if mitigated by Jupiter's aspect or presence
             jupiter_house = planets.get("Jupiter", {}).get("house", 0)
-            mitigated = jupiter_house in kendras
+            mitigated = jupiter_house in self.KENDRA_HOUSES
 
             if mitigated:
                 desc = f"Malefics in kendras ({', '.join(planet_houses)}) but mitigated by Jupiter - strong personality, determination, leadership through firm approach, courage"
@@ -5605,18 +5617,14 @@ class ExtendedYogaService:
         """
         yogas = []
 
-        main_planets = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
-        benefics = ["Jupiter", "Venus", "Mercury", "Moon"]
-        malefics = ["Sun", "Mars", "Saturn"]
+        main_planets = SEVEN_PLANETS
 
-        benefic_houses = [planets.get(p, {}).get("house", 0) for p in benefics if planets.get(p, {}).get("house", 0)]
-        malefic_houses = [planets.get(p, {}).get("house", 0) for p in malefics if planets.get(p, {}).get("house", 0)]
-
-        upachaya_houses = [3, 6, 10, 11]
+        benefic_houses = [planets.get(p, {}).get("house", 0) for p in self.NATURAL_BENEFICS_WITH_MOON if planets.get(p, {}).get("house", 0)]
+        malefic_houses = [planets.get(p, {}).get("house", 0) for p in self.KROORA_GRAHAS if planets.get(p, {}).get("house", 0)]
 
         # 1. Vallaki Yoga - Benefics in upachayas, malefics elsewhere
-        benefics_in_upachaya = sum(1 for h in benefic_houses if h in upachaya_houses)
-        malefics_in_upachaya = sum(1 for h in malefic_houses if h in upachaya_houses)
+        benefics_in_upachaya = sum(1 for h in benefic_houses if h in self.UPACHAYA_HOUSES)
+        malefics_in_upachaya = sum(1 for h in malefic_houses if h in self.UPACHAYA_HOUSES)
 
         if benefics_in_upachaya >= 3 and malefics_in_upachaya == 0:
             yogas.append({
@@ -5643,7 +5651,7 @@ class ExtendedYogaService:
             })
 
         # 3. Paasha Yoga - All malefics in upachayas (3,6,10,11)
-        if len(malefic_houses) >= 2 and all(h in upachaya_houses for h in malefic_houses):
+        if len(malefic_houses) >= 2 and all(h in self.UPACHAYA_HOUSES for h in malefic_houses):
             yogas.append({
                 "name": "Paasha Yoga",
                 "description": "All malefics in upachayas (3,6,10,11) - Noose/bondage pattern, imprisonment risk, restricted freedom",
@@ -5732,11 +5740,9 @@ class ExtendedYogaService:
         ketu_house = planets.get("Ketu", {}).get("house", 0)
         sun_house = planets.get("Sun", {}).get("house", 0)
 
-        kendra_houses = [1, 4, 7, 10]
-
         # Count planets in each house for conjunction detection
         house_planet_count = {}
-        main_planets = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
+        main_planets = SEVEN_PLANETS
         for planet in main_planets:
             house = planets.get(planet, {}).get("house", 0)
             if house:
@@ -5797,7 +5803,7 @@ class ExtendedYogaService:
                     })
 
         # 4. Markandeya Sanyas Yoga - Jupiter and Saturn in kendras, Moon in 9th or 10th
-        if jupiter_house in kendra_houses and saturn_house in kendra_houses:
+        if jupiter_house in self.KENDRA_HOUSES and saturn_house in self.KENDRA_HOUSES:
             if moon_house in [9, 10]:
                 yogas.append({
                     "name": "Markandeya Sanyas Yoga",
@@ -5869,11 +5875,312 @@ class ExtendedYogaService:
                         "bphs_category": "Non-BPHS (Practical)",
                         "bphs_section": "Modern/Practical Addition",
                         "bphs_ref": "Not in BPHS spec",
-                "yoga_forming_planets": [p for p in main_planets + ["Ketu"] if planets.get(p, {}).get("house", 0) == 10]
+                "yoga_forming_planets": [p for p in main_planets + ("Ketu",) if planets.get(p, {}).get("house", 0) == 10]
             })
 
         return yogas
 
+    # The 27 Nitya yogas in order of Sun-Moon distance
+    NITYA_YOGAS = tuple(MappingProxyType(nitya) for nitya in (
+        {
+            "name": "Vishkambha Yoga",
+            "range": "0° - 13°20'",
+            "effects": "Determination, ability to overcome obstacles, research aptitude, can be stubborn",
+            "nature": "Mixed",
+            "deity": "Yama (God of Death)",
+            "strength": "Medium",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Priti Yoga",
+            "range": "13°20' - 26°40'",
+            "effects": "Friendly nature, popularity, good relationships, pleasant personality, social success",
+            "nature": "Auspicious",
+            "deity": "Vishnu (Preserver)",
+            "strength": "Strong",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Ayushman Yoga",
+            "range": "26°40' - 40°",
+            "effects": "Longevity, good health, vitality, blessed with long life and prosperity",
+            "nature": "Auspicious",
+            "deity": "Chandra (Moon)",
+            "strength": "Strong",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Saubhagya Yoga",
+            "range": "40° - 53°20'",
+            "effects": "Fortune, happiness, blessed life, marital bliss, overall well-being",
+            "nature": "Auspicious",
+            "deity": "Brahma (Creator)",
+            "strength": "Strong",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Shobhana Yoga",
+            "range": "53°20' - 66°40'",
+            "effects": "Attractiveness, beauty, charm, artistic talents, refined tastes",
+            "nature": "Auspicious",
+            "deity": "Brihaspati (Jupiter)",
+            "strength": "Strong",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Atiganda Yoga",
+            "range": "66°40' - 80°",
+            "effects": "Obstacles, conflicts, aggressive nature, challenges in relationships",
+            "nature": "Inauspicious",
+            "deity": "Agni (Fire)",
+            "strength": "Medium",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Sukarma Yoga",
+            "range": "80° - 93°20'",
+            "effects": "Good deeds, virtuous nature, ethical conduct, success through right action",
+            "nature": "Auspicious",
+            "deity": "Indra (King of Gods)",
+            "strength": "Strong",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Dhriti Yoga",
+            "range": "93°20' - 106°40'",
+            "effects": "Patience, perseverance, determination, ability to sustain efforts, steady progress",
+            "nature": "Auspicious",
+            "deity": "Jala (Water)",
+            "strength": "Medium",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Shoola Yoga",
+            "range": "106°40' - 120°",
+            "effects": "Sharp mind, critical nature, pain/suffering, can be harsh or piercing in speech",
+            "nature": "Inauspicious",
+            "deity": "Sarpa (Serpent)",
+            "strength": "Medium",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Ganda Yoga",
+            "range": "120° - 133°20'",
+            "effects": "Obstacles, difficulties, prone to accidents, need for caution in undertakings",
+            "nature": "Inauspicious",
+            "deity": "Agni (Fire)",
+            "strength": "Medium",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Vriddhi Yoga",
+            "range": "133°20' - 146°40'",
+            "effects": "Growth, expansion, prosperity, accumulation of wealth, business success",
+            "nature": "Auspicious",
+            "deity": "Vishnu (Preserver)",
+            "strength": "Strong",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Dhruva Yoga",
+            "range": "146°40' - 160°",
+            "effects": "Stability, permanence, fixed determination, long-lasting results, reliability",
+            "nature": "Auspicious",
+            "deity": "Bhumi (Earth)",
+            "strength": "Strong",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Vyaghata Yoga",
+            "range": "160° - 173°20'",
+            "effects": "Violence, conflicts, accidents, sudden events, aggressive tendencies",
+            "nature": "Inauspicious",
+            "deity": "Vayu (Wind)",
+            "strength": "Medium",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Harshana Yoga",
+            "range": "173°20' - 186°40'",
+            "effects": "Joy, cheerfulness, optimism, brings happiness to self and others, uplifting nature",
+            "nature": "Auspicious",
+            "deity": "Bhaga (Fortune)",
+            "strength": "Strong",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Vajra Yoga",
+            "range": "186°40' - 200°",
+            "effects": "Diamond-like strength, invincibility, powerful personality, strong constitution",
+            "nature": "Auspicious",
+            "deity": "Indra (King of Gods)",
+            "strength": "Strong",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Siddhi Yoga",
+            "range": "200° - 213°20'",
+            "effects": "Spiritual attainment, success in endeavors, accomplishment of goals, mastery",
+            "nature": "Auspicious",
+            "deity": "Ganesha (Remover of Obstacles)",
+            "strength": "Very Strong",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Vyatipata Yoga",
+            "range": "213°20' - 226°40'",
+            "effects": "Calamities, misfortunes, sudden reversals, need for careful planning",
+            "nature": "Inauspicious",
+            "deity": "Rudra (Destroyer)",
+            "strength": "Medium",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Variyan Yoga",
+            "range": "226°40' - 240°",
+            "effects": "Nobility, generosity, charitable nature, respected in society, humanitarian",
+            "nature": "Auspicious",
+            "deity": "Varuna (Water God)",
+            "strength": "Strong",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Parigha Yoga",
+            "range": "240° - 253°20'",
+            "effects": "Obstacles, confinement, restrictions, delays in achievements, perseverance needed",
+            "nature": "Inauspicious",
+            "deity": "Tvashta (Celestial Architect)",
+            "strength": "Medium",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Shiva Yoga",
+            "range": "253°20' - 266°40'",
+            "effects": "Auspiciousness, spiritual inclination, blessings of Lord Shiva, transformation",
+            "nature": "Auspicious",
+            "deity": "Shiva (Transformer)",
+            "strength": "Very Strong",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Siddha Yoga",
+            "range": "266°40' - 280°",
+            "effects": "Perfection, accomplishment, spiritual realization, mastery in chosen field",
+            "nature": "Auspicious",
+            "deity": "Kartikeya (Warrior God)",
+            "strength": "Very Strong",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Sadhya Yoga",
+            "range": "280° - 293°20'",
+            "effects": "Achievable goals, practical success, manifestation of desires, diligence",
+            "nature": "Auspicious",
+            "deity": "Savita (Solar Deity)",
+            "strength": "Strong",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Shubha Yoga",
+            "range": "293°20' - 306°40'",
+            "effects": "Auspiciousness, good fortune, pleasant life, beneficial results, positive outlook",
+            "nature": "Auspicious",
+            "deity": "Lakshmi (Goddess of Wealth)",
+            "strength": "Strong",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Shukla Yoga",
+            "range": "306°40' - 320°",
+            "effects": "Purity, righteousness, moral character, clean intentions, virtuous living",
+            "nature": "Auspicious",
+            "deity": "Parvati (Divine Mother)",
+            "strength": "Strong",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Brahma Yoga",
+            "range": "320° - 333°20'",
+            "effects": "Spiritual knowledge, wisdom, scholarly pursuits, connection with divine, vedic learning",
+            "nature": "Auspicious",
+            "deity": "Brahma (Creator)",
+            "strength": "Very Strong",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Indra Yoga",
+            "range": "333°20' - 346°40'",
+            "effects": "Leadership, authority, royal qualities, command over others, administrative skills",
+            "nature": "Auspicious",
+            "deity": "Indra (King of Gods)",
+            "strength": "Very Strong",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        },
+        {
+            "name": "Vaidhriti Yoga",
+            "range": "346°40' - 360°",
+            "effects": "Obstacles, opposition, reversals, need for patience, challenges in sustaining efforts",
+            "nature": "Inauspicious",
+            "deity": "Pitris (Ancestors)",
+            "strength": "Medium",
+            "bphs_category": "Non-BPHS (Practical)",
+            "bphs_section": "Modern/Practical Addition",
+            "bphs_ref": "Not in BPHS spec"
+        }
+    ))
+
     def _detect_nitya_yogas(self, planets: Dict) -> List[Dict]:
         """
         27 Nitya Yogas (Birth Yogas) - Based on Sun-Moon longitudinal distance
@@ -5902,310 +6209,9 @@ class ExtendedYogaService:
         # Determine which of the 27 Nitya Yogas is formed
         nitya_index = int(distance / nitya_span)
 
-        # Define all 27 Nitya Yogas with their effects
-        nitya_yogas_data = [
-            {
-                "name": "Vishkambha Yoga",
-                "range": "0° - 13°20'",
-                "effects": "Determination, ability to overcome obstacles, research aptitude, can be stubborn",
-                "nature": "Mixed",
-                "deity": "Yama (God of Death)",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Priti Yoga",
-                "range": "13°20' - 26°40'",
-                "effects": "Friendly nature, popularity, good relationships, pleasant personality, social success",
-                "nature": "Auspicious",
-                "deity": "Vishnu (Preserver)",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Ayushman Yoga",
-                "range": "26°40' - 40°",
-                "effects": "Longevity, good health, vitality, blessed with long life and prosperity",
-                "nature": "Auspicious",
-                "deity": "Chandra (Moon)",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Saubhagya Yoga",
-                "range": "40° - 53°20'",
-                "effects": "Fortune, happiness, blessed life, marital bliss, overall well-being",
-                "nature": "Auspicious",
-                "deity": "Brahma (Creator)",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Shobhana Yoga",
-                "range": "53°20' - 66°40'",
-                "effects": "Attractiveness, beauty, charm, artistic talents, refined tastes",
-                "nature": "Auspicious",
-                "deity": "Brihaspati (Jupiter)",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Atiganda Yoga",
-                "range": "66°40' - 80°",
-                "effects": "Obstacles, conflicts, aggressive nature, challenges in relationships",
-                "nature": "Inauspicious",
-                "deity": "Agni (Fire)",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Sukarma Yoga",
-                "range": "80° - 93°20'",
-                "effects": "Good deeds, virtuous nature, ethical conduct, success through right action",
-                "nature": "Auspicious",
-                "deity": "Indra (King of Gods)",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Dhriti Yoga",
-                "range": "93°20' - 106°40'",
-                "effects": "Patience, perseverance, determination, ability to sustain efforts, steady progress",
-                "nature": "Auspicious",
-                "deity": "Jala (Water)",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Shoola Yoga",
-                "range": "106°40' - 120°",
-                "effects": "Sharp mind, critical nature, pain/suffering, can be harsh or piercing in speech",
-                "nature": "Inauspicious",
-                "deity": "Sarpa (Serpent)",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Ganda Yoga",
-                "range": "120° - 133°20'",
-                "effects": "Obstacles, difficulties, prone to accidents, need for caution in undertakings",
-                "nature": "Inauspicious",
-                "deity": "Agni (Fire)",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Vriddhi Yoga",
-                "range": "133°20' - 146°40'",
-                "effects": "Growth, expansion, prosperity, accumulation of wealth, business success",
-                "nature": "Auspicious",
-                "deity": "Vishnu (Preserver)",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Dhruva Yoga",
-                "range": "146°40' - 160°",
-                "effects": "Stability, permanence, fixed determination, long-lasting results, reliability",
-                "nature": "Auspicious",
-                "deity": "Bhumi (Earth)",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Vyaghata Yoga",
-                "range": "160° - 173°20'",
-                "effects": "Violence, conflicts, accidents, sudden events, aggressive tendencies",
-                "nature": "Inauspicious",
-                "deity": "Vayu (Wind)",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Harshana Yoga",
-                "range": "173°20' - 186°40'",
-                "effects": "Joy, cheerfulness, optimism, brings happiness to self and others, uplifting nature",
-                "nature": "Auspicious",
-                "deity": "Bhaga (Fortune)",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Vajra Yoga",
-                "range": "186°40' - 200°",
-                "effects": "Diamond-like strength, invincibility, powerful personality, strong constitution",
-                "nature": "Auspicious",
-                "deity": "Indra (King of Gods)",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Siddhi Yoga",
-                "range": "200° - 213°20'",
-                "effects": "Spiritual attainment, success in endeavors, accomplishment of goals, mastery",
-                "nature": "Auspicious",
-                "deity": "Ganesha (Remover of Obstacles)",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Vyatipata Yoga",
-                "range": "213°20' - 226°40'",
-                "effects": "Calamities, misfortunes, sudden reversals, need for careful planning",
-                "nature": "Inauspicious",
-                "deity": "Rudra (Destroyer)",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Variyan Yoga",
-                "range": "226°40' - 240°",
-                "effects": "Nobility, generosity, charitable nature, respected in society, humanitarian",
-                "nature": "Auspicious",
-                "deity": "Varuna (Water God)",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Parigha Yoga",
-                "range": "240° - 253°20'",
-                "effects": "Obstacles, confinement, restrictions, delays in achievements, perseverance needed",
-                "nature": "Inauspicious",
-                "deity": "Tvashta (Celestial Architect)",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Shiva Yoga",
-                "range": "253°20' - 266°40'",
-                "effects": "Auspiciousness, spiritual inclination, blessings of Lord Shiva, transformation",
-                "nature": "Auspicious",
-                "deity": "Shiva (Transformer)",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Siddha Yoga",
-                "range": "266°40' - 280°",
-                "effects": "Perfection, accomplishment, spiritual realization, mastery in chosen field",
-                "nature": "Auspicious",
-                "deity": "Kartikeya (Warrior God)",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Sadhya Yoga",
-                "range": "280° - 293°20'",
-                "effects": "Achievable goals, practical success, manifestation of desires, diligence",
-                "nature": "Auspicious",
-                "deity": "Savita (Solar Deity)",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Shubha Yoga",
-                "range": "293°20' - 306°40'",
-                "effects": "Auspiciousness, good fortune, pleasant life, beneficial results, positive outlook",
-                "nature": "Auspicious",
-                "deity": "Lakshmi (Goddess of Wealth)",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Shukla Yoga",
-                "range": "306°40' - 320°",
-                "effects": "Purity, righteousness, moral character, clean intentions, virtuous living",
-                "nature": "Auspicious",
-                "deity": "Parvati (Divine Mother)",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Brahma Yoga",
-                "range": "320° - 333°20'",
-                "effects": "Spiritual knowledge, wisdom, scholarly pursuits, connection with divine, vedic learning",
-                "nature": "Auspicious",
-                "deity": "Brahma (Creator)",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Indra Yoga",
-                "range": "333°20' - 346°40'",
-                "effects": "Leadership, authority, royal qualities, command over others, administrative skills",
-                "nature": "Auspicious",
-                "deity": "Indra (King of Gods)",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            },
-            {
-                "name": "Vaidhriti Yoga",
-                "range": "346°40' - 360°",
-                "effects": "Obstacles, opposition, reversals, need for patience, challenges in sustaining efforts",
-                "nature": "Inauspicious",
-                "deity": "Pitris (Ancestors)",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec"
-            }
-        ]
-
         # Get the detected Nitya Yoga
         if 0 <= nitya_index < 27:
-            nitya_data = nitya_yogas_data[nitya_index]
+            nitya_data = self.NITYA_YOGAS[nitya_index]
 
             # Calculate exact position within the yoga
             yoga_start = nitya_index * nitya_span
@@ -6332,6 +6338,19 @@ class ExtendedYogaService:
 
         return timing_info
 
+    # Keywords in yoga names pointing to their forming planet
+    YOGA_PLANET_KEYWORDS = MappingProxyType({
+        "Sun": ["sun"],
+        "Moon": ["moon", "chandra"],
+        "Mars": ["mars", "mangala", "kuja"],
+        "Mercury": ["mercury", "budha"],
+        "Jupiter": ["jupiter", "guru"],
+        "Venus": ["venus", "shukra"],
+        "Saturn": ["saturn", "shani"],
+        "Rahu": ["rahu"],
+        "Ketu": ["ketu"]
+    })
+
     def _extract_yoga_planets(self, yoga: Dict) -> List[str]:
         """
         Extract the planets forming this yoga from its name/description
@@ -6340,19 +6359,7 @@ class ExtendedYogaService:
         description = yoga.get("description", "").lower()
         name = yoga.get("name", "").lower()
 
-        planet_keywords = {
-            "Sun": ["sun"],
-            "Moon": ["moon", "chandra"],
-            "Mars": ["mars", "mangala", "kuja"],
-            "Mercury": ["mercury", "budha"],
-            "Jupiter": ["jupiter", "guru"],
-            "Venus": ["venus", "shukra"],
-            "Saturn": ["saturn", "shani"],
-            "Rahu": ["rahu"],
-            "Ketu": ["ketu"]
-        }
-
-        for planet, keywords in planet_keywords.items():
+        for planet, keywords in self.YOGA_PLANET_KEYWORDS.items():
             if any(keyword in name or keyword in description for keyword in keywords):
                 planets.append(planet)
 
@@ -6450,6 +6457,9 @@ class ExtendedYogaService:
         Returns:
             Ascendant sign (1-12) or None if not found
         """
+        if isinstance(planets, ChartFacts):
+            return planets.ascendant_sign_num
+
         # Try different keys for ascendant
         for key in ["Ascendant", "Lagna", "ASC"]:
             if key in planets:
@@ -6462,6 +6472,9 @@ class ExtendedYogaService:
 
         return None
 
+    # Houses 1-12
+    HOUSE_NUMBERS = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12)
+
     def _detect_bhava_yogas(self, planets: Dict) -> List[Dict]:
         """
         Detect Bhava Yogas based on house lord placements.
@@ -6503,13 +6516,14 @@ class ExtendedYogaService:
             return yogas
 
         # Get all house lords
-        house_lords = self.get_house_lords_map(ascendant_sign)
+        if isinstance(planets, ChartFacts) and planets.ascendant_index == (ascendant_sign - 1) % 12:
+            house_lords = planets.house_lords
+        else:
+            house_lords = self.get_house_lords_map(ascendant_sign)
 
         # Detect all 12 house lords (complete Bhava Yoga system)
         # All lords are important as each governs specific life areas
-        all_lords = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12]
-
-        for lord_house in all_lords:
+        for lord_house in self.HOUSE_NUMBERS:
             lord_planet = house_lords[lord_house]
             lord_placement = planets.get(lord_planet, {}).get("house", 0)
 
@@ -6544,48 +6558,27 @@ class ExtendedYogaService:
         Returns:
             Yoga dict with name, description, effects, strength, or None
         """
-        # Define house names for readability
-        house_names = {
-            1: "1st (Lagna)", 2: "2nd (Dhana)", 3: "3rd (Sahaja)",
-            4: "4th (Sukha)", 5: "5th (Putra)", 6: "6th (Ripu)",
-            7: "7th (Kalatra)", 8: "8th (Randhra)", 9: "9th (Dharma)",
-            10: "10th (Karma)", 11: "11th (Labha)", 12: "12th (Vyaya)"
-        }
-
-        # Calculate house distance (useful for determining strength)
-        distance_from_lagna = placement
-        is_kendra = placement in [1, 4, 7, 10]
-        is_trikona = placement in [1, 5, 9]
-        is_dusthana = placement in [6, 8, 12]
-        is_upachaya = placement in [3, 6, 10, 11]
-
-        # Determine strength based on placement type
-        if is_kendra and is_trikona:  # 1st house
-            base_strength = "Very Strong"
-        elif is_kendra or is_trikona:
-            base_strength = "Strong"
-        elif is_upachaya:
-            base_strength = "Medium"
-        elif is_dusthana:
-            base_strength = "Weak"
-        else:
-            base_strength = "Medium"
-
         # Get specific effects based on lord_house and placement
         effects_data = self._get_bhava_yoga_effects(lord_house, placement)
 
         if not effects_data:
             return None
 
+        # Without a listed strength: kendra / trikona strong, upachaya medium, dusthana weak
+        if "strength" in effects_data:
+            strength = effects_data["strength"]
+        else:
+            strength = self.BHAVA_PLACEMENT_STRENGTH[placement]
+
         return {
             "name": effects_data["name"],
             "description": effects_data["description"],
-            "strength": effects_data.get("strength", base_strength),
+            "strength": strength,
             "category": "Bhava Yoga (House Lord Placement)",
             "yoga_forming_planets": [planet],
             "formation": f"{lord_house}{self._get_ordinal(lord_house)} lord ({planet}) in {placement}{self._get_ordinal(placement)} house",
             "effects": effects_data["effects"],
-            "life_areas": effects_data.get("life_areas", [])
+            "life_areas": list(effects_data.get("life_areas", ()))
         }
 
     def _get_ordinal(self, n: int) -> str:
@@ -6602,1579 +6595,49 @@ class ExtendedYogaService:
         else:
             return "th"
 
-    def _get_bhava_yoga_effects(self, lord_house: int, placement: int) -> Optional[Dict]:
+    def _get_bhava_yoga_effects(self, lord_house: int, placement: int) -> Optional[Mapping[str, Any]]:
         """
         Get classical effects for house lord placements from BPHS.
 
         This contains the core wisdom of Bhava Yogas - effects when a house lord
-        occupies a specific house.
-
-        Complete implementation (144 Bhava Yogas):
-        - 1st lord placements (12 yogas) - Lagna/Self yogas
-        - 2nd lord placements (12 yogas) - Wealth/Family yogas
-        - 3rd lord placements (12 yogas) - Courage/Skills yogas
-        - 4th lord placements (12 yogas) - Property/Happiness yogas
-        - 5th lord placements (12 yogas) - Intelligence/Children yogas
-        - 6th lord placements (12 yogas) - Service/Health yogas
-        - 7th lord placements (12 yogas) - Partnership/Marriage yogas
-        - 8th lord placements (12 yogas) - Transformation/Occult yogas
-        - 9th lord placements (12 yogas) - Fortune/Dharma yogas
-        - 10th lord placements (12 yogas) - Career/Karma yogas
-        - 11th lord placements (12 yogas) - Gains/Income yogas
-        - 12th lord placements (12 yogas) - Moksha/Foreign yogas
-
-        Total: 144 complete Bhava Yogas (all house lord combinations)
+        occupies a specific house. The 144 combinations (12 lords x 12 houses)
+        live in data/bhava_yoga_effects.json and are loaded once, at import,
+        into BHAVA_YOGA_EFFECTS.
 
         Args:
             lord_house: Which house lord (1-12)
             placement: Where it's placed (1-12)
 
         Returns:
-            Dict with name, description, effects, strength, life_areas
+            Read-only mapping with name, description, effects, strength, life_areas
         """
-        # All Bhava Yoga effects database
-        # Format: bhava_effects[lord_house][placement] = {name, description, effects, strength, life_areas}
-
-        bhava_effects = {}
-
-        # ====================================================================
-        # 1ST LORD (LAGNA LORD) PLACEMENTS - Self, Personality, Life Path
-        # ====================================================================
-        bhava_effects[1] = {
-            1: {
-                "name": "Lagna Adhi Yoga",
-                "description": "1st lord in 1st house - Self-empowered personality",
-                "effects": "Strong personality, good health, magnetic presence, self-confidence, leadership qualities, independent nature, long life",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Personality", "Health", "Self-confidence", "Leadership"]
-            },
-            2: {
-                "name": "Dhana Yoga",
-                "description": "1st lord in 2nd house - Self-earned wealth",
-                "effects": "Wealth through own efforts, eloquent speech, family support, good financial sense, accumulation of resources",
-                "strength": "Strong",
-                "bphs_category": "Major Positive Yogas",
-                "bphs_section": "B) Dhana (Ch.41)",
-                "bphs_ref": "Ch.41",
-                "life_areas": ["Wealth", "Family", "Speech", "Resources"]
-            },
-            3: {
-                "name": "Sahasa Yoga",
-                "description": "1st lord in 3rd house - Courage and skills",
-                "effects": "Courageous nature, younger siblings bring joy, skilled in arts/crafts, short journeys profitable, self-made success",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Courage", "Siblings", "Skills", "Communication"]
-            },
-            4: {
-                "name": "Sukha Yoga",
-                "description": "1st lord in 4th house - Happiness and comfort",
-                "effects": "Property ownership, vehicles, mother's blessings, educational success, domestic happiness, comfortable life",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Property", "Mother", "Education", "Happiness"]
-            },
-            5: {
-                "name": "Putra Yoga",
-                "description": "1st lord in 5th house - Intelligence and progeny",
-                "effects": "High intelligence, blessed with children, creative talents, good speculation, spiritual inclinations, past life merit",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Intelligence", "Children", "Creativity", "Spirituality"]
-            },
-            6: {
-                "name": "Ripu Sthana Yoga",
-                "description": "1st lord in 6th house - Victory over obstacles",
-                "effects": "Health challenges but eventual victory over enemies, success in service/competition, ability to overcome obstacles, may face debts early in life",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Health", "Enemies", "Service", "Competition"]
-            },
-            7: {
-                "name": "Kalatra Yoga",
-                "description": "1st lord in 7th house - Partnership focused",
-                "effects": "Focus on partnerships, spouse plays important role, business success, public relations skills, may travel for work/partnership",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Marriage", "Partnership", "Business", "Travel"]
-            },
-            8: {
-                "name": "Ayu Sthana Yoga",
-                "description": "1st lord in 8th house - Transformation and longevity",
-                "effects": "Interest in occult/mysticism, transformative life experiences, research abilities, inheritance possible, need to guard health",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Longevity", "Occult", "Research", "Transformation"]
-            },
-            9: {
-                "name": "Bhagya Yoga",
-                "description": "1st lord in 9th house - Fortune and blessings",
-                "effects": "Great fortune, father's support, spiritual wisdom, higher education, long journeys bring success, dharmic life, strong moral character",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Fortune", "Father", "Spirituality", "Higher Education"]
-            },
-            10: {
-                "name": "Karma Yoga",
-                "description": "1st lord in 10th house - Career success",
-                "effects": "Outstanding career success, fame, leadership in profession, authority, respect in society, strong work ethic, public recognition",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Career", "Fame", "Leadership", "Authority"]
-            },
-            11: {
-                "name": "Labha Yoga",
-                "description": "1st lord in 11th house - Gains and fulfillment",
-                "effects": "Multiple income sources, fulfillment of desires, large friend circle, elder siblings supportive, gains increase with age",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Gains", "Friends", "Desires", "Income"]
-            },
-            12: {
-                "name": "Vyaya Sthana Yoga",
-                "description": "1st lord in 12th house - Foreign lands and spirituality",
-                "effects": "Foreign residence/travel, spiritual pursuits, expenses on self, isolation for meditation, success in foreign lands, charitable nature",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Foreign Lands", "Spirituality", "Expenses", "Isolation"]
-            }
-        }
-
-        # ====================================================================
-        # 9TH LORD (DHARMA LORD) PLACEMENTS - Fortune, Father, Spirituality
-        # ====================================================================
-        bhava_effects[9] = {
-            1: {
-                "name": "Dharma Lagna Yoga",
-                "description": "9th lord in 1st house - Fortune in personality",
-                "effects": "Fortunate personality, blessed life, dharmic conduct, wise and philosophical, respected for knowledge, father's blessings strong",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Fortune", "Wisdom", "Respect", "Dharma"]
-            },
-            2: {
-                "name": "Dhana Dharma Yoga",
-                "description": "9th lord in 2nd house - Wealth through fortune",
-                "effects": "Wealth from fortune and family, father may help financially, truthful speech brings gains, family traditions important",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Wealth", "Family", "Fortune", "Values"]
-            },
-            3: {
-                "name": "Sahasa Dharma Yoga",
-                "description": "9th lord in 3rd house - Fortune through courage",
-                "effects": "Fortune through self-effort and courage, younger siblings blessed, communication skills lead to success, religious writings possible",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Courage", "Communication", "Self-effort", "Writing"]
-            },
-            4: {
-                "name": "Sukha Dharma Yoga",
-                "description": "9th lord in 4th house - Fortunate domestic life",
-                "effects": "Property through fortune, mother is fortunate, educational opportunities abundant, vehicles and comforts, peaceful home",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Property", "Mother", "Education", "Comfort"]
-            },
-            5: {
-                "name": "Putra Dharma Yoga",
-                "description": "9th lord in 5th house - Highly fortunate yoga",
-                "effects": "Excellent Raj Yoga - blessed children, high intelligence, spiritual wisdom, creative genius, speculation brings gains, mantra siddhi possible",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Children", "Intelligence", "Spirituality", "Creativity"]
-            },
-            6: {
-                "name": "Ripu Dharma Yoga",
-                "description": "9th lord in 6th house - Challenges to fortune",
-                "effects": "Father may have health issues, fortune comes through service/competition, obstacles to higher education initially, victory over enemies through dharma",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Service", "Obstacles", "Father's Health", "Competition"]
-            },
-            7: {
-                "name": "Kalatra Dharma Yoga",
-                "description": "9th lord in 7th house - Fortune through partnerships",
-                "effects": "Fortunate marriage, spouse brings luck, business partnerships blessed, travel for spiritual/business purposes successful",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Marriage", "Partnership", "Fortune", "Travel"]
-            },
-            8: {
-                "name": "Randhra Dharma Yoga",
-                "description": "9th lord in 8th house - Hidden fortune",
-                "effects": "Inheritance possible, sudden gains from fortune, interest in occult/spirituality deepens with age, father's longevity good, research into philosophy",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Inheritance", "Occult", "Research", "Sudden Gains"]
-            },
-            9: {
-                "name": "Dharma Adhi Yoga",
-                "description": "9th lord in 9th house - Maximum fortune",
-                "effects": "Extremely fortunate life, father is prosperous and supportive, higher education abroad possible, spiritual teacher potential, pilgrimage to holy places, dharmic wealth",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Fortune", "Father", "Higher Education", "Spirituality"]
-            },
-            10: {
-                "name": "Karma Dharma Yoga (Dharma-Karmadhipati Yoga)",
-                "description": "9th lord in 10th house - Fortune through career",
-                "effects": "Raj Yoga - career brings fortune, ethical profession, fame through righteous action, father may influence career, respected leader",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Career", "Fortune", "Ethics", "Fame"]
-            },
-            11: {
-                "name": "Labha Dharma Yoga",
-                "description": "9th lord in 11th house - Fortune brings gains",
-                "effects": "Fortunate gains, desires fulfilled easily, elder siblings fortunate, income from multiple sources, fortune increases after marriage",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Gains", "Desires", "Fortune", "Income"]
-            },
-            12: {
-                "name": "Vyaya Dharma Yoga",
-                "description": "9th lord in 12th house - Foreign fortune and moksha",
-                "effects": "Fortune in foreign lands, spiritual expenditures bring merit, pilgrimage expenses, father may reside abroad, moksha yoga - liberation pursuits",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Foreign Lands", "Spirituality", "Pilgrimage", "Liberation"]
-            }
-        }
-
-        # ====================================================================
-        # 10TH LORD (KARMA LORD) PLACEMENTS - Career, Status, Profession
-        # ====================================================================
-        bhava_effects[10] = {
-            1: {
-                "name": "Karma Lagna Yoga",
-                "description": "10th lord in 1st house - Career-focused personality",
-                "effects": "Strong career focus, self-made success, professional reputation excellent, leadership in chosen field, work defines identity",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Career", "Self-made Success", "Leadership", "Identity"]
-            },
-            2: {
-                "name": "Dhana Karma Yoga",
-                "description": "10th lord in 2nd house - Wealth through career",
-                "effects": "Career brings wealth, family profession possible, eloquent professional speaker, financial success through work, reputation for earning ability",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Wealth", "Career", "Family Business", "Speech"]
-            },
-            3: {
-                "name": "Sahasa Karma Yoga",
-                "description": "10th lord in 3rd house - Career through skills",
-                "effects": "Success through skills and communication, media/writing career possible, younger siblings help career, short business trips, courageous professional decisions",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Skills", "Communication", "Media", "Courage"]
-            },
-            4: {
-                "name": "Sukha Karma Yoga",
-                "description": "10th lord in 4th house - Career brings comfort",
-                "effects": "Real estate career possible, mother influences profession, educational institutions, vehicles for work, professional happiness, work from home success",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Real Estate", "Education", "Mother's Influence", "Comfort"]
-            },
-            5: {
-                "name": "Putra Karma Yoga",
-                "description": "10th lord in 5th house - Creative career success",
-                "effects": "Creative profession, children may continue profession, intelligent career choices, speculation in career pays off, teaching/entertainment career",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Creativity", "Children", "Teaching", "Entertainment"]
-            },
-            6: {
-                "name": "Ripu Karma Yoga",
-                "description": "10th lord in 6th house - Service-oriented career",
-                "effects": "Service profession (medical, legal, military), competitive career, success over professional rivals, litigation expertise, health-related profession",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Service", "Competition", "Medicine", "Law"]
-            },
-            7: {
-                "name": "Kalatra Karma Yoga",
-                "description": "10th lord in 7th house - Partnership in career",
-                "effects": "Business partnerships successful, spouse may be business partner, foreign business, public relations career, consulting profession",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Business Partnership", "Foreign Trade", "Consulting", "Public Relations"]
-            },
-            8: {
-                "name": "Randhra Karma Yoga",
-                "description": "10th lord in 8th house - Transformative career",
-                "effects": "Research career, occult/astrology profession, sudden career changes, insurance/investigation work, inheritance may affect career, crisis management",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Research", "Occult", "Investigation", "Transformation"]
-            },
-            9: {
-                "name": "Dharma Karma Yoga",
-                "description": "10th lord in 9th house - Fortunate career (Raj Yoga)",
-                "effects": "Highly fortunate profession, father helps career, higher education leads to career success, teaching/law/religion career, foreign assignments, ethical profession brings respect",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Fortune", "Higher Education", "Teaching", "Ethics"]
-            },
-            10: {
-                "name": "Karma Adhi Yoga",
-                "description": "10th lord in 10th house - Career powerhouse",
-                "effects": "Extraordinary career success, natural leader, peak professional achievement, authority in field, famous in profession, strong work ethic, lasting legacy",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Career Success", "Fame", "Authority", "Legacy"]
-            },
-            11: {
-                "name": "Labha Karma Yoga",
-                "description": "10th lord in 11th house - Career brings massive gains",
-                "effects": "High income from career, professional desires fulfilled, network crucial for career, multiple income streams from profession, elder siblings aid career",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Income", "Gains", "Networking", "Desires"]
-            },
-            12: {
-                "name": "Vyaya Karma Yoga",
-                "description": "10th lord in 12th house - Foreign/spiritual career",
-                "effects": "Foreign career/postings, hospital/prison/ashram work, spiritual profession, expenses on career, work in isolated places, charitable organizations, behind-scenes work",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Foreign Career", "Spirituality", "Isolation", "Charity"]
-            }
-        }
-
-        # ====================================================================
-        # 5TH LORD (PURVA PUNYA) PLACEMENTS - Intelligence, Children, Creativity
-        # ====================================================================
-        bhava_effects[5] = {
-            1: {
-                "name": "Putra Lagna Yoga",
-                "description": "5th lord in 1st house - Intelligence shines",
-                "effects": "Highly intelligent personality, creative self-expression, speculative mind, children bring joy, past life merits visible, romantic nature",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Intelligence", "Creativity", "Children", "Romance"]
-            },
-            2: {
-                "name": "Dhana Putra Yoga",
-                "description": "5th lord in 2nd house - Wealth through intelligence",
-                "effects": "Intelligent financial decisions, speculation brings wealth, children contribute to family wealth, creative speech/voice, artistic talents bring income",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Wealth", "Speculation", "Creativity", "Speech"]
-            },
-            3: {
-                "name": "Sahasa Putra Yoga",
-                "description": "5th lord in 3rd house - Creative communication",
-                "effects": "Creative writing/media skills, younger siblings intelligent, artistic crafts, courageous speculation, short travels with children",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Writing", "Communication", "Arts", "Siblings"]
-            },
-            4: {
-                "name": "Sukha Putra Yoga",
-                "description": "5th lord in 4th house - Domestic creativity",
-                "effects": "Children bring domestic happiness, property through speculation, creative home environment, mother is creative/intelligent, educational institutions at home",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Home", "Children", "Education", "Property"]
-            },
-            5: {
-                "name": "Putra Adhi Yoga",
-                "description": "5th lord in 5th house - Maximum creativity",
-                "effects": "Blessed with intelligent children, exceptional creativity, speculation highly favorable, mantra siddhi, teaching abilities, spiritual practices powerful, romance flourishes",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Children", "Creativity", "Spirituality", "Speculation"]
-            },
-            6: {
-                "name": "Ripu Putra Yoga",
-                "description": "5th lord in 6th house - Challenges to progeny",
-                "effects": "Delayed children or health issues to children, speculation may cause debts, creative work in service/medicine, competitive intelligence, victory through intellect",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Obstacles", "Service", "Children's Health", "Competition"]
-            },
-            7: {
-                "name": "Kalatra Putra Yoga",
-                "description": "5th lord in 7th house - Creative partnerships",
-                "effects": "Spouse is creative/intelligent, children after marriage bring joy, creative business partnerships, romantic marriage, speculation in partnership",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Marriage", "Partnership", "Romance", "Children"]
-            },
-            8: {
-                "name": "Randhra Putra Yoga",
-                "description": "5th lord in 8th house - Hidden creativity",
-                "effects": "Interest in occult knowledge, research-oriented intelligence, sudden speculative gains/losses, inheritance from children, transformative creativity, mystical children",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Occult", "Research", "Transformation", "Speculation"]
-            },
-            9: {
-                "name": "Dharma Putra Yoga (Raj Yoga)",
-                "description": "5th lord in 9th house - Fortunate intelligence",
-                "effects": "Excellent Raj Yoga - highly intelligent and fortunate children, past merit brings fortune, creative spiritual wisdom, higher education excellent, speculation blessed by luck",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Fortune", "Intelligence", "Spirituality", "Children"]
-            },
-            10: {
-                "name": "Karma Putra Yoga",
-                "description": "5th lord in 10th house - Creative career",
-                "effects": "Creative profession brings success, children follow in career, intelligent career decisions, speculation affects career, teaching/entertainment profession",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Career", "Creativity", "Children", "Fame"]
-            },
-            11: {
-                "name": "Labha Putra Yoga",
-                "description": "5th lord in 11th house - Creative gains",
-                "effects": "Speculation brings gains, children achieve their desires, creative network, multiple income from creative work, fulfillment through children",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Gains", "Children", "Speculation", "Desires"]
-            },
-            12: {
-                "name": "Vyaya Putra Yoga",
-                "description": "5th lord in 12th house - Foreign creativity",
-                "effects": "Children may reside abroad, creative work in isolation, expenses on children's education, speculation causes expenses, spiritual creativity, meditation brings insights",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Foreign Lands", "Spirituality", "Expenses", "Isolation"]
-            }
-        }
-
-        # ====================================================================
-        # 2ND LORD (DHANA KARAKA) PLACEMENTS - Wealth, Family, Speech
-        # ====================================================================
-        bhava_effects[2] = {
-            1: {
-                "name": "Dhana Lagna Yoga",
-                "description": "2nd lord in 1st house - Self-earned wealth",
-                "effects": "Self-made wealth, eloquent speaker, strong family values, attractive face, good eating habits, resourceful personality, wealth through personal efforts",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Wealth", "Personality", "Speech", "Self-reliance"]
-            },
-            2: {
-                "name": "Dhana Adhi Yoga",
-                "description": "2nd lord in 2nd house - Wealth multiplication",
-                "effects": "Great wealth accumulation, strong family bonds, sweet speech, excellent financial management, inheritance, multiple income sources, food prosperity",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Wealth", "Family", "Speech", "Prosperity"]
-            },
-            3: {
-                "name": "Sahasa Dhana Yoga",
-                "description": "2nd lord in 3rd house - Wealth through courage",
-                "effects": "Wealth through skills/arts, siblings support financially, earnings from communication/writing, self-effort brings money, short journeys profitable",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Skills", "Communication", "Siblings", "Courage"]
-            },
-            4: {
-                "name": "Sukha Dhana Yoga",
-                "description": "2nd lord in 4th house - Property wealth",
-                "effects": "Wealth from property/vehicles, mother's family prosperous, comfortable home life, education brings wealth, real estate success, landed property",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Property", "Comfort", "Education", "Mother"]
-            },
-            5: {
-                "name": "Putra Dhana Yoga",
-                "description": "2nd lord in 5th house - Intelligent wealth",
-                "effects": "Wealth through speculation/investments, children bring prosperity, creative earnings, past life merit brings wealth, lottery/shares favorable, intelligent financial decisions",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Speculation", "Children", "Intelligence", "Investments"]
-            },
-            6: {
-                "name": "Ripu Dhana Yoga",
-                "description": "2nd lord in 6th house - Service wealth",
-                "effects": "Earnings through service/medicine, wealth after overcoming obstacles, loans/debts possible but manageable, enemies create financial stress, health expenses",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Service", "Debts", "Obstacles", "Health"]
-            },
-            7: {
-                "name": "Kalatra Dhana Yoga",
-                "description": "2nd lord in 7th house - Partnership wealth",
-                "effects": "Wealth through spouse/partnerships, business brings prosperity, marriage improves finances, foreign trade profitable, eloquent in public speaking",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Marriage", "Business", "Partnership", "Trade"]
-            },
-            8: {
-                "name": "Randhra Dhana Yoga",
-                "description": "2nd lord in 8th house - Hidden wealth",
-                "effects": "Sudden financial ups and downs, inheritance likely, wealth through research/occult, family secrets affect finances, longevity of wealth uncertain, insurance/wills important",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Inheritance", "Uncertainty", "Occult", "Transformation"]
-            },
-            9: {
-                "name": "Dharma Dhana Yoga (Raj Yoga)",
-                "description": "2nd lord in 9th house - Fortune wealth",
-                "effects": "Excellent Raj Yoga - wealth through father/gurus, dharmic earnings, religious donations bring returns, fortunate family, higher education brings wealth, ethical money",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Fortune", "Ethics", "Father", "Spirituality"]
-            },
-            10: {
-                "name": "Karma Dhana Yoga",
-                "description": "2nd lord in 10th house - Career wealth",
-                "effects": "Wealth through profession, family business success, career brings financial stability, good reputation increases earnings, government favor possible",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Career", "Profession", "Reputation", "Authority"]
-            },
-            11: {
-                "name": "Labha Dhana Yoga",
-                "description": "2nd lord in 11th house - Continuous gains",
-                "effects": "Excellent wealth yoga - multiple income streams, elder siblings helpful, desires fulfilled through wealth, network brings prosperity, steady gains throughout life",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Gains", "Income", "Desires", "Network"]
-            },
-            12: {
-                "name": "Vyaya Dhana Yoga",
-                "description": "2nd lord in 12th house - Expenses on family",
-                "effects": "Family expenses high, wealth goes to charity/spirituality, foreign residence possible, speech may cause losses, expenditure on education, hidden wealth abroad",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Expenses", "Foreign", "Charity", "Losses"]
-            }
-        }
-
-        # ====================================================================
-        # 3RD LORD (SAHAJA KARAKA) PLACEMENTS - Siblings, Courage, Communication
-        # ====================================================================
-        bhava_effects[3] = {
-            1: {
-                "name": "Sahasa Lagna Yoga",
-                "description": "3rd lord in 1st house - Courageous personality",
-                "effects": "Very courageous and adventurous, self-reliant nature, younger siblings influence life, skilled in arts/crafts, active communication style, athletic build",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Courage", "Skills", "Independence", "Communication"]
-            },
-            2: {
-                "name": "Dhana Sahaja Yoga",
-                "description": "3rd lord in 2nd house - Wealth through skills",
-                "effects": "Earnings through skills/arts, siblings contribute to wealth, communication skills bring money, family supports courage, writing/media income",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Skills", "Wealth", "Communication", "Siblings"]
-            },
-            3: {
-                "name": "Sahaja Adhi Yoga",
-                "description": "3rd lord in 3rd house - Maximum courage",
-                "effects": "Extremely courageous, excellent relationship with siblings, highly skilled, successful in arts/media, short travels beneficial, strong willpower, initiative brings success",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Courage", "Siblings", "Skills", "Initiative"]
-            },
-            4: {
-                "name": "Sukha Sahaja Yoga",
-                "description": "3rd lord in 4th house - Skillful comfort",
-                "effects": "Property through self-effort, mother encourages skills, comfortable life through talents, vehicles for travel, education in arts, home-based creative work",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Property", "Skills", "Comfort", "Mother"]
-            },
-            5: {
-                "name": "Putra Sahaja Yoga",
-                "description": "3rd lord in 5th house - Creative skills",
-                "effects": "Highly creative and artistic, children are talented, speculation through skills, intelligent communication, performing arts, romantic courage",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Creativity", "Skills", "Children", "Romance"]
-            },
-            6: {
-                "name": "Ripu Sahaja Yoga",
-                "description": "3rd lord in 6th house - Competitive courage",
-                "effects": "Victory through courage, siblings may have health issues, competition brings success, service requires skills, courage overcomes enemies, medical/healing skills",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Competition", "Service", "Courage", "Victory"]
-            },
-            7: {
-                "name": "Kalatra Sahaja Yoga",
-                "description": "3rd lord in 7th house - Partnership skills",
-                "effects": "Spouse is artistic/communicative, business partnerships successful, courage in relationships, travels with spouse, diplomatic skills, trade journeys",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Partnership", "Communication", "Business", "Travel"]
-            },
-            8: {
-                "name": "Randhra Sahaja Yoga",
-                "description": "3rd lord in 8th house - Hidden talents",
-                "effects": "Courage in crisis, research/investigative skills, occult communication abilities, transformative efforts, siblings face ups and downs, longevity through courage",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Research", "Occult", "Crisis", "Transformation"]
-            },
-            9: {
-                "name": "Dharma Sahaja Yoga",
-                "description": "3rd lord in 9th house - Dharmic courage",
-                "effects": "Courageous in dharma, long journeys bring skills, siblings are fortunate, religious arts/music, teaching communication, publishing success, pilgrimage journeys",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Fortune", "Travel", "Teaching", "Publishing"]
-            },
-            10: {
-                "name": "Karma Sahaja Yoga",
-                "description": "3rd lord in 10th house - Skillful career",
-                "effects": "Career in communication/media/arts, self-made career success, professional skills recognized, siblings help career, entrepreneurial courage, performance profession",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Career", "Skills", "Performance", "Recognition"]
-            },
-            11: {
-                "name": "Labha Sahaja Yoga",
-                "description": "3rd lord in 11th house - Gains through skills",
-                "effects": "Skills bring income, siblings bring gains, desires fulfilled through effort, communication network profitable, artistic income, wishes achieved through courage",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Gains", "Skills", "Desires", "Network"]
-            },
-            12: {
-                "name": "Vyaya Sahaja Yoga",
-                "description": "3rd lord in 12th house - Foreign skills",
-                "effects": "Skills used abroad, siblings may live far away, expenses on hobbies/arts, isolation develops talents, spiritual communication, meditation requires effort",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Foreign", "Isolation", "Spirituality", "Expenses"]
-            }
-        }
-
-        # ====================================================================
-        # 4TH LORD (SUKHA KARAKA) PLACEMENTS - Mother, Property, Education, Happiness
-        # ====================================================================
-        bhava_effects[4] = {
-            1: {
-                "name": "Sukha Lagna Yoga",
-                "description": "4th lord in 1st house - Comfortable personality",
-                "effects": "Mother's influence strong, property ownership, vehicles, educational success, peaceful nature, domestic happiness, emotional security, comfortable life",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Comfort", "Mother", "Property", "Education"]
-            },
-            2: {
-                "name": "Dhana Sukha Yoga",
-                "description": "4th lord in 2nd house - Property wealth",
-                "effects": "Wealth through real estate, family property, mother brings prosperity, comfortable family life, ancestral wealth, vehicles as assets, savings for comfort",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Property", "Wealth", "Family", "Assets"]
-            },
-            3: {
-                "name": "Sahaja Sukha Yoga",
-                "description": "4th lord in 3rd house - Property through effort",
-                "effects": "Property through self-effort, mother encourages skills, siblings share property, short moves for property, courage brings comfort, education in arts",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Effort", "Property", "Skills", "Siblings"]
-            },
-            4: {
-                "name": "Sukha Adhi Yoga",
-                "description": "4th lord in 4th house - Maximum happiness",
-                "effects": "Excellent property holdings, strong mother's support, multiple vehicles, superior education, domestic bliss, emotional fulfillment, landed property, peaceful heart",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Property", "Mother", "Education", "Happiness"]
-            },
-            5: {
-                "name": "Putra Sukha Yoga",
-                "description": "4th lord in 5th house - Educational intelligence",
-                "effects": "Excellent education, intelligent children, creative home, mother is wise, property for children, speculation in real estate, comfortable romance, teaching from home",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Education", "Intelligence", "Children", "Creativity"]
-            },
-            6: {
-                "name": "Ripu Sukha Yoga",
-                "description": "4th lord in 6th house - Property challenges",
-                "effects": "Property disputes possible, mother's health issues, emotional stress, service from home, medical education, debt for property, victory through persistence, healthcare real estate",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Disputes", "Service", "Health", "Obstacles"]
-            },
-            7: {
-                "name": "Kalatra Sukha Yoga",
-                "description": "4th lord in 7th house - Partnership property",
-                "effects": "Property through spouse, comfortable marriage, business from home, relocation after marriage, spouse is educated, partnership in real estate, vehicles through marriage",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Marriage", "Property", "Partnership", "Relocation"]
-            },
-            8: {
-                "name": "Randhra Sukha Yoga",
-                "description": "4th lord in 8th house - Inheritance property",
-                "effects": "Inherited property, mother's longevity concerns, sudden property gains/losses, hidden assets, research education, transformation through family, occult real estate",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Inheritance", "Uncertainty", "Mother", "Transformation"]
-            },
-            9: {
-                "name": "Dharma Sukha Yoga (Raj Yoga)",
-                "description": "4th lord in 9th house - Fortunate property",
-                "effects": "Excellent Raj Yoga - religious property, fortunate mother, higher education abroad, dharmic comfort, father and mother harmonious, pilgrimage properties, ashram/temple land",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Fortune", "Education", "Religion", "Mother"]
-            },
-            10: {
-                "name": "Karma Sukha Yoga (Raj Yoga)",
-                "description": "4th lord in 10th house - Career property",
-                "effects": "Excellent Raj Yoga - property through career, professional education, office/workplace ownership, mother supports career, government property, fame brings comfort, authority",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Career", "Property", "Fame", "Authority"]
-            },
-            11: {
-                "name": "Labha Sukha Yoga",
-                "description": "4th lord in 11th house - Property gains",
-                "effects": "Multiple properties, elder siblings share property, desires for comfort fulfilled, income from real estate, vehicles as gains, networking brings property, wishes achieved",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Gains", "Property", "Income", "Desires"]
-            },
-            12: {
-                "name": "Vyaya Sukha Yoga",
-                "description": "4th lord in 12th house - Foreign property",
-                "effects": "Property abroad, mother may live far, expenses on property/vehicles, foreign education, isolated property, spiritual home, meditation room, ashram residence",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Foreign", "Spirituality", "Isolation", "Expenses"]
-            }
-        }
-
-        # ====================================================================
-        # 6TH LORD (RIPU/SHATRU KARAKA) PLACEMENTS - Enemies, Service, Health
-        # ====================================================================
-        bhava_effects[6] = {
-            1: {
-                "name": "Ripu Lagna Yoga",
-                "description": "6th lord in 1st house - Competitive personality",
-                "effects": "Competitive nature, health needs attention, service-oriented, ability to fight obstacles, enemies openly visible, medical profession possible, athletic build",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Competition", "Health", "Service", "Enemies"]
-            },
-            2: {
-                "name": "Dhana Ripu Yoga",
-                "description": "6th lord in 2nd house - Wealth through service",
-                "effects": "Earnings through service/medicine, family disputes over money, debts affect wealth, speech creates enemies, hard work for savings, overcoming financial obstacles",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Service", "Debts", "Family", "Obstacles"]
-            },
-            3: {
-                "name": "Sahaja Ripu Yoga",
-                "description": "6th lord in 3rd house - Victory through courage",
-                "effects": "Victory over enemies through courage, siblings may face health issues, competitive skills, service communication, effort overcomes obstacles, brave in competition",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Victory", "Courage", "Competition", "Siblings"]
-            },
-            4: {
-                "name": "Sukha Ripu Yoga",
-                "description": "6th lord in 4th house - Property disputes",
-                "effects": "Property disputes possible, mother's health concerns, stress at home, service from property, medical education, debt for vehicles, emotional challenges",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Disputes", "Property", "Mother", "Stress"]
-            },
-            5: {
-                "name": "Putra Ripu Yoga",
-                "description": "6th lord in 5th house - Children health issues",
-                "effects": "Children's health needs care, delayed progeny, speculation causes debts, creative service, competitive intelligence, educational obstacles, victory through intellect",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Children", "Health", "Obstacles", "Speculation"]
-            },
-            6: {
-                "name": "Ripu Adhi Yoga",
-                "description": "6th lord in 6th house - Victory over enemies",
-                "effects": "Excellent for victory - defeats all enemies, strong health recovery, success in service/legal fields, overcomes debts, litigation expertise, medical profession success",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Victory", "Service", "Health", "Competition"]
-            },
-            7: {
-                "name": "Kalatra Ripu Yoga",
-                "description": "6th lord in 7th house - Partnership conflicts",
-                "effects": "Conflicts in marriage/partnerships, spouse may have health issues, business disputes, marriage after obstacles, partner in service field, legal partnerships",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Marriage", "Conflicts", "Partnership", "Legal"]
-            },
-            8: {
-                "name": "Randhra Ripu Yoga (Viparita Raj Yoga)",
-                "description": "6th lord in 8th house - Transformation through obstacles",
-                "effects": "Viparita Raj Yoga - enemies destroy themselves, chronic health but long life, sudden victory over obstacles, inheritance through service, occult healing, research medicine",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Longevity", "Victory", "Occult", "Healing"]
-            },
-            9: {
-                "name": "Dharma Ripu Yoga",
-                "description": "6th lord in 9th house - Obstacles to fortune",
-                "effects": "Conflicts with father/gurus, dharma through service, health issues during travel, legal battles over beliefs, competitive higher education, service abroad",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Conflicts", "Father", "Travel", "Beliefs"]
-            },
-            10: {
-                "name": "Karma Ripu Yoga",
-                "description": "6th lord in 10th house - Service career",
-                "effects": "Career in service/medicine/legal fields, workplace competition, success through hard work, enemies in profession, health stress from career, government service",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Career", "Service", "Competition", "Work"]
-            },
-            11: {
-                "name": "Labha Ripu Yoga",
-                "description": "6th lord in 11th house - Gains through service",
-                "effects": "Income through service, victory brings gains, debts eventually paid, elder siblings face obstacles, desires fulfilled after struggle, competitive income",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Gains", "Service", "Victory", "Income"]
-            },
-            12: {
-                "name": "Vyaya Ripu Yoga (Viparita Raj Yoga)",
-                "description": "6th lord in 12th house - Hidden victory",
-                "effects": "Viparita Raj Yoga - enemies defeated secretly, expenses destroy debts, service abroad, health expenses but healing, hospitalization for recovery, foreign medical work",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Foreign", "Victory", "Healing", "Expenses"]
-            }
-        }
-
-        # ====================================================================
-        # 7TH LORD (KALATRA KARAKA) PLACEMENTS - Spouse, Partnerships, Business
-        # ====================================================================
-        bhava_effects[7] = {
-            1: {
-                "name": "Kalatra Lagna Yoga",
-                "description": "7th lord in 1st house - Partnership focused",
-                "effects": "Spouse plays major role in life, attractive personality, focus on relationships, partner-oriented, business success, public relations skills, early marriage possible",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Marriage", "Partnership", "Personality", "Relationships"]
-            },
-            2: {
-                "name": "Dhana Kalatra Yoga",
-                "description": "7th lord in 2nd house - Wealth through spouse",
-                "effects": "Wealth through marriage/partnerships, spouse brings prosperity, family business partnerships, eloquent partner, in-laws support finances, joint assets grow",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Wealth", "Marriage", "Partnership", "Family"]
-            },
-            3: {
-                "name": "Sahaja Kalatra Yoga",
-                "description": "7th lord in 3rd house - Active partnerships",
-                "effects": "Spouse is courageous/communicative, business partnerships in media/arts, siblings introduce spouse, marriage through effort, partner travels, creative business",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Partnership", "Communication", "Courage", "Travel"]
-            },
-            4: {
-                "name": "Sukha Kalatra Yoga",
-                "description": "7th lord in 4th house - Comfortable marriage",
-                "effects": "Domestic happiness through spouse, property after marriage, spouse like mother figure, partner is educated, comfortable partnership, relocation for marriage, vehicles together",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Marriage", "Comfort", "Property", "Happiness"]
-            },
-            5: {
-                "name": "Putra Kalatra Yoga",
-                "description": "7th lord in 5th house - Romantic marriage",
-                "effects": "Love marriage, spouse is intelligent/creative, children from good marriage, speculation with partner, romantic relationship, creative business, joyful partnership",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Romance", "Love", "Children", "Creativity"]
-            },
-            6: {
-                "name": "Ripu Kalatra Yoga",
-                "description": "7th lord in 6th house - Partnership challenges",
-                "effects": "Marital disputes possible, spouse in service/health field, delayed marriage, obstacles in partnerships, partner overcomes enemies, business competition, health issues to spouse",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Conflicts", "Delays", "Service", "Obstacles"]
-            },
-            7: {
-                "name": "Kalatra Adhi Yoga",
-                "description": "7th lord in 7th house - Perfect partnership",
-                "effects": "Excellent marriage, strong spouse, successful partnerships, long-lasting relationships, business prosperity, public recognition, balanced relationships, partner is ideal match",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Marriage", "Partnership", "Business", "Public"]
-            },
-            8: {
-                "name": "Randhra Kalatra Yoga",
-                "description": "7th lord in 8th house - Transformative marriage",
-                "effects": "Spouse brings transformation, inheritance through marriage, partner interested in occult, sudden changes in relationship, research partnerships, longevity concerns, deep intimacy",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Transformation", "Inheritance", "Intimacy", "Occult"]
-            },
-            9: {
-                "name": "Dharma Kalatra Yoga (Raj Yoga)",
-                "description": "7th lord in 9th house - Fortunate marriage",
-                "effects": "Excellent Raj Yoga - spouse is fortunate/spiritual, marriage brings dharma, partner from good family, long distance marriage, religious partnership, foreign spouse possible, blessed union",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Fortune", "Marriage", "Dharma", "Travel"]
-            },
-            10: {
-                "name": "Karma Kalatra Yoga (Raj Yoga)",
-                "description": "7th lord in 10th house - Career partnership",
-                "effects": "Excellent Raj Yoga - spouse helps career, business partnerships excel, fame through marriage, professional partner, public recognition together, authority in partnerships",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Career", "Fame", "Partnership", "Authority"]
-            },
-            11: {
-                "name": "Labha Kalatra Yoga",
-                "description": "7th lord in 11th house - Profitable partnerships",
-                "effects": "Gains through spouse/partnerships, desires fulfilled in marriage, business brings income, profitable collaborations, network through spouse, wishes achieved together",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Gains", "Income", "Desires", "Network"]
-            },
-            12: {
-                "name": "Vyaya Kalatra Yoga",
-                "description": "7th lord in 12th house - Foreign partnerships",
-                "effects": "Spouse from foreign land, marriage causes relocation, expenses on partnerships, spiritual union, isolated together, bed pleasures good, foreign business, partner abroad",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Foreign", "Spirituality", "Expenses", "Isolation"]
-            }
-        }
-
-        # ====================================================================
-        # 8TH LORD (RANDHRA KARAKA) PLACEMENTS - Longevity, Transformation, Occult
-        # ====================================================================
-        bhava_effects[8] = {
-            1: {
-                "name": "Randhra Lagna Yoga",
-                "description": "8th lord in 1st house - Mysterious personality",
-                "effects": "Mysterious aura, interest in occult, transformative life experiences, health fluctuations, research-oriented mind, sudden changes, long life if well-placed, secretive nature",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Occult", "Transformation", "Health", "Mystery"]
-            },
-            2: {
-                "name": "Dhana Randhra Yoga",
-                "description": "8th lord in 2nd house - Uncertain wealth",
-                "effects": "Sudden financial ups/downs, inheritance possible, family secrets, wealth through research/occult, speech about mysteries, savings fluctuate, hidden family wealth",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Inheritance", "Fluctuation", "Secrets", "Wealth"]
-            },
-            3: {
-                "name": "Sahaja Randhra Yoga",
-                "description": "8th lord in 3rd house - Courageous transformation",
-                "effects": "Siblings face transformations, courage in crisis, occult communication, research skills, sudden short journeys, transformation through effort, investigative abilities",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Courage", "Research", "Siblings", "Crisis"]
-            },
-            4: {
-                "name": "Sukha Randhra Yoga",
-                "description": "8th lord in 4th house - Property inheritance",
-                "effects": "Inherited property, mother's longevity concerns, sudden property changes, emotional transformations, education in research, hidden real estate, occult from home",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Inheritance", "Property", "Mother", "Emotions"]
-            },
-            5: {
-                "name": "Putra Randhra Yoga",
-                "description": "5th lord in 8th house - Transformative creativity",
-                "effects": "Children face transformations, delayed progeny, occult intelligence, research education, sudden speculative gains/losses, past life karma affects children, mystical insights",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Children", "Occult", "Research", "Transformation"]
-            },
-            6: {
-                "name": "Ripu Randhra Yoga (Viparita Raj Yoga)",
-                "description": "8th lord in 6th house - Longevity through obstacles",
-                "effects": "Viparita Raj Yoga - long life despite health challenges, victory over chronic enemies, transformation destroys obstacles, occult healing powers, service in research/medicine",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Longevity", "Victory", "Healing", "Service"]
-            },
-            7: {
-                "name": "Kalatra Randhra Yoga",
-                "description": "8th lord in 7th house - Transformative partnerships",
-                "effects": "Spouse brings transformation, inheritance through marriage, partner interested in occult, sudden partnership changes, deep intimacy, research partnerships, longevity concerns",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Marriage", "Transformation", "Inheritance", "Intimacy"]
-            },
-            8: {
-                "name": "Randhra Adhi Yoga",
-                "description": "8th lord in 8th house - Occult mastery",
-                "effects": "Long life, occult/mysticism mastery, inheritance likely, research excellence, transformation ability, sudden gains, hidden wealth, regeneration power, tantric knowledge",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Longevity", "Occult", "Inheritance", "Transformation"]
-            },
-            9: {
-                "name": "Dharma Randhra Yoga",
-                "description": "8th lord in 9th house - Mystical wisdom",
-                "effects": "Mystical spirituality, transformation through dharma, research in philosophy, sudden foreign journeys, occult teachings, father's longevity concerns, hidden religious knowledge",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Mysticism", "Philosophy", "Transformation", "Father"]
-            },
-            10: {
-                "name": "Karma Randhra Yoga",
-                "description": "8th lord in 10th house - Research career",
-                "effects": "Career in research/occult/investigation, sudden career changes, inheritance affects profession, transformation through work, detective/psychology/mining career, authority fluctuates",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Career", "Research", "Investigation", "Change"]
-            },
-            11: {
-                "name": "Labha Randhra Yoga",
-                "description": "8th lord in 11th house - Sudden gains",
-                "effects": "Sudden unexpected gains, inheritance from elder siblings, occult income, transformation brings profits, research network, desires fulfilled mysteriously, lottery wins possible",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Gains", "Inheritance", "Sudden", "Income"]
-            },
-            12: {
-                "name": "Vyaya Randhra Yoga (Viparita Raj Yoga)",
-                "description": "8th lord in 12th house - Spiritual transformation",
-                "effects": "Viparita Raj Yoga - spiritual transformation, expenses on research, foreign occult studies, liberation through transformation, moksha yoga, meditation brings insights, hidden powers",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Spirituality", "Moksha", "Occult", "Liberation"]
-            }
-        }
-
-        # ====================================================================
-        # 11TH LORD (LABHA KARAKA) PLACEMENTS - Gains, Income, Friends
-        # ====================================================================
-        bhava_effects[11] = {
-            1: {
-                "name": "Labha Lagna Yoga",
-                "description": "11th lord in 1st house - Gains through self",
-                "effects": "Self-made income, desires fulfilled through personality, elder siblings helpful, optimistic nature, gains through appearance, networking abilities, ambitious personality",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Gains", "Personality", "Desires", "Self-effort"]
-            },
-            2: {
-                "name": "Dhana Labha Yoga",
-                "description": "11th lord in 2nd house - Wealth multiplication",
-                "effects": "Excellent wealth yoga - multiple income sources, family brings gains, savings accumulate, desires for wealth fulfilled, elder siblings support finances, continuous prosperity",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Wealth", "Income", "Savings", "Prosperity"]
-            },
-            3: {
-                "name": "Sahaja Labha Yoga",
-                "description": "11th lord in 3rd house - Gains through skills",
-                "effects": "Income through skills/communication, siblings bring profits, creative income, networking brings success, short journeys profitable, artistic gains, courageous for desires",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Skills", "Communication", "Gains", "Network"]
-            },
-            4: {
-                "name": "Sukha Labha Yoga",
-                "description": "11th lord in 4th house - Property gains",
-                "effects": "Gains from real estate, mother brings prosperity, comfortable income, multiple properties, vehicles as gains, educational income, networking from home, desires for comfort fulfilled",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Property", "Gains", "Comfort", "Mother"]
-            },
-            5: {
-                "name": "Putra Labha Yoga (Raj Yoga)",
-                "description": "11th lord in 5th house - Speculative gains",
-                "effects": "Excellent Raj Yoga - gains through speculation/investments, children bring prosperity, creative income, past merit brings gains, lottery/shares favorable, desires fulfilled through intelligence",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Speculation", "Children", "Creativity", "Gains"]
-            },
-            6: {
-                "name": "Ripu Labha Yoga",
-                "description": "11th lord in 6th house - Gains through service",
-                "effects": "Income through service, victory over financial obstacles, desires after struggle, competitive income, debt eventually repaid, healing professions bring gains, hard work pays",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Service", "Competition", "Victory", "Income"]
-            },
-            7: {
-                "name": "Kalatra Labha Yoga",
-                "description": "11th lord in 7th house - Partnership gains",
-                "effects": "Gains through spouse/partnerships, business brings profits, desires fulfilled through marriage, partner is prosperous, networking through spouse, profitable collaborations",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Partnership", "Business", "Marriage", "Gains"]
-            },
-            8: {
-                "name": "Randhra Labha Yoga",
-                "description": "11th lord in 8th house - Sudden gains",
-                "effects": "Sudden unexpected income, inheritance brings gains, occult/research income, desires fulfilled mysteriously, lottery possible, transformation brings profits, hidden income sources",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Sudden", "Inheritance", "Occult", "Gains"]
-            },
-            9: {
-                "name": "Dharma Labha Yoga (Raj Yoga)",
-                "description": "11th lord in 9th house - Fortunate gains",
-                "effects": "Excellent Raj Yoga - fortune brings gains, dharmic income, father's network helpful, higher education brings income, desires fulfilled through luck, religious gains, blessed prosperity",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Fortune", "Dharma", "Gains", "Prosperity"]
-            },
-            10: {
-                "name": "Karma Labha Yoga",
-                "description": "11th lord in 10th house - Career gains",
-                "effects": "Career brings excellent income, professional network strong, desires fulfilled through work, authority increases earnings, reputation brings gains, government favor possible",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Career", "Income", "Authority", "Fame"]
-            },
-            11: {
-                "name": "Labha Adhi Yoga",
-                "description": "11th lord in 11th house - Maximum gains",
-                "effects": "Excellent gains yoga - all desires fulfilled, multiple income streams, elder siblings very helpful, networking brings wealth, wishes achieved easily, continuous prosperity throughout life",
-                "strength": "Very Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Gains", "Desires", "Income", "Wishes"]
-            },
-            12: {
-                "name": "Vyaya Labha Yoga",
-                "description": "11th lord in 12th house - Foreign gains",
-                "effects": "Income from abroad, expenses equal income, desires for spirituality, foreign network, charitable giving, gains through isolation, spiritual desires fulfilled, hidden income",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Foreign", "Expenses", "Spirituality", "Charity"]
-            }
-        }
-
-        # ====================================================================
-        # 12TH LORD (VYAYA KARAKA) PLACEMENTS - Expenses, Losses, Foreign, Moksha
-        # ====================================================================
-        bhava_effects[12] = {
-            1: {
-                "name": "Vyaya Lagna Yoga",
-                "description": "12th lord in 1st house - Spiritual personality",
-                "effects": "Spiritual inclinations, expenses on self/health, foreign residence possible, isolated personality, meditation-oriented, charitable nature, moksha desires, pilgrimage interests",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Spirituality", "Foreign", "Expenses", "Isolation"]
-            },
-            2: {
-                "name": "Dhana Vyaya Yoga",
-                "description": "12th lord in 2nd house - Wealth expenses",
-                "effects": "High family expenses, wealth goes to charity, foreign investments, speech about spirituality, savings for foreign travel, generous donations, hidden wealth abroad",
-                "strength": "Weak",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Expenses", "Charity", "Foreign", "Wealth"]
-            },
-            3: {
-                "name": "Sahaja Vyaya Yoga",
-                "description": "12th lord in 3rd house - Foreign skills",
-                "effects": "Skills used abroad, siblings may live far, expenses on hobbies/arts, courage for spirituality, isolation develops talents, communication about meditation, journeys abroad",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Foreign", "Skills", "Isolation", "Spirituality"]
-            },
-            4: {
-                "name": "Sukha Vyaya Yoga",
-                "description": "12th lord in 4th house - Foreign property",
-                "effects": "Property abroad, mother lives far or spiritual, expenses on vehicles/property, foreign education, isolated residence, meditation room important, ashram property, emotional detachment",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Foreign", "Property", "Spirituality", "Mother"]
-            },
-            5: {
-                "name": "Putra Vyaya Yoga",
-                "description": "12th lord in 5th house - Foreign children",
-                "effects": "Children abroad or spiritual, expenses on children's education, creativity in isolation, speculation causes losses, meditation brings insights, spiritual intelligence, foreign study",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Children", "Foreign", "Spirituality", "Expenses"]
-            },
-            6: {
-                "name": "Ripu Vyaya Yoga (Viparita Raj Yoga)",
-                "description": "12th lord in 6th house - Victory through expenses",
-                "effects": "Viparita Raj Yoga - expenses destroy enemies, debts lead to liberation, service abroad, healing expenses beneficial, foreign medical work, obstacles lead to moksha, hospitalization heals",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Victory", "Foreign", "Healing", "Liberation"]
-            },
-            7: {
-                "name": "Kalatra Vyaya Yoga",
-                "description": "12th lord in 7th house - Foreign spouse",
-                "effects": "Spouse from foreign land, marriage abroad, partnership expenses, relocation after marriage, spiritual partnership, bed pleasures good, business abroad, isolated with partner",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Foreign", "Marriage", "Relocation", "Expenses"]
-            },
-            8: {
-                "name": "Randhra Vyaya Yoga (Viparita Raj Yoga)",
-                "description": "12th lord in 8th house - Spiritual transformation",
-                "effects": "Viparita Raj Yoga - moksha yoga, spiritual transformation deep, expenses on occult/research, foreign inheritance, isolation brings insights, meditation on death, liberation focus, tantric practices",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Moksha", "Transformation", "Spirituality", "Occult"]
-            },
-            9: {
-                "name": "Dharma Vyaya Yoga",
-                "description": "12th lord in 9th house - Foreign dharma",
-                "effects": "Spiritual journeys abroad, father lives far, expenses on pilgrimage, foreign gurus, higher education abroad, charitable dharma, ashram life, renunciation tendencies, monastery attraction",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Pilgrimage", "Foreign", "Dharma", "Renunciation"]
-            },
-            10: {
-                "name": "Karma Vyaya Yoga",
-                "description": "12th lord in 10th house - Foreign career",
-                "effects": "Career abroad, expenses on profession, work in isolation/hospitals/ashrams, foreign business, spiritual career, losses through authority, MNC work, export-import, international profession",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Foreign", "Career", "Isolation", "Spirituality"]
-            },
-            11: {
-                "name": "Labha Vyaya Yoga",
-                "description": "12th lord in 11th house - Foreign gains",
-                "effects": "Income from abroad, expenses equal gains, desires for spirituality fulfilled, foreign network, charitable income, gains through isolation, spiritual wishes achieved, hidden profits",
-                "strength": "Medium",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Foreign", "Gains", "Spirituality", "Network"]
-            },
-            12: {
-                "name": "Vyaya Adhi Yoga",
-                "description": "12th lord in 12th house - Complete moksha",
-                "effects": "Strong moksha yoga - complete spiritual liberation, life abroad, isolated residence, meditation mastery, ashram/monastery life, detachment from material, enlightenment focus, final liberation",
-                "strength": "Strong",
-                "bphs_category": "Non-BPHS (Practical)",
-                "bphs_section": "Modern/Practical Addition",
-                "bphs_ref": "Not in BPHS spec",
-                "life_areas": ["Moksha", "Liberation", "Spirituality", "Foreign"]
-            }
-        }
-
-        # Return the specific effect if available
-        if lord_house in bhava_effects and placement in bhava_effects[lord_house]:
-            return bhava_effects[lord_house][placement]
+        if 1 <= lord_house <= 12 and 1 <= placement <= 12:
+            return self.BHAVA_YOGA_EFFECTS[lord_house][placement]
 
         return None
 
+    # Yoga name keywords by impact
+    MIXED_IMPACT_KEYWORDS = ("kala sarpa", "viparita", "sanyas", "randhra")
+    NEGATIVE_IMPACT_KEYWORDS = ("dosha", "kemadruma", "daridra", "shakata", "balarishta", "grahan", "pitra", "manglik", "kroora")
+    POSITIVE_IMPACT_KEYWORDS = ("raj yoga", "dhana", "mahapurusha", "adhi yoga", "labha", "putra", "gajakesari", "kubera", "lakshmi", "sukha")
+
     def _classify_yoga_impact(self, name: str, category: str) -> str:
         """Classify yoga impact: positive, negative, mixed, neutral"""
         name_lower = name.lower()
         category_lower = category.lower()
 
         # Mixed indicators (both challenges and opportunities)
-        mixed_keywords = ["kala sarpa", "viparita", "sanyas", "randhra"]
-        for keyword in mixed_keywords:
+        for keyword in self.MIXED_IMPACT_KEYWORDS:
             if keyword in name_lower or keyword in category_lower:
                 return "mixed"
 
         # Negative indicators
-        negative_keywords = ["dosha", "kemadruma", "daridra", "shakata", "balarishta", "grahan", "pitra", "manglik", "kroora"]
-        for keyword in negative_keywords:
+        for keyword in self.NEGATIVE_IMPACT_KEYWORDS:
             if keyword in name_lower or keyword in category_lower:
                 return "negative"
 
         # Positive indicators
-        positive_keywords = ["raj yoga", "dhana", "mahapurusha", "adhi yoga", "labha", "putra", "gajakesari", "kubera", "lakshmi", "sukha"]
-        for keyword in positive_keywords:
+        for keyword in self.POSITIVE_IMPACT_KEYWORDS:
             if keyword in name_lower or keyword in category_lower:
                 return "positive"
 
@@ -8186,6 +6649,34 @@ class ExtendedYogaService:
 
         return "positive"  # Default
 
+    # Yoga name keywords by importance
+    MAJOR_YOGA_KEYWORDS = (
+        # Pancha Mahapurusha Yogas (5 great person yogas)
+        "hamsa", "malavya", "sasa", "ruchaka", "bhadra",
+        # Sun-Based Yogas (BPHS Tier 1)
+        "vesi", "vosi", "ubhayachari",
+        # Moon-Based Yogas (BPHS Tier 1)
+        "sunapha", "anapha", "durudhura",
+        # Learning & Wisdom Yogas (BPHS Tier 1)
+        "saraswati",
+        # Major Raj Yogas
+        "raj yoga", "neecha bhanga",
+        # Major Dhana Yogas (classical wealth yogas)
+        # Note: "dhana yoga" is safe here because house lord yogas are filtered out
+        # by the category check above (lines 3906-3913) before reaching this point
+        "kubera", "lakshmi", "maha dhana", "dhana yoga",
+        # Major benefic yogas
+        "gajakesari", "gaja kesari", "adhi yoga", "vasumathi",
+        # Major challenging yogas
+        "kala sarpa", "kemadruma", "daridra", "shakata",
+        # Doshas (major afflictions)
+        "manglik", "grahan", "pitra", "kaal sarp"
+    )
+    MODERATE_YOGA_KEYWORDS = (
+        "nabhasa", "sanyas", "yoga", "bhanga", "nitya",
+        "budhaditya", "chandra mangal", "guru mangal", "parivartana", "viparita"
+    )
+
     def _classify_yoga_importance(self, name: str, strength: str, category: str) -> str:
         """Classify yoga importance: major, moderate, minor"""
         name_lower = name.lower()
@@ -8203,30 +6694,7 @@ class ExtendedYogaService:
                 return "minor"
 
         # Major yogas - life-changing combinations
-        major_keywords = [
-            # Pancha Mahapurusha Yogas (5 great person yogas)
-            "hamsa", "malavya", "sasa", "ruchaka", "bhadra",
-            # Sun-Based Yogas (BPHS Tier 1)
-            "vesi", "vosi", "ubhayachari",
-            # Moon-Based Yogas (BPHS Tier 1)
-            "sunapha", "anapha", "durudhura",
-            # Learning & Wisdom Yogas (BPHS Tier 1)
-            "saraswati",
-            # Major Raj Yogas
-            "raj yoga", "neecha bhanga",
-            # Major Dhana Yogas (classical wealth yogas)
-            # Note: "dhana yoga" is safe here because house lord yogas are filtered out
-            # by the category check above (lines 3906-3913) before reaching this point
-            "kubera", "lakshmi", "maha dhana", "dhana yoga",
-            # Major benefic yogas
-            "gajakesari", "gaja kesari", "adhi yoga", "vasumathi",
-            # Major challenging yogas
-            "kala sarpa", "kemadruma", "daridra", "shakata",
-            # Doshas (major afflictions)
-            "manglik", "grahan", "pitra", "kaal sarp"
-        ]
-
-        for keyword in major_keywords:
+        for keyword in self.MAJOR_YOGA_KEYWORDS:
             if keyword in name_lower:
                 return "major"
 
@@ -8250,11 +6718,6 @@ class ExtendedYogaService:
             return "major"
 
         # Moderate yogas - significant but not life-defining
-        moderate_keywords = [
-            "nabhasa", "sanyas", "yoga", "bhanga", "nitya",
-            "budhaditya", "chandra mangal", "guru mangal", "parivartana", "viparita"
-        ]
-
         # Nabhasa yogas are moderate
         if "nabhasa" in category_lower:
             return "moderate"
@@ -8268,7 +6731,7 @@ class ExtendedYogaService:
             return "moderate"
 
         # Check if any moderate keyword is present
-        for keyword in moderate_keywords:
+        for keyword in self.MODERATE_YOGA_KEYWORDS:
             if keyword in name_lower and strength in ["Strong", "Medium"]:
                 return "moderate"
 
@@ -8304,6 +6767,9 @@ class ExtendedYogaService:
         enriched["life_area"] = self._categorize_life_area(yoga["category"], yoga["name"])
         return enriched
 
+    # Rank of yoga strengths
+    STRENGTH_ORDER = MappingProxyType({"Very Strong": 4, "Strong": 3, "Medium": 2, "Weak": 1})
+
     def _deduplicate_yogas(self, yogas: List[Dict]) -> List[Dict]:
         """
         Deduplicate yogas that have the same name (with spelling variations).
@@ -8337,12 +6803,10 @@ class ExtendedYogaService:
                 # 2. Longer description
                 # 3. Strength order: Very Strong > Strong > Medium > Weak
 
-                strength_order = {"Very Strong": 4, "Strong": 3, "Medium": 2, "Weak": 1}
-
                 def yoga_priority(y):
                     desc = y.get("description", "")
                     has_notes = "[CANCELLED" in desc or "[WEAKENED" in desc
-                    strength_val = strength_order.get(y.get("strength", "Medium"), 2)
+                    strength_val = self.STRENGTH_ORDER.get(y.get("strength", "Medium"), 2)
                     desc_len = len(desc)
                     return (has_notes, strength_val, desc_len)
 
@@ -8452,54 +6916,8 @@ class ExtendedYogaService:
 
         When all 7 planets are in one category, creates specific energy pattern.
         """
-        yogas = []
-        main_planets = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
-
-        # Check if all planets exist
-        planets_present = [p for p in main_planets if p in planets and planets[p].get("house", 0)]
-        if len(planets_present) < 7:
-            return yogas
-
-        # Count planets in panaphara and apoklima
-        panaphara_count = 0
-        apoklima_count = 0
-
-        for planet_name in main_planets:
-            if planet_name not in planets:
-                continue
-
-            planet_house = planets[planet_name].get("house", 0)
-            if not planet_house:
-                continue
-
-            if self._in_panaphara(planet_house):
-                panaphara_count += 1
-            elif self._in_apoklima(planet_house):
-                apoklima_count += 1
-
-        # Check for Vaapī Yoga
-        if panaphara_count == 7:
-            yogas.append({
-                "name": "Vaapī Nabhasa Yoga - Panaphara",
-                "description": "All 7 planets in Panaphara houses (2,5,8,11) - steady progress, resourcefulness, balanced energy distribution, success through persistent effort",
-                "strength": "Medium",
-                "category": "Nabhasa Yoga - Pattern",
-                        "bphs_category": "Non-BPHS (Practical)",
-                        "bphs_section": "Modern/Practical Addition",
-                        "bphs_ref": "Not in BPHS spec"
-            })
-        elif apoklima_count == 7:
-            yogas.append({
-                "name": "Vaapī Nabhasa Yoga - Apoklima",
-                "description": "All 7 planets in Apoklima houses (3,6,9,12) - philosophical nature, behind-the-scenes work, delayed but lasting results, gradual growth",
-                "strength": "Medium",
-                "category": "Nabhasa Yoga - Pattern",
-                        "bphs_category": "Non-BPHS (Practical)",
-                        "bphs_section": "Modern/Practical Addition",
-                        "bphs_ref": "Not in BPHS spec"
-            })
-
-        return yogas
+        # Declarative rules (data/yoga_rules.json), evaluated once per chart
+        return self._rule_yogas("vaapi_nabhasa", planets)
 
     def _detect_kalanidhi_yoga(self, planets: Dict, options: Dict = None) -> List[Dict]:
         """
@@ -8618,6 +7036,9 @@ class ExtendedYogaService:
 
         return yogas
 
+    # Houses all planets must occupy for Bheri yoga
+    BHERI_HOUSES = (1, 2, 7, 12)
+
     def _detect_bheri_yoga(self, planets: Dict) -> List[Dict]:
         """
         Bherī Yoga (Ch.36.15-16): Venus in kendra, Jupiter in 9th, planets confined to houses 1,2,7,12
@@ -8644,13 +7065,12 @@ class ExtendedYogaService:
             return yogas
 
         # Check if all 7 planets are confined to houses 1, 2, 7, 12
-        allowed_houses = [1, 2, 7, 12]
-        seven_planets = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
+        seven_planets = SEVEN_PLANETS
 
         planets_confined = True
         for planet in seven_planets:
             planet_house = planets.get(planet, {}).get("house", 0)
-            if planet_house and planet_house not in allowed_houses:
+            if planet_house and planet_house not in self.BHERI_HOUSES:
                 planets_confined = False
                 break
 
@@ -8679,16 +7099,13 @@ class ExtendedYogaService:
         """
         yogas = []
 
-        # Natural benefics: Jupiter, Venus, Mercury, waxing Moon
-        natural_benefics = ["Jupiter", "Venus", "Mercury", "Moon"]
-
         # Get houses occupied by benefics
         benefics_in_1st = []
         benefics_in_5th = []
         benefics_in_2nd = []
         benefics_in_9th = []
 
-        for planet in natural_benefics:
+        for planet in self.NATURAL_BENEFICS_WITH_MOON:
             planet_data = planets.get(planet, {})
             house = planet_data.get("house", 0)
 
@@ -8920,15 +7337,12 @@ class ExtendedYogaService:
         """
         yogas = []
 
-        # Natural benefics: Jupiter, Venus, Mercury
-        benefics = ["Jupiter", "Venus", "Mercury"]
-
         # Check for benefics in 6th, 7th, 8th from Lagna
         benefics_in_6th = []
         benefics_in_7th = []
         benefics_in_8th = []
 
-        for planet in benefics:
+        for planet in self.NATURAL_BENEFICS:
             planet_house = planets.get(planet, {}).get("house", 0)
 
             if planet_house == 6:
@@ -9082,14 +7496,13 @@ class ExtendedYogaService:
         Effect: Divine blessings of respective deity - Vishnu (preservation), Shiva (transformation), Brahmā (creation)
         """
         yogas = []
-        kendra_houses = [1, 4, 7, 10]
 
         # Hari Yoga: Jupiter strong in kendra
         jup_data = planets.get("Jupiter", {})
         jup_house = jup_data.get("house", 0)
         jup_sign = jup_data.get("sign_num", 0)
 
-        if jup_house in kendra_houses:
+        if jup_house in self.KENDRA_HOUSES:
             jup_strong = False
             strength_reason = ""
 
@@ -9119,7 +7532,7 @@ class ExtendedYogaService:
         moon_house = moon_data.get("house", 0)
         moon_sign = moon_data.get("sign_num", 0)
 
-        if moon_house in kendra_houses:
+        if moon_house in self.KENDRA_HOUSES:
             moon_strong = False
             strength_reason = ""
 
@@ -9149,7 +7562,7 @@ class ExtendedYogaService:
             planet_house = planet_data.get("house", 0)
             planet_sign = planet_data.get("sign_num", 0)
 
-            if planet_house in kendra_houses:
+            if planet_house in self.KENDRA_HOUSES:
                 planet_strong = False
                 strength_reason = ""
 
@@ -9260,11 +7673,9 @@ class ExtendedYogaService:
         """
         yogas = []
 
-        benefics = ["Jupiter", "Venus", "Mercury", "Moon"]
-
         # Check 1st-7th axis
         axis_1_7 = []
-        for planet in benefics:
+        for planet in self.NATURAL_BENEFICS_WITH_MOON:
             house = planets.get(planet, {}).get("house", 0)
             if house in [1, 7]:
                 axis_1_7.append((planet, house))
@@ -9284,7 +7695,7 @@ class ExtendedYogaService:
 
         # Check 4th-10th axis
         axis_4_10 = []
-        for planet in benefics:
+        for planet in self.NATURAL_BENEFICS_WITH_MOON:
             house = planets.get(planet, {}).get("house", 0)
             if house in [4, 10]:
                 axis_4_10.append((planet, house))
@@ -9309,6 +7720,22 @@ class ExtendedYogaService:
     # Birth time-based yogas: Hora, Drekkana, Navamsa, Vargottama, Pushkara, Gandanta, Nakshatra
     # ==============================================================================
 
+    # Signs of Sun hora (fire/air) and Moon hora (water/earth)
+    FIRE_AIR_SIGNS = (1, 3, 5, 7, 9, 11)  # Aries, Gemini, Leo, Libra, Sagittarius, Aquarius
+    WATER_EARTH_SIGNS = (2, 4, 6, 8, 10, 12)  # Taurus, Cancer, Virgo, Scorpio, Capricorn, Pisces
+
+    # Signs at the water-fire junctions
+    GANDANTA_SIGNS = (12, 1, 4, 5, 8, 9)  # Pisces, Aries, Cancer, Leo, Scorpio, Sagittarius
+
+    # Birth nakshatras of the Moon -> nakshatra number
+    AUSPICIOUS_NAKSHATRAS = MappingProxyType({
+        "Rohini": 4, "Pushya": 8, "Uttara Phalguni": 12,
+        "Hasta": 13, "Shravana": 22, "Revati": 27
+    })
+    INAUSPICIOUS_NAKSHATRAS = MappingProxyType({
+        "Ardra": 6, "Ashlesha": 9, "Mula": 19
+    })
+
     def _detect_timing_yogas(self, planets: Dict) -> List[Dict]:
         """
         Timing-Based Yogas (8 yogas): Birth moment factors affecting life quality
@@ -9337,10 +7764,7 @@ class ExtendedYogaService:
         # Hora = half of sign (15 degrees each). Sun hora (odd signs 0-15°) or Moon hora (even signs 0-15°)
         # This is simplified - would need exact ascendant degrees
         # For now, consider Sun hora benefic for fire/air signs, Moon hora for water/earth
-        fire_air_signs = [1, 3, 5, 7, 9, 11]  # Aries, Gemini, Leo, Libra, Sagittarius, Aquarius
-        water_earth_signs = [2, 4, 6, 8, 10, 12]  # Taurus, Cancer, Virgo, Scorpio, Capricorn, Pisces
-
-        if asc_sign in fire_air_signs:
+        if asc_sign in self.FIRE_AIR_SIGNS:
             yogas.append({
                 "name": "Auspicious Sun Hora Birth",
                 "description": f"Birth in Sun hora with {self.SIGNS[asc_sign-1]} ascendant - vitality, authority, solar blessings, father's grace, daytime strength, active life force",
@@ -9352,7 +7776,7 @@ class ExtendedYogaService:
                 "yoga_forming_planets": ["Sun"]
             })
 
-        if asc_sign in water_earth_signs:
+        if asc_sign in self.WATER_EARTH_SIGNS:
             yogas.append({
                 "name": "Auspicious Moon Hora Birth",
                 "description": f"Birth in Moon hora with {self.SIGNS[asc_sign-1]} ascendant - nurturing, receptivity, lunar blessings, mother's grace, nighttime strength, emotional depth",
@@ -9424,15 +7848,14 @@ class ExtendedYogaService:
         # Yoga 6: Gandanta Birth (junction points between water and fire signs)
         # Gandanta = 48 minutes before/after junction of Pisces-Aries, Cancer-Leo, Scorpio-Sagittarius
         # This is a challenging yoga requiring remedial measures
-        gandanta_signs = [12, 1, 4, 5, 8, 9]  # Pisces, Aries, Cancer, Leo, Scorpio, Sagittarius
         # Simplified: check if ascendant or Moon in these signs (would need exact degrees)
 
         moon_sign = planets.get("Moon", {}).get("sign_num", 0)
-        if asc_sign in gandanta_signs or moon_sign in gandanta_signs:
+        if asc_sign in self.GANDANTA_SIGNS or moon_sign in self.GANDANTA_SIGNS:
             affected = []
-            if asc_sign in gandanta_signs:
+            if asc_sign in self.GANDANTA_SIGNS:
                 affected.append(f"Ascendant in {self.SIGNS[asc_sign-1]}")
-            if moon_sign in gandanta_signs:
+            if moon_sign in self.GANDANTA_SIGNS:
                 affected.append(f"Moon in {self.SIGNS[moon_sign-1]}")
 
             if affected:
@@ -9444,7 +7867,7 @@ class ExtendedYogaService:
                     "bphs_category": "Major Challenges",
                     "bphs_section": "D) Birth Timing Factors",
                     "bphs_ref": "Generic",
-                    "yoga_forming_planets": ["Moon"] if moon_sign in gandanta_signs else []
+                    "yoga_forming_planets": ["Moon"] if moon_sign in self.GANDANTA_SIGNS else []
                 })
 
         # Yoga 7: Auspicious Nakshatra Birth
@@ -9452,12 +7875,8 @@ class ExtendedYogaService:
         # Auspicious: Rohini (4), Pushya (8), Uttara Phalguni (12), Hasta (13), Shravana (22), Revati (27)
         moon_nakshatra = planets.get("Moon", {}).get("nakshatra", None)
         if moon_nakshatra:
-            auspicious_nakshatras = {
-                "Rohini": 4, "Pushya": 8, "Uttara Phalguni": 12,
-                "Hasta": 13, "Shravana": 22, "Revati": 27
-            }
             if isinstance(moon_nakshatra, str):
-                if moon_nakshatra in auspicious_nakshatras:
+                if moon_nakshatra in self.AUSPICIOUS_NAKSHATRAS:
                     yogas.append({
                         "name": f"Auspicious {moon_nakshatra} Birth",
                         "description": f"Moon in {moon_nakshatra} nakshatra - divine blessings, fortunate birth, natural prosperity, smooth life path, spiritual merit",
@@ -9470,11 +7889,8 @@ class ExtendedYogaService:
                     })
 
         # Yoga 8: Inauspicious Nakshatra Birth
-            inauspicious_nakshatras = {
-                "Ardra": 6, "Ashlesha": 9, "Mula": 19
-            }
             if isinstance(moon_nakshatra, str):
-                if moon_nakshatra in inauspicious_nakshatras:
+                if moon_nakshatra in self.INAUSPICIOUS_NAKSHATRAS:
                     yogas.append({
                         "name": f"Challenging {moon_nakshatra} Birth",
                         "description": f"Moon in {moon_nakshatra} nakshatra - karmic intensity, transformational challenges, requires remedial measures, eventual spiritual growth, deep insights",
@@ -9568,6 +7984,9 @@ class ExtendedYogaService:
 
         return yogas
 
+    # Planets checked for aspects on a vargottama Moon
+    VARGOTTAMA_MOON_ASPECTORS = ("Sun", "Mars", "Mercury", "Jupiter", "Venus", "Saturn")
+
     def _detect_strong_vargottama_moon(self, planets: Dict) -> List[Dict]:
         """
         Strong Vargottama Moon (Ch.39.42): Moon in same sign D1 & D9 + aspected by 4+ planets
@@ -9600,9 +8019,8 @@ class ExtendedYogaService:
             return yogas
 
         aspecting_planets = []
-        seven_planets = ["Sun", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
 
-        for planet in seven_planets:
+        for planet in self.VARGOTTAMA_MOON_ASPECTORS:
             planet_house = planets.get(planet, {}).get("house", 0)
             if planet_house and self._planet_aspects_house_simple(planet, planet_house, moon_house):
                 aspecting_planets.append(planet)
@@ -9669,6 +8087,14 @@ class ExtendedYogaService:
 
         return yogas
 
+    # Significations of the kendras
+    KENDRA_MEANINGS = MappingProxyType({
+        1: "self, personality, overall life",
+        4: "home, mother, emotions, happiness",
+        7: "marriage, partnerships, business",
+        10: "career, status, public recognition"
+    })
+
     def _detect_benefic_in_single_kendra(self, planets: Dict) -> List[Dict]:
         """
         Benefic in Single Kendra (Ch.39 Generic): One strong benefic in any single kendra
@@ -9679,15 +8105,7 @@ class ExtendedYogaService:
         """
         yogas = []
 
-        benefics = ["Jupiter", "Venus", "Mercury"]
-        kendra_meanings = {
-            1: "self, personality, overall life",
-            4: "home, mother, emotions, happiness",
-            7: "marriage, partnerships, business",
-            10: "career, status, public recognition"
-        }
-
-        for planet in benefics:
+        for planet in self.NATURAL_BENEFICS:
             planet_data = planets.get(planet, {})
             planet_sign = planet_data.get("sign_num", 0)
             planet_house = planet_data.get("house", 0)
@@ -9705,7 +8123,7 @@ class ExtendedYogaService:
 
             if is_exalted or is_own_sign:
                 strength_desc = "exalted" if is_exalted else "own sign"
-                life_area = kendra_meanings.get(planet_house, "life area")
+                life_area = self.KENDRA_MEANINGS.get(planet_house, "life area")
 
                 yogas.append({
                     "name": f"Strong {planet} in {planet_house}th Kendra",
@@ -9725,6 +8143,17 @@ class ExtendedYogaService:
     # Note: These require D9 (Navamsa) data integration
     # ==============================================================================
 
+    # Significations of the Parijata yoga lord
+    PARIJATA_PLANET_MEANINGS = MappingProxyType({
+        "Sun": "authority, leadership, father, government",
+        "Moon": "mind, emotions, mother, public",
+        "Mars": "courage, energy, siblings, property",
+        "Mercury": "intelligence, communication, business",
+        "Jupiter": "wisdom, dharma, children, fortune",
+        "Venus": "love, arts, spouse, luxury",
+        "Saturn": "discipline, service, longevity, karma"
+    })
+
     def _detect_parijata_yoga(self, planets: Dict) -> List[Dict]:
         """
         Parijāta Yoga (Ch.41.18): Planet exalted in both D1 and D9
@@ -9759,19 +8188,10 @@ class ExtendedYogaService:
                 d9_exalted = (planet_d9_sign == exalt_sign_d1)
 
             if d1_exalted and d9_exalted:
-                planet_meanings = {
-                    "Sun": "authority, leadership, father, government",
-                    "Moon": "mind, emotions, mother, public",
-                    "Mars": "courage, energy, siblings, property",
-                    "Mercury": "intelligence, communication, business",
-                    "Jupiter": "wisdom, dharma, children, fortune",
-                    "Venus": "love, arts, spouse, luxury",
-                    "Saturn": "discipline, service, longevity, karma"
-                }
 
                 yogas.append({
                     "name": f"Parijāta Yoga ({planet})",
-                    "description": f"{planet} exalted in both D1 and D9 - supreme excellence in {planet_meanings.get(planet, 'significations')}, fulfillment of highest potential, divine blessings like celestial Parijata tree",
+                    "description": f"{planet} exalted in both D1 and D9 - supreme excellence in {self.PARIJATA_PLANET_MEANINGS.get(planet, 'significations')}, fulfillment of highest potential, divine blessings like celestial Parijata tree",
                     "strength": "Very Strong",
                     "category": "Divisional Amplifier",
                     "bphs_category": "Divisional Yogas",
@@ -9992,6 +8412,17 @@ class ExtendedYogaService:
     # Note: These require comprehensive D9 data integration
     # ==============================================================================
 
+    # Significations of the Devaloka yoga lord
+    DEVALOKA_PLANET_MEANINGS = MappingProxyType({
+        "Sun": "leadership, authority, father, soul",
+        "Moon": "mind, emotions, mother, public relations",
+        "Mars": "courage, energy, property, siblings",
+        "Mercury": "intelligence, communication, commerce",
+        "Jupiter": "wisdom, fortune, children, dharma",
+        "Venus": "love, arts, luxury, partnerships",
+        "Saturn": "discipline, longevity, service, karma"
+    })
+
     def _detect_devaloka_yoga(self, planets: Dict) -> List[Dict]:
         """
         Devaloka Yoga (Ch.41.23): Planet in Mooltrikona in both D1 and D9
@@ -10021,19 +8452,10 @@ class ExtendedYogaService:
             d9_mooltrikona = (planet_d9_sign == mooltrikona_sign)
 
             if d1_mooltrikona and d9_mooltrikona:
-                planet_meanings = {
-                    "Sun": "leadership, authority, father, soul",
-                    "Moon": "mind, emotions, mother, public relations",
-                    "Mars": "courage, energy, property, siblings",
-                    "Mercury": "intelligence, communication, commerce",
-                    "Jupiter": "wisdom, fortune, children, dharma",
-                    "Venus": "love, arts, luxury, partnerships",
-                    "Saturn": "discipline, longevity, service, karma"
-                }
 
                 yogas.append({
                     "name": f"Devaloka Yoga ({planet})",
-                    "description": f"{planet} in Mooltrikona in both D1 and D9 - divine realm (devaloka) blessings in {planet_meanings.get(planet, 'significations')}, exceptional fortune, sustained excellence, godly favor",
+                    "description": f"{planet} in Mooltrikona in both D1 and D9 - divine realm (devaloka) blessings in {self.DEVALOKA_PLANET_MEANINGS.get(planet, 'significations')}, exceptional fortune, sustained excellence, godly favor",
                     "strength": "Very Strong",
                     "category": "Divisional Amplifier",
                     "bphs_category": "Major Positive Yogas",
@@ -10044,6 +8466,17 @@ class ExtendedYogaService:
 
         return yogas
 
+    # Significations of the Brahmaloka yoga lord
+    BRAHMALOKA_PLANET_MEANINGS = MappingProxyType({
+        "Sun": "authority, leadership, recognition",
+        "Moon": "emotional harmony, mental peace",
+        "Mars": "supported courage, protected energy",
+        "Mercury": "favorable communication, easy learning",
+        "Jupiter": "blessed wisdom, fortunate growth",
+        "Venus": "harmonious love, artistic success",
+        "Saturn": "supported discipline, rewarded patience"
+    })
+
     def _detect_brahmaloka_yoga(self, planets: Dict) -> List[Dict]:
         """
         Brahmaloka Yoga (Ch.41.24): Planet in friend's sign in both D1 and D9
@@ -10078,19 +8511,10 @@ class ExtendedYogaService:
             d9_friend_sign = d9_sign_lord in friends
 
             if d1_friend_sign and d9_friend_sign:
-                planet_meanings = {
-                    "Sun": "authority, leadership, recognition",
-                    "Moon": "emotional harmony, mental peace",
-                    "Mars": "supported courage, protected energy",
-                    "Mercury": "favorable communication, easy learning",
-                    "Jupiter": "blessed wisdom, fortunate growth",
-                    "Venus": "harmonious love, artistic success",
-                    "Saturn": "supported discipline, rewarded patience"
-                }
 
                 yogas.append({
                     "name": f"Brahmaloka Yoga ({planet})",
-                    "description": f"{planet} in friend's signs in both D1 (ruled by {d1_sign_lord}) and D9 (ruled by {d9_sign_lord}) - Brahma realm blessings in {planet_meanings.get(planet, 'significations')}, creative power, harmonious success, divine support",
+                    "description": f"{planet} in friend's signs in both D1 (ruled by {d1_sign_lord}) and D9 (ruled by {d9_sign_lord}) - Brahma realm blessings in {self.BRAHMALOKA_PLANET_MEANINGS.get(planet, 'significations')}, creative power, harmonious success, divine support",
                     "strength": "Strong",
                     "category": "Divisional Amplifier",
                     "bphs_category": "Major Positive Yogas",
@@ -10101,6 +8525,17 @@ class ExtendedYogaService:
 
         return yogas
 
+    # Significations of the Iravatamsa yoga lord
+    IRAVATAMSA_PLANET_MEANINGS = MappingProxyType({
+        "Sun": "leadership, authority, soul purpose",
+        "Moon": "emotional depth, intuitive wisdom",
+        "Mars": "courage, strategic action, delayed victories",
+        "Mercury": "communication mastery, analytical skills",
+        "Jupiter": "philosophical wisdom, spiritual growth",
+        "Venus": "refined taste, artistic development",
+        "Saturn": "earned authority, mature discipline"
+    })
+
     def _detect_iravatamsa_yoga(self, planets: Dict) -> List[Dict]:
         """
         Iravatāṁsa Yoga (Ch.41.25): Planet exalted in D9 only (not in D1)
@@ -10137,19 +8572,10 @@ class ExtendedYogaService:
 
             # Formation: NOT exalted in D1, BUT exalted in D9
             if not d1_exalted and d9_exalted:
-                planet_meanings = {
-                    "Sun": "leadership, authority, soul purpose",
-                    "Moon": "emotional depth, intuitive wisdom",
-                    "Mars": "courage, strategic action, delayed victories",
-                    "Mercury": "communication mastery, analytical skills",
-                    "Jupiter": "philosophical wisdom, spiritual growth",
-                    "Venus": "refined taste, artistic development",
-                    "Saturn": "earned authority, mature discipline"
-                }
 
                 yogas.append({
                     "name": f"Iravatāṁsa Yoga ({planet})",
-                    "description": f"{planet} exalted in D9 but not D1 - hidden potential in {planet_meanings.get(planet, 'significations')}, late blooming excellence, inner strength that manifests over time especially in marriage and dharma, like celestial elephant Iravata emerging",
+                    "description": f"{planet} exalted in D9 but not D1 - hidden potential in {self.IRAVATAMSA_PLANET_MEANINGS.get(planet, 'significations')}, late blooming excellence, inner strength that manifests over time especially in marriage and dharma, like celestial elephant Iravata emerging",
                     "strength": "Medium",
                     "category": "Divisional Amplifier",
                     "bphs_category": "Standard Yogas",
@@ -10162,15 +8588,22 @@ class ExtendedYogaService:
 
     def enrich_yogas(self, yogas: List[Dict]) -> List[Dict]:
         """Deduplicate and enrich all yogas with classification metadata"""
-        # NEW: Use comprehensive normalization system for proper deduplication and categorization
-        from app.services.yoga_normalization import deduplicate_yogas
-
         # First deduplicate using comprehensive normalization (handles spelling variations)
         deduplicated = deduplicate_yogas(yogas)
 
         # Then enrich with metadata
         return [self._enrich_yoga_with_metadata(yoga) for yoga in deduplicated]
 
+    def detect_enriched_yogas(
+        self,
+        planets: Dict[str, Any],
+        houses: Any = None,
+        categories: Optional[Iterable[str]] = None,
+        min_importance: Optional[str] = None
+    ) -> List[Dict]:
+        """Detect, deduplicate and enrich yogas in one call (one compute task)"""
+        return self.enrich_yogas(self.detect_extended_yogas(planets, houses, categories, min_importance))
+
 
 # Global instance
 extended_yoga_service = ExtendedYogaService()
@@ -3,34 +3,37 @@ Hyperlocal Panchang Service
 Handles complete Panchang calculations using Swiss Ephemeris
 """
 
-from typing import Optional, List, Dict, Any, Tuple
+import logging
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
-import logging
+from typing import Any, Dict, List, Optional, Tuple
+
 import swisseph as swe
 
+from app.core.compute import compute_executor
+from app.core.ephemeris import ephemeris
 from app.core.supabase_client import SupabaseClient
 from app.schemas.hyperlocal_panchang import (
+    AuspiciousTime,
+    DailyGuidance,
+    DayQuality,
     GetPanchangRequest,
-    SubscribeLocationRequest,
-    UpdatePanchangPreferencesRequest,
-    Panchang,
-    TithiInfo,
-    NakshatraInfo,
-    YogaInfo,
-    KaranaInfo,
-    VaraInfo,
     HoraInfo,
-    SunMoonData,
     InauspiciousTime,
-    AuspiciousTime,
-    PanchangSubscription,
-    PanchangPreferences,
-    DailyGuidance,
-    Paksha,
+    KaranaInfo,
     MoonPhase,
+    NakshatraInfo,
+    Paksha,
+    Panchang,
+    PanchangPreferences,
+    PanchangSubscription,
     Ritu,
-    DayQuality
+    SubscribeLocationRequest,
+    SunMoonData,
+    TithiInfo,
+    UpdatePanchangPreferencesRequest,
+    VaraInfo,
+    YogaInfo,
 )
 
 logger = logging.getLogger(__name__)
@@ -124,6 +127,24 @@ class HyperlocalPanchangService:
         longitude: float,
         timezone: str,
         location_name: Optional[str]
+    ) -> Dict[str, Any]:
+        """Calculate all Panchang elements in a compute worker"""
+        return await compute_executor.run(
+            calculate_panchang_data,
+            panchang_date,
+            latitude,
+            longitude,
+            timezone,
+            location_name
+        )
+
+    def _compute_panchang(
+        self,
+        panchang_date: date,
+        latitude: float,
+        longitude: float,
+        timezone: str,
+        location_name: Optional[str]
     ) -> Dict[str, Any]:
         """Calculate all Panchang elements"""
 
@@ -136,8 +157,8 @@ class HyperlocalPanchangService:
         )
 
         # Calculate Sun and Moon positions
-        sun_pos = swe.calc_ut(jd, swe.SUN)[0][0]  # Longitude in degrees
-        moon_pos = swe.calc_ut(jd, swe.MOON)[0][0]
+        sun_pos = ephemeris.calc_ut(jd, swe.SUN)[0][0]  # Longitude in degrees
+        moon_pos = ephemeris.calc_ut(jd, swe.MOON)[0][0]
 
         # Calculate Tithi
         tithi_info = self._calculate_tithi(moon_pos, sun_pos, jd, latitude, longitude)
@@ -398,8 +419,8 @@ class HyperlocalPanchangService:
                              int(sunset_utc[3]), int(sunset_utc[4]), int(sunset_utc[5]))
 
         # Moon phase calculation
-        moon_pos = swe.calc_ut(jd, swe.MOON)[0][0]
-        sun_pos = swe.calc_ut(jd, swe.SUN)[0][0]
+        moon_pos = ephemeris.calc_ut(jd, swe.MOON)[0][0]
+        sun_pos = ephemeris.calc_ut(jd, swe.SUN)[0][0]
         elongation = (moon_pos - sun_pos) % 360
 
         # Moon illumination (simplified)
@@ -652,3 +673,20 @@ class HyperlocalPanchangService:
         )
 
         return [PanchangSubscription(**sub) for sub in result] if result else []
+
+
+def calculate_panchang_data(
+    panchang_date: date,
+    latitude: float,
+    longitude: float,
+    timezone: str,
+    location_name: Optional[str]
+) -> Dict[str, Any]:
+    """Calculate Panchang without database access (picklable entry point for compute workers)"""
+    return HyperlocalPanchangService(supabase=None)._compute_panchang(
+        panchang_date,
+        latitude,
+        longitude,
+        timezone,
+        location_name
+    )
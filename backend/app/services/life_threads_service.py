@@ -4,6 +4,7 @@ Handles Dasha timeline generation and life event management
 """
 
 from typing import Optional, List, Dict, Any, Tuple
+from bisect import bisect_left, bisect_right
 from datetime import date, datetime, timedelta, timezone, time as datetime_time
 from decimal import Decimal
 import logging
@@ -23,6 +24,7 @@ from app.schemas.life_threads import (
     DashaAnalysis
 )
 from app.services.vedic_astrology_accurate import AccurateVedicAstrology
+from app.services.dasha_engine import get_timeline, mahadasha_index_at
 
 logger = logging.getLogger(__name__)
 
@@ -283,7 +285,8 @@ class LifeThreadsService:
                 birth_time=birth_time_obj,
                 latitude=latitude,
                 longitude=longitude,
-                timezone_str="Asia/Kolkata"
+                timezone_str="Asia/Kolkata",
+                include=["dasha"]  # Only the mahadasha timeline is used
             )
 
             # Get the Vimshottari Dasha data from chart
@@ -308,7 +311,10 @@ class LifeThreadsService:
                 "profile_id": profile_id,
                 "birth_date": birth_date.isoformat(),
                 "vimshottari_start_date": birth_date.isoformat(),
-                "mahadasha_periods": mahadasha_periods
+                "mahadasha_periods": mahadasha_periods,
+                # Lets sub-periods be looked up without recalculating the chart
+                "moon_longitude": chart_data["planets"]["Moon"]["longitude"],
+                "birth_datetime": datetime.combine(birth_date, birth_time_obj).isoformat()
             }
 
         except Exception as e:
@@ -400,26 +406,32 @@ class LifeThreadsService:
 
         events = events_result if events_result else []
 
-        # Map events to Mahadasha periods
+        # Map events to Mahadasha periods: with events sorted by date, each
+        # period's events are a contiguous slice found by bisection
+        dated_events = sorted(
+            ((datetime.fromisoformat(event["event_date"]).date(), event) for event in events),
+            key=lambda item: item[0]
+        )
+        event_dates = [event_date for event_date, _ in dated_events]
         mahadasha_blocks = []
         for period in timeline_data["mahadasha_periods"]:
             period_start = datetime.fromisoformat(period["start_date"]).date()
             period_end = datetime.fromisoformat(period["end_date"]).date()
 
-            # Find events in this period
+            first = bisect_left(event_dates, period_start)
+            last = bisect_right(event_dates, period_end)
             period_events = [
                 TimelineEvent(
                     id=event["id"],
                     event_name=event["event_name"],
-                    event_date=datetime.fromisoformat(event["event_date"]).date(),
+                    event_date=event_date,
                     event_type=event["event_type"],
                     event_impact=event.get("event_impact"),
                     is_milestone=event["is_milestone"],
                     dasha_lord=period["planet"],
                     tags=event.get("tags", [])
                 )
-                for event in events
-                if period_start <= datetime.fromisoformat(event["event_date"]).date() <= period_end
+                for event_date, event in dated_events[first:last]
             ]
 
             mahadasha_blocks.append(
@@ -478,12 +490,28 @@ class LifeThreadsService:
                 profile.get("longitude")
             )
 
+        # Timelines with the Moon's position resolve sub-periods as well
+        if timeline.get("moon_longitude") is not None and timeline.get("birth_datetime"):
+            dasha_timeline = get_timeline(
+                timeline["moon_longitude"],
+                datetime.fromisoformat(timeline["birth_datetime"])
+            )
+            periods = dasha_timeline.periods_at(event_date, depth=3)
+            dasha_period = {}
+            for period in periods:
+                dasha_period[period["level"]] = period["planet"]
+                dasha_period[f"{period['level']}_start"] = period["start_date"]
+                dasha_period[f"{period['level']}_end"] = period["end_date"]
+            return dasha_period
+
         # Find Mahadasha for date
-        for period in timeline["mahadasha_periods"]:
+        periods = timeline["mahadasha_periods"]
+        index = mahadasha_index_at([period["start_date"] for period in periods], event_date)
+        if index >= 0:
+            period = periods[index]
             start = datetime.fromisoformat(period["start_date"]).date()
             end = datetime.fromisoformat(period["end_date"]).date()
-
-            if start <= event_date <= end:
+            if event_date <= end:
                 return {
                     "mahadasha": period["planet"],
                     "mahadasha_start": start.isoformat(),
@@ -10,6 +10,7 @@ Uses Swiss Ephemeris for accurate astronomical calculations.
 """
 
 import swisseph as swe
+from app.core.ephemeris import ephemeris
 from datetime import datetime, timedelta, time
 from typing import Dict, List, Tuple, Optional, Any
 import math
@@ -110,8 +111,8 @@ class MuhurtaService:
         jd = self._datetime_to_julian(dt)
 
         # Get Sun and Moon positions (tropical)
-        sun_pos = swe.calc_ut(jd, swe.SUN)[0][0]
-        moon_pos = swe.calc_ut(jd, swe.MOON)[0][0]
+        sun_pos = ephemeris.calc_ut(jd, swe.SUN)[0][0]
+        moon_pos = ephemeris.calc_ut(jd, swe.MOON)[0][0]
 
         # Calculate tithi
         diff = self._normalize_degrees(moon_pos - sun_pos)
@@ -155,7 +156,7 @@ class MuhurtaService:
         jd = self._datetime_to_julian(dt)
 
         # Get Moon position (sidereal)
-        moon_pos_sidereal = swe.calc_ut(jd, swe.MOON, swe.FLG_SIDEREAL)[0][0]
+        moon_pos_sidereal = ephemeris.calc_ut(jd, swe.MOON, swe.FLG_SIDEREAL)[0][0]
 
         # Calculate nakshatra (0-26)
         nakshatra_num = int(moon_pos_sidereal / (360.0 / 27.0))
@@ -197,8 +198,8 @@ class MuhurtaService:
         jd = self._datetime_to_julian(dt)
 
         # Get Sun and Moon positions (sidereal)
-        sun_pos = swe.calc_ut(jd, swe.SUN, swe.FLG_SIDEREAL)[0][0]
-        moon_pos = swe.calc_ut(jd, swe.MOON, swe.FLG_SIDEREAL)[0][0]
+        sun_pos = ephemeris.calc_ut(jd, swe.SUN, swe.FLG_SIDEREAL)[0][0]
+        moon_pos = ephemeris.calc_ut(jd, swe.MOON, swe.FLG_SIDEREAL)[0][0]
 
         # Calculate yoga
         combined = self._normalize_degrees(sun_pos + moon_pos)
@@ -235,8 +236,8 @@ class MuhurtaService:
         jd = self._datetime_to_julian(dt)
 
         # Get Sun and Moon positions
-        sun_pos = swe.calc_ut(jd, swe.SUN)[0][0]
-        moon_pos = swe.calc_ut(jd, swe.MOON)[0][0]
+        sun_pos = ephemeris.calc_ut(jd, swe.SUN)[0][0]
+        moon_pos = ephemeris.calc_ut(jd, swe.MOON)[0][0]
 
         # Calculate karana
         diff = self._normalize_degrees(moon_pos - sun_pos)
@@ -345,8 +346,8 @@ class MuhurtaService:
         step = 1.0  # Start with 1 day step
 
         for _ in range(20):  # Max iterations
-            sun_pos = swe.calc_ut(jd, swe.SUN)[0][0]
-            moon_pos = swe.calc_ut(jd, swe.MOON)[0][0]
+            sun_pos = ephemeris.calc_ut(jd, swe.SUN)[0][0]
+            moon_pos = ephemeris.calc_ut(jd, swe.MOON)[0][0]
             diff = self._normalize_degrees(moon_pos - sun_pos)
 
             if abs(diff - target_diff) < 0.01:  # Converged
@@ -366,7 +367,7 @@ class MuhurtaService:
         step = 1.0
 
         for _ in range(20):
-            moon_pos = swe.calc_ut(jd, swe.MOON, swe.FLG_SIDEREAL)[0][0]
+            moon_pos = ephemeris.calc_ut(jd, swe.MOON, swe.FLG_SIDEREAL)[0][0]
 
             if abs(moon_pos - target_pos) < 0.01:
                 break
@@ -385,8 +386,8 @@ class MuhurtaService:
         step = 1.0
 
         for _ in range(20):
-            sun_pos = swe.calc_ut(jd, swe.SUN, swe.FLG_SIDEREAL)[0][0]
-            moon_pos = swe.calc_ut(jd, swe.MOON, swe.FLG_SIDEREAL)[0][0]
+            sun_pos = ephemeris.calc_ut(jd, swe.SUN, swe.FLG_SIDEREAL)[0][0]
+            moon_pos = ephemeris.calc_ut(jd, swe.MOON, swe.FLG_SIDEREAL)[0][0]
             combined = self._normalize_degrees(sun_pos + moon_pos)
 
             if abs(combined - target_combined) < 0.01:
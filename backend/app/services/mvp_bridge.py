@@ -9,15 +9,20 @@ from datetime import datetime, date, time
 import hashlib
 import json
 from app.services.astrology import astrology_service
+from app.services.chart_cache_service import chart_cache_service
 from app.services.supabase_service import supabase_service
 
 
 class MVPBridge:
     """Bridge layer between existing MVP and AI Engine"""
 
+    # Chart type -> key in the bridge's `charts` payload
+    CHART_KEYS = {"D1": "rasi", "D9": "navamsa", "Moon": "moon"}
+
     def __init__(self):
         """Initialize MVP Bridge"""
         self.astrology = astrology_service
+        self.chart_cache = chart_cache_service
         self.db = supabase_service
 
     def generate_canonical_hash(self, input_params: Dict[str, Any]) -> str:
@@ -104,44 +109,19 @@ class MVPBridge:
             if cached_result:
                 return cached_result
 
-        # Calculate charts using existing services
-        charts = {}
-
-        # D1 (Rashi) - Birth chart
-        if 'D1' in chart_types:
-            charts['rasi'] = self.astrology.calculate_birth_chart(
-                name=name,
-                birth_date=birth_date,
-                birth_time=birth_time,
-                latitude=latitude,
-                longitude=longitude,
-                timezone_str=timezone_str,
-                city=city
-            )
-
-        # D9 (Navamsa)
-        if 'D9' in chart_types:
-            charts['navamsa'] = self.astrology.calculate_navamsa_chart(
-                name=name,
-                birth_date=birth_date,
-                birth_time=birth_time,
-                latitude=latitude,
-                longitude=longitude,
-                timezone_str=timezone_str,
-                city=city
-            )
-
-        # Moon Chart (Chandra Kundali)
-        if 'Moon' in chart_types:
-            charts['moon'] = self.astrology.calculate_moon_chart(
-                name=name,
-                birth_date=birth_date,
-                birth_time=birth_time,
-                latitude=latitude,
-                longitude=longitude,
-                timezone_str=timezone_str,
-                city=city
-            )
+        # Calculate all requested charts from a single D1 computation,
+        # reusing charts already calculated for the same birth data
+        bundle = await self.chart_cache.calculate_chart_bundle(
+            name=name,
+            birth_date=birth_date,
+            birth_time=birth_time,
+            latitude=latitude,
+            longitude=longitude,
+            timezone_str=timezone_str,
+            city=city,
+            chart_types=[chart_type for chart_type in chart_types if chart_type in self.CHART_KEYS]
+        )
+        charts = {self.CHART_KEYS[chart_type]: chart for chart_type, chart in bundle.items()}
 
         # Extract dashas from D1 chart
         dashas = {}
@@ -221,7 +201,8 @@ class MVPBridge:
             latitude=latitude,
             longitude=longitude,
             timezone_str=timezone_str,
-            city="Current Location"
+            city="Current Location",
+            include=[]  # Only planetary positions are used
         )
 
         return {
@@ -6,6 +6,7 @@ Answers specific questions based on the chart cast for the moment the question i
 from typing import Dict, List, Any, Tuple, Optional
 from datetime import datetime
 import swisseph as swe
+from app.core.ephemeris import ephemeris
 import pytz
 
 
@@ -130,7 +131,7 @@ class PrashnaService:
         )
 
         # Get ayanamsa
-        ayanamsa = swe.get_ayanamsa_ut(jd)
+        ayanamsa = ephemeris.get_ayanamsa_ut(jd)
 
         # Calculate Ascendant
         cusps, ascmc = swe.houses(jd, latitude, longitude, b'P')
@@ -199,7 +200,7 @@ class PrashnaService:
                 planet_data["degree"] = ketu_pos % 30
             else:
                 # Calculate planet position
-                planet_data_raw, ret_flag = swe.calc_ut(jd, planet_id)
+                planet_data_raw, ret_flag = ephemeris.calc_ut(jd, planet_id)
                 tropical_long = planet_data_raw[0]
                 sidereal_long = (tropical_long - ayanamsa) % 360
 
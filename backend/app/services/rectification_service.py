@@ -76,7 +76,8 @@ class RectificationService:
                     latitude=latitude,
                     longitude=longitude,
                     timezone_str=timezone_str,
-                    city=city
+                    city=city,
+                    include=[]  # Scoring only needs core positions
                 )
 
                 # Score this candidate against event anchors
@@ -64,6 +64,14 @@ class SupabaseService:
         response = query.execute()
         return response.data[0] if response.data else None
 
+    async def get_profiles_by_ids(self, profile_ids: List[str], user_id: str = None) -> List[Dict[str, Any]]:
+        """Get several profiles in one query - user_id is optional for admin access"""
+        query = self.client.table("profiles").select("*").in_("id", profile_ids)
+        if user_id:
+            query = query.eq("user_id", user_id)
+        response = query.execute()
+        return response.data if response.data else []
+
     async def update_profile(self, profile_id: str, user_id: str, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update a profile"""
         # If setting as primary, unset others
@@ -98,6 +106,23 @@ class SupabaseService:
         response = self.client.table("charts").insert(data).execute()
         return response.data[0] if response.data else None
 
+    async def update_chart(self, profile_id: str, chart_type: str, chart_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Replace the cached data of an existing chart"""
+        response = self.client.table("charts").update({
+            "chart_data": chart_data,
+            "calculated_at": datetime.utcnow().isoformat()
+        }).eq("profile_id", profile_id).eq("chart_type", chart_type).execute()
+        return response.data[0] if response.data else None
+
+    async def upsert_charts(self, charts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insert or replace many charts in one request (unique on profile_id + chart_type)"""
+        if not charts:
+            return []
+        calculated_at = datetime.utcnow().isoformat()
+        rows = [{**chart, "calculated_at": calculated_at} for chart in charts]
+        response = self.client.table("charts").upsert(rows, on_conflict="profile_id,chart_type").execute()
+        return response.data if response.data else []
+
     async def get_chart(self, profile_id: str, chart_type: str) -> Optional[Dict[str, Any]]:
         """Get a chart"""
         response = self.client.table("charts").select("*").eq("profile_id", profile_id).eq("chart_type", chart_type).execute()
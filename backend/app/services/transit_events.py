@@ -0,0 +1,347 @@
+"""
+Event-driven transit engine.
+
+Finds the moments at which transits change, at their exact times, instead
+of sampling positions day by day:
+
+- Sign ingresses (sidereal 30° boundaries)
+- Nakshatra changes (13°20' boundaries)
+- Retrograde and direct stations (the speed changes sign)
+- Conjunctions with natal degrees (every exact pass, including the
+  retrograde returns)
+
+Each body is sampled once per STEP_DAYS[body]. Steps are shorter than half
+the shortest interval between two stations of the body, so a step holds at
+most one station, found as a sign change of the speed and solved on the
+speed (Illinois regula falsi). Between stations the longitude is monotonic,
+so every boundary between two samples is crossed exactly once; it is
+bracketed by the samples and solved on the longitude (Newton steps with the
+ephemeris speed, kept inside the bracket). The number of ephemeris calls
+therefore follows the number of events (a few per event) plus a handful of
+samples per station period, not the number of days.
+
+Times are Julian days (UT); positions are sidereal (Lahiri) from
+app.core.ephemeris.
+
+Usage:
+    from app.services.transit_events import transit_event_engine
+
+    events = transit_event_engine.find_events(
+        start_jd, end_jd, natal_points={"Moon": 142.22}
+    )
+"""
+
+import math
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import swisseph as swe
+
+from app.core.chart_core import NAKSHATRA_NAMES, SIGN_NAMES
+from app.core.ephemeris import ephemeris
+
+FLAGS = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | swe.FLG_SPEED
+
+SIGN_SPAN = 30.0
+NAKSHATRA_SPAN = 360.0 / 27
+
+EVENT_TYPES = ("sign_ingress", "nakshatra_change", "station_retrograde", "station_direct", "natal_conjunction")
+
+# Swiss Ephemeris body and longitude offset (Ketu is opposite the mean node)
+BODIES = MappingProxyType({
+    "Sun": (swe.SUN, 0.0),
+    "Moon": (swe.MOON, 0.0),
+    "Mars": (swe.MARS, 0.0),
+    "Mercury": (swe.MERCURY, 0.0),
+    "Jupiter": (swe.JUPITER, 0.0),
+    "Venus": (swe.VENUS, 0.0),
+    "Saturn": (swe.SATURN, 0.0),
+    "Rahu": (swe.MEAN_NODE, 0.0),
+    "Ketu": (swe.MEAN_NODE, 180.0)
+})
+
+# Bodies with retrograde periods (the Sun, the Moon and the mean nodes never station)
+STATIONING_BODIES = frozenset(("Mars", "Mercury", "Jupiter", "Venus", "Saturn"))
+
+# Sampling step in days: under half the shortest interval between two
+# stations over 1900-2100 (Mercury 19 days, Venus 40, Mars 60, Jupiter 117,
+# Saturn 133), and under 180° of travel so longitudes unwrap unambiguously
+STEP_DAYS = MappingProxyType({
+    "Sun": 150.0,
+    "Moon": 11.0,
+    "Mars": 30.0,
+    "Mercury": 9.0,
+    "Jupiter": 58.0,
+    "Venus": 20.0,
+    "Saturn": 66.0,
+    "Rahu": 3000.0,
+    "Ketu": 3000.0
+})
+
+# Event times are solved to the ephemeris cache resolution (one second)
+TIME_TOLERANCE = 1.0 / 86400.0
+MAX_ITERATIONS = 60
+
+_JD_UNIX_EPOCH = 2440587.5
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_BODY_ORDER = {body: index for index, body in enumerate(BODIES)}
+_EVENT_ORDER = {event_type: index for index, event_type in enumerate(EVENT_TYPES)}
+
+
+def datetime_to_jd(moment: datetime) -> float:
+    """Julian day (UT) of a datetime (naive datetimes are taken as UTC)"""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return _JD_UNIX_EPOCH + (moment - _UNIX_EPOCH).total_seconds() / 86400.0
+
+
+def jd_to_datetime(jd: float) -> datetime:
+    """UTC datetime of a Julian day (UT)"""
+    return _UNIX_EPOCH + timedelta(days=jd - _JD_UNIX_EPOCH)
+
+
+class TransitEventEngine:
+    """Exact transit events of the grahas over a time range"""
+
+    def __init__(self):
+        """Initialize with Lahiri ayanamsa"""
+        swe.set_sid_mode(swe.SIDM_LAHIRI)
+        self.ephemeris = ephemeris
+
+    def find_events(
+        self,
+        start_jd: float,
+        end_jd: float,
+        bodies: Optional[Iterable[str]] = None,
+        event_types: Optional[Iterable[str]] = None,
+        natal_points: Optional[Mapping[str, float]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Transit events in (start_jd, end_jd], sorted by time
+
+        Args:
+            start_jd: Start of the range (Julian day, UT)
+            end_jd: End of the range (Julian day, UT)
+            bodies: Transiting bodies (keys of BODIES; default: all)
+            event_types: Event types (EVENT_TYPES; default: all)
+            natal_points: Natal point name -> sidereal longitude, for
+                natal_conjunction events
+
+        Returns:
+            Events with jd, planet, event_type, longitude, retrograde,
+            description and type-specific fields (from_sign/to_sign,
+            from_nakshatra/to_nakshatra, sign, natal_point)
+
+        Raises:
+            ValueError: If a body or event type is unknown, or end_jd < start_jd
+        """
+        bodies = list(BODIES) if bodies is None else list(bodies)
+        event_types = set(EVENT_TYPES if event_types is None else event_types)
+
+        unknown = [body for body in bodies if body not in BODIES]
+        unknown += [event_type for event_type in event_types if event_type not in _EVENT_ORDER]
+        if unknown:
+            raise ValueError(f"Unknown transit bodies or event types: {', '.join(map(str, unknown))}")
+        if end_jd < start_jd:
+            raise ValueError("end_jd must not be before start_jd")
+
+        # Boundaries to find crossings of: (event type, spacing, offset, natal point)
+        targets = []
+        if "sign_ingress" in event_types:
+            targets.append(("sign_ingress", SIGN_SPAN, 0.0, None))
+        if "nakshatra_change" in event_types:
+            targets.append(("nakshatra_change", NAKSHATRA_SPAN, 0.0, None))
+        if "natal_conjunction" in event_types:
+            targets.extend(
+                ("natal_conjunction", 360.0, float(lon) % 360.0, name)
+                for name, lon in (natal_points or {}).items()
+            )
+
+        events = []
+        for body in bodies:
+            events.extend(self._body_events(body, start_jd, end_jd, targets, event_types))
+
+        events.sort(key=lambda event: (event["jd"], _BODY_ORDER[event["planet"]], _EVENT_ORDER[event["event_type"]]))
+        return events
+
+    def _state(self, body: str, jd: float) -> Tuple[float, float]:
+        """Sidereal longitude and speed of a body"""
+        planet_id, offset = BODIES[body]
+        position, _ = self.ephemeris.calc_ut(jd, planet_id, FLAGS)
+        return (position[0] + offset) % 360.0, position[3]
+
+    def _body_events(
+        self,
+        body: str,
+        start_jd: float,
+        end_jd: float,
+        targets: List[Tuple[str, float, float, Optional[str]]],
+        event_types: Iterable[str]
+    ) -> List[Dict[str, Any]]:
+        """Events of one body, walking the range one step at a time"""
+        stations = body in STATIONING_BODIES and bool({"station_retrograde", "station_direct"} & set(event_types))
+        track_speed = body in STATIONING_BODIES
+        step = STEP_DAYS[body]
+        events = []
+
+        t0 = start_jd
+        lon0, speed0 = self._state(body, t0)
+        while t0 < end_jd:
+            t1 = min(t0 + step, end_jd)
+            lon1, speed1 = self._state(body, t1)
+
+            if track_speed and (speed0 < 0) != (speed1 < 0):
+                # One station in the step: split the step there
+                station = self._find_station(body, t0, speed0, t1, speed1)
+                lon_s, _ = self._state(body, station)
+                events.extend(self._crossings(body, t0, lon0, station, lon_s, speed0 >= 0, targets))
+                if stations:
+                    events.append(self._station_event(body, station, lon_s, retrograde=speed1 < 0))
+                events.extend(self._crossings(body, station, lon_s, t1, lon1, speed1 >= 0, targets))
+            else:
+                events.extend(self._crossings(body, t0, lon0, t1, lon1, speed0 >= 0, targets))
+
+            t0, lon0, speed0 = t1, lon1, speed1
+
+        return events
+
+    def _crossings(
+        self,
+        body: str,
+        ta: float,
+        lon_a: float,
+        tb: float,
+        lon_b: float,
+        direct: bool,
+        targets: List[Tuple[str, float, float, Optional[str]]]
+    ) -> List[Dict[str, Any]]:
+        """Events of the boundaries crossed while the longitude moves monotonically from ta to tb"""
+        if not targets or tb <= ta:
+            return []
+
+        # Unwrapped travel (under 180° per step)
+        travel = (lon_b - lon_a) % 360.0 if direct else -((lon_a - lon_b) % 360.0)
+        low, high = (lon_a, lon_a + travel) if direct else (lon_a + travel, lon_a)
+
+        events = []
+        for event_type, spacing, offset, natal_point in targets:
+            # Boundaries offset + k * spacing in (low, high]
+            first = math.floor((low - offset) / spacing) + 1
+            last = math.floor((high - offset) / spacing)
+            for k in range(first, last + 1):
+                boundary = offset + k * spacing
+                jd = self._find_crossing(body, ta, lon_a, tb, travel, boundary)
+                events.append(self._crossing_event(body, event_type, jd, boundary, k, direct, natal_point))
+        return events
+
+    def _find_crossing(self, body: str, ta: float, lon_a: float, tb: float, travel: float, boundary: float) -> float:
+        """Moment the body reaches an (unwrapped) boundary between ta and tb"""
+        direction = 1.0 if travel >= 0 else -1.0
+        distance = (boundary - lon_a) * direction
+        low, high = ta, tb
+
+        # Linear interpolation, then Newton steps on the longitude
+        t = ta + (tb - ta) * distance / abs(travel)
+        for _ in range(MAX_ITERATIONS):
+            lon, speed = self._state(body, t)
+            moved = ((lon - lon_a) * direction + 180.0) % 360.0 - 180.0
+            error = moved - distance
+            if error < 0:
+                low = t
+            else:
+                high = t
+
+            rate = speed * direction
+            t_next = t - error / rate if rate > 0 else None
+            if t_next is None or not low <= t_next <= high:
+                t_next = (low + high) / 2
+            if abs(t_next - t) < TIME_TOLERANCE or high - low < TIME_TOLERANCE:
+                return t_next
+            t = t_next
+        return t
+
+    def _find_station(self, body: str, ta: float, speed_a: float, tb: float, speed_b: float) -> float:
+        """Moment the speed of a body changes sign between ta and tb (Illinois regula falsi)"""
+        t = previous = ta
+        side = 0
+        for _ in range(MAX_ITERATIONS):
+            t = (ta * speed_b - tb * speed_a) / (speed_b - speed_a)
+            if abs(t - previous) < TIME_TOLERANCE or tb - ta < TIME_TOLERANCE:
+                break
+            previous = t
+
+            _, speed = self._state(body, t)
+            if (speed < 0) == (speed_b < 0):
+                tb, speed_b = t, speed
+                if side == -1:
+                    speed_a /= 2
+                side = -1
+            else:
+                ta, speed_a = t, speed
+                if side == 1:
+                    speed_b /= 2
+                side = 1
+        return t
+
+    def _crossing_event(
+        self,
+        body: str,
+        event_type: str,
+        jd: float,
+        boundary: float,
+        index: int,
+        direct: bool,
+        natal_point: Optional[str]
+    ) -> Dict[str, Any]:
+        """Event of a boundary crossing (index: boundary number of the grid)"""
+        longitude = boundary % 360.0
+        motion = "" if direct else " (retrograde)"
+
+        if event_type == "sign_ingress":
+            entered, left = (index, index - 1) if direct else (index - 1, index)
+            from_sign, to_sign = SIGN_NAMES[left % 12], SIGN_NAMES[entered % 12]
+            fields = {"from_sign": from_sign, "to_sign": to_sign}
+            description = f"{body} enters {to_sign}{motion}"
+        elif event_type == "nakshatra_change":
+            entered, left = (index, index - 1) if direct else (index - 1, index)
+            from_nakshatra, to_nakshatra = NAKSHATRA_NAMES[left % 27], NAKSHATRA_NAMES[entered % 27]
+            fields = {"from_nakshatra": from_nakshatra, "to_nakshatra": to_nakshatra}
+            description = f"{body} enters {to_nakshatra} nakshatra{motion}"
+        else:
+            fields = {"natal_point": natal_point, "sign": SIGN_NAMES[int(longitude // SIGN_SPAN) % 12]}
+            description = f"{body} conjoins natal {natal_point}{motion}"
+
+        return self._event(body, event_type, jd, longitude, not direct, description, fields)
+
+    def _station_event(self, body: str, jd: float, longitude: float, retrograde: bool) -> Dict[str, Any]:
+        """Event of a station (retrograde: the body turns retrograde)"""
+        sign = SIGN_NAMES[int(longitude // SIGN_SPAN) % 12]
+        event_type = "station_retrograde" if retrograde else "station_direct"
+        description = f"{body} stations {'retrograde' if retrograde else 'direct'} in {sign}"
+        return self._event(body, event_type, jd, longitude, retrograde, description, {"sign": sign})
+
+    def _event(
+        self,
+        body: str,
+        event_type: str,
+        jd: float,
+        longitude: float,
+        retrograde: bool,
+        description: str,
+        fields: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return {
+            "jd": round(jd, 6),
+            "planet": body,
+            "event_type": event_type,
+            "longitude": round(longitude, 4),
+            "retrograde": retrograde,
+            **fields,
+            "description": description
+        }
+
+
+# Singleton instance
+transit_event_engine = TransitEventEngine()
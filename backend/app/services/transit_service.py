@@ -1,11 +1,21 @@
 """
 Transit and Sade Sati Calculation Service
-Calculates current planetary transits and Sade Sati periods
+Calculates current planetary transits, transit timelines and Sade Sati periods
 """
 
+from collections import Counter
 from typing import Dict, Any, List, Optional
 from datetime import datetime, date, timedelta
+import pytz
 import swisseph as swe
+from app.core.chart_core import ASCENDANT_KEYS, GRAHAS
+from app.core.ephemeris import ephemeris
+from app.services.transit_events import (
+    EVENT_TYPES,
+    datetime_to_jd,
+    jd_to_datetime,
+    transit_event_engine,
+)
 
 
 class TransitService:
@@ -24,6 +34,12 @@ class TransitService:
         "Ketu": swe.MEAN_NODE  # Ketu is 180° from Rahu
     }
 
+    # Planets listed in upcoming sign changes (the Moon changes sign every ~2.5 days)
+    SIGN_CHANGE_PLANETS = ("Sun", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu")
+
+    # Longest transit timeline (the Moon alone has ~400 events a year)
+    MAX_TIMELINE_DAYS = 3 * 366
+
     def __init__(self):
         """Initialize with Lahiri ayanamsa"""
         swe.set_sid_mode(swe.SIDM_LAHIRI)
@@ -52,7 +68,7 @@ class TransitService:
         jd = swe.julday(reference_date.year, reference_date.month, reference_date.day, 12.0)
 
         # Get ayanamsa
-        ayanamsa = swe.get_ayanamsa_ut(jd)
+        ayanamsa = ephemeris.get_ayanamsa_ut(jd)
 
         transits = {}
 
@@ -62,7 +78,7 @@ class TransitService:
                 continue  # Calculate Ketu from Rahu
 
             # Calculate tropical position
-            result = swe.calc_ut(jd, planet_id, swe.FLG_SWIEPH)
+            result = ephemeris.calc_ut(jd, planet_id, swe.FLG_SWIEPH)
             tropical_long = result[0][0]
 
             # Convert to sidereal
@@ -112,6 +128,129 @@ class TransitService:
             "significant_transits": self._identify_significant_transits(transits)
         }
 
+    def calculate_transit_timeline(
+        self,
+        birth_chart: Dict[str, Any],
+        start_date: datetime,
+        end_date: datetime,
+        latitude: float = 0.0,
+        longitude: float = 0.0,
+        timezone_str: str = "UTC",
+        planets: Optional[List[str]] = None,
+        event_types: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Calculate the transit events between two moments, in time order
+
+        Sign ingresses, nakshatra changes, retrograde/direct stations and
+        conjunctions with the natal planets and ascendant, at their exact
+        times (see app.services.transit_events).
+
+        Args:
+            birth_chart: Chart data (planets and ascendant with sidereal longitudes)
+            start_date: Start of the timeline (naive datetimes are in timezone_str)
+            end_date: End of the timeline (naive datetimes are in timezone_str)
+            latitude: Observer latitude (positions are geocentric, so unused)
+            longitude: Observer longitude (positions are geocentric, so unused)
+            timezone_str: Timezone of naive dates and of event dates
+            planets: Transiting planets (default: all nine grahas)
+            event_types: Event types to include (default: all EVENT_TYPES)
+
+        Returns:
+            Dictionary with the range, the events (each with its local date)
+            and event counts by type
+
+        Raises:
+            ValueError: If the timezone is unknown, the range is reversed or
+                longer than MAX_TIMELINE_DAYS, or a planet or event type is unknown
+        """
+        try:
+            tz = pytz.timezone(timezone_str)
+        except pytz.UnknownTimeZoneError:
+            raise ValueError(f"Unknown timezone: {timezone_str}")
+        start = self._localize(start_date, tz)
+        end = self._localize(end_date, tz)
+        if end < start:
+            raise ValueError("end_date must not be before start_date")
+        if end - start > timedelta(days=self.MAX_TIMELINE_DAYS):
+            raise ValueError(f"Transit timeline is limited to {self.MAX_TIMELINE_DAYS} days")
+
+        events = transit_event_engine.find_events(
+            datetime_to_jd(start),
+            datetime_to_jd(end),
+            bodies=planets,
+            event_types=event_types,
+            natal_points=self._natal_points(birth_chart)
+        )
+        for event in events:
+            event["date"] = jd_to_datetime(event["jd"]).astimezone(tz).isoformat(timespec="seconds")
+
+        counts = Counter(event["event_type"] for event in events)
+
+        return {
+            "start_date": start.isoformat(),
+            "end_date": end.isoformat(),
+            "timezone": timezone_str,
+            "events": events,
+            "event_counts": {event_type: counts[event_type] for event_type in EVENT_TYPES if counts[event_type]},
+            "total_events": len(events)
+        }
+
+    def get_upcoming_sign_changes(
+        self,
+        reference: datetime,
+        days: int = 30,
+        planets: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Calculate the sign changes in the next `days` days
+
+        Args:
+            reference: Start moment (naive datetimes are UTC)
+            days: Days to look ahead
+            planets: Planets to include (default: SIGN_CHANGE_PLANETS)
+
+        Returns:
+            List of sign changes (planet, current/next sign, change date, days until)
+        """
+        start_jd = datetime_to_jd(reference)
+        ingresses = transit_event_engine.find_events(
+            start_jd,
+            start_jd + days,
+            bodies=self.SIGN_CHANGE_PLANETS if planets is None else planets,
+            event_types=["sign_ingress"]
+        )
+        return [
+            {
+                "planet": event["planet"],
+                "current_sign": event["from_sign"],
+                "next_sign": event["to_sign"],
+                "change_date": jd_to_datetime(event["jd"]),
+                "days_until": round(event["jd"] - start_jd, 2)
+            }
+            for event in ingresses
+        ]
+
+    def _localize(self, moment: datetime, tz: Any) -> datetime:
+        """Timezone-aware datetime (naive datetimes are in tz)"""
+        return tz.localize(moment) if moment.tzinfo is None else moment.astimezone(tz)
+
+    def _natal_points(self, birth_chart: Dict[str, Any]) -> Dict[str, float]:
+        """Sidereal longitudes of the natal grahas and ascendant"""
+        planets = birth_chart.get("planets", {})
+        points = {
+            name: float(planets[name]["longitude"])
+            for name in GRAHAS
+            if isinstance(planets.get(name), dict) and planets[name].get("longitude") is not None
+        }
+
+        ascendant = birth_chart.get("ascendant") or next(
+            (planets[key] for key in ASCENDANT_KEYS if isinstance(planets.get(key), dict)), None
+        )
+        if ascendant and ascendant.get("longitude") is not None:
+            points["Ascendant"] = float(ascendant["longitude"])
+        return points
+
     def _get_transit_effects(self, planet: str, house_from_moon: int) -> str:
         """Get effects of planet transit through house from Moon"""
         effects = {
@@ -203,9 +342,9 @@ class TransitService:
 
         # Get current Saturn position
         jd = swe.julday(reference_date.year, reference_date.month, reference_date.day, 12.0)
-        ayanamsa = swe.get_ayanamsa_ut(jd)
+        ayanamsa = ephemeris.get_ayanamsa_ut(jd)
 
-        result = swe.calc_ut(jd, swe.SATURN, swe.FLG_SWIEPH)
+        result = ephemeris.calc_ut(jd, swe.SATURN, swe.FLG_SWIEPH)
         tropical_long = result[0][0]
         sidereal_long = (tropical_long - ayanamsa) % 360
         saturn_sign = int(sidereal_long / 30)
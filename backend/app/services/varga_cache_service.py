@@ -0,0 +1,109 @@
+"""
+Varga Cache Service
+On-demand divisional charts (D2-D60). A varga is calculated from the stored
+D1 chart the first time it is requested and cached on its own, keyed by a
+hash of the D1 longitudes, the varga and the engine version - so D1 chart
+rows no longer carry all 16 vargas, and one varga can be served without
+building the others.
+
+D1 charts stored before vargas became lazy still embed "divisional_charts";
+those are served as they are.
+
+Backed by cache_service (Redis, or the in-memory LRU fallback).
+"""
+
+from typing import Any, Dict, Iterable, List
+
+from app.core.cache import CacheNamespace, CacheTTL, cache_service
+from app.services.divisional_charts_service import divisional_charts_service
+from app.services.vedic_astrology_accurate import accurate_vedic_astrology
+
+
+class VargaCacheService:
+    """Per-varga cache of divisional charts derived from a D1 chart"""
+
+    # Decimal places of the D1 longitudes in the cache key (6 = ~0.004")
+    LONGITUDE_PRECISION = 6
+
+    def __init__(self):
+        """Initialize varga cache service"""
+        self.cache = cache_service
+        self.divisional = divisional_charts_service
+        self.ttl = CacheTTL.WEEK
+
+    def make_key(self, chart_data: Dict[str, Any], varga: str) -> str:
+        """
+        Build the cache key of a varga of a D1 chart
+
+        Varga positions depend only on the D1 longitudes, so charts of
+        identical birth data share their vargas across profiles.
+        """
+        key_data = {
+            "longitudes": {
+                name: round(float(planet["longitude"]), self.LONGITUDE_PRECISION)
+                for name, planet in sorted(chart_data.get("planets", {}).items())
+            },
+            "varga": varga,
+            "engine_version": accurate_vedic_astrology.ENGINE_VERSION
+        }
+        digest = self.cache._hash_key(key_data)
+        return self.cache._make_key(CacheNamespace.VARGAS, f"v{accurate_vedic_astrology.ENGINE_VERSION}:{digest}")
+
+    def calculate_vargas(self, chart_data: Dict[str, Any], vargas: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Calculate divisional charts of a D1 chart (one VargaMatrix for all of them)"""
+        planets = chart_data["planets"]
+        matrix = self.divisional.calculate_varga_matrix(planets, chart_data.get("ascendant"))
+        return self.divisional.materialize_divisional_charts(matrix, planets, vargas)
+
+    async def get_vargas(self, chart_data: Dict[str, Any], vargas: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get divisional charts of a D1 chart, calculating and caching missing ones
+
+        Args:
+            chart_data: Stored D1 chart data (planets with longitudes)
+            vargas: Chart names (keys of DivisionalChartsService.DIVISIONAL_CHARTS)
+
+        Returns:
+            Dict of divisional charts in the requested order
+
+        Raises:
+            ValueError: If a varga name is unknown
+        """
+        vargas = list(dict.fromkeys(vargas))
+        unknown = [varga for varga in vargas if varga not in self.divisional.DIVISIONAL_CHARTS]
+        if unknown:
+            raise ValueError(f"Unknown divisional chart(s): {', '.join(unknown)}")
+
+        # Legacy charts embed their vargas
+        embedded = chart_data.get("divisional_charts") or {}
+        charts = {varga: embedded[varga] for varga in vargas if varga in embedded}
+
+        missing: List[str] = []
+        for varga in vargas:
+            if varga in charts:
+                continue
+            cached = await self.cache.get(self.make_key(chart_data, varga))
+            if cached is not None:
+                charts[varga] = cached
+            else:
+                missing.append(varga)
+
+        if missing:
+            calculated = self.calculate_vargas(chart_data, missing)
+            for varga, chart in calculated.items():
+                await self.cache.set(self.make_key(chart_data, varga), chart, ttl=self.ttl)
+            charts.update(calculated)
+
+        return {varga: charts[varga] for varga in vargas}
+
+    async def get_varga(self, chart_data: Dict[str, Any], varga: str) -> Dict[str, Any]:
+        """Get one divisional chart of a D1 chart (see get_vargas)"""
+        return (await self.get_vargas(chart_data, [varga]))[varga]
+
+    async def detect_yogas(self, chart_data: Dict[str, Any], varga: str) -> List[Dict[str, Any]]:
+        """Detect yogas in one divisional chart, calculating only that varga"""
+        return self.divisional.detect_divisional_yogas(varga, await self.get_varga(chart_data, varga))
+
+
+# Singleton instance
+varga_cache_service = VargaCacheService()
@@ -14,6 +14,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import math
 import logging
 
+from app.core.ephemeris import ephemeris
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,8 +32,10 @@ class VarshapalService:
         if swisseph is None:
             import swisseph as swe
             self.swe = swe
+            self.ephemeris = ephemeris
         else:
             self.swe = swisseph
+            self.ephemeris = swisseph
 
         # Planet constants
         self.PLANETS = {
@@ -168,7 +172,7 @@ class VarshapalService:
 
         while (end_jd - start_jd) > tolerance:
             mid_jd = (start_jd + end_jd) / 2.0
-            sun_pos, _ = self.swe.calc_ut(mid_jd, self.swe.SUN)
+            sun_pos, _ = self.ephemeris.calc_ut(mid_jd, self.swe.SUN)
             sun_longitude = sun_pos[0]
 
             # Normalize to 0-360
@@ -206,7 +210,7 @@ class VarshapalService:
 
         for planet_name, planet_id in self.PLANETS.items():
             try:
-                pos, _ = self.swe.calc_ut(jd, planet_id)
+                pos, _ = self.ephemeris.calc_ut(jd, planet_id)
                 longitude_deg = pos[0] % 360
 
                 planets_data[planet_name] = {
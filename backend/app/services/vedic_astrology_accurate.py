@@ -3,9 +3,14 @@ Accurate Vedic Astrology Calculation Service using Swiss Ephemeris
 Based on classical Jyotish principles with professional-grade accuracy
 """
 
-from typing import Dict, List, Any, Tuple
-from datetime import datetime, date, time, timedelta
+from typing import Dict, List, Any, Tuple, Optional, Iterable, FrozenSet, Set
+from datetime import datetime, date, time
+from time import perf_counter
+import logging
 import swisseph as swe
+from app.core.ephemeris import ephemeris
+from app.core.metrics import CHART_STAGE_SECONDS, metrics
+from app.services.dasha_engine import get_timeline
 import pytz
 from app.services.extended_yoga_service import extended_yoga_service
 from app.services.divisional_charts_service import divisional_charts_service
@@ -13,6 +18,8 @@ from app.services.dosha_detection_service import dosha_detection_service
 from app.services.transit_service import transit_service
 from app.services.dasha_interpretation_service import dasha_interpretation_service
 
+logger = logging.getLogger(__name__)
+
 
 class AccurateVedicAstrology:
     """Professional-grade Vedic astrology calculations using Swiss Ephemeris"""
@@ -103,11 +110,46 @@ class AccurateVedicAstrology:
         "Saturn": 15.0
     }
 
+    # Optional stages of the D1 pipeline. Core positions (ascendant, planets,
+    # houses, nakshatras) are always calculated; everything else runs only
+    # when requested through calculate_birth_chart(include=...)
+    CHART_STAGES = (
+        "dasha",             # Vimshottari dasha with classical interpretations
+        "dasha_ai",          # Deferred AI personalization of the current mahadasha
+        "yogas",             # Classical + extended yoga detection
+        "divisional_charts", # All 16 Shodashvarga charts
+        "vimshopaka_bala",   # Composite strength across vargas
+        "vargottama",        # Same sign in D1 and D9
+        "doshas",            # Manglik, Kaal Sarpa, Pitra, Grahan
+        "transits",          # Current transits relative to Moon/Lagna
+        "sade_sati"          # Saturn's 7.5 year transit over natal Moon
+    )
+
+    # Stages left out of the complete chart (include=None); they run only when
+    # named explicitly. Divisional charts are served per varga on demand
+    # (varga_cache_service) instead of being stored in every D1 chart
+    ON_DEMAND_STAGES = ("divisional_charts",)
+
+    # Stages that consume the output of another stage
+    STAGE_DEPENDENCIES = {
+        "dasha_ai": ("dasha",)
+    }
+
+    # D1 stages consumed by the derived D9 and Moon charts
+    DERIVED_CHART_STAGES = ("dasha", "vargottama")
+
+    # Chart types calculate_chart_bundle can produce from one D1 computation
+    BUNDLE_CHART_TYPES = ("D1", "D9", "Moon")
+
+    # Bump whenever calculation output changes: cached charts from other
+    # versions (content cache and stored chart rows) are then recalculated
+    ENGINE_VERSION = "2.4.1"
+
     def __init__(self):
         """Initialize Swiss Ephemeris with Lahiri ayanamsa"""
         # Set sidereal mode with Lahiri ayanamsa (Government of India standard)
         swe.set_sid_mode(swe.SIDM_LAHIRI)
-        print("✅ Swiss Ephemeris initialized with Lahiri ayanamsa")
+        logger.debug("Swiss Ephemeris initialized with Lahiri ayanamsa")
 
     def _is_exalted(self, planet_name: str, sign_num: int) -> bool:
         """Check if planet is in its exaltation sign"""
@@ -164,6 +206,37 @@ class AccurateVedicAstrology:
             distance = 360 - distance
         return distance
 
+    def resolve_stages(self, include: Optional[Iterable[str]] = None) -> FrozenSet[str]:
+        """
+        Resolve requested pipeline stages, adding the stages they depend on
+
+        Args:
+            include: Stage names from CHART_STAGES. None selects every stage
+                except ON_DEMAND_STAGES (the complete chart); an empty list
+                selects core positions only.
+
+        Returns:
+            Frozen set of stage names to run
+
+        Raises:
+            ValueError: If an unknown stage name is requested
+        """
+        if include is None:
+            return frozenset(self.CHART_STAGES).difference(self.ON_DEMAND_STAGES)
+
+        stages = set(include)
+        unknown = stages - set(self.CHART_STAGES)
+        if unknown:
+            raise ValueError(
+                f"Unknown chart stage(s): {', '.join(sorted(unknown))}. "
+                f"Valid stages: {', '.join(self.CHART_STAGES)}"
+            )
+
+        for stage in list(stages):
+            stages.update(self.STAGE_DEPENDENCIES.get(stage, ()))
+
+        return frozenset(stages)
+
     def calculate_birth_chart(
         self,
         name: str,
@@ -172,7 +245,8 @@ class AccurateVedicAstrology:
         latitude: float,
         longitude: float,
         timezone_str: str = "UTC",
-        city: str = "Unknown"
+        city: str = "Unknown",
+        include: Optional[Iterable[str]] = None
     ) -> Dict[str, Any]:
         """
         Calculate accurate Vedic birth chart (Rashi chart/D1)
@@ -181,7 +255,16 @@ class AccurateVedicAstrology:
         - Swiss Ephemeris for planetary positions
         - Lahiri ayanamsa for sidereal zodiac
         - Whole Sign house system (authentic Vedic method)
+
+        Args:
+            include: Optional stages to run on top of the core positions
+                (see CHART_STAGES). None runs every stage but the
+                ON_DEMAND_STAGES (divisional charts); stages that are
+                not run are omitted from the result. The stages actually
+                run are listed under "stages".
         """
+        stages = self.resolve_stages(include)
+        started = perf_counter()
 
         # Combine date and time
         birth_datetime = datetime.combine(birth_date, birth_time)
@@ -197,43 +280,46 @@ class AccurateVedicAstrology:
         else:
             birth_datetime_utc = birth_datetime
 
-        # Calculate Julian Day
-        jd = swe.julday(
-            birth_datetime_utc.year,
-            birth_datetime_utc.month,
-            birth_datetime_utc.day,
-            birth_datetime_utc.hour + birth_datetime_utc.minute/60.0
-        )
-
-        # Calculate Ascendant (Lagna)
-        # Using houses() instead of houses_ex() for simpler output
-        # Returns (cusps, ascmc) where ascmc[0] is the Ascendant
-        cusps, ascmc = swe.houses(jd, latitude, longitude, b'P')  # 'P' = Placidus
-        asc_longitude = ascmc[0]  # Ascendant longitude in tropical
+        with metrics.timer(CHART_STAGE_SECONDS, stage="ephemeris"):
+            # Calculate Julian Day
+            jd = swe.julday(
+                birth_datetime_utc.year,
+                birth_datetime_utc.month,
+                birth_datetime_utc.day,
+                birth_datetime_utc.hour + birth_datetime_utc.minute/60.0
+            )
+
+            # Calculate Ascendant (Lagna)
+            # Using houses() instead of houses_ex() for simpler output
+            # Returns (cusps, ascmc) where ascmc[0] is the Ascendant
+            cusps, ascmc = swe.houses(jd, latitude, longitude, b'P')  # 'P' = Placidus
+            asc_longitude = ascmc[0]  # Ascendant longitude in tropical
 
-        # Convert to sidereal
-        # Use get_ayanamsa_ut (not _ex) which returns a single float value
-        ayanamsa = swe.get_ayanamsa_ut(jd)
-        print(f"🔢 Ayanamsa value: {ayanamsa} (type: {type(ayanamsa)})")
-        print(f"🔢 Ascendant tropical: {asc_longitude}")
+            # Convert to sidereal
+            # Use get_ayanamsa_ut (not _ex) which returns a single float value
+            ayanamsa = ephemeris.get_ayanamsa_ut(jd)
 
-        asc_sidereal = (asc_longitude - ayanamsa) % 360
-        asc_sign = int(asc_sidereal / 30)
-        asc_degree = asc_sidereal % 30
+            asc_sidereal = (asc_longitude - ayanamsa) % 360
+            asc_sign = int(asc_sidereal / 30)
+            asc_degree = asc_sidereal % 30
 
-        print(f"✅ Ascendant sidereal: {asc_sidereal} (Sign: {self.SIGNS[asc_sign]} {asc_degree:.2f}°)")
+            logger.debug(
+                f"Ayanamsa {ayanamsa}, ascendant tropical {asc_longitude}, "
+                f"sidereal {asc_sidereal} ({self.SIGNS[asc_sign]} {asc_degree:.2f}°)"
+            )
 
-        # Calculate all planets
-        planets = self._calculate_planets(jd, ayanamsa, asc_sign)
+            # Calculate all planets
+            planets = self._calculate_planets(jd, ayanamsa, asc_sign)
 
-        # Calculate houses using Whole Sign system (Vedic standard)
-        houses = self._calculate_whole_sign_houses(asc_sign)
+        with metrics.timer(CHART_STAGE_SECONDS, stage="houses"):
+            # Calculate houses using Whole Sign system (Vedic standard)
+            houses = self._calculate_whole_sign_houses(asc_sign)
 
-        # Determine which planets are in which houses
-        planets = self._assign_houses_to_planets(planets, asc_sign)
+            # Determine which planets are in which houses
+            planets = self._assign_houses_to_planets(planets, asc_sign)
 
-        # Calculate nakshatras
-        planets = self._add_nakshatras(planets)
+            # Calculate nakshatras
+            planets = self._add_nakshatras(planets)
 
         # Add Ascendant to planets dict for Bhava Yoga calculations (Phase 4)
         planets["Ascendant"] = {
@@ -244,89 +330,96 @@ class AccurateVedicAstrology:
             "house": 1  # Ascendant is always in the 1st house
         }
 
-        # Calculate Vimshottari Dasha
-        dasha = self._calculate_vimshottari_dasha(planets["Moon"], birth_datetime)
-
-        # Prepare chart context for AI personalization
-        chart_context = {
-            "planets": planets,
-            "ascendant": {
-                "sign": self.SIGNS[asc_sign],
-                "sign_num": asc_sign,
-                "degree": asc_degree
-            }
+        ascendant_data = {
+            "sign": self.SIGNS[asc_sign],
+            "sign_num": asc_sign,
+            "degree": asc_degree,
+            "longitude": asc_sidereal
         }
 
-        # Enhance dasha with interpretations (includes AI personalization)
-        dasha = dasha_interpretation_service.enhance_dasha_with_interpretations(
-            dasha,
-            chart_data=chart_context,
-            use_ai=True  # Enable AI personalization
-        )
-
-        # Detect yogas
-        yogas = self._detect_vedic_yogas(planets, asc_sign)
+        # Optional stages - results are keyed by their output field
+        results: Dict[str, Any] = {}
+
+        if "dasha" in stages:
+            with metrics.timer(CHART_STAGE_SECONDS, stage="dasha"):
+                # Calculate Vimshottari Dasha
+                dasha = self._calculate_vimshottari_dasha(planets["Moon"], birth_datetime)
+
+                # Enhance dasha with classical interpretations. AI personalization
+                # is a blocking LLM call, so it never runs here - see "dasha_ai"
+                results["dasha"] = dasha_interpretation_service.enhance_dasha_with_interpretations(
+                    dasha,
+                    use_ai=False
+                )
+
+        if "dasha_ai" in stages:
+            # Mark for deferred enrichment (dasha_enrichment_service stores the
+            # personalization on the chart row once the AI responds)
+            results["dasha_ai"] = {"status": dasha_interpretation_service.AI_STATUS_PENDING}
+
+        if "yogas" in stages:
+            with metrics.timer(CHART_STAGE_SECONDS, stage="yogas"):
+                results["yogas"] = self._detect_vedic_yogas(planets, asc_sign)
+
+        divisional_charts = None
+        varga_matrix = None
+        if "divisional_charts" in stages:
+            # Calculate ALL divisional charts (D2-D60 Shodashvarga system)
+            logger.debug("Calculating all divisional charts (D2-D60)")
+            with metrics.timer(CHART_STAGE_SECONDS, stage="divisional_charts"):
+                # All 16 varga signs in one array pass, then the chart dicts
+                varga_matrix = divisional_charts_service.calculate_varga_matrix(planets, ascendant_data)
+                divisional_charts = divisional_charts_service.materialize_divisional_charts(
+                    varga_matrix,
+                    planets,
+                    [chart for chart in divisional_charts_service.DIVISIONAL_CHART_PRIORITIES["all"] if chart != "D9"]
+                )
+            results["divisional_charts"] = divisional_charts
+
+        if "vimshopaka_bala" in stages:
+            # Calculate Vimshopaka Bala (composite planetary strength) straight
+            # from the varga signs - no divisional chart dicts needed
+            with metrics.timer(CHART_STAGE_SECONDS, stage="vimshopaka_bala"):
+                if varga_matrix is None:
+                    varga_matrix = divisional_charts_service.calculate_varga_matrix(planets, ascendant_data)
+                results["vimshopaka_bala"] = divisional_charts_service.calculate_vimshopaka_bala_from_matrix(
+                    varga_matrix
+                )
+
+        if "vargottama" in stages:
+            # Add Vargottama status (same sign in D1 and D9)
+            with metrics.timer(CHART_STAGE_SECONDS, stage="vargottama"):
+                self._add_vargottama(planets, divisional_charts)
+
+        if "doshas" in stages:
+            # Detect doshas (remedies by remedy_id, resolved from the dosha remedy catalog)
+            with metrics.timer(CHART_STAGE_SECONDS, stage="doshas"):
+                results["doshas"] = dosha_detection_service.detect_all_doshas(
+                    planets,
+                    {
+                        "sign_num": asc_sign,
+                        "degree": asc_degree,
+                        "longitude": asc_sidereal
+                    },
+                    mode="reference"
+                )
 
-        # Calculate ALL divisional charts (D2-D60 Shodashvarga system)
-        print("🔢 Calculating all divisional charts (D2-D60)...")
-        divisional_charts = divisional_charts_service.calculate_all_divisional_charts(
-            planets,
-            {
-                "sign": self.SIGNS[asc_sign],
-                "sign_num": asc_sign,
-                "degree": asc_degree,
-                "longitude": asc_sidereal
-            },
-            priority="all"  # Calculate all 16 divisional charts (complete Shodashvarga)
-        )
-
-        # Calculate Vimshopaka Bala (composite planetary strength)
-        print("💪 Calculating Vimshopaka Bala (planetary strengths)...")
-        vimshopaka_bala = divisional_charts_service.calculate_vimshopaka_bala(
-            planets,
-            divisional_charts
-        )
-
-        # Add Vargottama status (same sign in D1 and D9)
-        print("🎯 Detecting Vargottama planets...")
-        if "D9" in divisional_charts and "planets" in divisional_charts["D9"]:
-            d9_planets = divisional_charts["D9"]["planets"]
-            for planet_name in planets:
-                if planet_name in d9_planets:
-                    d1_sign = planets[planet_name]["sign"]
-                    d9_sign = d9_planets[planet_name]["sign"]
-                    planets[planet_name]["vargottama"] = (d1_sign == d9_sign)
-                else:
-                    planets[planet_name]["vargottama"] = False
-        else:
-            # If D9 not available, set all to False
-            for planet_name in planets:
-                planets[planet_name]["vargottama"] = False
-
-        # Detect doshas
-        print("⚠️  Detecting doshas...")
-        doshas = dosha_detection_service.detect_all_doshas(
-            planets,
-            {
-                "sign_num": asc_sign,
-                "degree": asc_degree,
-                "longitude": asc_sidereal
-            }
-        )
-
-        # Calculate current transits
-        print("🪐 Calculating current transits...")
         moon_sign = planets["Moon"]["sign_num"]
-        current_transits = transit_service.get_current_transits(
-            moon_sign,
-            asc_sign
-        )
-
-        # Calculate Sade Sati
-        print("🔮 Calculating Sade Sati...")
-        sade_sati = transit_service.calculate_sade_sati(moon_sign)
-
-        print("✅ All calculations complete!")
+        if "transits" in stages:
+            # Calculate current transits
+            with metrics.timer(CHART_STAGE_SECONDS, stage="transits"):
+                results["transits"] = transit_service.get_current_transits(
+                    moon_sign,
+                    asc_sign
+                )
+
+        if "sade_sati" in stages:
+            # Calculate Sade Sati
+            with metrics.timer(CHART_STAGE_SECONDS, stage="sade_sati"):
+                results["sade_sati"] = transit_service.calculate_sade_sati(moon_sign)
+
+        CHART_STAGE_SECONDS.observe(perf_counter() - started, stage="total")
+        logger.debug(f"Chart calculated for {name} (stages: {', '.join(sorted(stages)) or 'core'})")
 
         return {
             "basic_info": {
@@ -351,18 +444,37 @@ class AccurateVedicAstrology:
             },
             "planets": planets,
             "houses": houses,
-            "dasha": dasha,
-            "yogas": yogas,
-            "divisional_charts": divisional_charts,
-            "vimshopaka_bala": vimshopaka_bala,
-            "doshas": doshas,
-            "transits": current_transits,
-            "sade_sati": sade_sati,
+            **results,
+            "stages": [stage for stage in self.CHART_STAGES if stage in stages],
             "chart_type": "D1",
+            "engine_version": self.ENGINE_VERSION,
             "calculation_method": "Swiss Ephemeris with Lahiri Ayanamsa",
             "house_system": "Whole Sign (Vedic Standard)"
         }
 
+    def _add_vargottama(self, planets: Dict, divisional_charts: Optional[Dict[str, Any]] = None) -> Dict:
+        """
+        Flag planets occupying the same sign in D1 and D9 (Vargottama)
+
+        Uses the D9 from divisional_charts when it was calculated, otherwise
+        derives the Navamsa sign directly from each planet's longitude.
+        """
+        d9_planets = None
+        if divisional_charts and "D9" in divisional_charts and "planets" in divisional_charts["D9"]:
+            d9_planets = divisional_charts["D9"]["planets"]
+
+        for planet_name, planet_data in planets.items():
+            if d9_planets is not None:
+                if planet_name in d9_planets:
+                    planet_data["vargottama"] = (planet_data["sign"] == d9_planets[planet_name]["sign"])
+                else:
+                    planet_data["vargottama"] = False
+            else:
+                d9_sign = self._get_navamsa_position(planet_data["longitude"])["sign"]
+                planet_data["vargottama"] = (planet_data["sign"] == d9_sign)
+
+        return planets
+
     def _calculate_planets(self, jd: float, ayanamsa: float, asc_sign: int) -> Dict[str, Any]:
         """Calculate accurate planetary positions using Swiss Ephemeris"""
 
@@ -374,7 +486,7 @@ class AccurateVedicAstrology:
                 continue
 
             # Calculate planet position
-            result = swe.calc_ut(jd, planet_id, swe.FLG_SWIEPH)
+            result = ephemeris.calc_ut(jd, planet_id, swe.FLG_SWIEPH)
             tropical_long = result[0][0]
             speed = result[0][3]
 
@@ -501,82 +613,30 @@ class AccurateVedicAstrology:
         Calculate Vimshottari Dasha with correct formula
         Based on Moon's nakshatra position at birth
         """
+        timeline = get_timeline(moon_data["longitude"], birth_datetime)
 
-        moon_longitude = moon_data["longitude"]
-
-        # Determine current nakshatra and lord
-        nakshatra_num = int(moon_longitude / 13.333333)
-        nakshatra_lord_idx = nakshatra_num % 9
-        current_lord = self.NAKSHATRA_LORDS[nakshatra_lord_idx]
-
-        # Calculate how much of the nakshatra has been traversed
-        traversed_in_nakshatra = (moon_longitude % 13.333333) / 13.333333
-
-        # Calculate remaining period of current Mahadasha
-        total_years = self.DASHA_YEARS[current_lord]
-        elapsed_years = traversed_in_nakshatra * total_years
-        remaining_years = total_years - elapsed_years
-
-        # Generate Mahadasha sequence
         mahadashas = []
-        current_date = birth_datetime
-        lord_idx = nakshatra_lord_idx
-
-        # Add remaining portion of birth Mahadasha
-        end_date = current_date + timedelta(days=remaining_years * 365.25)
-        mahadashas.append({
-            "planet": current_lord,
-            "start_date": current_date.strftime("%Y-%m-%d"),
-            "end_date": end_date.strftime("%Y-%m-%d"),
-            "years": round(remaining_years, 2),
-            "months": int(remaining_years * 12),
-            "days": int(remaining_years * 365.25)
-        })
-        current_date = end_date
-
-        # Add next 8 Mahadashas (complete 120-year cycle)
-        for i in range(1, 9):
-            lord_idx = (nakshatra_lord_idx + i) % 9
-            lord = self.NAKSHATRA_LORDS[lord_idx]
-            years = self.DASHA_YEARS[lord]
-
-            end_date = current_date + timedelta(days=years * 365.25)
+        for index, maha in enumerate(timeline.periods(1)):
+            years = timeline.balance_years if index == 0 else self.DASHA_YEARS[maha["planet"]]
             mahadashas.append({
-                "planet": lord,
-                "start_date": current_date.strftime("%Y-%m-%d"),
-                "end_date": end_date.strftime("%Y-%m-%d"),
-                "years": years,
-                "months": years * 12,
+                "planet": maha["planet"],
+                "start_date": maha["start_date"],
+                "end_date": maha["end_date"],
+                "years": round(years, 2) if index == 0 else years,
+                "months": int(years * 12),
                 "days": int(years * 365.25)
             })
-            current_date = end_date
-
-        # Find currently active Mahadasha (based on today's date)
-        today = datetime.now()
-        current_maha_idx = 0
-        for idx, maha in enumerate(mahadashas):
-            start = datetime.strptime(maha["start_date"], "%Y-%m-%d")
-            end = datetime.strptime(maha["end_date"], "%Y-%m-%d")
-            if start <= today <= end:
-                current_maha_idx = idx
-                break
-
-        # Calculate Antardashas for the CURRENT Mahadasha (not birth mahadasha)
+
+        # Currently active periods (based on today's date)
+        active = timeline.periods_at(datetime.now(), depth=3)
+        current_maha_idx = active[0]["index"] if active else 0
         current_maha = mahadashas[current_maha_idx]
-        antardashas = self._calculate_antardashas(
-            current_maha["planet"],
-            datetime.strptime(current_maha["start_date"], "%Y-%m-%d"),
-            current_maha["years"]
-        )
 
-        # Find currently active Antardasha within current Mahadasha
-        current_antar = None
-        for antar in antardashas:
-            start = datetime.strptime(antar["start_date"], "%Y-%m-%d")
-            end = datetime.strptime(antar["end_date"], "%Y-%m-%d")
-            if start <= today <= end:
-                current_antar = antar
-                break
+        # Antardashas of the CURRENT Mahadasha (not birth mahadasha)
+        antardashas = [
+            self._format_dasha_period(antar)
+            for antar in timeline.periods(2, parent_index=current_maha_idx)
+        ]
 
         return {
             "current_mahadasha": {
@@ -585,46 +645,26 @@ class AccurateVedicAstrology:
                 "end_date": current_maha["end_date"],
                 "remaining_years": round(current_maha["years"], 2)
             },
-            "current_antardasha": current_antar if current_antar else None,
+            "current_antardasha": self._format_dasha_period(active[1]) if len(active) > 1 else None,
+            "current_pratyantardasha": self._format_dasha_period(active[2]) if len(active) > 2 else None,
             "mahadashas": mahadashas,
             "antardashas": antardashas,
             "total_cycle_years": 120,
             "calculation_method": "Vimshottari Dasha System"
         }
 
-    def _calculate_antardashas(self, maha_lord: str, start_date: datetime, maha_years: float) -> List[Dict]:
-        """
-        Calculate Antardashas (sub-periods) using correct Vedic formula
-        Formula: Antardasha period = (Maha lord years × Antar lord years) / 120
-        """
-
-        antardashas = []
-        current_date = start_date
-
-        # Find starting index
-        start_idx = self.NAKSHATRA_LORDS.index(maha_lord)
-
-        for i in range(9):
-            antar_lord = self.NAKSHATRA_LORDS[(start_idx + i) % 9]
-
-            # Correct Vedic formula
-            antar_years = (self.DASHA_YEARS[maha_lord] * self.DASHA_YEARS[antar_lord]) / 120
-            antar_days = antar_years * 365.25
-
-            end_date = current_date + timedelta(days=antar_days)
-
-            antardashas.append({
-                "planet": antar_lord,
-                "start_date": current_date.strftime("%Y-%m-%d"),
-                "end_date": end_date.strftime("%Y-%m-%d"),
-                "years": round(antar_years, 3),
-                "months": round(antar_years * 12, 1),
-                "days": int(antar_days)
-            })
-
-            current_date = end_date
-
-        return antardashas
+    def _format_dasha_period(self, period: Dict[str, Any]) -> Dict[str, Any]:
+        """Dasha engine period -> chart output format"""
+        days = period["end"] - period["start"]
+        years = days / 365.25
+        return {
+            "planet": period["planet"],
+            "start_date": period["start_date"],
+            "end_date": period["end_date"],
+            "years": round(years, 3),
+            "months": round(years * 12, 1),
+            "days": int(days)
+        }
 
     def calculate_navamsa(
         self,
@@ -641,11 +681,22 @@ class AccurateVedicAstrology:
         Used for marriage, dharma, and spiritual analysis
         """
 
-        # First get D1 chart
+        # First get D1 chart - only the stages the Navamsa output carries over
         d1_chart = self.calculate_birth_chart(
-            name, birth_date, birth_time, latitude, longitude, timezone_str, city
+            name, birth_date, birth_time, latitude, longitude, timezone_str, city,
+            include=self.DERIVED_CHART_STAGES
         )
 
+        return self._derive_navamsa(d1_chart)
+
+    def _derive_navamsa(self, d1_chart: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the Navamsa chart (D9) from an already calculated D1 chart
+
+        The D1 chart must include the dasha and vargottama stages
+        (DERIVED_CHART_STAGES).
+        """
+
         # Calculate Navamsa positions for all planets
         navamsa_planets = {}
 
@@ -697,6 +748,7 @@ class AccurateVedicAstrology:
             "houses": navamsa_houses,
             "dasha": d1_chart["dasha"],
             "chart_type": "D9",
+            "engine_version": self.ENGINE_VERSION,
             "calculation_method": "Swiss Ephemeris with Lahiri Ayanamsa",
             "house_system": "Whole Sign (Vedic Standard)",
             "note": "Navamsa - Marriage, Dharma, and Spiritual Potential"
@@ -778,7 +830,7 @@ class AccurateVedicAstrology:
             extended_yogas = extended_yoga_service.detect_extended_yogas(planets)
             yogas.extend(extended_yogas)
         except Exception as e:
-            print(f"Warning: Extended yoga detection failed: {e}")
+            logger.warning(f"Extended yoga detection failed: {e}")
 
         # If no major yogas found
         if not yogas:
@@ -815,9 +867,20 @@ class AccurateVedicAstrology:
 
         # First calculate D1 chart to get all planetary positions
         d1_chart = self.calculate_birth_chart(
-            name, birth_date, birth_time, latitude, longitude, timezone_str, city
+            name, birth_date, birth_time, latitude, longitude, timezone_str, city,
+            include=self.DERIVED_CHART_STAGES
         )
 
+        return self._derive_moon_chart(d1_chart)
+
+    def _derive_moon_chart(self, d1_chart: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the Moon chart (Chandra Kundali) from an already calculated D1 chart
+
+        The D1 chart must include the dasha and vargottama stages
+        (DERIVED_CHART_STAGES).
+        """
+
         # Get Moon's position to use as ascendant
         moon_data = d1_chart["planets"]["Moon"]
         moon_sign = moon_data["sign_num"]
@@ -875,11 +938,125 @@ class AccurateVedicAstrology:
             "dasha": d1_chart["dasha"],
             "yogas": moon_chart_yogas,
             "chart_type": "Moon",
+            "engine_version": self.ENGINE_VERSION,
             "calculation_method": "Swiss Ephemeris with Lahiri Ayanamsa",
             "house_system": "Whole Sign from Moon (Chandra Kundali)",
             "note": "Moon chart shows emotional nature, mind, and life fortune from lunar perspective"
         }
 
+    def calculate_chart_bundle(
+        self,
+        name: str,
+        birth_date: date,
+        birth_time: time,
+        latitude: float,
+        longitude: float,
+        timezone_str: str = "UTC",
+        city: str = "Unknown",
+        chart_types: Iterable[str] = BUNDLE_CHART_TYPES,
+        include: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Calculate several chart types from a single D1 computation
+
+        Ephemeris positions and the D1 pipeline run once; D9 and Moon charts
+        are derived from that D1 instead of recalculating it per chart.
+
+        Args:
+            chart_types: Chart types to return (any of BUNDLE_CHART_TYPES)
+            include: D1 pipeline stages when D1 is requested (None = all).
+                Derived charts only add the stages they need.
+
+        Returns:
+            Dict mapping each requested chart type to its chart data
+
+        Raises:
+            ValueError: If an unknown chart type or stage is requested
+        """
+        chart_types, stages = self._resolve_bundle(chart_types, include)
+        if not chart_types:
+            return {}
+
+        d1_chart = self.calculate_birth_chart(
+            name, birth_date, birth_time, latitude, longitude, timezone_str, city,
+            include=stages
+        )
+
+        derivations = {
+            "D1": lambda: d1_chart,
+            "D9": lambda: self._derive_navamsa(d1_chart),
+            "Moon": lambda: self._derive_moon_chart(d1_chart)
+        }
+
+        return {chart_type: derivations[chart_type]() for chart_type in chart_types}
+
+    def calculate_birth_charts_batch(
+        self,
+        records: List[Dict[str, Any]],
+        chart_types: Iterable[str] = ("D1",),
+        include: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Calculate charts for many birth records in one call
+
+        Chart types and stages are validated once for the whole batch. A
+        record that fails is reported in its slot instead of aborting the
+        rest of the batch.
+
+        Args:
+            records: Birth details, each holding calculate_birth_chart
+                arguments (name, birth_date, birth_time, latitude, longitude,
+                timezone_str, city)
+            chart_types: Chart types to calculate per record
+            include: D1 pipeline stages (None = all)
+
+        Returns:
+            One entry per record, in order: {"charts": {chart_type: data}}
+            or {"error": message}
+
+        Raises:
+            ValueError: If an unknown chart type or stage is requested
+        """
+        chart_types, stages = self._resolve_bundle(chart_types, include)
+
+        results = []
+        for record in records:
+            try:
+                charts = self.calculate_chart_bundle(
+                    **record,
+                    chart_types=chart_types,
+                    include=stages
+                )
+                results.append({"charts": charts})
+            except Exception as e:
+                results.append({"error": str(e)})
+
+        return results
+
+    def _resolve_bundle(
+        self,
+        chart_types: Iterable[str],
+        include: Optional[Iterable[str]]
+    ) -> Tuple[List[str], Set[str]]:
+        """
+        Validate bundle chart types and resolve the D1 stages they need
+
+        Returns:
+            (deduplicated chart types, D1 stages to run)
+        """
+        chart_types = list(dict.fromkeys(chart_types))
+        unknown = [chart_type for chart_type in chart_types if chart_type not in self.BUNDLE_CHART_TYPES]
+        if unknown:
+            raise ValueError(
+                f"Unknown chart type(s): {', '.join(unknown)}. "
+                f"Valid types: {', '.join(self.BUNDLE_CHART_TYPES)}"
+            )
+
+        stages = set(self.resolve_stages(include)) if "D1" in chart_types else set()
+        if any(chart_type != "D1" for chart_type in chart_types):
+            stages.update(self.DERIVED_CHART_STAGES)
+
+        return chart_types, stages
 
 # Singleton instance
 accurate_vedic_astrology = AccurateVedicAstrology()
@@ -0,0 +1,177 @@
+"""
+Memoized yoga detection results keyed by placement signature.
+
+Rectification tries birth-time candidates a few minutes apart, and the same
+profile is analysed again on every request, but the yoga detectors only look
+at discrete facts: sign, house and D9 placement plus the dignity, combustion
+and retrograde flags. A chart's placement signature collects exactly those
+facts, together with the few degree-dependent features the detectors use:
+
+- Jaimini karakas (the order of the planets by degree within sign)
+- Waxing or waning Moon (Sun-Moon distance below 180°)
+- Nitya yoga bucket (Sun-Moon distance in 27 parts of 13°20')
+
+Charts with the same signature have the same yogas, apart from the degree
+text of the Nitya yoga, which ExtendedYogaService recomputes on every call
+("live" families in YOGA_FAMILIES).
+
+Provides:
+- placement_signature(): hashable signature of a planets dict
+- YogaResultCache: thread-safe LRU of detection results with hit/miss metrics
+
+Usage:
+    from app.services.yoga_cache import placement_signature, yoga_result_cache
+
+    key = placement_signature(planets, karakas)
+    found, value = yoga_result_cache.lookup(key)
+
+The cache lives in process memory: each compute worker process keeps its
+own cache and its own counters.
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Tuple
+
+# Planet fields read by the yoga detectors (degrees enter only through the features below)
+SIGNATURE_FIELDS = (
+    "house", "sign_num", "d9_sign", "d9_house", "exalted", "debilitated", "own_sign",
+    "d9_exalted", "d9_own_sign", "combust", "retrograde",
+)
+
+# Width of one Nitya yoga (27 per circle), as in ExtendedYogaService._detect_nitya_yogas
+NITYA_SPAN = 360 / 27
+
+# Stands for a field the planet does not have (distinct from None / False)
+_MISSING = "<missing>"
+
+
+def placement_signature(planets: Mapping[str, Mapping[str, Any]], karakas: Mapping[str, str]) -> Tuple:
+    """
+    Hashable signature of everything the yoga detectors read from a chart
+
+    Bodies keep their dict order (occupant lists follow it). A nakshatra is
+    only used when given as a name, so other representations are dropped.
+
+    Args:
+        planets: Planet positions as passed to detect_extended_yogas
+        karakas: Jaimini karakas of the chart (JaiminiService.calculate_charakarakas)
+
+    Raises:
+        TypeError: On unhashable field values
+    """
+    bodies = []
+    for name, data in planets.items():
+        nakshatra = data.get("nakshatra")
+        bodies.append((
+            name,
+            tuple(data.get(field, _MISSING) for field in SIGNATURE_FIELDS),
+            nakshatra if isinstance(nakshatra, str) else None,
+        ))
+
+    sun, moon = planets.get("Sun", {}), planets.get("Moon", {})
+    waxing = 0 < (moon.get("longitude", 0) - sun.get("longitude", 0)) % 360 < 180
+    sun_long, moon_long = sun.get("longitude"), moon.get("longitude")
+    nitya = None if sun_long is None or moon_long is None else int((moon_long - sun_long) % 360 / NITYA_SPAN)
+
+    signature = (tuple(bodies), tuple(karakas.items()), waxing, nitya)
+    hash(signature)
+    return signature
+
+
+_SCALARS = (str, int, float, type(None))
+
+
+def freeze_yogas(yogas: Iterable[Dict[str, Any]]) -> Tuple[Tuple[Dict[str, Any], Tuple[str, ...]], ...]:
+    """Yogas to cache, each with the keys of its container values (copied by thaw_yogas)"""
+    return tuple(
+        (yoga, tuple(key for key, value in yoga.items() if not isinstance(value, _SCALARS)))
+        for yoga in yogas
+    )
+
+
+def thaw_yogas(frozen: Iterable[Tuple[Dict[str, Any], Tuple[str, ...]]]) -> List[Dict[str, Any]]:
+    """Copies of cached yogas that callers may modify (lists such as yoga_forming_planets included)"""
+    yogas = []
+    for yoga, nested in frozen:
+        yoga = dict(yoga)
+        for key in nested:
+            value = yoga[key]
+            yoga[key] = value.copy() if type(value) is list and all(isinstance(item, _SCALARS) for item in value) \
+                else copy.deepcopy(value)
+        yogas.append(yoga)
+    return yogas
+
+
+class YogaResultCache:
+    """
+    Thread-safe LRU cache of yoga detection results.
+
+    Features:
+    - Bounded size with least-recently-used eviction
+    - Hit/miss metrics
+    """
+
+    def __init__(self, maxsize: int = 512):
+        """
+        Initialize yoga result cache.
+
+        Args:
+            maxsize: Maximum cached charts (0 disables caching)
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """(True, value) for a cached key, else (False, None)"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def store(self, key: Hashable, value: Any) -> None:
+        """Cache a value, evicting the least recently used entries beyond maxsize"""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counts, hit rate and current size
+        """
+        total_requests = self.hits + self.misses
+        hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(hit_rate, 2),
+            "total_requests": total_requests,
+            "size": len(self._entries),
+            "maxsize": self.maxsize
+        }
+
+
+# Global yoga result cache instance
+yoga_result_cache = YogaResultCache()
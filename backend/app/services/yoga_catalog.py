@@ -0,0 +1,134 @@
+"""
+Static yoga catalog and compact yoga payloads.
+
+A detected yoga repeats the same prose on every chart: category, BPHS
+classification, importance, life area and, for most yogas, description
+and effects. The catalog (data/yoga_catalog.json) holds these fields once
+per yoga, keyed by a stable id derived from the yoga name:
+
+    "gaja-kesari-yoga": {"name": "Gaja Kesari Yoga", "category": "...", ...}
+
+A compact yoga is its id plus the fields that differ from the catalog
+entry (chart-specific description, strength, forming planets, ...):
+
+    {"id": "gaja-kesari-yoga", "strength": "Strong", "yoga_forming_planets": ["Moon", "Jupiter"]}
+
+Compaction is lossless: expand(compact(yoga)) == yoga for any yoga, with
+or without a catalog entry. Fields the yoga lacks but the entry has are
+listed under "unset". Clients fetch the catalog once (GET /yogas/catalog,
+versioned by a content hash) and resolve compact yogas locally.
+
+The catalog is generated from detection over sample charts
+(scripts/generate_yoga_catalog.py): a field is catalogued when it had the
+same value on every chart showing the yoga.
+
+Usage:
+    from app.services.yoga_catalog import get_yoga_catalog
+
+    catalog = get_yoga_catalog()
+    compact = catalog.compact_yogas(yogas)
+    assert catalog.expand_yogas(compact) == yogas
+"""
+
+import copy
+import hashlib
+import json
+import re
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from app.services.yoga_rules import BACKEND_DIR
+
+DEFAULT_CATALOG_PATH = BACKEND_DIR / "data" / "yoga_catalog.json"
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def yoga_id(name: str) -> str:
+    """
+    Stable catalog id of a yoga name: ASCII, lowercase, words joined by "-"
+
+    "Gaja Kesari Yoga" -> "gaja-kesari-yoga", "Vīṇā Yoga" -> "vina-yoga"
+    """
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", "-", ascii_name.lower()).strip("-")
+
+
+class YogaCatalog:
+    """Static yoga fields by yoga id, with compaction of detected yogas against them"""
+
+    def __init__(self, entries: Mapping[str, Mapping[str, Any]]):
+        """
+        Initialize the catalog.
+
+        Args:
+            entries: Yoga id -> static fields (JSON values)
+        """
+        self.entries = MappingProxyType({
+            key: MappingProxyType(dict(fields)) for key, fields in sorted(entries.items())
+        })
+        canonical = json.dumps(self._yogas(), sort_keys=True, ensure_ascii=False)
+        self.version = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+    @classmethod
+    def from_file(cls, path: Path) -> "YogaCatalog":
+        """Load a catalog written by scripts/generate_yoga_catalog.py"""
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f)["yogas"])
+
+    def get(self, key: str) -> Optional[Mapping[str, Any]]:
+        """Catalog entry of a yoga id, or None"""
+        return self.entries.get(key)
+
+    def compact(self, yoga: Mapping[str, Any]) -> Dict[str, Any]:
+        """Yoga id plus the fields that differ from its catalog entry"""
+        key = yoga_id(yoga["name"])
+        static = self.entries.get(key, {})
+        compact = {"id": key}
+        compact.update((field, value) for field, value in yoga.items() if field not in static or static[field] != value)
+        unset = [field for field in static if field not in yoga]
+        if unset:
+            compact["unset"] = unset
+        return compact
+
+    def expand(self, compact: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Full yoga of a compact one (fresh copies of catalog values)
+
+        Raises:
+            KeyError: If the yoga has neither a catalog entry nor a name
+        """
+        static = self.entries.get(compact["id"], {})
+        unset = compact.get("unset", ())
+        yoga = {
+            field: value if isinstance(value, _SCALARS) else copy.deepcopy(value)
+            for field, value in static.items() if field not in unset
+        }
+        yoga.update((field, value) for field, value in compact.items() if field not in ("id", "unset"))
+        if "name" not in yoga:
+            raise KeyError(f"Unknown yoga id: {compact['id']}")
+        return yoga
+
+    def compact_yogas(self, yogas: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+        """Compact form of each yoga"""
+        return [self.compact(yoga) for yoga in yogas]
+
+    def expand_yogas(self, compact_yogas: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+        """Full form of each compact yoga"""
+        return [self.expand(compact) for compact in compact_yogas]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready catalog: version and yoga id -> static fields"""
+        return {"version": self.version, "yogas": self._yogas()}
+
+    def _yogas(self) -> Dict[str, Dict[str, Any]]:
+        return {key: dict(fields) for key, fields in self.entries.items()}
+
+
+@lru_cache(maxsize=1)
+def get_yoga_catalog() -> YogaCatalog:
+    """Catalog from data/yoga_catalog.json, loaded once per process"""
+    return YogaCatalog.from_file(DEFAULT_CATALOG_PATH)
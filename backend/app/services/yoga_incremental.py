@@ -0,0 +1,254 @@
+"""
+Incremental yoga evaluation between nearby chart variants.
+
+Rectification and time-scrubbing UIs evaluate charts that differ only
+slightly: a few minutes of birth time move degrees and longitudes, and
+now and then a house, sign or nakshatra. Most yoga detectors only look at
+houses, signs and dignity flags, so they give the same yogas on the
+variant and do not need to run again.
+
+The dependency map (detector -> chart facts it read) is recorded while
+detectors run on a TracedPlanets view of the chart:
+
+- A fact is (body, field), e.g. ("Moon", "house"); (body, None) is the
+  presence of a body and (None, None) the set of bodies (iteration)
+- Reading a whole body (iterating or copying its fields) records
+  (body, "*"), which depends on every field of the body; testing a body
+  for truth records (body, "+"), whether it has any field
+
+A detector is a deterministic function of the facts it read, so when none
+of them changed on the variant it returns the same yogas, even if it
+would have branched on other facts. Re-running affected detectors records
+their new inputs, so the map stays exact from one variant to the next.
+
+Usage:
+    evaluation = extended_yoga_service.evaluate_yogas(planets)
+    evaluation = extended_yoga_service.reevaluate_yogas(evaluation, nearby_planets)
+    evaluation.yogas        # same as list(iter_extended_yogas(nearby_planets))
+    evaluation.rerun        # detectors that ran for this variant
+
+Deduplication and enrichment are redone for a detector family only when
+one of its detectors ran again or an earlier family kept other yogas.
+"""
+
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+
+Fact = Tuple[Optional[str], Optional[str]]
+
+# Fact of the set of bodies in the chart
+BODY_SET: Fact = (None, None)
+
+# Field of a fact that stands for every field of the body
+WHOLE_BODY = "*"
+
+# Field of a fact that stands for whether the body has any field
+NON_EMPTY = "+"
+
+_MISSING = object()
+
+
+class _TracedBody(dict):
+    """Fields of one body, recording each read as (body, field)"""
+
+    __slots__ = ("_name", "_reads")
+
+    def __init__(self, data: Mapping[str, Any], name: str, reads: Set[Fact]):
+        super().__init__(data)
+        self._name = name
+        self._reads = reads
+
+    def __getitem__(self, field):
+        self._reads.add((self._name, field))
+        return super().__getitem__(field)
+
+    def get(self, field, default=None):
+        self._reads.add((self._name, field))
+        return super().get(field, default)
+
+    def __contains__(self, field):
+        self._reads.add((self._name, field))
+        return super().__contains__(field)
+
+    def __bool__(self):
+        self._reads.add((self._name, NON_EMPTY))
+        return super().__len__() > 0
+
+    def _read_all(self):
+        self._reads.add((self._name, WHOLE_BODY))
+
+    def __iter__(self):
+        self._read_all()
+        return super().__iter__()
+
+    def __len__(self):
+        self._read_all()
+        return super().__len__()
+
+    def keys(self):
+        self._read_all()
+        return super().keys()
+
+    def values(self):
+        self._read_all()
+        return super().values()
+
+    def items(self):
+        self._read_all()
+        return super().items()
+
+    def copy(self):
+        self._read_all()
+        return dict(super().items())
+
+
+class TracedPlanets(dict):
+    """
+    Planets dict that records which chart facts are read
+
+    Bodies are _TracedBody copies of the given entries (shallow), so field
+    reads are recorded too. Detectors receive it in place of the planets
+    dict; values they return are plain (yogas do not keep the bodies).
+    """
+
+    def __init__(self, planets: Mapping[str, Any], reads: Set[Fact]):
+        super().__init__({
+            name: _TracedBody(data, name, reads) if isinstance(data, dict) else data
+            for name, data in planets.items()
+        })
+        self._reads = reads
+
+    def _read(self, name):
+        self._reads.add((name, None))
+        if not isinstance(super().get(name), _TracedBody):
+            # Value without traced fields (not a dict): depends on all of it
+            self._reads.add((name, WHOLE_BODY))
+
+    def __getitem__(self, name):
+        self._read(name)
+        return super().__getitem__(name)
+
+    def get(self, name, default=None):
+        self._read(name)
+        return super().get(name, default)
+
+    def __contains__(self, name):
+        self._reads.add((name, None))
+        return super().__contains__(name)
+
+    def __iter__(self):
+        self._reads.add(BODY_SET)
+        return super().__iter__()
+
+    def __len__(self):
+        self._reads.add(BODY_SET)
+        return super().__len__()
+
+    def keys(self):
+        self._reads.add(BODY_SET)
+        return super().keys()
+
+    def values(self):
+        self._reads.add(BODY_SET)
+        return super().values()
+
+    def items(self):
+        self._reads.add(BODY_SET)
+        return super().items()
+
+
+class ChartChanges:
+    """Facts that differ between two variants of a chart, indexed for dependency checks"""
+
+    def __init__(self, facts: Iterable[Fact]):
+        self.facts = frozenset(facts)
+        self.bodies = frozenset(name for name, _ in self.facts)
+        self.whole_bodies = frozenset(name for name, field in self.facts if field == WHOLE_BODY)
+
+    @classmethod
+    def between(cls, old: Mapping[str, Any], new: Mapping[str, Any]) -> "ChartChanges":
+        """Changes found by comparing two planets dicts field by field"""
+        changed = set()
+        if old.keys() != new.keys():
+            changed.add(BODY_SET)
+        for name in old.keys() | new.keys():
+            before, after = old.get(name, _MISSING), new.get(name, _MISSING)
+            if before is _MISSING or after is _MISSING:
+                changed.update(((name, None), (name, WHOLE_BODY)))
+            elif not (isinstance(before, dict) and isinstance(after, dict)):
+                if before != after:
+                    changed.add((name, WHOLE_BODY))
+            else:
+                changed.update(
+                    (name, field) for field in before.keys() | after.keys()
+                    if before.get(field, _MISSING) != after.get(field, _MISSING)
+                )
+                if bool(before) != bool(after):
+                    changed.add((name, NON_EMPTY))
+        return cls(changed)
+
+    @classmethod
+    def of_bodies(cls, names: Iterable[str]) -> "ChartChanges":
+        """Changes of bodies named by the caller (every field, and presence)"""
+        return cls(fact for name in names for fact in ((name, None), (name, WHOLE_BODY)))
+
+    def __bool__(self) -> bool:
+        return bool(self.facts)
+
+
+class DetectorRun:
+    """Yogas of one detector run (frozen, see yoga_cache.freeze_yogas) and the facts it read"""
+
+    __slots__ = ("yogas", "reads", "bodies", "whole_bodies")
+
+    def __init__(self, yogas: Any, reads: Iterable[Fact]):
+        self.yogas = yogas
+        self.reads = frozenset(reads)
+        self.bodies = frozenset(name for name, _ in self.reads)
+        self.whole_bodies = frozenset(name for name, field in self.reads if field == WHOLE_BODY)
+
+    def affected_by(self, changes: ChartChanges) -> bool:
+        """Whether the detector may give other yogas after these changes"""
+        # A whole-body change hits every read of the body; a whole-body read is hit by any change
+        return bool(changes) and not (
+            self.reads.isdisjoint(changes.facts)
+            and self.bodies.isdisjoint(changes.whole_bodies)
+            and self.whole_bodies.isdisjoint(changes.bodies)
+        )
+
+
+class YogaEvaluation:
+    """
+    Result of an incremental yoga evaluation, the base for the next variant
+
+    Attributes:
+        planets: Copy of the evaluated planets (diffed against the next variant)
+        categories: Category filter of the evaluation (see ExtendedYogaService.YOGA_FAMILIES)
+        min_importance: Importance filter of the evaluation
+        detectors: Detector -> DetectorRun
+        families: Detectors of a family -> (canonical names seen before it,
+            its frozen deduplicated and enriched yogas, names it added)
+        yogas: Deduplicated, enriched yogas (as iter_extended_yogas yields them)
+        rerun: Detectors that ran for this evaluation, in order
+    """
+
+    def __init__(
+        self,
+        planets: Mapping[str, Any],
+        categories: Optional[List[str]],
+        min_importance: Optional[str],
+        detectors: Dict[str, DetectorRun],
+        families: Dict[Tuple[str, ...], Tuple[FrozenSet[str], Any, FrozenSet[str]]],
+        yogas: List[Dict[str, Any]],
+        rerun: List[str]
+    ):
+        self.planets = {name: dict(data) if isinstance(data, dict) else data for name, data in planets.items()}
+        self.categories = categories
+        self.min_importance = min_importance
+        self.detectors = detectors
+        self.families = families
+        self.yogas = yogas
+        self.rerun = tuple(rerun)
+
+    def dependencies(self) -> Dict[str, FrozenSet[Fact]]:
+        """Detector -> chart facts it read"""
+        return {detector: run.reads for detector, run in self.detectors.items()}
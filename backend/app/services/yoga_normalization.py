@@ -11,7 +11,7 @@ Created: 2025-11-10
 Purpose: Fix duplicate yogas and ensure proper categorization
 """
 
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Set
 import re
 
 
@@ -465,17 +465,20 @@ class YogaNormalizer:
             return "negative"
         return "neutral"
 
-    def deduplicate_yogas(self, yogas: List[Dict]) -> List[Dict]:
+    def deduplicate_yogas(self, yogas: List[Dict], seen: Optional[Set[str]] = None) -> List[Dict]:
         """
         Remove duplicate yogas by normalizing names.
 
         Args:
             yogas: List of yoga dictionaries
+            seen: Lowercased canonical names already kept (updated in place),
+                to deduplicate yogas arriving in batches
 
         Returns:
             Deduplicated list with canonical names and proper categories
         """
-        seen = {}
+        if seen is None:
+            seen = set()
         deduplicated = []
 
         for yoga in yogas:
@@ -504,7 +507,7 @@ class YogaNormalizer:
                     yoga["bphs_ref"] = "N/A"
 
                 # Mark as seen and add to result
-                seen[canonical_name.lower()] = True
+                seen.add(canonical_name.lower())
                 deduplicated.append(yoga)
 
         return deduplicated
@@ -564,9 +567,9 @@ def get_yoga_category(name: str) -> str:
     return normalizer.get_category(name)
 
 
-def deduplicate_yogas(yogas: List[Dict]) -> List[Dict]:
+def deduplicate_yogas(yogas: List[Dict], seen: Optional[Set[str]] = None) -> List[Dict]:
     """Remove duplicate yogas and apply proper categorization."""
-    return normalizer.deduplicate_yogas(yogas)
+    return normalizer.deduplicate_yogas(yogas, seen)
 
 
 def generate_deduplication_report(original: List[Dict], deduplicated: List[Dict]) -> Dict:
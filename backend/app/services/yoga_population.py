@@ -0,0 +1,301 @@
+"""
+Population-scale yoga detection (NumPy).
+
+ExtendedYogaService detects yogas one chart at a time, which is too slow
+for frequency statistics, AstroTwin features or regression comparisons
+over 100k charts. This module holds N charts as one structured array and
+evaluates yoga predicates column-wise, for all charts at once:
+
+- A chart is one row of CHART_DTYPE: ascendant sign, and sign / house /
+  longitude of each of BODIES (unplaced bodies have house and sign 0)
+- Each yoga of POPULATION_YOGAS is a predicate over whole columns; the
+  result is an N x Y boolean matrix (row = chart, column = yoga)
+- Predicates follow the per-chart detectors exactly (same house
+  arithmetic, same edge cases), so the matrix can be checked against
+  extended_yoga_service on the same charts
+- Bhava yogas are one column per (lord house, placement): 144 columns
+  named after their formation, e.g. "Bhava Yoga: 10th lord in 1st house"
+
+Usage:
+    charts = random_charts(100_000, seed=0)      # or charts_from_planets([...])
+    matrix = detect_population_yogas(charts)     # (100000, len(POPULATION_YOGAS)) bool
+    frequencies = yoga_frequencies(matrix)       # {"Hamsa Yoga": 0.0612, ...}
+"""
+
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.chart_core import GRAHAS, SEVEN_PLANETS, SIGN_LORDS
+from app.services.extended_yoga_service import ExtendedYogaService, extended_yoga_service
+
+BODIES = GRAHAS
+
+CHART_DTYPE = np.dtype([
+    ("ascendant_sign", np.int8),
+    ("sign", np.int8, (len(BODIES),)),
+    ("house", np.int8, (len(BODIES),)),
+    ("longitude", np.float64, (len(BODIES),)),
+])
+
+_INDEX = {name: index for index, name in enumerate(BODIES)}
+
+# Planets counted around the Sun / Moon by the Sun and Moon yogas
+_AROUND_SUN = ("Mars", "Mercury", "Jupiter", "Venus", "Saturn")
+_AROUND_MOON = ("Mars", "Mercury", "Jupiter", "Venus", "Saturn")
+_KEMADRUMA_PLANETS = ("Sun", "Mars", "Mercury", "Jupiter", "Venus", "Saturn")
+
+
+def _ordinal(number: int) -> str:
+    return f"{number}{extended_yoga_service._get_ordinal(number)}"
+
+
+BHAVA_YOGAS = tuple(
+    f"Bhava Yoga: {_ordinal(lord_house)} lord in {_ordinal(placement)} house"
+    for lord_house in range(1, 13) for placement in range(1, 13)
+)
+_BHAVA_COLUMNS = {name: index for index, name in enumerate(BHAVA_YOGAS)}
+
+
+class _Columns:
+    """Per-body columns of a chart array, as wide ints for house arithmetic"""
+
+    def __init__(self, charts: np.ndarray):
+        self.size = len(charts)
+        self.ascendant_sign = charts["ascendant_sign"].astype(np.int16)
+        self.signs = charts["sign"].astype(np.int16)
+        self.houses = charts["house"].astype(np.int16)
+
+    def house(self, name: str) -> np.ndarray:
+        return self.houses[:, _INDEX[name]]
+
+    def sign(self, name: str) -> np.ndarray:
+        return self.signs[:, _INDEX[name]]
+
+    def distances(self, names: Sequence[str], origin: str) -> np.ndarray:
+        """(N, len(names)) house distances from the origin's house, 0-11"""
+        return (self.houses[:, [_INDEX[name] for name in names]] - self.house(origin)[:, None]) % 12
+
+
+Predicate = Callable[[_Columns], np.ndarray]
+
+
+def _mahapurusha(planet: str) -> Predicate:
+    exaltation = ExtendedYogaService.EXALTATION_SIGNS[planet]
+    own_signs = ExtendedYogaService.OWN_SIGNS[planet]
+
+    def predicate(columns: _Columns) -> np.ndarray:
+        sign = columns.sign(planet)
+        return np.isin(columns.house(planet), ExtendedYogaService.KENDRA_HOUSES) & ((sign == exaltation) | np.isin(sign, own_signs))
+
+    return predicate
+
+
+def _gajakesari(columns: _Columns) -> np.ndarray:
+    moon, jupiter = columns.house("Moon"), columns.house("Jupiter")
+    return (moon != 0) & (jupiter != 0) & np.isin((jupiter - moon) % 12, (0, 3, 6, 9))
+
+
+def _budhaditya(columns: _Columns) -> np.ndarray:
+    sun = columns.house("Sun")
+    return (sun == columns.house("Mercury")) & np.isin(sun, (1, 2, 4, 5, 7, 9, 10, 11))
+
+
+def _any_at(names: Sequence[str], origin: str, distance: int) -> Predicate:
+    return lambda columns: (columns.distances(names, origin) == distance).any(axis=1)
+
+
+def _both_sides(names: Sequence[str], origin: str) -> Predicate:
+    def predicate(columns: _Columns) -> np.ndarray:
+        distances = columns.distances(names, origin)
+        return (distances == 1).any(axis=1) & (distances == 11).any(axis=1)
+
+    return predicate
+
+
+def _kemadruma(columns: _Columns) -> np.ndarray:
+    distances = columns.distances(_KEMADRUMA_PLANETS, "Moon")
+    return ~((distances == 1) | (distances == 11)).any(axis=1)
+
+
+def _kala_sarpa_counts(columns: _Columns) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(valid axis, all hemmed, number hemmed) for Kala Sarpa"""
+    rahu, ketu = columns.house("Rahu"), columns.house("Ketu")
+    valid = (rahu != 0) & (ketu != 0) & ((ketu - rahu) % 12 == 6)
+    houses = columns.houses[:, [_INDEX[name] for name in SEVEN_PLANETS]]
+    # Houses 1-5 after Rahu's; unplaced planets are ignored
+    placed = (houses >= 1) & (houses <= 12)
+    hemmed = placed & np.isin((houses - rahu[:, None]) % 12, (1, 2, 3, 4, 5))
+    all_hemmed = (hemmed | ~placed).all(axis=1)
+    return valid, all_hemmed, hemmed.sum(axis=1)
+
+
+def _kala_sarpa(columns: _Columns) -> np.ndarray:
+    valid, all_hemmed, _ = _kala_sarpa_counts(columns)
+    return valid & all_hemmed
+
+
+def _partial_kala_sarpa(columns: _Columns) -> np.ndarray:
+    valid, all_hemmed, count = _kala_sarpa_counts(columns)
+    return valid & ~all_hemmed & (count >= 5)
+
+
+def _sign_quality_counts(columns: _Columns) -> np.ndarray:
+    """(N, 3) planets of the seven in movable, fixed and dual signs"""
+    signs = columns.signs[:, [_INDEX[name] for name in SEVEN_PLANETS]]
+    placed = (signs >= 1) & (signs <= 12)
+    quality = (signs - 1) % 3
+    return np.stack([(placed & (quality == index)).sum(axis=1) for index in range(3)], axis=1)
+
+
+def _ashraya(quality: int) -> Predicate:
+    return lambda columns: _sign_quality_counts(columns)[:, quality] == 7
+
+
+def _maala(columns: _Columns) -> np.ndarray:
+    counts = _sign_quality_counts(columns)
+    return (counts >= 2).all(axis=1)
+
+
+POPULATION_PREDICATES: Dict[str, Predicate] = {
+    **{name: _mahapurusha(planet) for planet, name in ExtendedYogaService.MAHAPURUSHA_YOGA_NAMES.items()},
+    "Gajakesari Yoga": _gajakesari,
+    "Budhaditya Yoga": _budhaditya,
+    "Sunapha Yoga": _any_at(_AROUND_MOON, "Moon", 1),
+    "Anapha Yoga": _any_at(_AROUND_MOON, "Moon", 11),
+    "Durudhura Yoga": _both_sides(_AROUND_MOON, "Moon"),
+    "Kemadruma Yoga": _kemadruma,
+    "Vesi Yoga": _any_at(_AROUND_SUN, "Sun", 1),
+    "Vosi Yoga": _any_at(_AROUND_SUN, "Sun", 11),
+    "Ubhayachari Yoga": _both_sides(_AROUND_SUN, "Sun"),
+    "Kala Sarpa Yoga": _kala_sarpa,
+    "Partial Kala Sarpa Yoga": _partial_kala_sarpa,
+    "Rajju Yoga": _ashraya(0),
+    "Musala Yoga": _ashraya(1),
+    "Nala Yoga": _ashraya(2),
+    "Maala Yoga": _maala,
+}
+
+POPULATION_YOGAS = (*POPULATION_PREDICATES, *BHAVA_YOGAS)
+
+# [ascendant sign][house] -> body index of the house lord (row 0 / column 0 unused: -1)
+_LORD_INDEX = np.full((13, 13), -1, dtype=np.int16)
+for _ascendant in range(1, 13):
+    for _house in range(1, 13):
+        _LORD_INDEX[_ascendant, _house] = _INDEX[SIGN_LORDS[(_ascendant + _house - 2) % 12 + 1]]
+
+
+def _bhava_matrix(columns: _Columns) -> np.ndarray:
+    """(N, 144) Bhava yogas: column (lord_house - 1) * 12 + (placement - 1)"""
+    matrix = np.zeros((columns.size, 144), dtype=bool)
+    ascendant = columns.ascendant_sign
+    has_ascendant = ascendant != 0
+    lords = _LORD_INDEX[np.where(has_ascendant, (ascendant - 1) % 12 + 1, 0)]      # (N, 13)
+    rows = np.arange(columns.size)
+    for lord_house in range(1, 13):
+        lord = lords[:, lord_house]
+        placement = columns.houses[rows, lord]
+        found = has_ascendant & (placement >= 1) & (placement <= 12)
+        matrix[rows[found], (lord_house - 1) * 12 + placement[found] - 1] = True
+    return matrix
+
+
+def detect_population_yogas(charts: np.ndarray, yogas: Optional[Iterable[str]] = None) -> np.ndarray:
+    """
+    Detect yogas for every chart of a population.
+
+    Args:
+        charts: Structured array of CHART_DTYPE, one row per chart
+        yogas: Columns to compute (names from POPULATION_YOGAS); all by default
+
+    Returns:
+        Boolean matrix, one row per chart and one column per yoga (in the
+        order of `yogas`, or of POPULATION_YOGAS)
+
+    Raises:
+        ValueError: For an unknown yoga name
+    """
+    names = POPULATION_YOGAS if yogas is None else tuple(yogas)
+    unknown = [name for name in names if name not in POPULATION_PREDICATES and name not in _BHAVA_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown population yogas: {', '.join(unknown)}")
+
+    columns = _Columns(charts)
+    bhava = _bhava_matrix(columns) if any(name in _BHAVA_COLUMNS for name in names) else None
+
+    matrix = np.empty((columns.size, len(names)), dtype=bool)
+    for index, name in enumerate(names):
+        if name in _BHAVA_COLUMNS:
+            matrix[:, index] = bhava[:, _BHAVA_COLUMNS[name]]
+        else:
+            matrix[:, index] = POPULATION_PREDICATES[name](columns)
+    return matrix
+
+
+def yoga_frequencies(matrix: np.ndarray, names: Sequence[str] = POPULATION_YOGAS) -> Dict[str, float]:
+    """Share of charts (0-1) with each yoga of a detection matrix"""
+    if not len(matrix):
+        return {name: 0.0 for name in names}
+    return dict(zip(names, matrix.mean(axis=0).tolist()))
+
+
+def charts_from_planets(charts: Iterable[Dict]) -> np.ndarray:
+    """Chart array from planets dicts (as used by extended_yoga_service)"""
+    charts = list(charts)
+    array = np.zeros(len(charts), dtype=CHART_DTYPE)
+    array["longitude"] = np.nan
+    for row, planets in enumerate(charts):
+        array["ascendant_sign"][row] = extended_yoga_service._get_ascendant_sign(planets) or 0
+        for index, name in enumerate(BODIES):
+            data = planets.get(name)
+            if not data:
+                continue
+            array["sign"][row, index] = data.get("sign_num") or 0
+            array["house"][row, index] = data.get("house") or 0
+            if data.get("longitude") is not None:
+                array["longitude"][row, index] = data["longitude"]
+    return array
+
+
+def random_charts(size: int, seed: Optional[int] = None) -> np.ndarray:
+    """
+    Synthetic charts with whole-sign houses.
+
+    Longitudes are uniform, except that Mercury and Venus stay within 28 and
+    47 degrees of the Sun and Ketu is opposite Rahu. Not astronomically
+    accurate, but close enough for frequency baselines and regression tests.
+    """
+    rng = np.random.default_rng(seed)
+    longitudes = rng.uniform(0, 360, (size, len(BODIES)))
+    sun = longitudes[:, _INDEX["Sun"]]
+    longitudes[:, _INDEX["Mercury"]] = (sun + rng.uniform(-28, 28, size)) % 360
+    longitudes[:, _INDEX["Venus"]] = (sun + rng.uniform(-47, 47, size)) % 360
+    longitudes[:, _INDEX["Ketu"]] = (longitudes[:, _INDEX["Rahu"]] + 180) % 360
+
+    array = np.zeros(size, dtype=CHART_DTYPE)
+    ascendant = rng.integers(1, 13, size)
+    signs = (longitudes // 30).astype(np.int16) + 1
+    array["ascendant_sign"] = ascendant
+    array["sign"] = signs
+    array["house"] = (signs - ascendant[:, None]) % 12 + 1
+    array["longitude"] = longitudes
+    return array
+
+
+def population_yoga_statistics(sample_size: int, seed: int = 0) -> Dict[str, Any]:
+    """
+    Yoga frequencies over a synthetic population (random_charts).
+
+    Args:
+        sample_size: Number of charts
+        seed: Random seed, for reproducible statistics
+
+    Returns:
+        Dict with sample_size, seed, and frequencies (yoga name -> share of charts)
+    """
+    matrix = detect_population_yogas(random_charts(sample_size, seed=seed))
+    return {
+        "sample_size": sample_size,
+        "seed": seed,
+        "frequencies": {name: round(share, 6) for name, share in yoga_frequencies(matrix).items()},
+    }
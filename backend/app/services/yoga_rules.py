@@ -0,0 +1,495 @@
+"""
+Declarative yoga rules compiled to predicate closures over ChartFacts.
+
+Yoga definitions are data (data/yoga_rules.json) instead of imperative
+`_detect_*` methods. Each rule has a condition written as a JSON
+s-expression, and the output yoga dict as a template:
+
+    {
+      "group": "guru_mangala",
+      "bphs_id": null,
+      "when": ["eq", ["house", "Jupiter"], ["house", "Mars"]],
+      "yoga": {"name": "Guru-Mangala Yoga", "strength": "Medium", ...}
+    }
+
+Compilation:
+- Rule families are expanded with "for" ({"planet": ["Sun", ...],
+  "house": [3, 6]} gives one rule per combination; "{planet}" in any
+  string is substituted, a bare "{house}" keeps the value's type)
+- Quantifiers ("all"/"any"/"count" over a planet list, with "$" for the
+  planet) are unrolled into plain expressions
+- Every distinct subexpression becomes one node. Rules sharing a
+  subexpression (e.g. 28 rules asking whether the Lagna lord is strong)
+  share the node, and one evaluation pass over a chart computes each node
+  at most once, so cost follows the number of unique predicates rather
+  than the number of rules
+
+Expressions:
+    values      ["house", P]  ["sign", P]  ["lord", n]  ["sign_lord", s]
+                ["karaka", "AK"]  ["distance", h1, h2]  ["sub", a, b]
+    predicates  ["and", ...]  ["or", ...]  ["not", x]  ["eq", a, b]
+                ["ne", a, b]  ["gt"|"ge"|"lt"|"le", a, b]
+                ["in", x, [values] | "kendra"|"trikona"|...]
+                ["present", P]  ["conjunct", P, Q]  ["aspects", P, Q]
+                ["aspects_house", P, h]  ["exalted"|"debilitated"|
+                "own_sign"|"retrograde"|"combust", P]  ["strong", P]
+                ["benefic", P]  ["malefic", P]
+    quantifiers ["all"|"any"|"count", planets, expr with "$"]
+
+A planet P is a name or an expression giving one (["lord", 1]); missing
+planets have house and sign 0. Output strings may use "{var}" for values
+named in the rule's "vars" ({"lagna_lord": ["lord", 1]}).
+
+Usage:
+    from app.services.yoga_rules import get_yoga_rule_set
+
+    matches = get_yoga_rule_set().evaluate(facts)   # group -> [yoga, ...]
+"""
+
+import itertools
+import json
+import operator
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.core.chart_core import GRAHAS, SEVEN_PLANETS, SIGN_LORDS
+from app.services.chart_facts import ChartFacts
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+DEFAULT_RULES_PATH = BACKEND_DIR / "data" / "yoga_rules.json"
+
+HOUSE_GROUPS = {
+    "kendra": (1, 4, 7, 10),
+    "trikona": (1, 5, 9),
+    "upachaya": (3, 6, 10, 11),
+    "panaphara": (2, 5, 8, 11),
+    "apoklima": (3, 6, 9, 12),
+    "dusthana": (6, 8, 12),
+}
+
+PLANET_GROUPS = {
+    "SEVEN": SEVEN_PLANETS,
+    "ALL": GRAHAS,
+}
+
+_COMPARISONS = {
+    "eq": operator.eq, "ne": operator.ne,
+    "gt": operator.gt, "ge": operator.ge, "lt": operator.lt, "le": operator.le,
+}
+
+_PLANET_FLAGS = ("exalted", "debilitated", "own_sign", "retrograde", "combust")
+
+_UNSET = object()
+
+# Node: computes one value from the chart and the evaluation's memo
+Node = Callable[[ChartFacts, List[Any]], Any]
+
+
+class _Template(dict):
+    """format_map mapping that leaves unknown {placeholders} in place"""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+def _substitute(value: Any, bindings: Dict[str, Any]) -> Any:
+    """Substitute "for" bindings into a rule (strings, lists, dicts)"""
+    if isinstance(value, str):
+        if value.startswith("{") and value.endswith("}") and value[1:-1] in bindings:
+            return bindings[value[1:-1]]
+        return value.format_map(_Template(bindings)) if "{" in value else value
+    if isinstance(value, list):
+        return [_substitute(item, bindings) for item in value]
+    if isinstance(value, dict):
+        return {key: _substitute(item, bindings) for key, item in value.items()}
+    return value
+
+
+def _replace_placeholder(value: Any, planet: str) -> Any:
+    """Replace the quantifier placeholder "$" with a planet name"""
+    if value == "$":
+        return planet
+    if isinstance(value, list):
+        return [_replace_placeholder(item, planet) for item in value]
+    return value
+
+
+def expand_rules(definitions: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Expand rule families ("for") into one definition per combination"""
+    rules = []
+    for definition in definitions:
+        axes = definition.get("for")
+        if not axes:
+            rules.append(definition)
+            continue
+
+        template = {key: value for key, value in definition.items() if key != "for"}
+        choices = [
+            [value if isinstance(value, dict) else {axis: value} for value in values]
+            for axis, values in axes.items()
+        ]
+        for combination in itertools.product(*choices):
+            bindings: Dict[str, Any] = {}
+            for choice in combination:
+                bindings.update(choice)
+            rules.append(_substitute(template, bindings))
+    return rules
+
+
+def _planet_names(planets: Any) -> Tuple[str, ...]:
+    """Planets of a quantifier: a group name ("SEVEN") or a list"""
+    if isinstance(planets, str):
+        if planets not in PLANET_GROUPS:
+            raise ValueError(f"Unknown planet group: {planets}")
+        return PLANET_GROUPS[planets]
+    return tuple(planets)
+
+
+def _constant(value: Any) -> Tuple[str, Any]:
+    """Key of a constant (hashable form of the value)"""
+    if isinstance(value, list):
+        value = tuple(value)
+    return ("=", value)
+
+
+def _is_constant(key: Tuple) -> bool:
+    return key[0] == "="
+
+
+class _Compiler:
+    """
+    Compiles expressions in two passes:
+
+    1. intern(): normalize (unroll quantifiers, flatten and/or, resolve
+       house groups) and register every distinct subexpression once,
+       counting how many expressions refer to it
+    2. node(): build one closure per subexpression. Constant arguments are
+       bound into the closure; subexpressions referenced more than once
+       are memoized per evaluation.
+    """
+
+    def __init__(self):
+        self.exprs: Dict[Tuple, Tuple[str, Tuple[Tuple, ...]]] = {}
+        self.references: Dict[Tuple, int] = {}
+        self.slots = 0
+        self._nodes: Dict[Tuple, Node] = {}
+
+    def intern(self, expr: Any) -> Tuple:
+        """Key of a (normalized) expression"""
+        if not isinstance(expr, list) or not expr or not isinstance(expr[0], str):
+            return _constant(expr)
+
+        op, args = expr[0], expr[1:]
+        if op in ("all", "any", "count"):
+            planets, body = args
+            terms = [_replace_placeholder(body, name) for name in _planet_names(planets)]
+            if op != "count":
+                return self.intern(["and" if op == "all" else "or", *terms])
+            arg_keys = tuple(self.intern(term) for term in terms)
+        elif op == "in":
+            members = args[1]
+            if isinstance(members, str):
+                if members not in HOUSE_GROUPS:
+                    raise ValueError(f"Unknown house group: {members}")
+                members = HOUSE_GROUPS[members]
+            arg_keys = (self.intern(args[0]), _constant(frozenset(members)))
+        elif op in ("and", "or"):
+            arg_keys = tuple(dict.fromkeys(self.intern(arg) for arg in _flatten(op, args)))
+        elif op in _OPERATORS:
+            arg_keys = tuple(self.intern(arg) for arg in args)
+        else:
+            raise ValueError(f"Unknown yoga rule operator: {op}")
+
+        key = (op, *arg_keys)
+        if key not in self.exprs:
+            self.exprs[key] = (op, arg_keys)
+            self.references[key] = 0
+            for arg_key in arg_keys:
+                if not _is_constant(arg_key):
+                    self.references[arg_key] += 1
+        return key
+
+    def reference(self, key: Tuple) -> None:
+        """Count a reference from outside the expression graph (rules, vars)"""
+        if not _is_constant(key):
+            self.references[key] += 1
+
+    def node(self, key: Tuple) -> Node:
+        """Closure evaluating a key"""
+        if _is_constant(key):
+            value = key[1]
+            return lambda facts, memo: value
+
+        node = self._nodes.get(key)
+        if node is None:
+            op, arg_keys = self.exprs[key]
+            compute = self._build(op, arg_keys)
+            if self.references[key] > 1:
+                compute = self._memoized(compute)
+            node = self._nodes[key] = compute
+        return node
+
+    def _memoized(self, compute: Node) -> Node:
+        slot = self.slots
+        self.slots += 1
+
+        def read(facts: ChartFacts, memo: List[Any]) -> Any:
+            value = memo[slot]
+            if value is _UNSET:
+                value = memo[slot] = compute(facts, memo)
+            return value
+
+        return read
+
+    def _build(self, op: str, arg_keys: Tuple[Tuple, ...]) -> Node:
+        if op in ("and", "or"):
+            return _junction(op, [self.node(key) for key in arg_keys])
+        if op == "count":
+            terms = [self.node(key) for key in arg_keys]
+            return lambda facts, memo: sum(1 for term in terms if term(facts, memo))
+
+        first = arg_keys[0] if arg_keys else None
+        if first is not None and _is_constant(first) and op in _PLANET_OPERATORS and len(arg_keys) == 1:
+            # The common case, e.g. ["house", "Moon"]: bind the name
+            return _PLANET_OPERATORS[op](first[1])
+
+        values = [self.node(key) for key in arg_keys]
+        if op in _COMPARISONS or op == "in" or op == "sub":
+            compare = _COMPARISONS.get(op) or (operator.sub if op == "sub" else _contains)
+            left_key, right_key = arg_keys
+            left, right = values
+            if _is_constant(right_key):
+                constant = right_key[1]
+                return lambda facts, memo: compare(left(facts, memo), constant)
+            return lambda facts, memo: compare(left(facts, memo), right(facts, memo))
+
+        implementation = _OPERATORS[op]
+        if len(values) == 1:
+            value = values[0]
+            return lambda facts, memo: implementation(facts, value(facts, memo))
+        return lambda facts, memo: implementation(facts, *(value(facts, memo) for value in values))
+
+
+def _flatten(op: str, args: List[Any]) -> Iterable[Any]:
+    """Terms of an and/or, with nested ones of the same kind (or their quantifier) inlined"""
+    quantifier = "all" if op == "and" else "any"
+    for arg in args:
+        if isinstance(arg, list) and arg and arg[0] == op:
+            yield from _flatten(op, arg[1:])
+        elif isinstance(arg, list) and arg and arg[0] == quantifier:
+            planets, body = arg[1:]
+            yield from _flatten(op, [_replace_placeholder(body, name) for name in _planet_names(planets)])
+        else:
+            yield arg
+
+
+def _junction(op: str, terms: List[Node]) -> Node:
+    """Short-circuit and/or, unrolled for the usual two or three terms"""
+    if op == "and":
+        if len(terms) == 1:
+            return terms[0]
+        if len(terms) == 2:
+            a, b = terms
+            return lambda facts, memo: bool(a(facts, memo) and b(facts, memo))
+        if len(terms) == 3:
+            a, b, c = terms
+            return lambda facts, memo: bool(a(facts, memo) and b(facts, memo) and c(facts, memo))
+        return lambda facts, memo: all(term(facts, memo) for term in terms)
+
+    if len(terms) == 1:
+        return terms[0]
+    if len(terms) == 2:
+        a, b = terms
+        return lambda facts, memo: bool(a(facts, memo) or b(facts, memo))
+    return lambda facts, memo: any(term(facts, memo) for term in terms)
+
+
+def _contains(value: Any, members: Any) -> bool:
+    return value in members
+
+
+def _is_strong(facts: ChartFacts, planet: Optional[str]) -> bool:
+    """Own sign or exalted, not debilitated (the "strong" lord test)"""
+    data = facts.get(planet)
+    if not data or data.get("debilitated", False) or data.get("sign_num", 0) == 0:
+        return False
+    return bool(data.get("exalted", False) or data.get("own_sign", False))
+
+
+def _conjunct(facts: ChartFacts, first: Optional[str], second: Optional[str]) -> bool:
+    """Both planets placed, in the same house"""
+    house = facts.houses.get(first, 0)
+    return bool(house) and house == facts.houses.get(second, 0)
+
+
+def _flag(name: str) -> Callable[[ChartFacts, Optional[str]], bool]:
+    return lambda facts, planet: bool(facts.get(planet, {}).get(name, False))
+
+
+# op -> implementation(facts, *argument values)
+_OPERATORS: Dict[str, Callable[..., Any]] = {
+    "house": lambda facts, planet: facts.houses.get(planet, 0),
+    "sign": lambda facts, planet: facts.signs.get(planet, 0),
+    "present": lambda facts, planet: bool(facts.houses.get(planet)),
+    "strong": _is_strong,
+    "benefic": lambda facts, planet: planet in facts.benefics,
+    "malefic": lambda facts, planet: planet in facts.malefics,
+    "lord": lambda facts, house: facts.house_lords[house],
+    "sign_lord": lambda facts, sign: SIGN_LORDS[sign] if 1 <= sign <= 12 else None,
+    "karaka": lambda facts, name: facts.karakas.get(name),
+    "distance": lambda facts, start, end: (end - start) % 12 + 1,
+    "conjunct": _conjunct,
+    "aspects": lambda facts, planet, other: facts.aspects(planet, facts.houses.get(other, 0)),
+    "aspects_house": lambda facts, planet, house: facts.aspects(planet, house),
+    "not": lambda facts, value: not value,
+    **{name: _flag(name) for name in _PLANET_FLAGS},
+    **{name: None for name in (*_COMPARISONS, "in", "sub", "and", "or", "count")},
+}
+
+
+def _bind(implementation: Callable[..., Any]) -> Callable[[Any], Node]:
+    return lambda argument: lambda facts, memo: implementation(facts, argument)
+
+
+# Operators of one constant argument, with the argument bound at compile time
+_PLANET_OPERATORS: Dict[str, Callable[[Any], Node]] = {
+    "house": lambda planet: lambda facts, memo: facts.houses.get(planet, 0),
+    "sign": lambda planet: lambda facts, memo: facts.signs.get(planet, 0),
+    "lord": lambda house: lambda facts, memo: facts.house_lords[house],
+    **{name: _bind(_OPERATORS[name]) for name in ("present", "strong", "benefic", "malefic", "karaka", *_PLANET_FLAGS)},
+}
+
+
+def _compile_output(value: Any) -> Callable[[Dict[str, Any]], Any]:
+    """Output template -> function of the rule's runtime vars"""
+    if isinstance(value, str):
+        if value.startswith("{") and value.endswith("}") and value.count("{") == 1:
+            name = value[1:-1]
+            return lambda variables: variables[name]
+        if "{" in value:
+            return lambda variables: value.format_map(variables)
+        return lambda variables: value
+    if isinstance(value, list):
+        items = [_compile_output(item) for item in value]
+        return lambda variables: [item(variables) for item in items]
+    if isinstance(value, dict):
+        fields = [(key, _compile_output(item)) for key, item in value.items()]
+        return lambda variables: {key: field(variables) for key, field in fields}
+    return lambda variables: value
+
+
+class YogaRule:
+    """One yoga rule: condition, runtime vars and output template"""
+
+    __slots__ = ("id", "group", "bphs_id", "conjuncts", "variables", "output")
+
+    def __init__(self, definition: Dict[str, Any], compiler: _Compiler):
+        self.id = definition.get("id") or definition["yoga"]["name"]
+        self.group = definition["group"]
+        self.bphs_id = definition.get("bphs_id")
+
+        condition = compiler.intern(definition["when"])
+        # Top-level conjuncts, shared as guards with neighbouring rules
+        self.conjuncts: Tuple[Tuple, ...] = compiler.exprs[condition][1] if condition[0] == "and" else (condition,)
+        self.variables: Tuple[Tuple[str, Any], ...] = tuple(
+            (name, compiler.intern(expr)) for name, expr in definition.get("vars", {}).items()
+        )
+        self.output = _compile_output(definition["yoga"])
+
+
+# Step of an evaluation plan: (facts, memo, matches) -> None
+Step = Callable[[ChartFacts, List[Any], Dict[str, List[Dict[str, Any]]]], None]
+
+
+class YogaRuleSet:
+    """Compiled rules, evaluated together in one pass per chart"""
+
+    def __init__(self, definitions: Iterable[Dict[str, Any]]):
+        """
+        Compile rule definitions.
+
+        Consecutive rules starting with the same conjuncts are nested under
+        one guard, so e.g. a rule family requiring a strong Lagna lord
+        checks it once and skips the whole family when it fails.
+
+        Raises:
+            ValueError: On unknown operators or house groups
+        """
+        self._compiler = _Compiler()
+        self.rules = [YogaRule(definition, self._compiler) for definition in expand_rules(definitions)]
+        self.groups = tuple(dict.fromkeys(rule.group for rule in self.rules))
+
+        for rule in self.rules:
+            for key in rule.conjuncts:
+                self._compiler.reference(key)
+            for _, key in rule.variables:
+                self._compiler.reference(key)
+        self._steps = self._plan([(rule, rule.conjuncts) for rule in self.rules])
+
+    @classmethod
+    def from_file(cls, path: Path = DEFAULT_RULES_PATH) -> "YogaRuleSet":
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f)["rules"])
+
+    @property
+    def unique_predicates(self) -> int:
+        """Number of distinct subexpressions across all rules"""
+        return len(self._compiler.exprs)
+
+    def _plan(self, items: List[Tuple[YogaRule, Tuple[Tuple, ...]]]) -> List[Step]:
+        """Steps for rules with their remaining conjuncts, sharing leading ones"""
+        steps = []
+        index = 0
+        while index < len(items):
+            rule, conjuncts = items[index]
+            end = index + 1
+            if conjuncts:
+                while end < len(items) and items[end][1][:1] == conjuncts[:1]:
+                    end += 1
+            if end - index > 1:
+                guard = self._compiler.node(conjuncts[0])
+                nested = self._plan([(item, remaining[1:]) for item, remaining in items[index:end]])
+                steps.append(self._guarded(guard, nested))
+            else:
+                steps.append(self._leaf(rule, conjuncts))
+            index = end
+        return steps
+
+    @staticmethod
+    def _guarded(guard: Node, steps: List[Step]) -> Step:
+        def step(facts, memo, matches):
+            if guard(facts, memo):
+                for nested in steps:
+                    nested(facts, memo, matches)
+        return step
+
+    def _leaf(self, rule: YogaRule, conjuncts: Tuple[Tuple, ...]) -> Step:
+        condition = _junction("and", [self._compiler.node(key) for key in conjuncts]) if conjuncts else None
+        variables = [(name, self._compiler.node(key)) for name, key in rule.variables]
+        group, output = rule.group, rule.output
+
+        def step(facts, memo, matches):
+            if condition is None or condition(facts, memo):
+                values = {name: value(facts, memo) for name, value in variables}
+                matches.setdefault(group, []).append(output(values))
+        return step
+
+    def evaluate(self, facts: ChartFacts) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Evaluate every rule against a chart
+
+        Returns:
+            Group -> yogas of the matching rules, in rule order
+        """
+        memo = [_UNSET] * self._compiler.slots
+        matches: Dict[str, List[Dict[str, Any]]] = {}
+        for step in self._steps:
+            step(facts, memo, matches)
+        return matches
+
+
+@lru_cache(maxsize=1)
+def get_yoga_rule_set() -> YogaRuleSet:
+    """Rules from data/yoga_rules.json, compiled once per process"""
+    return YogaRuleSet.from_file(DEFAULT_RULES_PATH)
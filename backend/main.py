@@ -8,10 +8,15 @@ from app.features.life_snapshot import life_snapshot_feature
 from app.features.evidence_mode import evidence_mode_feature
 from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from contextlib import asynccontextmanager
 import uvicorn
 
 from app.core.config import settings
+from app.core.compute import compute_executor
+from app.core.ephemeris import ephemeris
+from app.core.metrics import metrics
+from app.services.yoga_cache import yoga_result_cache
 from app.api.v1.router import api_router
 from app.db.database import init_db
 from app.features.registry import feature_registry
@@ -55,6 +60,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     print("👋 Shutting down...")
+    compute_executor.shutdown()
 
 app = FastAPI(
     title="JioAstro API",
@@ -99,6 +105,27 @@ async def health_check():
         "note": "Using Supabase REST API for database operations"
     }
 
+metrics.gauge_callback(
+    "jioastro_compute_executor",
+    "Compute executor load and task counters",
+    lambda: {key: value for key, value in compute_executor.get_stats().items() if isinstance(value, (int, float))}
+)
+metrics.gauge_callback(
+    "jioastro_ephemeris_cache",
+    "Ephemeris position cache counters (main process)",
+    lambda: {key: ephemeris.get_stats()[key] for key in ("hits", "misses", "size")}
+)
+metrics.gauge_callback(
+    "jioastro_yoga_result_cache",
+    "Yoga detection result cache counters (main process)",
+    lambda: {key: yoga_result_cache.get_stats()[key] for key in ("hits", "misses", "size")}
+)
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Prometheus metrics: chart stage timings and compute load (text format)"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
 if __name__ == "__main__":
     uvicorn.run(
         "main:app",
@@ -0,0 +1,116 @@
+"""
+Yoga / Dosha Allocation Benchmark Script
+
+Measures the memory each yoga and dosha detector allocates per call with
+tracemalloc. The static tables of the detectors (effects, house groups,
+Kaal Sarpa types, ...) are class-level constants, so a call should only
+allocate its own results; a detector whose peak grows with the size of a
+table is rebuilding it on every call.
+
+Reported per detector:
+- peak: highest traced memory during one call (above the memory held before it)
+- time: mean call time with tracing off
+
+Yoga detection runs through iter_extended_yogas, so the result cache of
+detect_extended_yogas does not hide the work.
+
+Usage:
+    python scripts/benchmark_yoga_allocations.py [--iterations 200]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.dosha_detection_service import dosha_detection_service
+from app.services.extended_yoga_service import extended_yoga_service
+
+SAMPLE_PLANETS = {
+    "Ascendant": {"house": 1, "sign_num": 1, "degree": 12.0, "longitude": 12.0},
+    "Sun": {"house": 10, "sign_num": 10, "degree": 5.5, "longitude": 275.5},
+    "Moon": {"house": 4, "sign_num": 4, "degree": 20.1, "longitude": 110.1, "nakshatra": "Pushya"},
+    "Mars": {"house": 10, "sign_num": 10, "degree": 28.0, "longitude": 298.0, "exalted": True},
+    "Mercury": {"house": 9, "sign_num": 9, "degree": 14.2, "longitude": 254.2, "combust": True},
+    "Jupiter": {"house": 4, "sign_num": 4, "degree": 3.3, "longitude": 93.3, "exalted": True},
+    "Venus": {"house": 11, "sign_num": 11, "degree": 9.9, "longitude": 309.9},
+    "Saturn": {"house": 7, "sign_num": 7, "degree": 17.0, "longitude": 197.0, "exalted": True},
+    "Rahu": {"house": 3, "sign_num": 3, "degree": 1.0, "longitude": 61.0},
+    "Ketu": {"house": 9, "sign_num": 9, "degree": 1.0, "longitude": 241.0},
+}
+
+
+def measure_peak(func: Callable[[], Any], iterations: int) -> float:
+    """Mean peak of traced memory (bytes) during one call"""
+    func()  # warm up lazy tables and interned strings
+    tracemalloc.start()
+    peaks = []
+    for _ in range(iterations):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - before)
+    tracemalloc.stop()
+    return sum(peaks) / len(peaks)
+
+
+def measure_time(func: Callable[[], Any], iterations: int) -> float:
+    """Mean call time (ms) with tracing off"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+def detectors(planets: Dict[str, Any]) -> List[Tuple[str, Callable[[], Any]]]:
+    """(name, call) for every yoga and dosha detector on one chart"""
+    calls = [
+        (name, lambda method=getattr(extended_yoga_service, name): method(planets))
+        for name in sorted(dir(extended_yoga_service)) if name.startswith("_detect_")
+    ]
+    calls.append(("iter_extended_yogas", lambda: list(extended_yoga_service.iter_extended_yogas(planets))))
+    ascendant = planets["Ascendant"]
+    calls += [
+        ("detect_manglik_dosha", lambda: dosha_detection_service.detect_manglik_dosha(planets)),
+        ("detect_kaal_sarpa_dosha", lambda: dosha_detection_service.detect_kaal_sarpa_dosha(planets)),
+        ("detect_pitra_dosha", lambda: dosha_detection_service.detect_pitra_dosha(planets)),
+        ("detect_gandanta_dosha", lambda: dosha_detection_service.detect_gandanta_dosha(planets, ascendant)),
+        ("detect_grahan_dosha", lambda: dosha_detection_service.detect_grahan_dosha(planets)),
+        ("detect_kemdrum_dosha", lambda: dosha_detection_service.detect_kemdrum_dosha(planets)),
+        ("detect_all_doshas", lambda: dosha_detection_service.detect_all_doshas(planets, ascendant)),
+    ]
+    return calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200, help="Calls per detector")
+    args = parser.parse_args()
+
+    print("\n📊 Yoga / Dosha Detector Allocations")
+    print("-" * 70)
+    print(f"{'detector':<52}{'peak':>10}{'time':>8}")
+
+    total_peak = 0.0
+    for name, call in detectors(SAMPLE_PLANETS):
+        peak = measure_peak(call, args.iterations)
+        elapsed = measure_time(call, args.iterations)
+        row = f"{name:<52}{peak / 1024:>8.1f}KB{elapsed:>6.2f}ms"
+        if name in ("iter_extended_yogas", "detect_all_doshas"):
+            # Whole-chart runs (all detectors above plus enrichment)
+            print("-" * 70, row, "-" * 70, sep="\n")
+        else:
+            total_peak += peak
+            print(row)
+
+    print(f"{'sum of detector peaks':<52}{total_peak / 1024:>8.1f}KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Generate the precomputed daily ephemeris table used by app.core.ephemeris_table
+
+Writes a float32 .npy array of shape (days, bodies, 2) with the Lahiri
+sidereal longitude and speed of every graha at 0h UT of each day, plus a
+JSON metadata file next to it. After writing, the table is checked against
+swe.calc_ut at random instants and the maximum interpolation error per
+body is stored in the metadata (max_error_deg).
+
+Usage:
+    python scripts/generate_ephemeris_table.py
+    python scripts/generate_ephemeris_table.py --start-year 1950 --end-year 2050 --output /srv/ephemeris/lahiri_daily.npy
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+import numpy as np
+import swisseph as swe
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.ephemeris_table import (
+    DEFAULT_TABLE_PATH,
+    LONGITUDE,
+    SPEED,
+    TABLE_BODIES,
+    EphemerisTable,
+    date_to_jd,
+    metadata_path
+)
+
+BODY_IDS = {
+    "Sun": swe.SUN,
+    "Moon": swe.MOON,
+    "Mars": swe.MARS,
+    "Mercury": swe.MERCURY,
+    "Jupiter": swe.JUPITER,
+    "Venus": swe.VENUS,
+    "Saturn": swe.SATURN,
+    "Rahu": swe.MEAN_NODE
+}
+
+FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED | swe.FLG_SIDEREAL
+
+
+def ayanamsa_rate(jd: float) -> float:
+    """Ayanamsa change in degrees/day (central difference)"""
+    return (swe.get_ayanamsa_ut(jd + 0.5) - swe.get_ayanamsa_ut(jd - 0.5))
+
+
+def generate(output: Path, start_year: int, end_year: int) -> dict:
+    """Write the table and its metadata, return the metadata"""
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+
+    start_jd = date_to_jd(date(start_year, 1, 1))
+    days = int(date_to_jd(date(end_year + 1, 1, 1)) - start_jd) + 1  # Include Jan 1 after end_year
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    table = np.lib.format.open_memmap(output, mode="w+", dtype=np.float32, shape=(days, len(TABLE_BODIES), 2))
+
+    print(f"📅 Computing {days} days x {len(TABLE_BODIES)} bodies ({start_year}-{end_year})...")
+    started = time.time()
+
+    for day in range(days):
+        jd = start_jd + day
+        for index, body in enumerate(TABLE_BODIES):
+            if body == "Ayanamsa":
+                table[day, index, LONGITUDE] = swe.get_ayanamsa_ut(jd)
+                table[day, index, SPEED] = ayanamsa_rate(jd)
+            else:
+                position, _ = swe.calc_ut(jd, BODY_IDS[body], FLAGS)
+                table[day, index, LONGITUDE] = position[0]
+                table[day, index, SPEED] = position[3]
+
+    table.flush()
+    del table
+
+    metadata = {
+        "format": "numpy float32 (days, bodies, [longitude_deg, speed_deg_per_day])",
+        "ayanamsa": "Lahiri",
+        "node": "mean",
+        "bodies": list(TABLE_BODIES),
+        "start_jd": start_jd,
+        "step_days": 1.0,
+        "days": days,
+        "start_date": date(start_year, 1, 1).isoformat(),
+        "end_date": date(end_year + 1, 1, 1).isoformat(),
+        "swisseph_version": swe.version,
+        "generated_at": datetime.utcnow().isoformat()
+    }
+    metadata_path(output).write_text(json.dumps(metadata, indent=2))
+
+    print(f"✅ Table written to {output} in {time.time() - started:.1f}s")
+    return metadata
+
+
+def measure_errors(output: Path, samples: int, seed: int = 7) -> dict:
+    """Compare interpolated positions with swe.calc_ut at random instants"""
+    table = EphemerisTable(output)
+    rng = np.random.default_rng(seed)
+    jds = rng.uniform(table.start_jd, table.end_jd, samples)
+
+    errors = {}
+    for body in TABLE_BODIES:
+        interpolated = table.longitudes(body, jds)
+        if body == "Ayanamsa":
+            exact = np.array([swe.get_ayanamsa_ut(jd) for jd in jds])
+        else:
+            exact = np.array([swe.calc_ut(jd, BODY_IDS[body], FLAGS)[0][0] for jd in jds])
+        diff = np.abs(np.mod(interpolated - exact + 180.0, 360.0) - 180.0)
+        errors[body] = float(diff.max())
+        print(f"   {body:<9} max error {errors[body]:.6f}°")
+
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the daily sidereal ephemeris table")
+    parser.add_argument("--start-year", type=int, default=1900)
+    parser.add_argument("--end-year", type=int, default=2100)
+    parser.add_argument("--output", type=Path, default=DEFAULT_TABLE_PATH)
+    parser.add_argument("--samples", type=int, default=5000, help="Random instants used to measure interpolation error")
+    args = parser.parse_args()
+
+    if args.end_year < args.start_year:
+        parser.error("--end-year must not be before --start-year")
+
+    metadata = generate(args.output, args.start_year, args.end_year)
+
+    print(f"🔍 Measuring interpolation error at {args.samples} random instants...")
+    metadata["max_error_deg"] = measure_errors(args.output, args.samples)
+    metadata_path(args.output).write_text(json.dumps(metadata, indent=2))
+
+    size_mb = args.output.stat().st_size / (1024 * 1024)
+    print(f"✅ Done: {metadata['days']} days, {size_mb:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
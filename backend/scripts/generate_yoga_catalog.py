@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Generate the static yoga catalog used by app.services.yoga_catalog
+
+Calculates sample birth charts (reproducible random birth moments and
+places), detects their yogas with extended_yoga_service and keeps, for
+each yoga id, the fields that had the same value on every chart showing
+the yoga. Yogas seen on fewer than --min-charts charts only get their name:
+one chart cannot tell static text from chart-specific text.
+
+Usage:
+    python scripts/generate_yoga_catalog.py
+    python scripts/generate_yoga_catalog.py --charts 5000 --seed 1 --output /tmp/yoga_catalog.json
+"""
+
+import argparse
+import json
+import random
+import sys
+from collections import Counter
+from datetime import date, time
+from pathlib import Path
+from typing import Any, Dict
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.extended_yoga_service import extended_yoga_service
+from app.services.vedic_astrology_accurate import accurate_vedic_astrology
+from app.services.yoga_catalog import DEFAULT_CATALOG_PATH, YogaCatalog, yoga_id
+
+# Marks a field whose value differs between charts
+_VARIES = object()
+
+
+def sample_planets(rng: random.Random) -> Dict[str, Any]:
+    """Planets of a birth chart at a random moment and place (1900-2030)"""
+    chart = accurate_vedic_astrology.calculate_birth_chart(
+        name="Sample",
+        birth_date=date(rng.randint(1900, 2030), rng.randint(1, 12), rng.randint(1, 28)),
+        birth_time=time(rng.randint(0, 23), rng.randint(0, 59)),
+        latitude=rng.uniform(-50, 60),
+        longitude=rng.uniform(-130, 150),
+        timezone_str="UTC",
+        include=("vargottama",),  # core positions plus the D9 fields the detectors read
+    )
+    return chart["planets"]
+
+
+def generate(charts: int, seed: int, min_charts: int) -> Dict[str, Dict[str, Any]]:
+    """Yoga id -> static fields over the sample charts"""
+    rng = random.Random(seed)
+    seen_on = Counter()
+    fields: Dict[str, Dict[str, Any]] = {}
+    for index in range(charts):
+        for yoga in extended_yoga_service.iter_extended_yogas(sample_planets(rng)):
+            key = yoga_id(yoga["name"])
+            seen_on[key] += 1
+            known = fields.setdefault(key, dict(yoga))
+            for field in list(known):
+                if known[field] is not _VARIES and yoga.get(field, _VARIES) != known[field]:
+                    known[field] = _VARIES
+            for field in yoga.keys() - known.keys():
+                known[field] = _VARIES
+        if (index + 1) % 500 == 0:
+            print(f"  {index + 1}/{charts} charts, {len(fields)} yogas")
+
+    entries = {}
+    for key, known in fields.items():
+        static = {field: value for field, value in known.items() if value is not _VARIES}
+        if seen_on[key] < min_charts:
+            static = {"name": static["name"]} if "name" in static else {}
+        entries[key] = static
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the static yoga catalog")
+    parser.add_argument("--charts", type=int, default=5000, help="Sample charts to detect yogas on")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-charts", type=int, default=3, help="Charts a yoga needs before its fields are catalogued")
+    parser.add_argument("--output", type=Path, default=DEFAULT_CATALOG_PATH)
+    args = parser.parse_args()
+
+    print(f"🔍 Detecting yogas on {args.charts} sample charts...")
+    catalog = YogaCatalog(generate(args.charts, args.seed, args.min_charts))
+
+    document = {
+        "metadata": {
+            "description": "Static yoga fields by yoga id, loaded by app/services/yoga_catalog.py "
+                           "(generated by scripts/generate_yoga_catalog.py)",
+            "charts": args.charts,
+            "seed": args.seed,
+            "min_charts": args.min_charts,
+        },
+        "yogas": catalog.to_dict()["yogas"],
+    }
+    args.output.write_text(json.dumps(document, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    print(f"✅ Done: {len(catalog.entries)} yogas, version {catalog.version}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Tests for house / sign bitboards (app.services.bitboards)
+"""
+
+import pytest
+
+from app.services import bitboards
+from app.services.dosha_detection_service import DoshaDetectionService
+from app.services.extended_yoga_service import ExtendedYogaService
+
+
+def _chart(**houses):
+    """Planet -> house (whole sign from an Aries ascendant)"""
+    planets = {"Ascendant": {"house": 1, "sign_num": 1}}
+    for name, house in houses.items():
+        planets[name] = {"house": house, "sign_num": house}
+    return planets
+
+
+@pytest.mark.unit
+class TestBitboards:
+    """Tests for mask construction and predicates"""
+
+    def test_mask_and_members(self):
+        assert bitboards.mask((1, 4, 7, 10)) == bitboards.KENDRA
+        assert bitboards.members(bitboards.KENDRA) == (1, 4, 7, 10)
+        assert bitboards.mask((None, 13, 1)) == bitboards.bit(1)
+        assert bitboards.count(bitboards.ALL_HOUSES) == 12
+
+    def test_arc_wraps(self):
+        assert bitboards.members(bitboards.arc(10, 4)) == (1, 10, 11, 12)
+        assert bitboards.arc(13, 2) == bitboards.arc(1, 2)
+        assert bitboards.arc(5, 12) == bitboards.ALL_HOUSES
+        assert bitboards.arc(5, 0) == 0
+
+    def test_house_and_sign_masks(self):
+        planets = _chart(Sun=1, Moon=4, Mars=4)
+        planets["Venus"] = {"house": 0}
+        assert bitboards.house_mask(planets, ("Sun", "Moon", "Mars", "Venus", "Saturn")) == bitboards.mask((1, 4))
+        assert bitboards.sign_mask(planets, ("Moon",)) == bitboards.bit(4)
+
+    def test_within(self):
+        assert bitboards.within(bitboards.mask((1, 7)), bitboards.KENDRA)
+        assert not bitboards.within(bitboards.mask((1, 5)), bitboards.KENDRA)
+        assert bitboards.within(0, bitboards.KENDRA)
+
+    def test_runs(self):
+        assert bitboards.has_run(bitboards.arc(3, 6), 6)
+        assert not bitboards.has_run(bitboards.arc(10, 6), 6)
+        assert bitboards.is_contiguous(bitboards.mask((4, 5, 6)))
+        assert not bitboards.is_contiguous(bitboards.mask((4, 6)))
+        assert bitboards.lowest(bitboards.mask((10, 12))) == 10
+        assert bitboards.lowest(0) == 0
+
+    def test_offsets_from(self):
+        offsets = bitboards.offsets_from(bitboards.mask((10, 12, 2)), 10)
+        assert offsets == 0b10101
+        assert bitboards.span(offsets) == 4
+
+
+@pytest.mark.unit
+class TestBitboardDetectors:
+    """Detectors whose group predicates run on bitboards"""
+
+    def test_nabhasa_patterns(self):
+        service = ExtendedYogaService()
+        yogas = service._detect_nabhasa_akriti_yogas(_chart(Sun=1, Moon=7, Mars=1, Mercury=7, Jupiter=1, Venus=7, Saturn=1))
+        names = {yoga["name"] for yoga in yogas}
+        assert {"Vajra Yoga (Nabhasa)", "Kamala Yoga"} <= names
+        # 1st and 7th are not successive kendras
+        assert not names & {"Hal Yoga", "Gada Yoga"}
+
+        yogas = service._detect_nabhasa_akriti_yogas(_chart(Sun=10, Moon=1, Mars=10, Mercury=1, Jupiter=1, Venus=1, Saturn=10))
+        assert "Gada Yoga" in {yoga["name"] for yoga in yogas}
+
+        yogas = service._detect_nabhasa_akriti_yogas(_chart(Sun=10, Moon=11, Mars=12, Mercury=1, Jupiter=2, Venus=3, Saturn=4))
+        names = {yoga["name"] for yoga in yogas}
+        assert {"Naukaa Yoga", "Dhanus Yoga (BPHS)"} <= names
+
+    def test_kala_sarpa_hemmed(self):
+        service = ExtendedYogaService()
+        planets = _chart(Rahu=1, Ketu=7, Sun=2, Moon=3, Mars=4, Mercury=5, Jupiter=6, Venus=2, Saturn=3)
+        assert service._detect_kala_sarpa_yoga(planets)[0]["name"] == "Kala Sarpa Yoga - Anant Kala Sarpa"
+
+        planets.update(_chart(Venus=8, Saturn=9, Jupiter=10))
+        assert service._detect_kala_sarpa_yoga(planets) == []
+
+    def test_kaal_sarpa_dosha_axis_wraps(self):
+        service = DoshaDetectionService()
+        planets = _chart(Rahu=10, Ketu=4, Sun=11, Moon=12, Mars=1, Mercury=2, Jupiter=3, Venus=11, Saturn=5)
+        details = service.detect_kaal_sarpa_dosha(planets)["details"]
+        assert set(details["planets_between"]) == {"Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus"}
+        assert details["planets_outside"] == ["Saturn"]
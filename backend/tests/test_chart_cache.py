@@ -0,0 +1,155 @@
+"""
+Tests for the content-addressed chart cache
+"""
+
+import pytest
+from datetime import date, time
+
+from app.core.cache import CacheService
+from app.services import chart_cache_service as chart_cache_module
+from app.services.chart_cache_service import ChartCacheService
+from app.services.vedic_astrology_accurate import accurate_vedic_astrology
+
+
+BIRTH = {
+    "name": "Test Person",
+    "birth_date": date(1990, 1, 15),
+    "birth_time": time(14, 30),
+    "latitude": 28.6139,
+    "longitude": 77.2090,
+    "timezone_str": "Asia/Kolkata",
+    "city": "New Delhi"
+}
+
+
+def make_service(monkeypatch, maxsize=5000):
+    """Chart cache backed by a private in-memory cache"""
+    cache = CacheService(fallback_maxsize=maxsize)
+    cache.use_fallback = True
+
+    async def no_connect():
+        pass
+
+    monkeypatch.setattr(cache, "connect", no_connect)
+    service = ChartCacheService()
+    service.cache = cache
+    return service
+
+
+def key_for(service, chart_type="D1", include=None, **overrides):
+    birth = {**BIRTH, **overrides}
+    return service.make_key(
+        birth["birth_date"],
+        birth["birth_time"],
+        birth["latitude"],
+        birth["longitude"],
+        birth["timezone_str"],
+        chart_type,
+        include
+    )
+
+
+@pytest.mark.unit
+class TestChartCacheKey:
+    """Test cache key derivation"""
+
+    def test_key_is_stable(self, monkeypatch):
+        service = make_service(monkeypatch)
+        assert key_for(service) == key_for(service)
+        assert key_for(service).startswith(f"jioastro:charts:v{accurate_vedic_astrology.ENGINE_VERSION}:")
+
+    def test_same_utc_moment_shares_key(self, monkeypatch):
+        service = make_service(monkeypatch)
+        # 14:30 IST == 09:00 UTC
+        assert key_for(service) == key_for(service, birth_time=time(9, 0), timezone_str="UTC")
+
+    def test_coordinates_rounded(self, monkeypatch):
+        service = make_service(monkeypatch)
+        assert key_for(service) == key_for(service, latitude=28.61391, longitude=77.20904)
+        assert key_for(service) != key_for(service, latitude=28.6145)
+
+    def test_chart_type_and_stages_in_key(self, monkeypatch):
+        service = make_service(monkeypatch)
+        assert key_for(service, "D1") != key_for(service, "D9")
+        assert key_for(service, include=[]) != key_for(service, include=["yogas"])
+        assert key_for(service, include=["yogas", "doshas"]) == key_for(service, include=["doshas", "yogas"])
+
+    def test_engine_version_bump_changes_key(self, monkeypatch):
+        service = make_service(monkeypatch)
+        before = key_for(service)
+        monkeypatch.setattr(type(accurate_vedic_astrology), "ENGINE_VERSION", "999.0.0")
+        assert key_for(service) != before
+
+
+@pytest.mark.unit
+class TestChartCacheBundle:
+    """Test cached bundle calculation"""
+
+    @pytest.fixture
+    def calculations(self, monkeypatch):
+        """Count bundle calculations and run them inline"""
+        calls = []
+
+        async def run(func, *args, task_timeout=None, **kwargs):
+            calls.append(kwargs["chart_types"])
+            return func(*args, **kwargs)
+
+        monkeypatch.setattr(chart_cache_module.compute_executor, "run", run)
+        return calls
+
+    async def test_identical_birth_data_calculated_once(self, monkeypatch, calculations):
+        service = make_service(monkeypatch)
+
+        first = await service.calculate_chart_bundle(**BIRTH, chart_types=["D1", "D9"], include=[])
+        second = await service.calculate_chart_bundle(
+            **{**BIRTH, "name": "Twin", "city": "Delhi NCR"},
+            chart_types=["D1", "D9"],
+            include=[]
+        )
+
+        assert calculations == [["D1", "D9"]]
+        assert second["D1"]["planets"] == first["D1"]["planets"]
+        assert second["D1"]["basic_info"]["name"] == "Twin"
+        assert second["D1"]["basic_info"]["location"]["city"] == "Delhi NCR"
+        assert first["D1"]["basic_info"]["name"] == "Test Person"
+
+    async def test_only_missing_chart_types_calculated(self, monkeypatch, calculations):
+        service = make_service(monkeypatch)
+
+        await service.calculate_chart_bundle(**BIRTH, chart_types=["D1"], include=[])
+        charts = await service.calculate_chart_bundle(**BIRTH, chart_types=["D1", "Moon"], include=[])
+
+        assert calculations == [["D1"], ["Moon"]]
+        assert list(charts) == ["D1", "Moon"]
+
+    async def test_unknown_chart_type_rejected(self, monkeypatch, calculations):
+        service = make_service(monkeypatch)
+        with pytest.raises(ValueError):
+            await service.calculate_chart_bundle(**BIRTH, chart_types=["D60"])
+        assert calculations == []
+
+
+@pytest.mark.unit
+class TestFallbackLRU:
+    """Test the bounded in-memory fallback"""
+
+    async def test_least_recently_used_evicted(self, monkeypatch):
+        service = make_service(monkeypatch, maxsize=2)
+        cache = service.cache
+
+        await cache.set("a", {"value": 1})
+        await cache.set("b", {"value": 2})
+        assert await cache.get("a") == {"value": 1}
+        await cache.set("c", {"value": 3})
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == {"value": 1}
+        assert await cache.get("c") == {"value": 3}
+
+    async def test_values_are_copies(self, monkeypatch):
+        service = make_service(monkeypatch)
+        cache = service.cache
+
+        await cache.set("chart", {"basic_info": {"name": "A"}})
+        (await cache.get("chart"))["basic_info"]["name"] = "B"
+        assert (await cache.get("chart"))["basic_info"]["name"] == "A"
@@ -0,0 +1,105 @@
+"""
+Tests for the slotted chart core model
+"""
+
+import sys
+
+import pytest
+from datetime import date, time
+
+from app.core.chart_core import GRAHAS, ChartCore, PlanetPosition
+from app.services.vedic_astrology_accurate import accurate_vedic_astrology
+
+
+@pytest.fixture(scope="module")
+def chart():
+    return accurate_vedic_astrology.calculate_birth_chart(
+        name="Test Person",
+        birth_date=date(1990, 1, 15),
+        birth_time=time(14, 30),
+        latitude=28.6139,
+        longitude=77.2090,
+        timezone_str="Asia/Kolkata",
+        city="New Delhi",
+        include=["vargottama"]
+    )
+
+
+@pytest.mark.unit
+class TestChartCoreConversion:
+    """Test conversion from and to the dict format"""
+
+    def test_round_trip_is_exact(self, chart):
+        core = ChartCore.from_chart(chart)
+        assert core.to_planets() == chart["planets"]
+
+    def test_indices_match_dicts(self, chart):
+        core = ChartCore.from_chart(chart)
+        for name in GRAHAS:
+            data = chart["planets"][name]
+            planet = core[name]
+            assert planet.sign_num == data["sign_num"]
+            assert planet.sign == data["sign"]
+            assert planet.house == data["house"]
+            assert planet.nakshatra == data["nakshatra"]["number"]
+            assert planet.nakshatra_name == data["nakshatra"]["name"]
+            assert planet.nakshatra_lord == data["nakshatra"]["lord"]
+        assert core.ascendant_sign_num == chart["ascendant"]["sign_num"]
+
+    def test_occupancy(self, chart):
+        core = ChartCore.from_chart(chart)
+        for house in range(1, 13):
+            expected = tuple(name for name in GRAHAS if chart["planets"][name]["house"] == house)
+            assert core.planets_in_house(house) == expected
+        assert sum(len(core.planets_in_sign(sign)) for sign in range(1, 13)) == len(GRAHAS)
+
+    def test_house_sign_counts_from_ascendant(self, chart):
+        core = ChartCore.from_chart(chart)
+        for house in range(1, 13):
+            assert core.house_sign(house) == chart["houses"][house - 1]["sign_num"]
+
+    def test_minimal_planets_and_ascendant_entry(self):
+        planets = {
+            "Ascendant": {"sign_num": 12},
+            "Moon": {"sign": "Cancer", "house": 5},
+            "Jupiter": {"sign_num": 4, "house": 5, "note": "custom"}
+        }
+        core = ChartCore.from_planets(planets)
+
+        assert core.ascendant_sign_num == 12
+        assert core["Moon"].sign_num == 4
+        assert core.planets_in_house(5) == ("Moon", "Jupiter")
+        assert core.to_planets() == {
+            "Ascendant": {"sign": "Pisces", "sign_num": 12},
+            "Moon": {"sign": "Cancer", "sign_num": 4, "house": 5},
+            "Jupiter": {"sign": "Cancer", "sign_num": 4, "house": 5, "note": "custom"}
+        }
+
+    def test_missing_sign_kept_as_none(self):
+        core = ChartCore.from_planets({"Moon": {"house": 1}, "Sun": {"sign_num": 0, "house": 2}})
+
+        assert core["Moon"].sign_num is None and core["Moon"].sign is None
+        assert core["Sun"].sign is None
+        assert core.planets_in_house(1) == ("Moon",)
+        assert core.to_planets() == {"Moon": {"house": 1}, "Sun": {"sign_num": 0, "house": 2}}
+
+
+@pytest.mark.unit
+class TestChartCoreFootprint:
+    """Test that the compact model stays compact"""
+
+    def test_positions_have_no_instance_dict(self):
+        planet = PlanetPosition("Moon", 4)
+        assert not hasattr(planet, "__dict__")
+        with pytest.raises(AttributeError):
+            planet.colour = "white"
+
+    def test_smaller_than_planet_dicts(self, chart):
+        def dict_size(value):
+            if isinstance(value, dict):
+                return sys.getsizeof(value) + sum(dict_size(item) for item in value.values())
+            return 0
+
+        core = ChartCore.from_chart(chart)
+        slotted = sum(sys.getsizeof(planet) for planet in core)
+        assert slotted < dict_size(chart["planets"]) / 2
@@ -0,0 +1,115 @@
+"""
+Tests for the chart facts shared by the yoga detectors
+"""
+
+import inspect
+
+import pytest
+from datetime import date, time
+from unittest.mock import patch
+
+from app.services.chart_facts import ChartFacts
+from app.services.extended_yoga_service import ExtendedYogaService
+from app.services.vedic_astrology_accurate import accurate_vedic_astrology
+
+
+@pytest.fixture(scope="module")
+def planets():
+    chart = accurate_vedic_astrology.calculate_birth_chart(
+        name="Test Person",
+        birth_date=date(1990, 1, 15),
+        birth_time=time(14, 30),
+        latitude=28.6139,
+        longitude=77.2090,
+        timezone_str="Asia/Kolkata",
+        include=[]
+    )
+    return chart["planets"]
+
+
+@pytest.fixture
+def yoga_service():
+    return ExtendedYogaService()
+
+
+def _detectors(service):
+    """Detectors taking only the planets dict"""
+    for name, method in inspect.getmembers(service, inspect.ismethod):
+        parameters = list(inspect.signature(method).parameters.values())
+        if name.startswith("_detect_") and parameters and all(
+            parameter.default is not inspect.Parameter.empty for parameter in parameters[1:]
+        ):
+            yield name, method
+
+
+@pytest.mark.unit
+class TestChartFacts:
+    """Test facts derived from the planets dict"""
+
+    def test_is_the_planets_dict(self, yoga_service, planets):
+        facts = yoga_service.build_chart_facts(planets)
+        assert isinstance(facts, dict)
+        assert facts == planets
+        assert yoga_service.build_chart_facts(facts) is facts
+
+    def test_built_on_chart_core(self, yoga_service, planets):
+        facts = yoga_service.build_chart_facts(planets)
+
+        assert facts.core.to_planets() == planets
+        for name, data in planets.items():
+            assert facts.houses[name] == data["house"]
+            assert facts.signs[name] == data["sign_num"]
+        assert facts.occupants[1:] == tuple(facts.core.planets_in_house(house) for house in range(1, 13))
+
+    def test_matches_helper_methods(self, yoga_service, planets):
+        facts = yoga_service.build_chart_facts(planets)
+
+        assert facts.ascendant_index == yoga_service._calculate_ascendant_sign(planets)
+        assert facts.ascendant_sign_num == yoga_service._get_ascendant_sign(planets)
+        for house in range(1, 13):
+            assert facts.house_lords[house] == yoga_service._get_house_lord(house, facts.ascendant_index)
+            assert facts.occupants[house] == tuple(
+                name for name, data in planets.items() if name != "Ascendant" and data["house"] == house
+            )
+
+        for name in facts.grahas:
+            assert facts.dignity[name] == yoga_service._get_planet_dignity(name, planets)
+            assert (name in facts.benefics) == yoga_service._is_benefic(name, planets)
+            assert (name in facts.malefics) == yoga_service._is_malefic(name, planets)
+
+    def test_aspect_matrix(self, yoga_service, planets):
+        facts = yoga_service.build_chart_facts(planets)
+        for name in facts.grahas:
+            for house in range(1, 13):
+                expected = yoga_service._planet_aspects_house_simple(name, planets[name]["house"], house)
+                assert facts.aspects(name, house) == expected
+
+    def test_karakas_computed_once(self, yoga_service, planets):
+        calculate = yoga_service.jaimini.calculate_charakarakas
+        with patch.object(yoga_service.jaimini, "calculate_charakarakas", side_effect=calculate) as mock:
+            yogas = yoga_service.detect_extended_yogas(planets)
+        assert yogas
+        assert mock.call_count == 1
+
+    def test_without_ascendant(self, yoga_service):
+        facts = yoga_service.build_chart_facts({"Moon": {"sign_num": 4, "house": 1}})
+        assert facts.ascendant_index == 3
+        assert facts.ascendant_sign_num is None
+        assert facts.house_lords[1] == "Moon"
+        assert ChartFacts({}).house_lords == (None,) * 13
+
+
+@pytest.mark.unit
+class TestDetectorsWithFacts:
+    """Detectors give the same yogas from facts and from the raw dict"""
+
+    def test_every_detector_unchanged(self, yoga_service, planets):
+        facts = yoga_service.build_chart_facts(planets)
+        for name, detector in _detectors(yoga_service):
+            assert detector(facts) == detector(dict(planets)), name
+
+    def test_without_ascendant_entry(self, yoga_service, planets):
+        planets = {name: data for name, data in planets.items() if name != "Ascendant"}
+        facts = yoga_service.build_chart_facts(planets)
+        for name, detector in _detectors(yoga_service):
+            assert detector(facts) == detector(dict(planets)), name
@@ -0,0 +1,184 @@
+"""
+Tests for the staged D1 chart pipeline (calculate_birth_chart include=...)
+
+Core positions always run; optional stages (dasha, yogas, divisional charts,
+doshas, transits, ...) run only when requested.
+"""
+import pytest
+from datetime import date, time
+
+from app.services.vedic_astrology_accurate import accurate_vedic_astrology
+
+
+BIRTH = dict(
+    name="Test",
+    birth_date=date(1990, 5, 17),
+    birth_time=time(10, 30),
+    latitude=28.6139,
+    longitude=77.2090,
+    timezone_str="Asia/Kolkata",
+    city="New Delhi"
+)
+
+OPTIONAL_OUTPUTS = ["dasha", "yogas", "divisional_charts", "vimshopaka_bala", "doshas", "transits", "sade_sati"]
+
+
+@pytest.mark.unit
+class TestStageResolution:
+    """Tests for resolve_stages()"""
+
+    def test_none_selects_every_stage(self):
+        """Omitting include runs every stage except the on-demand ones"""
+        stages = accurate_vedic_astrology.resolve_stages(None)
+        assert stages == set(accurate_vedic_astrology.CHART_STAGES) - {"divisional_charts"}
+
+    def test_on_demand_stage_runs_when_named(self):
+        assert "divisional_charts" in accurate_vedic_astrology.resolve_stages(["divisional_charts"])
+
+    def test_empty_selects_core_only(self):
+        assert accurate_vedic_astrology.resolve_stages([]) == set()
+
+    def test_dependencies_are_added(self):
+        stages = accurate_vedic_astrology.resolve_stages(["vimshopaka_bala", "dasha_ai"])
+        assert stages == {"vimshopaka_bala", "dasha_ai", "dasha"}
+
+    def test_unknown_stage_rejected(self):
+        with pytest.raises(ValueError, match="Unknown chart stage"):
+            accurate_vedic_astrology.resolve_stages(["dasha", "horoscope"])
+
+
+@pytest.mark.unit
+class TestStagedBirthChart:
+    """Tests for calculate_birth_chart with selected stages"""
+
+    def test_core_positions_only(self):
+        chart = accurate_vedic_astrology.calculate_birth_chart(**BIRTH, include=[])
+
+        assert chart["stages"] == []
+        assert len(chart["houses"]) == 12
+        assert "nakshatra" in chart["planets"]["Moon"]
+        assert chart["planets"]["Ascendant"]["house"] == 1
+        for key in OPTIONAL_OUTPUTS:
+            assert key not in chart
+
+    def test_only_requested_stages_run(self):
+        chart = accurate_vedic_astrology.calculate_birth_chart(**BIRTH, include=["dasha", "doshas"])
+
+        assert chart["stages"] == ["dasha", "doshas"]
+        assert "mahadashas" in chart["dasha"]
+        assert "doshas" in chart
+        assert "yogas" not in chart
+        assert "divisional_charts" not in chart
+
+    def test_vargottama_without_divisional_charts(self):
+        """Vargottama derived from Navamsa directly matches the D9-based result"""
+        direct = accurate_vedic_astrology.calculate_birth_chart(**BIRTH, include=["vargottama"])
+        via_d9 = accurate_vedic_astrology.calculate_birth_chart(
+            **BIRTH, include=["divisional_charts", "vargottama"]
+        )
+
+        for planet, data in via_d9["planets"].items():
+            assert direct["planets"][planet]["vargottama"] == data["vargottama"]
+
+
+@pytest.mark.unit
+class TestDeferredDashaAI:
+    """AI dasha personalization is deferred, never run inside chart calculation"""
+
+    def test_dasha_ai_stage_marks_pending(self, monkeypatch):
+        from app.services.dasha_interpretation_service import dasha_interpretation_service
+
+        def fail(*args, **kwargs):
+            raise AssertionError("AI must not be called during chart calculation")
+
+        monkeypatch.setattr(dasha_interpretation_service, "generate_ai_personalization", fail)
+
+        chart = accurate_vedic_astrology.calculate_birth_chart(**BIRTH, include=["dasha_ai"])
+
+        assert chart["stages"] == ["dasha", "dasha_ai"]
+        assert chart["dasha_ai"] == {"status": dasha_interpretation_service.AI_STATUS_PENDING}
+        assert not chart["dasha"].get("ai_enhanced")
+        assert chart["dasha"]["interpretations_included"] is True
+
+    def test_apply_personalization_matches_current_lord(self):
+        from app.services.dasha_interpretation_service import dasha_interpretation_service
+
+        dasha = {"current_mahadasha": {"planet": "Venus"}}
+        stale = {"planet": "Sun", "personalized_summary": "old"}
+        fresh = {"planet": "Venus", "personalized_summary": "new", "personalized_focus_areas": ["art"]}
+
+        dasha = dasha_interpretation_service.apply_ai_personalization(dasha, stale)
+        assert "ai_enhanced" not in dasha
+
+        dasha = dasha_interpretation_service.apply_ai_personalization(dasha, fresh)
+        assert dasha["ai_enhanced"] is True
+        assert dasha["current_mahadasha"]["personalized_summary"] == "new"
+        assert dasha["current_mahadasha"]["personalized_focus_areas"] == ["art"]
+
+
+@pytest.mark.unit
+class TestChartBundle:
+    """Tests for calculate_chart_bundle (one D1 computation for D1, D9 and Moon)"""
+
+    def test_d1_calculated_once(self, monkeypatch):
+        calls = []
+        original = accurate_vedic_astrology.calculate_birth_chart
+
+        def counting(*args, **kwargs):
+            calls.append(kwargs.get("include"))
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(accurate_vedic_astrology, "calculate_birth_chart", counting)
+
+        bundle = accurate_vedic_astrology.calculate_chart_bundle(
+            **BIRTH, chart_types=["D1", "D9", "Moon"], include=["yogas"]
+        )
+
+        assert len(calls) == 1
+        assert set(bundle) == {"D1", "D9", "Moon"}
+        assert bundle["D1"]["stages"] == ["dasha", "yogas", "vargottama"]
+
+    def test_derived_charts_match_standalone(self):
+        bundle = accurate_vedic_astrology.calculate_chart_bundle(**BIRTH, chart_types=["D9", "Moon"])
+        navamsa = accurate_vedic_astrology.calculate_navamsa(**BIRTH)
+        moon = accurate_vedic_astrology.calculate_moon_chart(**BIRTH)
+
+        assert "D1" not in bundle
+        assert bundle["D9"]["planets"] == navamsa["planets"]
+        assert bundle["D9"]["ascendant"] == navamsa["ascendant"]
+        assert bundle["Moon"]["planets"] == moon["planets"]
+        assert bundle["Moon"]["yogas"] == moon["yogas"]
+
+    def test_unknown_chart_type_rejected(self):
+        with pytest.raises(ValueError, match="Unknown chart type"):
+            accurate_vedic_astrology.calculate_chart_bundle(**BIRTH, chart_types=["D1", "D60"])
+
+
+@pytest.mark.unit
+class TestChartBatch:
+    """Tests for calculate_birth_charts_batch"""
+
+    def test_results_in_record_order(self):
+        other = {**BIRTH, "name": "Other", "birth_date": date(1985, 1, 2), "timezone_str": "UTC"}
+
+        results = accurate_vedic_astrology.calculate_birth_charts_batch(
+            [BIRTH, other], chart_types=["D1", "D9"], include=[]
+        )
+        single = accurate_vedic_astrology.calculate_chart_bundle(**other, chart_types=["D1", "D9"], include=[])
+
+        assert len(results) == 2
+        assert results[0]["charts"]["D1"]["basic_info"]["name"] == "Test"
+        assert results[1]["charts"]["D1"]["planets"] == single["D1"]["planets"]
+        assert results[1]["charts"]["D9"]["planets"] == single["D9"]["planets"]
+
+    def test_failing_record_reported_in_place(self):
+        broken = {**BIRTH, "birth_date": "not a date"}
+
+        results = accurate_vedic_astrology.calculate_birth_charts_batch([broken, BIRTH], include=[])
+
+        assert "error" in results[0]
+        assert "charts" in results[1]
+
+    def test_unknown_chart_type_rejected_once(self):
+        with pytest.raises(ValueError, match="Unknown chart type"):
+            accurate_vedic_astrology.calculate_birth_charts_batch([BIRTH], chart_types=["D60"])
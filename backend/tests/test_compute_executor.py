@@ -0,0 +1,120 @@
+"""
+Tests for the compute executor (app.core.compute)
+
+Covers thread and process modes, backpressure (503) and task timeouts (504).
+"""
+import asyncio
+import time
+
+import pytest
+
+from app.core.compute import (
+    ComputeExecutor,
+    ComputeOverloadedError,
+    ComputeTimeoutError,
+    _callable_ref
+)
+from app.services.vedic_astrology_accurate import accurate_vedic_astrology
+
+
+def thread_executor(**overrides):
+    options = dict(workers=0, max_pending=4, queue_timeout=0.1, task_timeout=5.0, start_method="spawn")
+    options.update(overrides)
+    return ComputeExecutor(**options)
+
+
+@pytest.mark.unit
+class TestComputeExecutor:
+    """Tests for ComputeExecutor.run()"""
+
+    @pytest.mark.asyncio
+    async def test_thread_mode_returns_result(self):
+        executor = thread_executor()
+        try:
+            assert await executor.run(pow, 2, 10) == 1024
+            stats = executor.get_stats()
+            assert stats["mode"] == "thread"
+            assert stats["completed"] == 1
+            assert stats["pending"] == 0
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_process_mode_runs_singleton_method(self):
+        executor = ComputeExecutor(
+            workers=1, max_pending=2, queue_timeout=1.0, task_timeout=60.0, start_method="spawn"
+        )
+        try:
+            stages = await executor.run(accurate_vedic_astrology.resolve_stages, ["dasha_ai"])
+            assert stages == {"dasha_ai", "dasha"}
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_batch_preserves_order(self):
+        executor = thread_executor(workers=0)
+        try:
+            double = lambda chunk: [item * 2 for item in chunk]
+            assert await executor.run_batch(double, [3, 1, 2]) == [6, 2, 4]
+            assert await executor.run_batch(double, []) == []
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_batch_failed_chunk_fails_its_items(self):
+        executor = thread_executor(workers=0)
+        try:
+            def fail(chunk):
+                raise ValueError("bad chunk")
+
+            results = await executor.run_batch(fail, [1, 2])
+            assert [type(result) for result in results] == [ValueError, ValueError]
+            assert executor.get_stats()["failed"] == 1
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_with_503(self):
+        executor = thread_executor(max_pending=1)
+        try:
+            task = asyncio.ensure_future(executor.run(time.sleep, 0.5))
+            await asyncio.sleep(0.01)
+
+            with pytest.raises(ComputeOverloadedError) as exc_info:
+                await executor.run(pow, 2, 2)
+
+            assert exc_info.value.status_code == 503
+            assert exc_info.value.headers["Retry-After"]
+            assert executor.get_stats()["rejected"] == 1
+            await task
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_504_and_keeps_slot(self):
+        executor = thread_executor(task_timeout=0.05)
+        try:
+            with pytest.raises(ComputeTimeoutError) as exc_info:
+                await executor.run(time.sleep, 0.3)
+
+            assert exc_info.value.status_code == 504
+            # The runaway task still occupies its slot until it finishes
+            assert executor.get_stats()["pending"] == 1
+            time.sleep(0.4)
+            assert executor.get_stats()["pending"] == 0
+        finally:
+            executor.shutdown()
+
+
+@pytest.mark.unit
+class TestCallableRef:
+    """Tests for resolving callables by name in worker processes"""
+
+    def test_singleton_method(self):
+        ref = _callable_ref(accurate_vedic_astrology.calculate_birth_chart)
+        assert ref == ("app.services.vedic_astrology_accurate", "accurate_vedic_astrology", "calculate_birth_chart")
+
+    def test_non_singleton_method_rejected(self):
+        other = type(accurate_vedic_astrology)()
+        with pytest.raises(ValueError, match="module-level singleton"):
+            _callable_ref(other.calculate_birth_chart)
@@ -0,0 +1,134 @@
+"""
+Tests for the interval-indexed Vimshottari dasha engine
+"""
+
+import pytest
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+
+from app.services.dasha_engine import (
+    DASHA_YEARS,
+    DAYS_PER_YEAR,
+    LORDS,
+    VimshottariTimeline,
+    from_day_number,
+    get_timeline,
+    to_day_number
+)
+from app.services.vedic_astrology_accurate import accurate_vedic_astrology
+
+
+BIRTH = datetime(1990, 1, 15, 14, 30)
+MOON_LONGITUDE = 142.219302  # Purva Phalguni -> Venus mahadasha at birth
+
+
+@pytest.fixture(scope="module")
+def timeline():
+    return VimshottariTimeline(MOON_LONGITUDE, BIRTH)
+
+
+@pytest.mark.unit
+class TestTimelineStructure:
+    """Test period generation"""
+
+    def test_mahadasha_sequence(self, timeline):
+        mahas = timeline.periods(1)
+        assert [maha["planet"] for maha in mahas][:3] == ["Venus", "Sun", "Moon"]
+        assert len(mahas) == 9
+        assert timeline.start == pytest.approx(to_day_number(BIRTH))
+
+        # Balance of the birth mahadasha + 8 complete ones
+        total_years = (timeline.end - timeline.start) / DAYS_PER_YEAR
+        assert total_years == pytest.approx(120 - (DASHA_YEARS["Venus"] - timeline.balance_years))
+
+    def test_levels_tile_without_gaps(self, timeline):
+        for level in (2, 3):
+            periods = timeline.periods(level)
+            for previous, current in zip(periods, periods[1:]):
+                assert current["start"] == pytest.approx(previous["end"])
+            assert periods[0]["start"] == pytest.approx(timeline.start)
+            assert periods[-1]["end"] == pytest.approx(timeline.end)
+
+    def test_antardashas_of_complete_mahadasha(self, timeline):
+        antars = timeline.periods(2, parent_index=1)  # Sun mahadasha
+        assert [antar["planet"] for antar in antars] == ["Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury", "Ketu", "Venus"]
+        moon_antar_years = 6 * 10 / 120
+        assert antars[1]["end"] - antars[1]["start"] == pytest.approx(moon_antar_years * DAYS_PER_YEAR)
+
+    def test_antardashas_of_birth_mahadasha(self, timeline):
+        # The Venus mahadasha began before birth: its antardashas are laid
+        # out from that moment, and those that ended before birth are dropped
+        venus = timeline.periods(1)[0]
+        origin = venus["end"] - DASHA_YEARS["Venus"] * DAYS_PER_YEAR
+        order = LORDS[1:] + LORDS[:1]
+        ends = accumulate(
+            (DASHA_YEARS["Venus"] * DASHA_YEARS[lord] / 120 * DAYS_PER_YEAR for lord in order),
+            initial=origin
+        )
+        expected = [(lord, end) for lord, end in zip(order, list(ends)[1:]) if end > timeline.start]
+
+        antars = timeline.periods(2, parent_index=0)
+        assert [antar["planet"] for antar in antars] == [lord for lord, _ in expected] == ["Saturn", "Mercury", "Ketu"]
+        assert [antar["end"] for antar in antars] == pytest.approx([end for _, end in expected])
+        assert antars[0]["start"] == pytest.approx(timeline.start)
+
+
+@pytest.mark.unit
+class TestTimelineQueries:
+    """Test lookups by date"""
+
+    def test_periods_nest(self, timeline):
+        moment = datetime(2024, 6, 1, 12, 0)
+        periods = timeline.periods_at(moment, depth=5)
+
+        assert [period["level"] for period in periods] == [
+            "mahadasha", "antardasha", "pratyantardasha", "sookshma", "prana"
+        ]
+        day_number = to_day_number(moment)
+        for outer, inner in zip(periods, periods[1:]):
+            assert outer["start"] <= inner["start"] <= day_number < inner["end"] <= outer["end"] + 1e-9
+
+    def test_sub_period_starts_with_parent_lord(self, timeline):
+        maha = timeline.period_at(datetime(2030, 1, 1), level=1)
+        first_antar = timeline.period_at(from_day_number(maha["start"] + 0.001), level=2)
+        assert first_antar["planet"] == maha["planet"]
+
+    def test_outside_timeline(self, timeline):
+        assert timeline.periods_at(BIRTH - timedelta(days=1)) == []
+        assert timeline.period_at(date(2200, 1, 1)) is None
+
+    def test_vectorized_matches_scalar(self, timeline):
+        moments = [date(1989, 1, 1)] + [date(1990 + year, 3, 7) for year in range(0, 120, 3)]
+        for level in (1, 2, 3):
+            expected = [
+                period["planet"] if period else None
+                for period in (timeline.period_at(moment, level) for moment in moments)
+            ]
+            assert timeline.lords_at(moments, level) == expected
+
+    def test_invalid_depth(self, timeline):
+        with pytest.raises(ValueError):
+            timeline.periods_at(BIRTH, depth=6)
+        with pytest.raises(ValueError):
+            timeline.indices_at([BIRTH], level=4)
+
+    def test_timelines_are_shared(self):
+        assert get_timeline(MOON_LONGITUDE, BIRTH) is get_timeline(MOON_LONGITUDE, BIRTH)
+
+
+@pytest.mark.unit
+class TestChartDasha:
+    """Test the chart engine's dasha output built on the timeline"""
+
+    def test_current_periods(self):
+        dasha = accurate_vedic_astrology._calculate_vimshottari_dasha({"longitude": MOON_LONGITUDE}, BIRTH)
+        timeline = get_timeline(MOON_LONGITUDE, BIRTH)
+        maha, antar, pratyantar = timeline.periods_at(datetime.now(), depth=3)
+
+        assert dasha["current_mahadasha"]["planet"] == maha["planet"]
+        assert dasha["current_antardasha"]["planet"] == antar["planet"]
+        assert dasha["current_pratyantardasha"]["planet"] == pratyantar["planet"]
+        assert [a["planet"] for a in dasha["antardashas"]][0] == maha["planet"]
+        assert len(dasha["mahadashas"]) == 9
+        assert dasha["mahadashas"][1]["years"] == DASHA_YEARS[dasha["mahadashas"][1]["planet"]]
+        assert set(LORDS) == {m["planet"] for m in dasha["mahadashas"]}
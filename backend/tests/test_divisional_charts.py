@@ -605,6 +605,76 @@ class TestAllDivisionalCharts:
             assert chart_name in result
 
 
+# =============================================================================
+# VARGA MATRIX TESTS
+# =============================================================================
+
+class TestVargaMatrix:
+    """Test the vectorized Shodashvarga engine against the per-planet formulas"""
+
+    @pytest.mark.unit
+    @pytest.mark.divisional
+    def test_matrix_matches_divisional_position(self, divisional_service):
+        """Every varga position equals calculate_divisional_position, range edges included"""
+        longitudes = {f"body_{i}": i * 0.25 for i in range(1440)}
+        longitudes.update({f"end_{sign}": sign * 30 + 29.999999 for sign in range(12)})
+
+        matrix = divisional_service.calculate_varga_matrix_from_longitudes(longitudes)
+
+        assert matrix.signs.shape == (len(longitudes), 16)
+        for body, longitude in longitudes.items():
+            for varga in divisional_service.VARGAS:
+                expected = divisional_service.calculate_divisional_position(
+                    longitude, int(varga[1:]), int(longitude // 30) + 1
+                )
+                assert matrix.position(body, varga) == expected, (body, varga)
+
+    @pytest.mark.unit
+    @pytest.mark.divisional
+    def test_matrix_to_dict(self, divisional_service):
+        matrix = divisional_service.calculate_varga_matrix_from_longitudes({"Sun": 15.5, "Ascendant": 10.0})
+
+        signs = matrix.to_dict()
+        assert signs["Sun"]["D1"] == 1
+        assert signs["Sun"]["D9"] == matrix.sign("Sun", "D9") == 5  # 15.5° Aries -> Leo navamsa
+        assert list(signs["Ascendant"]) == list(divisional_service.VARGAS)
+
+    @pytest.mark.unit
+    @pytest.mark.divisional
+    def test_materialized_charts_match_per_chart_calculation(self, divisional_service):
+        planets = {
+            name: {"longitude": longitude, "sign": divisional_service.SIGNS[int(longitude // 30)],
+                   "sign_num": int(longitude // 30) + 1, "house": 1, "retrograde": name == "Saturn"}
+            for name, longitude in {"Sun": 15.5, "Moon": 45.8, "Saturn": 200.0, "Rahu": 359.9}.items()
+        }
+        ascendant = {"longitude": 100.0, "sign_num": 4}
+
+        charts = divisional_service.calculate_all_divisional_charts(planets, ascendant, priority="all")
+
+        assert "D9" not in charts
+        for chart_name, chart in charts.items():
+            division, _, purpose = divisional_service.DIVISIONAL_CHARTS[chart_name]
+            assert chart == divisional_service.calculate_divisional_chart(
+                planets, ascendant, division, chart_name, purpose
+            )
+
+    @pytest.mark.unit
+    @pytest.mark.divisional
+    def test_vimshopaka_from_matrix_matches_dict_calculation(self, divisional_service):
+        longitudes = {"Sun": 10.0, "Moon": 33.0, "Mars": 280.0, "Mercury": 160.0, "Jupiter": 95.0,
+                      "Venus": 350.0, "Saturn": 190.0, "Rahu": 40.0, "Ketu": 220.0}
+        planets = {name: {"longitude": lon, "sign_num": int(lon // 30) + 1} for name, lon in longitudes.items()}
+        matrix = divisional_service.calculate_varga_matrix_from_longitudes(longitudes)
+
+        charts = {
+            varga: {"planets": {name: {"sign_num": matrix.sign(name, varga)} for name in longitudes}}
+            for varga in divisional_service.VARGAS[1:]
+        }
+
+        assert divisional_service.calculate_vimshopaka_bala_from_matrix(matrix) == \
+            divisional_service.calculate_vimshopaka_bala(planets, charts)
+
+
 # =============================================================================
 # PERFORMANCE TESTS
 # =============================================================================
@@ -168,6 +168,16 @@ class TestKaalSarpaYoga:
             assert "positive_effects" in result
             assert len(result["positive_effects"]) > 0
 
+    def test_kaal_sarpa_type_details_are_copies(self, dosha_service):
+        """Test that the shared Kaal Sarpa type table is not changed through results"""
+        details = dosha_service._get_kaal_sarpa_type_details(1, 7)
+        details["positive_effects"].append("Changed")
+        default = dosha_service._get_kaal_sarpa_type_details(13, 7)
+        default["positive_effects"].append("Changed")
+
+        assert "Changed" not in dosha_service._get_kaal_sarpa_type_details(1, 7)["positive_effects"]
+        assert dosha_service._get_kaal_sarpa_type_details(13, 7)["positive_effects"] == ["Spiritual growth through adversity"]
+
     def test_kaal_sarpa_cancellations(self, dosha_service):
         """Test Kaal Sarpa with cancellations (Jupiter in Kendra)"""
         chart = {
@@ -443,3 +453,65 @@ class TestDoshaIntegration:
         
         # All 4 doshas should complete within 100ms
         assert (end - start) < 0.1
+
+
+# ============================================================================
+# DOSHA MODES AND REMEDY CATALOG TESTS
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.dosha
+class TestDoshaModes:
+    """Tests for reference/summary dosha modes and the remedy catalog"""
+
+    CHARTS = ("manglik_chart_high_intensity", "kaal_sarpa_full_chart", "pitra_dosha_high_chart",
+              "grahan_dosha_moon_rahu_chart", "clean_chart")
+
+    @pytest.fixture(params=CHARTS)
+    def chart(self, request):
+        return request.getfixturevalue(request.param)
+
+    def test_reference_mode_drops_only_remedies(self, dosha_service, chart):
+        full = dosha_service.detect_all_doshas(chart, {"sign_num": 0, "degree": 15.0})
+        reference = dosha_service.detect_all_doshas(chart, {"sign_num": 0, "degree": 15.0}, mode="reference")
+
+        assert reference == [{k: v for k, v in dosha.items() if k != "remedies"} for dosha in full]
+
+    def test_summary_mode(self, dosha_service, chart):
+        full = dosha_service.detect_all_doshas(chart, {"sign_num": 0, "degree": 15.0})
+        summary = dosha_service.detect_all_doshas(chart, {"sign_num": 0, "degree": 15.0}, mode="summary")
+
+        assert summary == [
+            {field: dosha.get(field) for field in ("name", "present", "severity", "intensity_score", "remedy_id")}
+            for dosha in full
+        ]
+
+    def test_unknown_mode_rejected(self, dosha_service, clean_chart):
+        with pytest.raises(ValueError, match="Unknown dosha mode"):
+            dosha_service.detect_all_doshas(clean_chart, {}, mode="brief")
+
+    def test_catalog_resolves_remedy_ids(self, dosha_service, chart):
+        from app.services.dosha_remedies import get_dosha_remedy_catalog
+
+        catalog = get_dosha_remedy_catalog()
+        for dosha in dosha_service.detect_all_doshas(chart, {"sign_num": 0, "degree": 15.0}):
+            if dosha["present"]:
+                assert catalog.get(dosha["remedy_id"])["remedies"] == dosha["remedies"]
+            else:
+                assert dosha["remedy_id"] is None
+
+    def test_remedy_ids(self, dosha_service, kaal_sarpa_full_chart, grahan_dosha_moon_rahu_chart):
+        from app.services.dosha_remedies import get_dosha_remedy_catalog
+
+        catalog = get_dosha_remedy_catalog()
+        assert dosha_service.remedy_id("Manglik Dosha", "very_low") == "manglik-dosha:low"
+        assert dosha_service.remedy_id("Manglik Dosha", "none") is None
+        assert dosha_service.remedy_id("Grahan Dosha", "medium", "moon-rahu") == "grahan-dosha:low:moon-rahu"
+        assert "moon-rahu" in dosha_service.detect_grahan_dosha(grahan_dosha_moon_rahu_chart)["remedy_id"]
+        assert len(catalog) == len(set(key for key, _ in dosha_service.remedy_sets()))
+        assert catalog.get("unknown-dosha:any") is None
+
+    def test_grahan_remedies_have_no_empty_entries(self, dosha_service, grahan_dosha_moon_rahu_chart):
+        result = dosha_service.detect_grahan_dosha(grahan_dosha_moon_rahu_chart)
+
+        assert all(None not in items for items in result["remedies"].values())
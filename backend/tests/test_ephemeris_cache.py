@@ -0,0 +1,59 @@
+"""
+Tests for the shared ephemeris position cache (app.core.ephemeris)
+"""
+import pytest
+import swisseph as swe
+
+from app.core.ephemeris import EphemerisCache, ephemeris
+
+JD = 2451545.123456  # Arbitrary instant that is not on a whole second
+
+
+@pytest.mark.unit
+class TestEphemerisCache:
+    """Tests for EphemerisCache"""
+
+    def test_matches_swiss_ephemeris_at_quantized_instant(self):
+        cache = EphemerisCache()
+        jd = cache.quantize(JD)
+
+        assert abs(jd - JD) <= 0.5 / 86400
+        assert cache.calc_ut(JD, swe.MOON) == swe.calc_ut(jd, swe.MOON)
+        assert cache.calc_ut(JD, swe.SUN, swe.FLG_SWIEPH) == swe.calc_ut(jd, swe.SUN, swe.FLG_SWIEPH)
+        assert cache.get_ayanamsa_ut(JD) == swe.get_ayanamsa_ut(jd)
+
+    def test_repeated_lookups_hit(self):
+        cache = EphemerisCache()
+
+        cache.calc_ut(JD, swe.SATURN)
+        cache.calc_ut(JD + 0.1 / 86400, swe.SATURN)  # Same second
+        cache.calc_ut(JD, swe.SATURN, swe.FLG_SWIEPH)  # Different flags
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["hit_rate"] == 33.33
+
+    def test_least_recently_used_evicted(self):
+        cache = EphemerisCache(maxsize=2)
+
+        cache.calc_ut(JD, swe.SUN)
+        cache.calc_ut(JD, swe.MOON)
+        cache.calc_ut(JD, swe.SUN)  # Sun is now most recent
+        cache.calc_ut(JD, swe.MARS)  # Evicts Moon
+
+        assert cache.get_stats()["size"] == 2
+        cache.calc_ut(JD, swe.SUN)
+        assert cache.hits == 2
+        cache.calc_ut(JD, swe.MOON)
+        assert cache.misses == 4
+
+    def test_transits_and_sade_sati_share_saturn(self):
+        from datetime import date
+        from app.services.transit_service import transit_service
+
+        transit_service.get_current_transits(0, 3, date(2030, 3, 1))
+        hits = ephemeris.hits
+        transit_service.calculate_sade_sati(0, date(2030, 3, 1))
+
+        assert ephemeris.hits >= hits + 2  # Saturn and ayanamsa reused
@@ -0,0 +1,74 @@
+"""
+Tests for the precomputed daily ephemeris table (app.core.ephemeris_table)
+"""
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+import swisseph as swe
+
+from app.core.ephemeris_table import EphemerisTable, date_to_jd
+from scripts.generate_ephemeris_table import BODY_IDS, FLAGS, generate
+
+
+@pytest.fixture(scope="module")
+def table(tmp_path_factory):
+    path = tmp_path_factory.mktemp("ephemeris") / "lahiri_daily.npy"
+    generate(path, 2024, 2024)
+    return EphemerisTable(path)
+
+
+@pytest.mark.unit
+class TestEphemerisTable:
+    """Tests for EphemerisTable"""
+
+    def test_missing_table_is_unavailable(self, tmp_path):
+        missing = EphemerisTable(tmp_path / "missing.npy")
+        assert missing.available is False
+        assert missing.covers(date_to_jd(date(2024, 1, 1))) is False
+
+    def test_date_to_jd_matches_swisseph(self):
+        assert date_to_jd(date(2024, 3, 15)) == swe.julday(2024, 3, 15, 0.0)
+
+    def test_daily_slice_matches_swisseph(self, table):
+        saturn = table.daily("Saturn", date(2024, 6, 1), date(2024, 6, 11))
+        exact = [
+            swe.calc_ut(date_to_jd(date(2024, 6, day)), swe.SATURN, FLAGS)[0][0]
+            for day in range(1, 11)
+        ]
+
+        assert saturn.shape == (10,)
+        assert np.allclose(saturn, exact, atol=1e-4)
+
+    @pytest.mark.parametrize("body", list(BODY_IDS))
+    def test_interpolation_error_bound(self, table, body):
+        jds = np.linspace(table.start_jd + 0.01, table.end_jd - 0.01, 200)
+        interpolated = table.longitudes(body, jds)
+        exact = np.array([swe.calc_ut(jd, BODY_IDS[body], FLAGS)[0][0] for jd in jds])
+
+        diff = np.abs(np.mod(interpolated - exact + 180.0, 360.0) - 180.0)
+        assert diff.max() < 0.001
+
+    def test_ketu_and_tropical(self, table):
+        jd = date_to_jd(date(2024, 8, 1)) + 0.3
+        rahu = table.longitude("Rahu", jd)
+        tropical_sun = table.longitude("Sun", jd, sidereal=False)
+
+        assert table.longitude("Ketu", jd) == pytest.approx((rahu + 180) % 360, abs=1e-9)
+        assert tropical_sun == pytest.approx(swe.calc_ut(jd, swe.SUN)[0][0], abs=0.001)
+
+    def test_outside_range_rejected(self, table):
+        with pytest.raises(ValueError, match="outside ephemeris table"):
+            table.longitude("Moon", date_to_jd(date(2030, 1, 1)))
+
+    def test_calendar_year_sign_change_uses_table(self, table, monkeypatch):
+        from app.services import calendar_year_service as module
+
+        service = module.CalendarYearService()
+        start, end = datetime(2024, 1, 1), datetime(2024, 12, 31)
+        expected = service._find_sign_change_date("Mars", start, end)
+
+        monkeypatch.setattr(module, "ephemeris_table", table)
+        monkeypatch.setattr(service, "_get_planet_position", lambda *args: pytest.fail("table not used"))
+
+        assert service._find_sign_change_date("Mars", start, end) == expected
@@ -1221,3 +1221,108 @@ class TestNewYogasIntegration:
                                 if any(category in name for name in yoga_names))
 
         assert detected_new_yogas >= 1, "Should detect at least one of the new yogas"
+
+
+# =============================================================================
+# FILTERED AND LAZY DETECTION
+# =============================================================================
+
+FILTER_CHART = {
+    "Ascendant": {"house": 1, "sign_num": 4},
+    "Sun": {"house": 10, "sign_num": 1, "retrograde": False},
+    "Moon": {"house": 1, "sign_num": 4, "retrograde": False},
+    "Mars": {"house": 7, "sign_num": 10, "retrograde": False},
+    "Mercury": {"house": 10, "sign_num": 1, "retrograde": False},
+    "Jupiter": {"house": 1, "sign_num": 4, "retrograde": False},
+    "Venus": {"house": 5, "sign_num": 8, "retrograde": False},
+    "Saturn": {"house": 4, "sign_num": 7, "retrograde": False},
+    "Rahu": {"house": 3, "sign_num": 6, "retrograde": True},
+    "Ketu": {"house": 9, "sign_num": 12, "retrograde": True}
+}
+
+
+class TestYogaFilters:
+    """Test category / importance filters and generator mode"""
+
+    @pytest.mark.unit
+    def test_families_cover_all_detectors_once(self, yoga_service):
+        detectors = [name for family in yoga_service.YOGA_FAMILIES.values() for name in family["detectors"]]
+        assert len(detectors) == len(set(detectors))
+        assert all(callable(getattr(yoga_service, name)) for name in detectors)
+
+    @pytest.mark.unit
+    def test_generator_matches_list(self, yoga_service):
+        assert list(yoga_service.iter_extended_yogas(FILTER_CHART)) == yoga_service.detect_extended_yogas(FILTER_CHART)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("min_importance", ["major", "moderate", "minor"])
+    def test_min_importance_matches_post_filter(self, yoga_service, min_importance):
+        rank = yoga_service.IMPORTANCE_RANK
+        expected = [
+            yoga for yoga in yoga_service.detect_extended_yogas(FILTER_CHART)
+            if rank[yoga["importance"]] >= rank[min_importance]
+        ]
+        assert yoga_service.detect_extended_yogas(FILTER_CHART, min_importance=min_importance) == expected
+
+    @pytest.mark.unit
+    def test_skipped_families_are_not_run(self, yoga_service, monkeypatch):
+        def fail(planets):
+            raise AssertionError("Bhava yogas should not run")
+
+        monkeypatch.setattr(yoga_service, "_detect_bhava_yogas", fail)
+        assert yoga_service.detect_extended_yogas(FILTER_CHART, min_importance="major")
+        assert yoga_service.detect_extended_yogas(FILTER_CHART, categories=["raj"])
+
+    @pytest.mark.unit
+    def test_category_filter(self, yoga_service):
+        yogas = yoga_service.detect_extended_yogas(FILTER_CHART, categories=["Raj"])
+        names = [yoga["name"] for yoga in yogas]
+        assert "Gaja Kesari Yoga" in names
+        assert not any("Nitya" in yoga["category"] or "Bhava" in yoga["category"] for yoga in yogas)
+
+    @pytest.mark.unit
+    def test_unknown_filters(self, yoga_service):
+        with pytest.raises(ValueError):
+            yoga_service.detect_extended_yogas(FILTER_CHART, categories=["astral"])
+        with pytest.raises(ValueError):
+            yoga_service.detect_extended_yogas(FILTER_CHART, min_importance="huge")
+
+    @pytest.mark.unit
+    def test_generator_short_circuits(self, yoga_service, monkeypatch):
+        def fail(planets):
+            raise AssertionError("Later families should not run")
+
+        monkeypatch.setattr(yoga_service, "_detect_bhava_yogas", fail)
+        first = next(yoga_service.iter_extended_yogas(FILTER_CHART))
+        assert yoga_service.find_extended_yoga(FILTER_CHART, first["name"]) == first
+
+
+class TestBhavaYogaTable:
+    """Test the Bhava yoga effects table (data/bhava_yoga_effects.json)"""
+
+    @pytest.mark.unit
+    def test_all_combinations_present(self, yoga_service):
+        for lord_house in range(1, 13):
+            for placement in range(1, 13):
+                effects = yoga_service._get_bhava_yoga_effects(lord_house, placement)
+                assert {"name", "description", "effects", "strength", "life_areas"} <= set(effects)
+        assert yoga_service._get_bhava_yoga_effects(1, 13) is None
+        assert yoga_service._get_bhava_yoga_effects(0, 1) is None
+
+    @pytest.mark.unit
+    def test_table_is_read_only(self, yoga_service):
+        effects = yoga_service._get_bhava_yoga_effects(1, 1)
+        with pytest.raises(TypeError):
+            effects["name"] = "Changed"
+        assert yoga_service._get_bhava_yoga_effects(1, 1) is effects
+
+    @pytest.mark.unit
+    def test_details(self, yoga_service):
+        yoga = yoga_service._get_bhava_yoga_details(1, 1, "Mars", 1)
+        assert yoga["name"] == "Lagna Adhi Yoga"
+        assert yoga["strength"] == "Very Strong"
+        assert yoga["formation"] == "1st lord (Mars) in 1st house"
+        assert yoga["life_areas"] == ["Personality", "Health", "Self-confidence", "Leadership"]
+
+        yoga["life_areas"].append("Changed")
+        assert "Changed" not in yoga_service._get_bhava_yoga_details(1, 1, "Mars", 1)["life_areas"]
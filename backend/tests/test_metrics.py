@@ -0,0 +1,106 @@
+"""
+Tests for chart stage metrics and Prometheus export (app.core.metrics)
+"""
+
+import pytest
+from datetime import date, time
+
+from app.core.compute import ComputeExecutor
+from app.core.metrics import CHART_STAGE_SECONDS, Histogram, MetricsRegistry, metrics
+from app.services.vedic_astrology_accurate import accurate_vedic_astrology
+
+
+BIRTH = dict(
+    name="Test Person",
+    birth_date=date(1990, 1, 15),
+    birth_time=time(14, 30),
+    latitude=28.6139,
+    longitude=77.2090,
+    timezone_str="Asia/Kolkata"
+)
+
+
+@pytest.mark.unit
+class TestHistogram:
+    """Tests for histogram recording and text export"""
+
+    def test_render_prometheus_text(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("test_seconds", "Test timings", labels=("stage",), buckets=(0.1, 1.0))
+        histogram.observe(0.05, stage="a")
+        histogram.observe(0.5, stage="a")
+        histogram.observe(5.0, stage="a")
+
+        lines = registry.render().splitlines()
+        assert lines[:2] == ["# HELP test_seconds Test timings", "# TYPE test_seconds histogram"]
+        assert 'test_seconds_bucket{stage="a",le="0.1"} 1' in lines
+        assert 'test_seconds_bucket{stage="a",le="1.0"} 2' in lines
+        assert 'test_seconds_bucket{stage="a",le="+Inf"} 3' in lines
+        assert 'test_seconds_sum{stage="a"} 5.55' in lines
+        assert 'test_seconds_count{stage="a"} 3' in lines
+
+    def test_labels_are_validated(self):
+        histogram = Histogram("test_seconds", "Test", labels=("stage",))
+        with pytest.raises(ValueError):
+            histogram.observe(1.0, phase="a")
+
+    def test_timer_records_on_error(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("test_seconds", "Test", labels=("stage",))
+        with pytest.raises(RuntimeError):
+            with registry.timer(histogram, stage="failing"):
+                raise RuntimeError("boom")
+        assert histogram.count(stage="failing") == 1
+
+    def test_drain_and_merge(self):
+        worker = MetricsRegistry()
+        main = MetricsRegistry()
+        for registry in (worker, main):
+            registry.histogram("test_seconds", "Test", labels=("stage",))
+
+        worker.histogram("test_seconds", "Test").observe(0.2, stage="a")
+        main.merge(worker.drain())
+
+        assert main.histogram("test_seconds", "Test").count(stage="a") == 1
+        assert worker.drain() == {}
+
+    def test_gauge_callback(self):
+        registry = MetricsRegistry()
+        registry.gauge_callback("test_queue", "Queue size", lambda: {"pending": 3})
+        assert 'test_queue{name="pending"} 3.0' in registry.render().splitlines()
+
+
+@pytest.mark.unit
+class TestChartStageMetrics:
+    """Tests for chart pipeline instrumentation"""
+
+    def test_only_run_stages_are_timed(self):
+        before = {stage: CHART_STAGE_SECONDS.count(stage=stage) for stage in ("ephemeris", "houses", "dasha", "yogas", "total")}
+        accurate_vedic_astrology.calculate_birth_chart(**BIRTH, include=["dasha"])
+
+        assert CHART_STAGE_SECONDS.count(stage="ephemeris") == before["ephemeris"] + 1
+        assert CHART_STAGE_SECONDS.count(stage="houses") == before["houses"] + 1
+        assert CHART_STAGE_SECONDS.count(stage="dasha") == before["dasha"] + 1
+        assert CHART_STAGE_SECONDS.count(stage="total") == before["total"] + 1
+        assert CHART_STAGE_SECONDS.count(stage="yogas") == before["yogas"]
+
+    def test_calculation_does_not_print(self, capsys):
+        accurate_vedic_astrology.calculate_birth_chart(**BIRTH)
+        assert capsys.readouterr().out == ""
+
+    @pytest.mark.asyncio
+    async def test_worker_metrics_are_merged(self):
+        executor = ComputeExecutor(
+            workers=1, max_pending=2, queue_timeout=1.0, task_timeout=60.0, start_method="spawn"
+        )
+        try:
+            before = CHART_STAGE_SECONDS.count(stage="ephemeris")
+            chart = await executor.run(accurate_vedic_astrology.calculate_birth_chart, **BIRTH, include=[])
+            assert chart["stages"] == []
+            assert CHART_STAGE_SECONDS.count(stage="ephemeris") == before + 1
+        finally:
+            executor.shutdown()
+
+    def test_metrics_render_includes_stage_histogram(self):
+        accurate_vedic_astrology.calculate_birth_chart(**BIRTH, include=[])
+        assert 'jioastro_chart_stage_seconds_count{stage="ephemeris"}' in metrics.render()
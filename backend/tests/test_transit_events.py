@@ -0,0 +1,170 @@
+"""
+Tests for the event-driven transit engine (app.services.transit_events)
+"""
+from datetime import datetime
+
+import numpy as np
+import pytest
+import swisseph as swe
+
+from app.core.ephemeris import EphemerisCache
+from app.services.transit_events import (
+    BODIES,
+    FLAGS,
+    NAKSHATRA_SPAN,
+    TransitEventEngine,
+    datetime_to_jd,
+)
+from app.services.transit_service import transit_service
+
+START = 2460676.5  # 2025-01-01 0h UT
+NATAL = {"Moon": 142.219302, "Ascendant": 47.39931}
+
+
+class CountingEphemeris(EphemerisCache):
+    """Ephemeris cache that counts calculations"""
+
+    def __init__(self):
+        super().__init__(maxsize=0)
+        self.calls = 0
+
+    def calc_ut(self, jd, body, flags):
+        self.calls += 1
+        return super().calc_ut(jd, body, flags)
+
+
+def state(body, jd):
+    planet_id, offset = BODIES[body]
+    position = swe.calc_ut(jd, planet_id, FLAGS)[0]
+    return (position[0] + offset) % 360, position[3]
+
+
+def scan(body, start, end, step):
+    """Events of a body found by sampling every `step` days: (event type, sample before)"""
+    jds = np.arange(start, end, step)
+    states = np.array([state(body, jd) for jd in jds])
+    lons, speeds = states[:, 0], states[:, 1]
+    events = []
+    for event_type, values in (("sign_ingress", lons // 30), ("nakshatra_change", lons // NAKSHATRA_SPAN)):
+        events += [(event_type, jds[i]) for i in np.flatnonzero(np.diff(values))]
+    for i in np.flatnonzero(np.diff(np.sign(speeds))):
+        events.append(("station_retrograde" if speeds[i] > 0 else "station_direct", jds[i]))
+    for lon in NATAL.values():
+        offset = (lons - lon + 180) % 360 - 180
+        crossed = (np.sign(offset[:-1]) != np.sign(offset[1:])) & (np.abs(offset[:-1]) < 90)
+        events += [("natal_conjunction", jds[i]) for i in np.flatnonzero(crossed)]
+    return sorted(events, key=lambda event: event[1])
+
+
+@pytest.mark.unit
+class TestTransitEventEngine:
+    """Tests for exact transit events"""
+
+    @pytest.mark.parametrize("body", list(BODIES))
+    def test_matches_hourly_scan(self, body):
+        step = 1 / 24
+        end = START + 240
+        events = TransitEventEngine().find_events(START, end, bodies=[body], natal_points=NATAL)
+        expected = scan(body, START, end, step)
+
+        assert [event["event_type"] for event in events] == [event_type for event_type, _ in expected]
+        for event, (_, sample) in zip(events, expected):
+            assert sample <= event["jd"] <= sample + step
+
+    def test_crossings_are_exact(self):
+        events = TransitEventEngine().find_events(START, START + 60, natal_points=NATAL)
+        for event in events:
+            lon, speed = state(event["planet"], event["jd"])
+            if event["event_type"].startswith("station"):
+                assert abs(speed) < 1e-4
+            else:
+                assert abs((lon - event["longitude"] + 180) % 360 - 180) < 2e-4
+
+    def test_events_sorted(self):
+        events = TransitEventEngine().find_events(START, START + 90, natal_points=NATAL)
+        assert [event["jd"] for event in events] == sorted(event["jd"] for event in events)
+
+    def test_retrograde_ingress(self):
+        # Mars re-entered Gemini retrograde on 2025-01-21
+        events = TransitEventEngine().find_events(START, START + 30, bodies=["Mars"], event_types=["sign_ingress"])
+
+        assert [(e["from_sign"], e["to_sign"], e["retrograde"]) for e in events] == [("Cancer", "Gemini", True)]
+        assert events[0]["description"] == "Mars enters Gemini (retrograde)"
+
+    def test_stations(self):
+        # Mercury turns retrograde and direct roughly three times a year
+        events = TransitEventEngine().find_events(
+            START, START + 365, bodies=["Mercury"], event_types=["station_retrograde", "station_direct"]
+        )
+        types = [event["event_type"] for event in events]
+
+        assert len(types) == 6
+        assert all(a != b for a, b in zip(types, types[1:]))
+
+    def test_cost_follows_events_not_days(self):
+        # Slow bodies over 20 years: a few calculations per event, against
+        # 4 * 7300 for a daily scan
+        engine = TransitEventEngine()
+        engine.ephemeris = CountingEphemeris()
+        bodies = ["Jupiter", "Saturn", "Rahu", "Ketu"]
+        events = engine.find_events(START, START + 20 * 365, bodies=bodies)
+
+        assert engine.ephemeris.calls < 5 * len(events)
+        assert engine.ephemeris.calls < len(bodies) * 20 * 365 / 10
+
+    def test_unknown_body_or_event_type_rejected(self):
+        engine = TransitEventEngine()
+        with pytest.raises(ValueError, match="Pluto"):
+            engine.find_events(START, START + 1, bodies=["Pluto"])
+        with pytest.raises(ValueError, match="eclipse"):
+            engine.find_events(START, START + 1, event_types=["eclipse"])
+        with pytest.raises(ValueError):
+            engine.find_events(START + 1, START)
+
+
+@pytest.mark.unit
+class TestTransitTimeline:
+    """Tests for TransitService.calculate_transit_timeline"""
+
+    CHART = {
+        "planets": {"Moon": {"longitude": 142.219302}},
+        "ascendant": {"longitude": 47.39931}
+    }
+
+    def test_timeline(self):
+        timeline = transit_service.calculate_transit_timeline(
+            self.CHART, datetime(2025, 1, 1), datetime(2025, 1, 31), timezone_str="Asia/Kolkata"
+        )
+
+        assert timeline["total_events"] == len(timeline["events"]) == sum(timeline["event_counts"].values())
+        natal = {e["natal_point"] for e in timeline["events"] if e["event_type"] == "natal_conjunction"}
+        assert natal == {"Moon", "Ascendant"}
+
+        # Makar Sankranti 2025: 14 January, 08:55 IST
+        sankranti = next(e for e in timeline["events"] if e["planet"] == "Sun" and e["event_type"] == "sign_ingress")
+        assert sankranti["to_sign"] == "Capricorn"
+        assert sankranti["date"].startswith("2025-01-14T08:5")
+        assert sankranti["date"].endswith("+05:30")
+
+    def test_naive_dates_in_timezone(self):
+        timeline = transit_service.calculate_transit_timeline(
+            self.CHART, datetime(2025, 1, 1), datetime(2025, 1, 2), timezone_str="Asia/Kolkata"
+        )
+        assert all(
+            datetime_to_jd(datetime.fromisoformat("2025-01-01T00:00:00+05:30")) < e["jd"]
+            for e in timeline["events"]
+        )
+
+    def test_invalid_timezone_or_range_rejected(self):
+        with pytest.raises(ValueError, match="Mars/Olympus"):
+            transit_service.calculate_transit_timeline(
+                self.CHART, datetime(2025, 1, 1), datetime(2025, 1, 2), timezone_str="Mars/Olympus"
+            )
+        with pytest.raises(ValueError, match="limited"):
+            transit_service.calculate_transit_timeline(self.CHART, datetime(2025, 1, 1), datetime(2030, 1, 1))
+
+    def test_upcoming_sign_changes_skip_moon(self):
+        changes = transit_service.get_upcoming_sign_changes(datetime(2025, 1, 1), days=30)
+
+        assert "Moon" not in {change["planet"] for change in changes}
+        assert [c["days_until"] for c in changes] == sorted(c["days_until"] for c in changes)
@@ -0,0 +1,132 @@
+"""
+Tests for on-demand divisional charts with per-varga caching
+"""
+
+import pytest
+from datetime import date, time
+
+from app.core.cache import CacheService
+from app.services.divisional_charts_service import divisional_charts_service
+from app.services.varga_cache_service import VargaCacheService
+from app.services.vedic_astrology_accurate import accurate_vedic_astrology
+
+
+BIRTH = {
+    "name": "Test Person",
+    "birth_date": date(1990, 1, 15),
+    "birth_time": time(14, 30),
+    "latitude": 28.6139,
+    "longitude": 77.2090,
+    "timezone_str": "Asia/Kolkata",
+    "city": "New Delhi"
+}
+
+
+@pytest.fixture(scope="module")
+def d1_chart():
+    """D1 chart as stored since vargas became lazy (no divisional_charts)"""
+    return accurate_vedic_astrology.calculate_birth_chart(**BIRTH, include=[])
+
+
+def make_service(monkeypatch):
+    """Varga cache backed by a private in-memory cache, counting calculations"""
+    cache = CacheService(fallback_maxsize=100)
+    cache.use_fallback = True
+
+    async def no_connect():
+        pass
+
+    monkeypatch.setattr(cache, "connect", no_connect)
+    service = VargaCacheService()
+    service.cache = cache
+    service.calculated = []
+
+    calculate_vargas = service.calculate_vargas
+
+    def counting(chart_data, vargas):
+        service.calculated.append(list(vargas))
+        return calculate_vargas(chart_data, vargas)
+
+    service.calculate_vargas = counting
+    return service
+
+
+@pytest.mark.unit
+class TestLazyDivisionalCharts:
+    """Test that the D1 pipeline no longer stores vargas"""
+
+    def test_default_chart_has_no_divisional_charts(self):
+        assert "divisional_charts" not in accurate_vedic_astrology.resolve_stages(None)
+        assert "vimshopaka_bala" in accurate_vedic_astrology.resolve_stages(None)
+
+
+@pytest.mark.unit
+class TestVargaCache:
+    """Test per-varga calculation and caching"""
+
+    async def test_varga_calculated_once(self, monkeypatch, d1_chart):
+        service = make_service(monkeypatch)
+
+        first = await service.get_varga(d1_chart, "D10")
+        second = await service.get_varga(d1_chart, "D10")
+
+        assert service.calculated == [["D10"]]
+        assert first == second
+        assert first["chart_type"] == "D10"
+
+    async def test_only_missing_vargas_calculated(self, monkeypatch, d1_chart):
+        service = make_service(monkeypatch)
+
+        await service.get_varga(d1_chart, "D2")
+        charts = await service.get_vargas(d1_chart, ["D60", "D2", "D30"])
+
+        assert service.calculated == [["D2"], ["D60", "D30"]]
+        assert list(charts) == ["D60", "D2", "D30"]
+
+    async def test_matches_eager_calculation(self, monkeypatch, d1_chart):
+        service = make_service(monkeypatch)
+        eager = accurate_vedic_astrology.calculate_birth_chart(**BIRTH, include=["divisional_charts"])
+
+        lazy = await service.get_vargas(d1_chart, list(eager["divisional_charts"]))
+
+        assert lazy == eager["divisional_charts"]
+
+    async def test_legacy_embedded_vargas_served(self, monkeypatch, d1_chart):
+        service = make_service(monkeypatch)
+        legacy = {**d1_chart, "divisional_charts": {"D7": {"chart_type": "D7", "legacy": True}}}
+
+        assert (await service.get_varga(legacy, "D7"))["legacy"] is True
+        assert service.calculated == []
+
+    async def test_identical_positions_share_entries(self, monkeypatch, d1_chart):
+        service = make_service(monkeypatch)
+        other_profile = {**d1_chart, "basic_info": {**d1_chart["basic_info"], "name": "Twin"}}
+
+        await service.get_varga(d1_chart, "D9")
+        await service.get_varga(other_profile, "D9")
+
+        assert service.calculated == [["D9"]]
+
+    def test_key_depends_on_varga_and_engine_version(self, monkeypatch, d1_chart):
+        service = make_service(monkeypatch)
+        key = service.make_key(d1_chart, "D10")
+
+        assert key.startswith(f"jioastro:vargas:v{accurate_vedic_astrology.ENGINE_VERSION}:")
+        assert key != service.make_key(d1_chart, "D12")
+        monkeypatch.setattr(type(accurate_vedic_astrology), "ENGINE_VERSION", "999.0.0")
+        assert service.make_key(d1_chart, "D10") != key
+
+    async def test_unknown_varga_rejected(self, monkeypatch, d1_chart):
+        service = make_service(monkeypatch)
+        with pytest.raises(ValueError, match="Unknown divisional chart"):
+            await service.get_varga(d1_chart, "D99")
+
+    async def test_yogas_detected_on_single_varga(self, monkeypatch, d1_chart):
+        service = make_service(monkeypatch)
+
+        yogas = await service.detect_yogas(d1_chart, "D10")
+
+        assert service.calculated == [["D10"]]
+        assert yogas == divisional_charts_service.detect_divisional_yogas(
+            "D10", await service.get_varga(d1_chart, "D10")
+        )
@@ -0,0 +1,126 @@
+"""
+Tests for memoized yoga detection (app.services.yoga_cache)
+"""
+
+import copy
+
+import pytest
+
+from app.services.extended_yoga_service import ExtendedYogaService
+from app.services.yoga_cache import YogaResultCache, placement_signature, yoga_result_cache
+
+PLANETS = {
+    "Ascendant": {"house": 1, "sign_num": 1, "degree": 12.0, "longitude": 12.0},
+    "Sun": {"house": 10, "sign_num": 10, "degree": 5.5, "longitude": 275.5},
+    "Moon": {"house": 4, "sign_num": 4, "degree": 20.1, "longitude": 110.1, "nakshatra": "Pushya"},
+    "Mars": {"house": 10, "sign_num": 10, "degree": 28.0, "longitude": 298.0, "exalted": True},
+    "Mercury": {"house": 9, "sign_num": 9, "degree": 14.2, "longitude": 254.2, "combust": True},
+    "Jupiter": {"house": 4, "sign_num": 4, "degree": 3.3, "longitude": 93.3, "exalted": True},
+    "Venus": {"house": 11, "sign_num": 11, "degree": 9.9, "longitude": 309.9},
+    "Saturn": {"house": 7, "sign_num": 7, "degree": 17.0, "longitude": 197.0, "exalted": True},
+    "Rahu": {"house": 3, "sign_num": 3, "degree": 1.0, "longitude": 61.0},
+    "Ketu": {"house": 9, "sign_num": 9, "degree": 1.0, "longitude": 241.0},
+}
+
+
+def _shifted(planets: dict, degrees: float) -> dict:
+    """Same chart with every body moved by a few arc-minutes within its sign"""
+    shifted = copy.deepcopy(planets)
+    for data in shifted.values():
+        data["degree"] += degrees
+        data["longitude"] += degrees
+    return shifted
+
+
+@pytest.fixture
+def yoga_service():
+    yoga_result_cache.clear()
+    yield ExtendedYogaService()
+    yoga_result_cache.clear()
+
+
+@pytest.mark.unit
+class TestPlacementSignature:
+    """Tests for placement_signature"""
+
+    def test_ignores_degrees_within_buckets(self):
+        karakas = {"AK": "Mars"}
+        assert placement_signature(PLANETS, karakas) == placement_signature(_shifted(PLANETS, 0.05), karakas)
+
+    def test_discrete_fields_and_features(self):
+        signature = placement_signature(PLANETS, {"AK": "Mars"})
+        assert placement_signature(PLANETS, {"AK": "Moon"}) != signature
+
+        combust = copy.deepcopy(PLANETS)
+        combust["Venus"]["combust"] = True
+        assert placement_signature(combust, {"AK": "Mars"}) != signature
+
+        # Sun-Moon distance crosses into the next Nitya yoga
+        later = copy.deepcopy(PLANETS)
+        later["Moon"]["longitude"] += 10
+        assert placement_signature(later, {"AK": "Mars"}) != signature
+
+    def test_unhashable_values(self):
+        planets = copy.deepcopy(PLANETS)
+        planets["Sun"]["house"] = [10]
+        with pytest.raises(TypeError):
+            placement_signature(planets, {})
+
+
+@pytest.mark.unit
+class TestYogaResultCache:
+    """Tests for YogaResultCache"""
+
+    def test_least_recently_used_evicted(self):
+        cache = YogaResultCache(maxsize=2)
+        cache.store("a", 1)
+        cache.store("b", 2)
+        assert cache.lookup("a") == (True, 1)
+        cache.store("c", 3)
+
+        assert cache.lookup("b") == (False, None)
+        assert cache.lookup("a") == (True, 1)
+        assert cache.get_stats()["size"] == 2
+
+    def test_disabled(self):
+        cache = YogaResultCache(maxsize=0)
+        cache.store("a", 1)
+        assert cache.lookup("a") == (False, None)
+
+
+@pytest.mark.unit
+class TestMemoizedDetection:
+    """detect_extended_yogas with the result cache in front"""
+
+    @pytest.mark.parametrize("filters", [
+        {},
+        {"categories": ["nitya", "sanyas"]},
+        {"min_importance": "major"},
+    ])
+    def test_matches_uncached_detection(self, yoga_service, filters):
+        hits = yoga_result_cache.hits
+        for planets in (PLANETS, _shifted(PLANETS, 0.05)):
+            expected = list(yoga_service.iter_extended_yogas(planets, **filters))
+            assert yoga_service.detect_extended_yogas(planets, **filters) == expected
+        assert yoga_result_cache.hits == hits + 1
+
+    def test_nitya_yoga_recomputed(self, yoga_service):
+        later = copy.deepcopy(PLANETS)
+        later["Moon"]["longitude"] += 0.05
+        hits = yoga_result_cache.hits
+
+        yoga_service.detect_extended_yogas(PLANETS, categories=["nitya"])
+        yogas = yoga_service.detect_extended_yogas(later, categories=["nitya"])
+        assert yoga_result_cache.hits == hits + 1
+        assert [yoga["sun_moon_distance"] for yoga in yogas] == [pytest.approx((110.15 - 275.5) % 360)]
+
+    def test_results_are_copies(self, yoga_service):
+        yogas = yoga_service.detect_extended_yogas(PLANETS)
+        expected = copy.deepcopy(yogas)
+        for yoga in yogas:
+            yoga["name"] = "changed"
+            for value in yoga.values():
+                if isinstance(value, list):
+                    value.append("changed")
+
+        assert yoga_service.detect_extended_yogas(PLANETS) == expected
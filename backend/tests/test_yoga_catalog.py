@@ -0,0 +1,87 @@
+"""
+Tests for the static yoga catalog (app.services.yoga_catalog)
+"""
+
+import json
+
+import pytest
+
+from app.services.extended_yoga_service import ExtendedYogaService
+from app.services.yoga_catalog import YogaCatalog, get_yoga_catalog, yoga_id
+
+PLANETS = {
+    "Ascendant": {"house": 1, "sign_num": 1, "degree": 12.0, "longitude": 12.0},
+    "Sun": {"house": 10, "sign_num": 10, "degree": 5.5, "longitude": 275.5},
+    "Moon": {"house": 4, "sign_num": 4, "degree": 20.1, "longitude": 110.1, "nakshatra": "Pushya"},
+    "Mars": {"house": 10, "sign_num": 10, "degree": 28.0, "longitude": 298.0, "exalted": True},
+    "Mercury": {"house": 9, "sign_num": 9, "degree": 14.2, "longitude": 254.2, "combust": True},
+    "Jupiter": {"house": 4, "sign_num": 4, "degree": 3.3, "longitude": 93.3, "exalted": True},
+    "Venus": {"house": 11, "sign_num": 11, "degree": 9.9, "longitude": 309.9},
+    "Saturn": {"house": 7, "sign_num": 7, "degree": 17.0, "longitude": 197.0, "exalted": True},
+    "Rahu": {"house": 3, "sign_num": 3, "degree": 1.0, "longitude": 61.0},
+    "Ketu": {"house": 9, "sign_num": 9, "degree": 1.0, "longitude": 241.0},
+}
+
+
+@pytest.fixture
+def catalog():
+    return YogaCatalog({
+        "hamsa-yoga": {"name": "Hamsa Yoga", "category": "Pancha Mahapurusha", "life_areas": ["Wisdom"]},
+    })
+
+
+@pytest.mark.unit
+class TestYogaId:
+    """Tests for yoga_id"""
+
+    def test_slug(self):
+        assert yoga_id("Gaja Kesari Yoga") == "gaja-kesari-yoga"
+        assert yoga_id("Vīṇā Yoga") == "vina-yoga"
+        assert yoga_id("Dhana Yoga (Ripu-Dhan Type)") == "dhana-yoga-ripu-dhan-type"
+
+
+@pytest.mark.unit
+class TestCompaction:
+    """compact / expand against a catalog"""
+
+    def test_static_fields_dropped(self, catalog):
+        yoga = {"name": "Hamsa Yoga", "category": "Pancha Mahapurusha", "life_areas": ["Wisdom"], "strength": "Strong"}
+        compact = catalog.compact(yoga)
+        assert compact == {"id": "hamsa-yoga", "strength": "Strong"}
+        assert catalog.expand(compact) == yoga
+
+    def test_differing_and_missing_fields(self, catalog):
+        yoga = {"name": "Hamsa Yoga", "category": "Other"}
+        compact = catalog.compact(yoga)
+        assert compact == {"id": "hamsa-yoga", "category": "Other", "unset": ["life_areas"]}
+        assert catalog.expand(compact) == yoga
+
+    def test_yoga_without_entry(self, catalog):
+        yoga = {"name": "Sasa Yoga", "strength": "Medium"}
+        assert catalog.expand(catalog.compact(yoga)) == yoga
+        with pytest.raises(KeyError):
+            catalog.expand({"id": "sasa-yoga"})
+
+    def test_expanded_values_are_copies(self, catalog):
+        catalog.expand({"id": "hamsa-yoga"})["life_areas"].append("Changed")
+        assert catalog.get("hamsa-yoga")["life_areas"] == ["Wisdom"]
+
+    def test_version_follows_content(self, catalog):
+        same = YogaCatalog({key: dict(fields) for key, fields in catalog.entries.items()})
+        other = YogaCatalog({"hamsa-yoga": {"name": "Hamsa Yoga"}})
+        assert same.version == catalog.version
+        assert other.version != catalog.version
+
+
+@pytest.mark.unit
+class TestShippedCatalog:
+    """data/yoga_catalog.json against detection"""
+
+    def test_round_trip_and_size(self):
+        catalog = get_yoga_catalog()
+        yogas = ExtendedYogaService().detect_enriched_yogas(PLANETS)
+        compact = json.loads(json.dumps(catalog.compact_yogas(yogas)))
+
+        assert catalog.expand_yogas(compact) == yogas
+        assert all(catalog.get(entry["id"]) for entry in compact)
+        assert len(json.dumps(compact)) < len(json.dumps(yogas)) / 2
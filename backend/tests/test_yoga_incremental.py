@@ -0,0 +1,120 @@
+"""
+Tests for incremental yoga evaluation (app.services.yoga_incremental)
+"""
+
+import copy
+
+import pytest
+
+from app.services.extended_yoga_service import ExtendedYogaService
+from app.services.yoga_incremental import BODY_SET, NON_EMPTY, WHOLE_BODY, ChartChanges, DetectorRun, TracedPlanets
+
+PLANETS = {
+    "Ascendant": {"house": 1, "sign_num": 1, "degree": 12.0, "longitude": 12.0},
+    "Sun": {"house": 10, "sign_num": 10, "degree": 5.5, "longitude": 275.5},
+    "Moon": {"house": 4, "sign_num": 4, "degree": 20.1, "longitude": 110.1, "nakshatra": "Pushya"},
+    "Mars": {"house": 10, "sign_num": 10, "degree": 28.0, "longitude": 298.0, "exalted": True},
+    "Mercury": {"house": 9, "sign_num": 9, "degree": 14.2, "longitude": 254.2, "combust": True},
+    "Jupiter": {"house": 4, "sign_num": 4, "degree": 3.3, "longitude": 93.3, "exalted": True},
+    "Venus": {"house": 11, "sign_num": 11, "degree": 9.9, "longitude": 309.9},
+    "Saturn": {"house": 7, "sign_num": 7, "degree": 17.0, "longitude": 197.0, "exalted": True},
+    "Rahu": {"house": 3, "sign_num": 3, "degree": 1.0, "longitude": 61.0},
+    "Ketu": {"house": 9, "sign_num": 9, "degree": 1.0, "longitude": 241.0},
+}
+
+
+def moved(planets, name, **fields):
+    variant = copy.deepcopy(planets)
+    variant[name].update(fields)
+    return variant
+
+
+@pytest.fixture
+def service():
+    return ExtendedYogaService()
+
+
+@pytest.mark.unit
+class TestTracing:
+    """Facts recorded by TracedPlanets"""
+
+    def test_field_reads(self):
+        reads = set()
+        traced = TracedPlanets(PLANETS, reads)
+        traced["Moon"]["house"]
+        traced.get("Sun", {}).get("sign_num")
+        "Pluto" in traced
+        assert reads == {("Moon", None), ("Moon", "house"), ("Sun", None), ("Sun", "sign_num"), ("Pluto", None)}
+
+    def test_whole_reads(self):
+        reads = set()
+        traced = TracedPlanets(PLANETS, reads)
+        list(traced)
+        dict(traced["Venus"])
+        bool(traced["Mars"])
+        assert {BODY_SET, ("Venus", WHOLE_BODY), ("Mars", NON_EMPTY)} <= reads
+        assert ("Mars", WHOLE_BODY) not in reads
+
+
+@pytest.mark.unit
+class TestChartChanges:
+    """ChartChanges and DetectorRun.affected_by"""
+
+    def test_between(self):
+        changes = ChartChanges.between(PLANETS, moved(PLANETS, "Moon", degree=21.0, longitude=111.0))
+        assert changes.facts == {("Moon", "degree"), ("Moon", "longitude")}
+
+    def test_added_body(self):
+        variant = dict(PLANETS, Uranus={"house": 2})
+        assert {BODY_SET, ("Uranus", None)} <= ChartChanges.between(PLANETS, variant).facts
+
+    def test_affected_by(self):
+        run = DetectorRun((), {("Moon", "house"), ("Venus", WHOLE_BODY)})
+        assert run.affected_by(ChartChanges([("Moon", "house")]))
+        assert run.affected_by(ChartChanges([("Venus", "degree")]))
+        assert run.affected_by(ChartChanges.of_bodies(["Moon"]))
+        assert not run.affected_by(ChartChanges([("Moon", "degree")]))
+        assert not run.affected_by(ChartChanges(()))
+
+
+@pytest.mark.unit
+class TestReevaluation:
+    """reevaluate_yogas against full detection"""
+
+    def test_evaluate_matches_full_detection(self, service):
+        evaluation = service.evaluate_yogas(PLANETS)
+        assert evaluation.yogas == list(service.iter_extended_yogas(PLANETS))
+        assert set(evaluation.rerun) == set(evaluation.dependencies())
+
+    def test_unchanged_chart_runs_nothing(self, service):
+        evaluation = service.reevaluate_yogas(service.evaluate_yogas(PLANETS), copy.deepcopy(PLANETS))
+        assert evaluation.rerun == ()
+        assert evaluation.yogas == list(service.iter_extended_yogas(PLANETS))
+
+    def test_chained_variants_match_full_detection(self, service):
+        variants = [
+            moved(PLANETS, "Moon", degree=20.5, longitude=110.5),
+            moved(PLANETS, "Moon", house=5, sign_num=5, degree=0.5, longitude=120.5, nakshatra="Magha"),
+            moved(PLANETS, "Jupiter", exalted=False),
+            moved(PLANETS, "Ascendant", sign_num=2, degree=1.0, longitude=31.0),
+        ]
+        evaluation = service.evaluate_yogas(PLANETS, min_importance="moderate")
+        for variant in variants:
+            evaluation = service.reevaluate_yogas(evaluation, variant)
+            assert evaluation.yogas == list(service.iter_extended_yogas(variant, min_importance="moderate"))
+
+    def test_only_dependent_detectors_rerun(self, service):
+        evaluation = service.evaluate_yogas(PLANETS)
+        variant = moved(PLANETS, "Jupiter", exalted=False)
+        dependent = {
+            detector for detector, reads in evaluation.dependencies().items()
+            if ("Jupiter", "exalted") in reads or ("Jupiter", WHOLE_BODY) in reads
+        }
+        evaluation = service.reevaluate_yogas(evaluation, variant)
+        assert set(evaluation.rerun) == dependent
+        assert len(dependent) < len(evaluation.detectors)
+
+    def test_changed_bodies(self, service):
+        variant = moved(PLANETS, "Saturn", exalted=False)
+        evaluation = service.reevaluate_yogas(service.evaluate_yogas(PLANETS), variant, changed=["Saturn"])
+        assert evaluation.yogas == list(service.iter_extended_yogas(variant))
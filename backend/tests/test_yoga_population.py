@@ -0,0 +1,123 @@
+"""
+Tests for population-scale yoga detection (app.services.yoga_population)
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from app.services.extended_yoga_service import ExtendedYogaService
+from app.services.yoga_population import (
+    BODIES,
+    POPULATION_PREDICATES,
+    POPULATION_YOGAS,
+    charts_from_planets,
+    detect_population_yogas,
+    population_yoga_statistics,
+    random_charts,
+    yoga_frequencies,
+)
+
+# Per-chart detectors covered by the population predicates
+DETECTORS = (
+    "_detect_pancha_mahapurusha", "_detect_gajakesari_yoga", "_detect_budhaditya_yoga",
+    "_detect_sunapha_yoga", "_detect_anapha_yoga", "_detect_durudhura_yoga", "_detect_kemadruma_yoga",
+    "_detect_vesi_yoga", "_detect_vosi_yoga", "_detect_ubhayachari_yoga", "_detect_kala_sarpa_yoga",
+    "_detect_nabhasa_ashraya_yogas", "_detect_bhava_yogas",
+)
+
+
+def _column_name(detector: str, yoga: dict) -> str:
+    if detector == "_detect_kala_sarpa_yoga":
+        return yoga["name"].split(" - ")[0]
+    if detector == "_detect_bhava_yogas":
+        lord, placement = yoga["formation"].split(" in ")
+        return f"Bhava Yoga: {lord.split(' (')[0]} in {placement}"
+    return yoga["name"]
+
+
+def _per_chart_names(service: ExtendedYogaService, planets: dict) -> set:
+    return {
+        _column_name(detector, yoga)
+        for detector in DETECTORS
+        for yoga in getattr(service, detector)(planets)
+    }
+
+
+def _planets_of(chart) -> dict:
+    planets = {"Ascendant": {"house": 1, "sign_num": int(chart["ascendant_sign"])}}
+    for index, name in enumerate(BODIES):
+        planets[name] = {
+            "house": int(chart["house"][index]),
+            "sign_num": int(chart["sign"][index]),
+            "longitude": float(chart["longitude"][index]),
+        }
+    return planets
+
+
+@pytest.fixture
+def yoga_service():
+    return ExtendedYogaService()
+
+
+@pytest.mark.unit
+class TestPopulationDetection:
+    """The batch matrix agrees with the per-chart detectors"""
+
+    def test_matches_per_chart_detectors(self, yoga_service):
+        charts = [_planets_of(chart) for chart in random_charts(400, seed=7)]
+
+        # Edge cases: missing ascendant / bodies, unplaced planets
+        rng = random.Random(3)
+        for _ in range(200):
+            planets = {"Ascendant": {"house": 1, "sign_num": rng.randint(0, 12)}} if rng.random() < 0.8 else {}
+            for name in BODIES:
+                if rng.random() < 0.9:
+                    planets[name] = {"house": rng.randint(0, 12), "sign_num": rng.randint(0, 12)}
+            charts.append(planets)
+
+        matrix = detect_population_yogas(charts_from_planets(charts))
+        assert matrix.shape == (len(charts), len(POPULATION_YOGAS))
+        for row, planets in zip(matrix, charts):
+            names = {POPULATION_YOGAS[column] for column in np.flatnonzero(row)}
+            assert names == _per_chart_names(yoga_service, planets), planets
+
+    def test_selected_columns(self):
+        charts = random_charts(50, seed=1)
+        full = detect_population_yogas(charts)
+        selected = detect_population_yogas(charts, ["Hamsa Yoga", "Bhava Yoga: 10th lord in 1st house"])
+        assert selected.shape == (50, 2)
+        assert (selected[:, 0] == full[:, POPULATION_YOGAS.index("Hamsa Yoga")]).all()
+
+        with pytest.raises(ValueError):
+            detect_population_yogas(charts, ["Unknown Yoga"])
+
+    def test_one_bhava_yoga_per_house_lord(self):
+        matrix = detect_population_yogas(random_charts(100, seed=2))
+        bhava = matrix[:, len(POPULATION_PREDICATES):]
+        assert (bhava.sum(axis=1) == 12).all()
+
+    def test_random_charts(self):
+        charts = random_charts(1000, seed=4)
+        assert ((charts["house"] >= 1) & (charts["house"] <= 12)).all()
+        sun, mercury = charts["longitude"][:, 0], charts["longitude"][:, 3]
+        assert (np.minimum((sun - mercury) % 360, (mercury - sun) % 360) <= 28).all()
+        assert np.array_equal(random_charts(1000, seed=4)["longitude"], charts["longitude"])
+
+
+@pytest.mark.unit
+class TestPopulationStatistics:
+    """Frequencies over a detection matrix"""
+
+    def test_frequencies(self):
+        matrix = np.array([[True, False], [True, True]])
+        assert yoga_frequencies(matrix, ("A", "B")) == {"A": 1.0, "B": 0.5}
+        assert yoga_frequencies(np.zeros((0, 2), dtype=bool), ("A", "B")) == {"A": 0.0, "B": 0.0}
+
+    def test_population_statistics(self):
+        statistics = population_yoga_statistics(2000, seed=0)
+        assert statistics["sample_size"] == 2000
+        assert set(statistics["frequencies"]) == set(POPULATION_YOGAS)
+        assert 0 < statistics["frequencies"]["Gajakesari Yoga"] < 1
+        assert population_yoga_statistics(2000, seed=0) == statistics
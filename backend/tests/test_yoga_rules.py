@@ -0,0 +1,121 @@
+"""
+Tests for declarative yoga rules (app.services.yoga_rules)
+"""
+
+import pytest
+from unittest.mock import patch
+
+from app.services.extended_yoga_service import ExtendedYogaService
+from app.services.yoga_rules import YogaRuleSet, expand_rules, get_yoga_rule_set
+
+
+def _planet(house, sign_num, **flags):
+    return {"house": house, "sign_num": sign_num, **flags}
+
+
+def _chart(ascendant_sign=1, **placements):
+    """Whole-sign chart: planet -> house (sign follows from the ascendant)"""
+    planets = {"Ascendant": _planet(1, ascendant_sign)}
+    for name, house in placements.items():
+        planets[name] = _planet(house, (ascendant_sign + house - 2) % 12 + 1)
+    return planets
+
+
+@pytest.fixture
+def yoga_service():
+    return ExtendedYogaService()
+
+
+@pytest.mark.unit
+class TestRuleCompilation:
+    """Tests for rule expansion and shared subexpressions"""
+
+    def test_for_expands_combinations(self):
+        rules = expand_rules([{
+            "group": "g",
+            "for": {"planet": ["Sun", "Moon"], "house": [3, {"house": 6, "label": "six"}]},
+            "when": ["eq", ["house", "{planet}"], "{house}"],
+            "yoga": {"name": "{planet} in {house}", "label": "{label}"}
+        }])
+        assert len(rules) == 4
+        assert rules[0]["when"] == ["eq", ["house", "Sun"], 3]
+        assert rules[0]["yoga"]["name"] == "Sun in 3"
+        assert rules[1]["yoga"]["label"] == "six"
+
+    def test_shared_subexpressions_compiled_once(self):
+        rule_set = YogaRuleSet([
+            {"group": "a", "when": ["eq", ["house", "Moon"], ["house", "Mars"]], "yoga": {"name": "A"}},
+            {"group": "b", "when": ["and", ["eq", ["house", "Moon"], ["house", "Mars"]], ["present", "Jupiter"]],
+             "yoga": {"name": "B"}},
+        ])
+        # house(Moon), house(Mars), eq, present(Jupiter), and
+        assert rule_set.unique_predicates == 5
+        assert rule_set.groups == ("a", "b")
+
+    def test_unknown_operator(self):
+        with pytest.raises(ValueError):
+            YogaRuleSet([{"group": "g", "when": ["between", 1, 2], "yoga": {"name": "X"}}])
+        with pytest.raises(ValueError):
+            YogaRuleSet([{"group": "g", "when": ["in", ["house", "Sun"], "nowhere"], "yoga": {"name": "X"}}])
+
+    def test_rule_file_loads(self):
+        rule_set = get_yoga_rule_set()
+        assert {"chandra_mangala", "guru_mangala", "viparita_like_support", "vaapi_nabhasa"} <= set(rule_set.groups)
+        assert rule_set.unique_predicates < len(rule_set.rules) * 4
+
+
+@pytest.mark.unit
+class TestRuleEvaluation:
+    """Tests for evaluating rules against a chart"""
+
+    def test_quantifiers_and_vars(self, yoga_service):
+        rule_set = YogaRuleSet([
+            {"group": "g", "when": ["all", ["Sun", "Moon"], ["in", ["house", "$"], "kendra"]],
+             "vars": {"lord": ["lord", 10]}, "yoga": {"name": "All in kendra", "lord": "{lord}"}},
+            {"group": "g", "when": ["ge", ["count", "SEVEN", ["present", "$"]], 2], "yoga": {"name": "Two present"}},
+        ])
+        facts = yoga_service.build_chart_facts(_chart(Sun=1, Moon=4))
+        assert rule_set.evaluate(facts) == {"g": [{"name": "All in kendra", "lord": "Saturn"}, {"name": "Two present"}]}
+
+        facts = yoga_service.build_chart_facts(_chart(Sun=1, Moon=5))
+        assert rule_set.evaluate(facts) == {"g": [{"name": "Two present"}]}
+
+    def test_rules_evaluated_once_per_chart(self, yoga_service):
+        facts = yoga_service.build_chart_facts(_chart(Moon=3, Mars=3, Jupiter=3))
+        rule_set = get_yoga_rule_set()
+        with patch.object(rule_set, "evaluate", side_effect=rule_set.evaluate) as mock:
+            yoga_service._detect_chandra_mangala_yoga(facts)
+            yoga_service._detect_guru_mangala_yoga(facts)
+        assert mock.call_count == 1
+
+
+@pytest.mark.unit
+class TestMigratedDetectors:
+    """Detectors backed by rules from data/yoga_rules.json"""
+
+    def test_chandra_mangala_aspect(self, yoga_service):
+        yogas = yoga_service._detect_chandra_mangala_yoga(_chart(Moon=1, Mars=7))
+        assert [yoga["name"] for yoga in yogas] == ["Chandra-Mangala Yoga (aspect)"]
+        assert yoga_service._detect_chandra_mangala_yoga(_chart(Moon=1, Mars=5)) == []
+
+    def test_guru_mangala(self, yoga_service):
+        assert yoga_service._detect_guru_mangala_yoga(_chart(Jupiter=4, Mars=4))
+        assert yoga_service._detect_guru_mangala_yoga(_chart(Jupiter=4, Mars=5)) == []
+
+    def test_viparita_like_support(self, yoga_service):
+        planets = _chart(Mars=1, Sun=6)
+        planets["Mars"]["own_sign"] = True
+        planets["Sun"]["debilitated"] = True
+        yogas = yoga_service._detect_viparita_like_support_yogas(planets)
+        assert len(yogas) == 1
+        assert "Sun" in yogas[0]["name"] or "Sun" in yogas[0]["description"]
+
+        planets["Mars"]["own_sign"] = False
+        assert yoga_service._detect_viparita_like_support_yogas(planets) == []
+
+    def test_vaapi_panaphara(self, yoga_service):
+        planets = _chart(Sun=2, Moon=5, Mars=8, Mercury=11, Jupiter=2, Venus=5, Saturn=8)
+        yogas = yoga_service._detect_vaapi_nabhasa_yoga(planets)
+        assert len(yogas) == 1
+        assert yogas[0]["name"].endswith("Panaphara")
+        assert {rule.bphs_id for rule in get_yoga_rule_set().rules if rule.group == "vaapi_nabhasa"} == {14}
@@ -94,10 +94,22 @@ export default function EnhancedChartPage() {
     enabled: !!profile,
   })
 
+  // Fetch divisional charts (D2-D60 are calculated on demand; older D1 charts embed them)
+  const embeddedDivisionalCharts = d1Chart?.chart_data?.divisional_charts
+  const { data: fetchedDivisionalCharts, isLoading: divisionalLoading } = useQuery({
+    queryKey: ['chart', profileId, 'divisional'],
+    queryFn: async () => {
+      const response = await apiClient.getDivisionalCharts(profileId)
+      return (response.data as any).divisional_charts
+    },
+    enabled: !!d1Chart && !embeddedDivisionalCharts,
+  })
+  const divisionalCharts = embeddedDivisionalCharts || fetchedDivisionalCharts
+
   const queryClient = useQueryClient()
 
   // Check if Phase 2 data is missing (old chart)
-  const hasPhase2Data = d1Chart?.chart_data?.divisional_charts ||
+  const hasPhase2Data = divisionalCharts ||
                         d1Chart?.chart_data?.doshas ||
                         d1Chart?.chart_data?.transits
 
@@ -491,15 +503,15 @@ export default function EnhancedChartPage() {
 
         {/* Divisional Charts Tab */}
         <TabsContent value="divisional" className="space-y-6">
-          {d1Loading ? (
+          {d1Loading || divisionalLoading ? (
             <Card>
               <CardContent className="text-center py-12">
                 <div className="w-8 h-8 border-4 border-jio-600 border-t-transparent rounded-full animate-spin mx-auto mb-4"></div>
                 <p className="text-gray-600">Loading divisional charts...</p>
               </CardContent>
             </Card>
-          ) : d1Chart?.chart_data?.divisional_charts ? (
-            <DivisionalChartsDisplay divisionalCharts={d1Chart.chart_data.divisional_charts} />
+          ) : divisionalCharts ? (
+            <DivisionalChartsDisplay divisionalCharts={divisionalCharts} />
           ) : (
             <Card className="border-2 border-yellow-300 bg-yellow-50">
               <CardContent className="py-8 text-center">
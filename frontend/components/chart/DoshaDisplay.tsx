@@ -1,8 +1,13 @@
 /**
  * DoshaDisplay Component
  * Displays all detected doshas with severity levels, effects, and remedies
+ * (remedies not included in the chart are resolved from their remedy_id)
  */
 
+'use client'
+
+import { useEffect, useState } from 'react'
+import { apiClient } from '@/lib/api'
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card'
 import { Badge } from '@/components/ui/badge'
 import { Alert, AlertDescription } from '@/components/ui/alert'
@@ -18,9 +23,13 @@ interface Dosha {
   description?: string
   details?: DoshaDetails
   effects?: string
-  remedies?: string[]
+  remedy_id?: string | null
+  remedies?: Remedies
 }
 
+// Remedy list, or remedy lists by category
+type Remedies = string[] | Record<string, string[]>
+
 interface DoshaDisplayProps {
   doshas: Dosha[]
 }
@@ -77,11 +86,42 @@ function formatDoshaDetails(details: DoshaDetails | undefined): string {
   }
 }
 
+/**
+ * Flatten remedies to display lines (categorized remedies prefixed by category)
+ */
+function remedyLines(remedies: Remedies | undefined): string[] {
+  if (!remedies) return []
+  if (Array.isArray(remedies)) return remedies
+  return Object.entries(remedies).flatMap(([category, items]) =>
+    (items || []).map((item) => `${category.replace(/_/g, ' ')}: ${item}`)
+  )
+}
+
 export function DoshaDisplay({ doshas }: DoshaDisplayProps) {
   // Filter to only show present doshas
   const presentDoshas = doshas.filter((d) => d.present)
   const noDoshas = presentDoshas.length === 0
 
+  // Remedies resolved on demand, by remedy_id
+  const [resolvedRemedies, setResolvedRemedies] = useState<Record<string, Remedies>>({})
+
+  useEffect(() => {
+    const remedyIds = presentDoshas
+      .filter((d) => !d.remedies && d.remedy_id)
+      .map((d) => d.remedy_id as string)
+
+    remedyIds.forEach(async (remedyId) => {
+      try {
+        const response = await apiClient.getDoshaRemedy(remedyId)
+        const entry = response.data as { remedies: Remedies }
+        setResolvedRemedies((prev) => ({ ...prev, [remedyId]: entry.remedies }))
+      } catch (err) {
+        console.error(`Failed to load remedies ${remedyId}:`, err)
+      }
+    })
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [doshas])
+
   return (
     <div className="space-y-6">
       {noDoshas ? (
@@ -114,7 +154,11 @@ export function DoshaDisplay({ doshas }: DoshaDisplayProps) {
           </Alert>
 
           <div className="grid gap-6">
-            {presentDoshas.map((dosha) => (
+            {presentDoshas.map((dosha) => {
+              const remedies = remedyLines(
+                dosha.remedies ?? (dosha.remedy_id ? resolvedRemedies[dosha.remedy_id] : undefined)
+              )
+              return (
               <Card
                 key={dosha.name}
                 className={`${getSeverityColor(dosha.severity)} transition-all hover:shadow-lg`}
@@ -191,13 +235,13 @@ export function DoshaDisplay({ doshas }: DoshaDisplayProps) {
                   )}
 
                   {/* Remedies Section */}
-                  {dosha.remedies && dosha.remedies.length > 0 && (
+                  {remedies.length > 0 && (
                     <div className="p-4 rounded-lg bg-gradient-to-br from-purple-50 to-blue-50 border border-purple-200">
                       <h4 className="font-semibold mb-3 flex items-center gap-2 text-purple-900">
                         🔮 Remedies & Solutions:
                       </h4>
                       <ul className="space-y-2">
-                        {dosha.remedies.map((remedy, idx) => (
+                        {remedies.map((remedy, idx) => (
                           <li
                             key={idx}
                             className="flex items-start gap-2 text-sm text-gray-800"
@@ -211,7 +255,8 @@ export function DoshaDisplay({ doshas }: DoshaDisplayProps) {
                   )}
                 </CardContent>
               </Card>
-            ))}
+              )
+            })}
           </div>
 
           {/* Footer Note */}
@@ -655,6 +655,16 @@ class APIClient {
     return this.request('/enhancements/yogas/bphs-report')
   }
 
+  // Divisional Charts - D2-D60, calculated on demand from the D1 chart
+  async getDivisionalCharts(profileId: string, priority: 'high' | 'medium' | 'all' = 'all') {
+    return this.request(`/charts/${profileId}/divisional/all?priority=${priority}`)
+  }
+
+  // Dosha Remedies - Resolve a dosha's remedy_id to its remedies
+  async getDoshaRemedy(remedyId: string) {
+    return this.request(`/enhancements/doshas/remedies/${encodeURIComponent(remedyId)}`)
+  }
+
   // Yoga Lookup - Get detailed information about a specific yoga
   async lookupYoga(yogaName: string) {
     return this.request(`/enhancements/yogas/lookup/${encodeURIComponent(yogaName)}`)